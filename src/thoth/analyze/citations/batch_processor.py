@@ -7,11 +7,11 @@ numbers of citations with features including:
 - Parallel/concurrent execution with rate limiting
 - Checkpoint/resume functionality for long-running operations
 - Progress tracking and statistics reporting
-- Caching to avoid duplicate API calls
+- Caching to avoid duplicate API calls, shared with the resolver's
+  ResolutionCache when it has one
 """
 
 import asyncio
-import hashlib
 import json
 import time
 from dataclasses import dataclass, field
@@ -29,6 +29,10 @@ except ImportError:
     TQDM_AVAILABLE = False
     logger.warning('tqdm not available - progress bars disabled')
 
+from thoth.analyze.citations.resolution_cache import (
+    ResolutionCache,
+    citation_cache_key,
+)
 from thoth.analyze.citations.resolution_types import (
     APISource,
     CitationResolutionStatus,
@@ -251,25 +255,25 @@ class BatchCitationProcessor:
             api: RateLimiter(rate) for api, rate in config.rate_limits.items()
         }
 
-        # In-memory cache for resolved citations with bounded size
-        # Using LRUCache to prevent unbounded growth during batch processing
-        from cachetools import LRUCache
-
-        self._cache: LRUCache = LRUCache(maxsize=5000)  # 5000 citations max
+        # Resolution cache: a CitationResolutionChain resolver caches (and
+        # looks up) results itself, in a cache shared with the other
+        # resolution paths; other resolvers get a bounded in-memory cache
+        self._cache: ResolutionCache | None = None
+        self._resolver_caches = False
+        if config.enable_caching:
+            resolver_cache = getattr(resolver, 'cache', None)
+            if isinstance(resolver_cache, ResolutionCache):
+                self._cache = resolver_cache
+                self._resolver_caches = True
+            else:
+                self._cache = ResolutionCache(maxsize=5000)  # 5000 citations max
 
         # Statistics tracking
         self.statistics = BatchStatistics()
 
-    def _get_cache_key(self, citation: Citation) -> str:
-        """Generate cache key for a citation."""
-        # Use title + first author + year as key
-        key_parts = [
-            citation.title or '',
-            citation.authors[0] if citation.authors else '',
-            str(citation.year or ''),
-        ]
-        key_string = '|'.join(key_parts).lower()
-        return hashlib.md5(key_string.encode()).hexdigest()
+    def _get_cache_key(self, citation: Citation) -> str | None:
+        """Generate cache key for a citation (None if it has no title)."""
+        return citation_cache_key(citation)
 
     async def _resolve_single_citation(
         self, citation: Citation, semaphore: asyncio.Semaphore
@@ -285,14 +289,18 @@ class BatchCitationProcessor:
             Resolution result with metadata
         """
         start_time = time.monotonic()
-        cache_key = self._get_cache_key(citation)
+        cache_key = None
+        if self._cache is not None and not self._resolver_caches:
+            cache_key = self._get_cache_key(citation)
 
         # Check cache if enabled
-        if self.config.enable_caching and cache_key in self._cache:
-            self.statistics.cache_hits += 1
-            title_preview = citation.title[:50] if citation.title else 'Unknown'
-            logger.debug(f'Cache hit for citation: {title_preview}')
-            return self._cache[cache_key]
+        if cache_key is not None:
+            cached = await self._cache.get(cache_key)
+            if cached is not None:
+                self.statistics.cache_hits += 1
+                title_preview = citation.title[:50] if citation.title else 'Unknown'
+                logger.debug(f'Cache hit for citation: {title_preview}')
+                return cached
 
         async with semaphore:
             # Rate limiting (use first available API limiter as default)
@@ -307,9 +315,11 @@ class BatchCitationProcessor:
             processing_time = (time.monotonic() - start_time) * 1000
             result.metadata.processing_time_ms = processing_time
 
-            # Cache the result
-            if self.config.enable_caching:
-                self._cache[cache_key] = result
+            # Cache the result (or count the resolver's cache hit)
+            if result.metadata.additional_info.get('cache_hit'):
+                self.statistics.cache_hits += 1
+            elif cache_key is not None:
+                await self._cache.put(cache_key, result)
 
             return result
 
@@ -635,10 +645,13 @@ class BatchCitationProcessor:
         return self.statistics
 
     def clear_cache(self):
-        """Clear the resolution cache."""
-        self._cache.clear()
+        """Clear the in-memory resolution cache."""
+        if self._cache is not None:
+            self._cache.clear()
         logger.info('Resolution cache cleared')
 
     def get_cache_size(self) -> int:
-        """Get current cache size."""
-        return len(self._cache)
+        """Get current in-memory cache size."""
+        if self._cache is None:
+            return 0
+        return self._cache.stats()['memory_size']
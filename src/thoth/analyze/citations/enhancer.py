@@ -6,7 +6,9 @@ from typing import List  # noqa: UP035
 from loguru import logger
 
 from thoth.analyze.citations.enrichment_service import CitationEnrichmentService
+from thoth.analyze.citations.local_resolver import LocalCorpusResolver
 from thoth.analyze.citations.opencitation import OpenCitationsAPI
+from thoth.analyze.citations.resolution_cache import ResolutionCache
 from thoth.analyze.citations.resolution_chain import CitationResolutionChain
 from thoth.analyze.citations.resolution_types import (
     CitationResolutionStatus,
@@ -141,6 +143,13 @@ class CitationEnhancer:
                         self.enhance_with_resolution_chain(citations)
                     )
                 finally:
+                    # The connection pools of the resolution cache and the
+                    # local resolver are bound to this loop
+                    chain = self._get_resolution_chain()
+                    if chain.cache is not None:
+                        loop.run_until_complete(chain.cache.close())
+                    if chain.local_resolver is not None:
+                        loop.run_until_complete(chain.local_resolver.close())
                     loop.close()
 
             # Run the async function in a separate thread
@@ -333,11 +342,16 @@ class CitationEnhancer:
             arxiv_resolver = ArxivResolver()
             openalex_resolver = OpenAlexResolver()
 
+            citation_config = self.config.citation_config
             self._resolution_chain = CitationResolutionChain(
                 crossref_resolver=crossref_resolver,
                 arxiv_resolver=arxiv_resolver,
                 openalex_resolver=openalex_resolver,
                 semanticscholar_resolver=self.semanticscholar_tool,
+                mode=getattr(citation_config, 'resolution_mode', 'sequential'),
+                hedge_delays=getattr(citation_config, 'hedge_delays_seconds', None),
+                cache=ResolutionCache.from_config(self.config),
+                local_resolver=LocalCorpusResolver.from_config(self.config),
             )
             logger.info('Initialized CitationResolutionChain with ArXiv support')
 
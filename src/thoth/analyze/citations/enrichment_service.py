@@ -629,6 +629,13 @@ class CitationEnrichmentService:
                     # Create minimal citation from original citation text
                     citation = Citation(text=result.citation)
 
+                # Bulk identifier lookups already return the full record, so
+                # fetching it again per citation would undo the batching;
+                # local matches carry the record we store ourselves
+                info = result.metadata.additional_info
+                if info.get('identifier_lookup') or info.get('local_match'):
+                    return citation
+
                 # Determine enrichment strategy based on available identifiers
                 if result.source == APISource.CROSSREF and result.matched_data.get(
                     'doi'
@@ -0,0 +1,546 @@
+"""
+Local-first citation resolution against our own paper corpus.
+
+A large share of references point to papers already in the paper_metadata
+table. LocalCorpusResolver matches citations against that table before the
+resolution chain asks any external API:
+
+1. Exact DOI or arXiv ID match
+2. Title match with two blocking strategies on an in-memory index:
+   - an inverted index of normalized title tokens (candidates share at least
+     half of the citation's title tokens)
+   - author-year blocks (first author name x publication year +-1), which
+     catch titles too garbled for the token index
+3. On an index miss, the same blocking in PostgreSQL - trigram similarity on
+   title_normalized and an author-year query - which finds papers added after
+   the index was built
+
+Candidates are scored with fuzzy_matcher.calculate_fuzzy_scores. A match is
+accepted when its title score reaches the threshold and neither year nor
+authors contradict it.
+
+Only complete records are matched: papers with a DOI or arXiv ID, or whose
+metadata came from processing the paper itself or a merge (source_of_truth
+'processed' or 'merged'). Title-only stubs - citation placeholders and
+external uploads - are left to the external APIs, so they get enriched.
+
+The index holds identifiers, titles, authors and years only. It is loaded
+from paper_metadata on first use in each process; the full record of a match
+is fetched from the database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+from loguru import logger
+
+from thoth.analyze.citations.fuzzy_matcher import (
+    calculate_fuzzy_scores,
+    normalize_author,
+    normalize_text,
+)
+from thoth.analyze.citations.resolution_chain import (
+    TITLE_THRESHOLD,
+    _citation_arxiv_id,
+    _normalize_arxiv_id,
+    _normalize_doi,
+)
+from thoth.analyze.citations.resolution_types import (
+    APISource,
+    CitationResolutionStatus,
+    ConfidenceLevel,
+    ResolutionMetadata,
+    ResolutionResult,
+)
+from thoth.utilities.schemas.citations import Citation
+
+# Candidates scored per citation and blocking strategy
+MAX_CANDIDATES = 20
+# Minimum author score when both sides list authors
+MIN_AUTHOR_SCORE = 0.2
+# How long to skip the database after PostgreSQL could not be reached
+DATABASE_RETRY_SECONDS = 300.0
+
+# Rows complete enough to stand in for an external API record
+_CITABLE_SOURCES = ('processed', 'merged')
+_CITABLE = (
+    '(doi IS NOT NULL OR arxiv_id IS NOT NULL '
+    "OR source_of_truth IN ('processed', 'merged'))"
+)
+_INDEX_COLUMNS = 'id, doi, arxiv_id, title, authors, year, source_of_truth'
+
+_INDEX_QUERY = f'SELECT {_INDEX_COLUMNS} FROM paper_metadata WHERE {_CITABLE}'
+# paper_metadata columns that are also Citation fields
+_RECORD_COLUMNS = (
+    'doi',
+    'arxiv_id',
+    'title',
+    'authors',
+    'year',
+    'journal',
+    'venue',
+    'volume',
+    'issue',
+    'pages',
+    'url',
+    'pdf_url',
+    'pdf_source',
+    'abstract',
+    'citation_count',
+    'reference_count',
+    'influential_citation_count',
+    'is_open_access',
+    'fields_of_study',
+)
+_RECORD_QUERY = (
+    f'SELECT id, {", ".join(_RECORD_COLUMNS)} FROM paper_metadata '
+    f'WHERE id = ANY($1::uuid[])'
+)
+# DOIs are stored as received; $1 is lowercased (index from migration 016)
+_IDENTIFIER_QUERY = (
+    f'SELECT {_INDEX_COLUMNS} FROM paper_metadata '
+    f'WHERE (lower(doi) = $1 OR arxiv_id = $2) AND {_CITABLE}'
+)
+# Uses the GIN trigram index on title_normalized
+_TRIGRAM_QUERY = (
+    f'SELECT {_INDEX_COLUMNS} FROM paper_metadata '
+    f'WHERE title_normalized % $1 AND {_CITABLE} '
+    f'ORDER BY similarity(title_normalized, $1) DESC LIMIT $2'
+)
+_AUTHOR_YEAR_QUERY = (
+    f'SELECT {_INDEX_COLUMNS} FROM paper_metadata '
+    f'WHERE year BETWEEN $1 AND $2 AND authors::text ILIKE $3 AND {_CITABLE} '
+    f'LIMIT $4'
+)
+
+# Title words too common to narrow down candidates
+_STOPWORDS = frozenset(
+    'and are for from into its not our over the their this using via what '
+    'when where which with without'.split()
+)
+_JSON_COLUMNS = ('authors', 'fields_of_study')
+
+_shared_resolver: LocalCorpusResolver | None = None
+_shared_resolver_lock = threading.Lock()
+
+
+def _sql_normalize_title(title: str) -> str:
+    """Normalize a title like the normalize_title() SQL function."""
+    normalized = re.sub(r'[^\w\s]', '', title.lower())
+    return re.sub(r'\s+', ' ', normalized).strip()
+
+
+def _title_tokens(title: str | None) -> set[str]:
+    return {
+        token
+        for token in normalize_text(title or '').split()
+        if len(token) >= 3 and token not in _STOPWORDS
+    }
+
+
+def _first_author_tokens(authors: list[str] | None) -> set[str]:
+    """Name parts of the first author, so 'Smith, J.' and 'John Smith' share one."""
+    if not authors:
+        return set()
+    return {token for token in normalize_author(authors[0]).split() if len(token) > 1}
+
+
+def _is_citable(paper: dict[str, Any]) -> bool:
+    """Whether a paper_metadata row is complete enough to match (see _CITABLE)."""
+    return bool(
+        paper.get('doi')
+        or paper.get('arxiv_id')
+        or paper.get('source_of_truth') in _CITABLE_SOURCES
+    )
+
+
+def _row_to_dict(row: Any) -> dict[str, Any]:
+    """Convert a paper_metadata row, decoding JSONB columns returned as text."""
+    data = dict(row)
+    data['id'] = str(data['id'])
+    for column in _JSON_COLUMNS:
+        if isinstance(data.get(column), str):
+            try:
+                data[column] = json.loads(data[column])
+            except ValueError:
+                data[column] = None
+    return data
+
+
+class LocalCorpusResolver:
+    """Resolves citations to papers in paper_metadata before any API is asked."""
+
+    def __init__(
+        self,
+        postgres_factory: Callable[[], Any],
+        match_threshold: float = TITLE_THRESHOLD,
+        max_candidates: int = MAX_CANDIDATES,
+    ):
+        """
+        Initialize the resolver.
+
+        Args:
+            postgres_factory: Creates a PostgresService. Called once per event
+                loop, since connection pools cannot be shared between loops.
+            match_threshold: Minimum title score of a match (0.0-1.0)
+            max_candidates: Candidates scored per citation and blocking
+                strategy
+        """
+        self.match_threshold = match_threshold
+        self.max_candidates = max_candidates
+        self._postgres_factory = postgres_factory
+        self._postgres: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._postgres_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._database_retry_at = 0.0
+
+        # The index: id -> (title, authors, year), plus the lookup structures
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._papers: dict[str, tuple[str, list[str], int | None]] = {}
+        self._by_doi: dict[str, str] = {}
+        self._by_arxiv: dict[str, str] = {}
+        self._title_index: dict[str, set[str]] = {}
+        self._author_year_index: dict[tuple[str, int], set[str]] = {}
+
+        self.identifier_hits = 0
+        self.index_hits = 0
+        self.database_hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config) -> LocalCorpusResolver | None:
+        """
+        Return the process-wide resolver configured in ``citation``.
+
+        All resolution chains of a process share one instance, so the index
+        is built once per process.
+
+        Returns:
+            The shared resolver, or None when local resolution is disabled or
+            no database URL is configured
+        """
+        citation_config = config.citation_config
+        if not getattr(citation_config, 'local_resolution_enabled', False):
+            return None
+        database_url = getattr(getattr(config, 'secrets', None), 'database_url', None)
+        if not database_url:
+            return None
+
+        global _shared_resolver
+        with _shared_resolver_lock:
+            if _shared_resolver is None:
+
+                def postgres_factory():
+                    from thoth.services.postgres_service import PostgresService
+
+                    return PostgresService(config=config, database_url=database_url)
+
+                _shared_resolver = cls(
+                    postgres_factory=postgres_factory,
+                    match_threshold=citation_config.local_match_threshold,
+                )
+            return _shared_resolver
+
+    async def _database(self) -> Any | None:
+        """Return the PostgresService of the running event loop, if available."""
+        if time.monotonic() < self._database_retry_at:
+            return None
+
+        loop = asyncio.get_running_loop()
+        postgres = self._postgres.get(loop)
+        if postgres is not None:
+            return postgres
+
+        lock = self._postgres_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            postgres = self._postgres.get(loop)
+            if postgres is None:
+                postgres = self._postgres_factory()
+                try:
+                    await postgres.initialize()
+                    if not self._loaded:
+                        await self._load_index(postgres)
+                except Exception as e:
+                    logger.warning(
+                        f'Local citation resolver cannot use PostgreSQL, '
+                        f'skipping it for {DATABASE_RETRY_SECONDS:.0f}s: {e}'
+                    )
+                    self._database_retry_at = time.monotonic() + DATABASE_RETRY_SECONDS
+                    return None
+                self._postgres[loop] = postgres
+        return postgres
+
+    async def _load_index(self, postgres: Any) -> None:
+        start_time = time.time()
+        rows = await postgres.fetch(_INDEX_QUERY)
+        for row in rows:
+            self.add_paper(_row_to_dict(row))
+        self._loaded = True
+        logger.info(
+            f'Loaded local citation index: {len(self._papers)} papers in '
+            f'{time.time() - start_time:.2f}s'
+        )
+
+    def add_paper(self, paper: dict[str, Any]) -> None:
+        """
+        Add a paper to the index; title-only stubs are skipped.
+
+        Args:
+            paper: paper_metadata row with at least id and title; doi,
+                arxiv_id, source_of_truth, authors and year are used when
+                present
+        """
+        if not _is_citable(paper):
+            return
+        paper_id = str(paper['id'])
+        title = paper.get('title') or ''
+        authors = [a for a in paper.get('authors') or [] if isinstance(a, str)]
+        year = paper.get('year')
+
+        with self._lock:
+            if paper_id in self._papers:
+                return
+            self._papers[paper_id] = (title, authors, year)
+            if paper.get('doi'):
+                self._by_doi[_normalize_doi(paper['doi'])] = paper_id
+            if arxiv_id := _normalize_arxiv_id(paper.get('arxiv_id') or ''):
+                self._by_arxiv[arxiv_id] = paper_id
+            for token in _title_tokens(title):
+                self._title_index.setdefault(token, set()).add(paper_id)
+            if year is not None:
+                for token in _first_author_tokens(authors):
+                    self._author_year_index.setdefault((token, year), set()).add(
+                        paper_id
+                    )
+
+    def _match_identifier(self, citation: Citation) -> str | None:
+        with self._lock:
+            if citation.doi and (doi := _normalize_doi(citation.doi)) in self._by_doi:
+                return self._by_doi[doi]
+            if arxiv_id := _citation_arxiv_id(citation):
+                return self._by_arxiv.get(arxiv_id)
+            return None
+
+    def _block(self, citation: Citation) -> list[str]:
+        """Candidate papers of a citation from the title and author-year blocks."""
+        candidates: dict[str, None] = {}
+
+        tokens = _title_tokens(citation.title)
+        overlap: dict[str, int] = {}
+        blocked: set[str] = set()
+        # add_paper mutates the index sets from other threads
+        with self._lock:
+            for token in tokens:
+                for paper_id in self._title_index.get(token, ()):
+                    overlap[paper_id] = overlap.get(paper_id, 0) + 1
+            if citation.year is not None:
+                for token in _first_author_tokens(citation.authors):
+                    for year in (citation.year - 1, citation.year, citation.year + 1):
+                        blocked |= self._author_year_index.get((token, year), set())
+        min_overlap = (len(tokens) + 1) // 2
+        ranked = sorted(
+            (paper_id for paper_id, count in overlap.items() if count >= min_overlap),
+            key=lambda paper_id: (-overlap[paper_id], paper_id),
+        )
+        candidates.update(dict.fromkeys(ranked[: self.max_candidates]))
+        candidates.update(dict.fromkeys(sorted(blocked)[: self.max_candidates]))
+
+        return list(candidates)
+
+    def _best_match(
+        self, citation: Citation, candidates: list[str]
+    ) -> tuple[str, float] | None:
+        """Score candidates against a citation and return the accepted match."""
+        if not candidates or not citation.title:
+            return None
+        with self._lock:
+            papers = [self._papers[paper_id] for paper_id in candidates]
+        _, components = calculate_fuzzy_scores(
+            [citation.title],
+            [title for title, _, _ in papers],
+            [citation.authors or []],
+            [authors for _, authors, _ in papers],
+            [citation.year],
+            [year for _, _, year in papers],
+            workers=1,
+        )
+
+        best = None
+        for j, (_, authors, year) in enumerate(papers):
+            title_score = float(components['title'][0, j])
+            if title_score < self.match_threshold:
+                continue
+            if (
+                citation.year is not None
+                and year is not None
+                and abs(citation.year - year) > 1
+            ):
+                continue
+            if (
+                citation.authors
+                and authors
+                and components['authors'][0, j] < MIN_AUTHOR_SCORE
+            ):
+                continue
+            if best is None or title_score > best[1]:
+                best = (candidates[j], title_score)
+        return best
+
+    async def _search_database(
+        self, postgres: Any, citation: Citation
+    ) -> tuple[str, float] | None:
+        """Look for a citation's paper in PostgreSQL and add the rows found."""
+        rows = []
+        doi = _normalize_doi(citation.doi) if citation.doi else None
+        arxiv_id = _citation_arxiv_id(citation)
+        if doi or arxiv_id:
+            rows += await postgres.fetch(_IDENTIFIER_QUERY, doi, arxiv_id)
+        if citation.title:
+            rows += await postgres.fetch(
+                _TRIGRAM_QUERY,
+                _sql_normalize_title(citation.title),
+                self.max_candidates,
+            )
+            first_author = _first_author_tokens(citation.authors)
+            if citation.year is not None and first_author:
+                surname = max(first_author, key=len).replace('_', '\\_')
+                rows += await postgres.fetch(
+                    _AUTHOR_YEAR_QUERY,
+                    citation.year - 1,
+                    citation.year + 1,
+                    f'%{surname}%',
+                    self.max_candidates,
+                )
+        if not rows:
+            return None
+
+        for row in rows:
+            self.add_paper(_row_to_dict(row))
+        if paper_id := self._match_identifier(citation):
+            return paper_id, 1.0
+        with self._lock:
+            found = [
+                paper_id
+                for paper_id in dict.fromkeys(str(row['id']) for row in rows)
+                if paper_id in self._papers
+            ]
+        return self._best_match(citation, found)
+
+    async def resolve_many(
+        self,
+        citations: list[Citation],
+        use_database: bool = True,
+    ) -> dict[int, ResolutionResult]:
+        """
+        Resolve citations to papers we already hold.
+
+        Args:
+            citations: Citations to resolve
+            use_database: Also search PostgreSQL for citations the in-memory
+                index cannot match (False = index only)
+
+        Returns:
+            Mapping of citation index to result for the citations matched;
+            the others are left to the external APIs
+        """
+        start_time = time.time()
+        postgres = await self._database()
+        if postgres is None or not citations:
+            return {}
+
+        matches: dict[int, tuple[str, float, str]] = {}
+        for i, citation in enumerate(citations):
+            if paper_id := self._match_identifier(citation):
+                matches[i] = (paper_id, 1.0, 'identifier')
+                self.identifier_hits += 1
+            elif match := self._best_match(citation, self._block(citation)):
+                matches[i] = (*match, 'index')
+                self.index_hits += 1
+            elif use_database and (
+                match := await self._search_database(postgres, citation)
+            ):
+                matches[i] = (*match, 'database')
+                self.database_hits += 1
+            else:
+                self.misses += 1
+
+        if not matches:
+            return {}
+
+        rows = await postgres.fetch(
+            _RECORD_QUERY, list({paper_id for paper_id, _, _ in matches.values()})
+        )
+        records = {str(row['id']): _row_to_dict(row) for row in rows}
+
+        per_citation_ms = (time.time() - start_time) * 1000 / len(citations)
+        results = {}
+        for i, (paper_id, score, match_type) in matches.items():
+            record = records.get(paper_id)
+            if record is None:
+                # Deleted since it was indexed
+                continue
+            citation = citations[i]
+            matched_data = {
+                column: record[column]
+                for column in _RECORD_COLUMNS
+                if record.get(column) is not None
+            }
+            results[i] = ResolutionResult(
+                citation=citation.text or citation.title or 'Unknown citation',
+                status=CitationResolutionStatus.RESOLVED,
+                confidence_score=score,
+                confidence_level=(
+                    ConfidenceLevel.HIGH if score >= 0.85 else ConfidenceLevel.MEDIUM
+                ),
+                source=APISource.LOCAL,
+                matched_data=matched_data,
+                metadata=ResolutionMetadata(
+                    api_sources_tried=[APISource.LOCAL],
+                    processing_time_ms=per_citation_ms,
+                    additional_info={
+                        'local_match': match_type,
+                        'paper_id': paper_id,
+                    },
+                ),
+            )
+        return results
+
+    async def resolve(self, citation: Citation) -> ResolutionResult | None:
+        """
+        Resolve a single citation to a paper we already hold.
+
+        Returns:
+            The result, or None if the paper is not in our corpus
+        """
+        return (await self.resolve_many([citation])).get(0)
+
+    def stats(self) -> dict[str, Any]:
+        """Size and hit counters of the resolver."""
+        with self._lock:
+            size = len(self._papers)
+        return {
+            'indexed_papers': size,
+            'loaded': self._loaded,
+            'identifier_hits': self.identifier_hits,
+            'index_hits': self.index_hits,
+            'database_hits': self.database_hits,
+            'misses': self.misses,
+        }
+
+    async def close(self) -> None:
+        """Close the database connections opened for the running event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        postgres = self._postgres.pop(loop, None)
+        if postgres is not None:
+            await postgres.close()
@@ -125,6 +125,8 @@ class MatchValidator:
     >>> for candidate in candidates:
     ...     score = validator.validate_match(input_citation, candidate)
     >>> best = validator.get_best_match(candidates)
+
+    validate_matches() scores a whole candidate list with one batch call.
     """
 
     def __init__(self):
@@ -224,6 +226,82 @@ class MatchValidator:
             candidate.rejection_reason = f'Scoring error: {str(e)}'  # noqa: RUF010
             return 0.0
 
+    def validate_matches(
+        self,
+        input_citation: Citation,
+        candidates: List[MatchCandidate],  # noqa: UP006
+    ) -> List[float]:  # noqa: UP006
+        """
+        Validate and score all candidates for an input citation.
+
+        Same scores and side effects as calling validate_match() on each
+        candidate, but the candidates that pass the hard constraints are
+        scored together with fuzzy_matcher.calculate_fuzzy_scores, which
+        normalizes the input citation once and computes the title and
+        journal ratios for all candidates in a few vectorized calls.
+
+        Args:
+            input_citation: The original citation we're trying to match
+            candidates: The candidate matches to validate
+
+        Returns:
+            Overall match score per candidate (0.0 if constraints fail)
+        """
+        scores = [0.0] * len(candidates)
+
+        # Step 1: Check hard constraints first (fast rejection)
+        passing = []
+        for i, candidate in enumerate(candidates):
+            if self.check_hard_constraints(input_citation, candidate):
+                passing.append(i)
+            else:
+                logger.debug(
+                    f'Candidate failed hard constraints: {candidate.rejection_reason}'
+                )
+                candidate.component_scores = ComponentScores()
+
+        if not passing:
+            return scores
+
+        # Step 2: Score the remaining candidates in one batch
+        valid = [candidates[i].citation for i in passing]
+        try:
+            overall_scores, components = fuzzy_matcher.calculate_fuzzy_scores(
+                titles1=[input_citation.title or ''],
+                titles2=[c.title or '' for c in valid],
+                authors1=[input_citation.authors or []],
+                authors2=[c.authors or [] for c in valid],
+                years1=[input_citation.year],
+                years2=[c.year for c in valid],
+                journals1=[input_citation.journal or ''],
+                journals2=[c.journal or '' for c in valid],
+            )
+        except Exception as e:
+            logger.error(
+                f'Error calculating fuzzy scores for candidates: {e}', exc_info=True
+            )
+            for i in passing:
+                candidates[i].component_scores = ComponentScores()
+                candidates[i].passed_constraints = False
+                candidates[i].rejection_reason = f'Scoring error: {e}'
+            return scores
+
+        # Step 3: Populate component scores from the score matrices
+        for n, i in enumerate(passing):
+            candidates[i].component_scores = ComponentScores(
+                title=float(components['title'][0, n]),
+                authors=float(components['authors'][0, n]),
+                year=float(components['year'][0, n]),
+                journal=float(components['journal'][0, n]),
+                overall=float(overall_scores[0, n]),
+            )
+            scores[i] = float(overall_scores[0, n])
+
+        logger.debug(
+            f'Scored {len(passing)}/{len(candidates)} candidates passing constraints'
+        )
+        return scores
+
     def check_hard_constraints(
         self, input_citation: Citation, candidate: MatchCandidate
     ) -> bool:
@@ -73,6 +73,7 @@ class OpenAlexResolver:
     """
 
     BASE_URL = 'https://api.openalex.org'
+    MAX_FILTER_VALUES = 100  # OpenAlex limit for values OR-ed in one filter
 
     def __init__(
         self,
@@ -522,6 +523,57 @@ class OpenAlexResolver:
 
         return candidates
 
+    @staticmethod
+    def _bare_doi(doi: str) -> str:
+        """Strip the doi.org prefix OpenAlex uses and lowercase the DOI."""
+        doi = doi.strip().lower()
+        for prefix in ('https://doi.org/', 'http://doi.org/', 'doi:'):
+            if doi.startswith(prefix):
+                return doi[len(prefix) :]
+        return doi
+
+    async def lookup_dois(self, dois: list[str]) -> dict[str, MatchCandidate]:
+        """
+        Look up works by DOI with one request per MAX_FILTER_VALUES DOIs.
+
+        Uses the OR filter (``filter=doi:a|b|c``) instead of one request per
+        DOI. DOIs containing filter separators cannot be expressed in the
+        filter and are skipped.
+
+        Args:
+            dois: DOIs to look up, with or without the doi.org prefix
+
+        Returns:
+            Mapping of lowercase bare DOI to the matching work, for the DOIs
+            OpenAlex knows. Confidence scores are not set.
+        """
+        wanted = [
+            doi
+            for doi in dict.fromkeys(self._bare_doi(d) for d in dois if d)
+            if doi and '|' not in doi and ',' not in doi
+        ]
+        matches: dict[str, MatchCandidate] = {}
+
+        for start in range(0, len(wanted), self.MAX_FILTER_VALUES):
+            group = wanted[start : start + self.MAX_FILTER_VALUES]
+            params = {'filter': 'doi:' + '|'.join(group), 'per-page': len(group)}
+            if self.email:
+                params['mailto'] = self.email
+
+            data = await self._make_request('/works', params)
+            for work in (data or {}).get('results', []):
+                try:
+                    match = self._parse_single_work(work)
+                except Exception as e:
+                    logger.warning(f'Failed to parse OpenAlex result: {e}')
+                    continue
+                if match.doi:
+                    matches[self._bare_doi(match.doi)] = match
+
+        self._matches_found += len(matches)
+        logger.debug(f'OpenAlex DOI lookup found {len(matches)}/{len(wanted)} works')
+        return matches
+
     async def batch_resolve(
         self, citations: list[Citation]
     ) -> dict[Citation, list[MatchCandidate]]:
@@ -6,7 +6,8 @@ timeout handling for responsive user interactions.
 
 Key Features:
     - Fast resolution with configurable timeout (default 10-15s)
-    - LRU cache for resolved DOIs by normalized citation key
+    - Resolved DOIs cached by normalized citation key in the resolution chain's
+      ResolutionCache, shared with the batch and enrichment paths
     - Negative result caching (1 hour TTL) to avoid hammering APIs
     - PENDING status for timeouts (marked for batch retry later)
     - Comprehensive statistics tracking and logging
@@ -21,15 +22,17 @@ Usage:
 """
 
 import asyncio
-import hashlib
 import time
 from dataclasses import dataclass, field  # noqa: F401
 from datetime import datetime, timedelta  # noqa: F401
 from typing import Any, Dict  # noqa: UP035
 
-from cachetools import LRUCache, TTLCache
 from loguru import logger
 
+from thoth.analyze.citations.resolution_cache import (
+    ResolutionCache,
+    citation_cache_key,
+)
 from thoth.analyze.citations.resolution_chain import CitationResolutionChain
 from thoth.analyze.citations.resolution_types import (
     APISource,  # noqa: F401
@@ -48,9 +51,10 @@ class RealTimeConfig:
 
     Attributes:
         timeout_seconds: Maximum time to spend on resolution (default 15s)
-        cache_size: Maximum number of entries in positive result cache
+        cache_size: Maximum number of cached results, used when the resolution
+            chain has no cache of its own
         negative_cache_ttl_hours: Time-to-live for negative cache entries
-        enable_negative_cache: Whether to cache failed resolution attempts
+        enable_negative_cache: Whether to cache unresolved citations
     """
 
     timeout_seconds: int = 15
@@ -123,8 +127,8 @@ class RealtimeCitationProcessor:
     Attributes:
         config: Configuration parameters for resolution and caching
         resolution_chain: Chain of API resolvers for citation lookup
-        positive_cache: LRU cache for successfully resolved citations
-        negative_cache: TTL cache for failed resolution attempts
+        cache: Resolution cache of the chain, holding resolved and unresolved
+            citations
         statistics: Performance and usage statistics
     """  # noqa: W505
 
@@ -143,66 +147,46 @@ class RealtimeCitationProcessor:
         self.config = config or RealTimeConfig()
         self.resolution_chain = resolution_chain or CitationResolutionChain()
 
-        # Initialize positive result cache (LRU)
-        self.positive_cache: LRUCache = LRUCache(maxsize=self.config.cache_size)
-
-        # Initialize negative result cache (TTL) - expires after N hours
-        negative_cache_ttl_seconds = self.config.negative_cache_ttl_hours * 3600
-        self.negative_cache: TTLCache = TTLCache(
-            maxsize=self.config.cache_size, ttl=negative_cache_ttl_seconds
-        )
+        # Use the chain's (possibly shared, persistent) cache, or give it one
+        if self.resolution_chain.cache is None:
+            negative_cache_ttl_seconds = (
+                self.config.negative_cache_ttl_hours * 3600
+                if self.config.enable_negative_cache
+                else 0
+            )
+            self.resolution_chain.cache = ResolutionCache(
+                maxsize=self.config.cache_size,
+                negative_ttl_seconds=negative_cache_ttl_seconds,
+            )
+        self.cache: ResolutionCache = self.resolution_chain.cache
 
         # Initialize statistics
         self.statistics = CacheStatistics()
 
-        # Lock for thread-safe cache access
-        self._cache_lock: asyncio.Lock | None = (
-            None  # Lazy init to avoid event loop binding
-        )
-
         logger.info(
             f'RealtimeCitationProcessor initialized with timeout={self.config.timeout_seconds}s, '
-            f'cache_size={self.config.cache_size}, '
+            f'cache_size={self.cache.stats()["memory_maxsize"]}, '
             f'negative_cache_ttl={self.config.negative_cache_ttl_hours}h'
         )
 
-    def _get_cache_lock(self) -> asyncio.Lock:
-        """Get or create the cache lock (lazy init to avoid event loop binding)."""
-        if self._cache_lock is None:
-            self._cache_lock = asyncio.Lock()
-        return self._cache_lock
-
-    def _normalize_citation_key(self, citation: Citation) -> str:
+    def _normalize_citation_key(self, citation: Citation) -> str | None:
         """
         Generate normalized cache key from citation.
 
-        Creates a consistent key from title, year, and first author for cache lookups.
-        Uses MD5 hash to keep keys manageable.
-
         Args:
             citation: Citation to generate key for
 
         Returns:
-            Normalized cache key (MD5 hash)
+            Normalized cache key (MD5 hash), or None if the citation is not
+            cached (no title, or a DOI that needs no resolution)
         """
-        # Extract components for key
-        title = (citation.title or '').lower().strip()
-        year = str(citation.year or '')
-        author = ''
-        if citation.authors and len(citation.authors) > 0:
-            author = citation.authors[0].lower().strip()
-
-        # Create stable key from normalized components
-        key_components = f'{title}|{year}|{author}'
-
-        # Use MD5 hash for consistent, manageable key length
-        key_hash = hashlib.md5(key_components.encode('utf-8')).hexdigest()
-
-        return key_hash
+        if citation.doi:
+            return None
+        return citation_cache_key(citation)
 
-    async def _check_positive_cache(self, cache_key: str) -> ResolutionResult | None:
+    async def _check_cache(self, cache_key: str) -> ResolutionResult | None:
         """
-        Check positive result cache.
+        Check the resolution cache.
 
         Args:
             cache_key: Normalized cache key
@@ -210,79 +194,32 @@ class RealtimeCitationProcessor:
         Returns:
             Cached ResolutionResult if found, None otherwise
         """
-        async with self._get_cache_lock():
-            result = self.positive_cache.get(cache_key)
-            if result:
-                logger.debug(f'Positive cache HIT for key: {cache_key[:16]}...')
-                self.statistics.positive_cache_hits += 1
-                return result
+        result = await self.cache.get(cache_key)
+        if result is None:
             return None
 
-    async def _check_negative_cache(self, cache_key: str) -> bool:
-        """
-        Check negative result cache.
-
-        Args:
-            cache_key: Normalized cache key
-
-        Returns:
-            True if key is in negative cache (known to fail), False otherwise
-        """
-        if not self.config.enable_negative_cache:
-            return False
-
-        async with self._get_cache_lock():
-            is_negative = cache_key in self.negative_cache
-            if is_negative:
-                logger.debug(f'Negative cache HIT for key: {cache_key[:16]}...')
-                self.statistics.negative_cache_hits += 1
-                return True
-            return False
-
-    async def _store_positive_cache(
-        self, cache_key: str, result: ResolutionResult
-    ) -> None:
-        """
-        Store result in positive cache.
-
-        Args:
-            cache_key: Normalized cache key
-            result: Resolution result to cache
-        """
-        async with self._get_cache_lock():
-            self.positive_cache[cache_key] = result
-            logger.debug(
-                f'Stored in positive cache: {cache_key[:16]}... '
-                f'(status={result.status}, confidence={result.confidence_score:.2f})'
-            )
-
-    async def _store_negative_cache(self, cache_key: str) -> None:
-        """
-        Store key in negative cache to avoid repeated failed lookups.
-
-        Args:
-            cache_key: Normalized cache key for failed resolution
-        """
-        if not self.config.enable_negative_cache:
-            return
-
-        async with self._get_cache_lock():
-            self.negative_cache[cache_key] = datetime.utcnow()
-            logger.debug(
-                f'Stored in negative cache: {cache_key[:16]}... '
-                f'(TTL={self.config.negative_cache_ttl_hours}h)'
+        if result.status == CitationResolutionStatus.UNRESOLVED:
+            if not self.config.enable_negative_cache:
+                return None
+            logger.debug(f'Negative cache HIT for key: {cache_key[:16]}...')
+            self.statistics.negative_cache_hits += 1
+            result.metadata.error_message = (
+                'Previously failed resolution (negative cache)'
             )
+            result.metadata.additional_info['negative_cache_hit'] = True
+        else:
+            logger.debug(f'Positive cache HIT for key: {cache_key[:16]}...')
+            self.statistics.positive_cache_hits += 1
+        return result
 
     async def resolve_citation(self, citation: Citation) -> ResolutionResult:
         """
         Resolve citation with caching and timeout handling.
 
         Resolution flow:
-        1. Check positive cache for previous successful resolution
-        2. Check negative cache to avoid repeated failures
-        3. Attempt resolution with timeout
-        4. Update appropriate cache based on result
-        5. Return result with PENDING status if timeout occurs
+        1. Check the cache for a previous resolution (successful or not)
+        2. Attempt resolution with timeout; the chain caches the result
+        3. Return result with PENDING status if timeout occurs
 
         Args:
             citation: Citation to resolve
@@ -298,34 +235,16 @@ class RealtimeCitationProcessor:
 
         logger.info(
             f"Resolving citation: '{citation.title or citation.text[:50]}...' "
-            f'(cache_key: {cache_key[:16]}...)'
+            f'(cache_key: {(cache_key or "-")[:16]}...)'
         )
 
-        # Step 1: Check positive cache
-        cached_result = await self._check_positive_cache(cache_key)
-        if cached_result:
-            return cached_result
-
-        # Step 2: Check negative cache
-        is_negative = await self._check_negative_cache(cache_key)
-        if is_negative:
-            # Return UNRESOLVED result from negative cache
-            return ResolutionResult(
-                citation=citation.text or str(citation),
-                status=CitationResolutionStatus.UNRESOLVED,
-                confidence_score=0.0,
-                confidence_level=ConfidenceLevel.LOW,
-                source=None,
-                matched_data=None,
-                metadata=ResolutionMetadata(
-                    attempt_count=0,
-                    last_attempt_time=datetime.utcnow(),
-                    error_message='Previously failed resolution (negative cache)',
-                    additional_info={'negative_cache_hit': True},
-                ),
-            )
+        # Step 1: Check the cache
+        if cache_key is not None:
+            cached_result = await self._check_cache(cache_key)
+            if cached_result:
+                return cached_result
 
-        # Step 3: Attempt resolution with timeout
+        # Step 2: Attempt resolution with timeout
         self.statistics.cache_misses += 1
 
         try:
@@ -335,7 +254,7 @@ class RealtimeCitationProcessor:
 
             # Wrap resolution in timeout
             result = await asyncio.wait_for(
-                self.resolution_chain.resolve(citation),
+                self.resolution_chain.resolve(citation, skip_cache_lookup=True),
                 timeout=self.config.timeout_seconds,
             )
 
@@ -354,12 +273,6 @@ class RealtimeCitationProcessor:
                 f'time={elapsed_ms:.1f}ms'
             )
 
-            # Step 4: Cache the result
-            if result.status == CitationResolutionStatus.RESOLVED:
-                await self._store_positive_cache(cache_key, result)
-            elif result.status == CitationResolutionStatus.UNRESOLVED:
-                await self._store_negative_cache(cache_key)
-
             return result
 
         except asyncio.TimeoutError:  # noqa: UP041
@@ -417,11 +330,18 @@ class RealtimeCitationProcessor:
                 ),
             )
 
-            # Cache error to avoid repeated failures
-            await self._store_negative_cache(cache_key)
-
             return result
 
+    def _cache_entries(self) -> tuple[list, list]:
+        """Split the cached results into positive and negative entries."""
+        positive_entries, negative_entries = [], []
+        for key, result in self.cache.entries():
+            if result.status == CitationResolutionStatus.UNRESOLVED:
+                negative_entries.append((key, result))
+            else:
+                positive_entries.append((key, result))
+        return positive_entries, negative_entries
+
     def get_cache_stats(self) -> Dict[str, Any]:  # noqa: UP006
         """
         Get comprehensive cache and performance statistics.
@@ -432,13 +352,15 @@ class RealtimeCitationProcessor:
                 - Hit rates (overall, positive, negative)
                 - Performance metrics (timeouts, errors, avg time)
                 - Request counts and breakdown
+                - Statistics of the shared resolution cache
         """
+        positive_entries, negative_entries = self._cache_entries()
+        cache_stats = self.cache.stats()
         stats = {
             # Cache size
-            'positive_cache_size': len(self.positive_cache),
-            'positive_cache_maxsize': self.positive_cache.maxsize,
-            'negative_cache_size': len(self.negative_cache),
-            'negative_cache_maxsize': self.negative_cache.maxsize,
+            'positive_cache_size': len(positive_entries),
+            'negative_cache_size': len(negative_entries),
+            'cache_maxsize': cache_stats['memory_maxsize'],
             # Hit rates
             'total_requests': self.statistics.total_requests,
             'cache_hit_rate': self.statistics.hit_rate,
@@ -457,51 +379,49 @@ class RealtimeCitationProcessor:
             'timeout_seconds': self.config.timeout_seconds,
             'negative_cache_ttl_hours': self.config.negative_cache_ttl_hours,
             'negative_cache_enabled': self.config.enable_negative_cache,
+            # Shared cache (all resolution paths of this process)
+            'resolution_cache': cache_stats,
         }
 
         return stats
 
     async def clear_cache(self) -> Dict[str, int]:  # noqa: UP006
         """
-        Clear all caches (positive and negative).
+        Clear all cached results (positive and negative) of this process.
+
+        Entries in the persistent store expire on their own TTL.
 
         Returns:
             Dictionary with counts of cleared entries:
-                - positive_cleared: Number of entries cleared from positive cache
-                - negative_cleared: Number of entries cleared from negative cache
+                - positive_cleared: Number of successful resolutions cleared
+                - negative_cleared: Number of failed resolutions cleared
         """
-        async with self._get_cache_lock():
-            positive_count = len(self.positive_cache)
-            negative_count = len(self.negative_cache)
-
-            self.positive_cache.clear()
-            self.negative_cache.clear()
+        negative_count = self.cache.clear(negative_only=True)
+        positive_count = self.cache.clear()
 
-            logger.info(
-                f'Caches cleared: positive={positive_count}, negative={negative_count}'
-            )
+        logger.info(
+            f'Caches cleared: positive={positive_count}, negative={negative_count}'
+        )
 
-            return {
-                'positive_cleared': positive_count,
-                'negative_cleared': negative_count,
-            }
+        return {
+            'positive_cleared': positive_count,
+            'negative_cleared': negative_count,
+        }
 
     async def clear_negative_cache(self) -> int:
         """
-        Clear only the negative result cache.
+        Clear only the cached failed resolutions.
 
         Useful for retrying previously failed citations without clearing successful results.
 
         Returns:
             Number of entries cleared from negative cache
         """  # noqa: W505
-        async with self._get_cache_lock():
-            count = len(self.negative_cache)
-            self.negative_cache.clear()
+        count = self.cache.clear(negative_only=True)
 
-            logger.info(f'Negative cache cleared: {count} entries removed')
+        logger.info(f'Negative cache cleared: {count} entries removed')
 
-            return count
+        return count
 
     def get_cache_contents(self) -> Dict[str, Any]:  # noqa: UP006
         """
@@ -513,8 +433,9 @@ class RealtimeCitationProcessor:
                 - negative_entries: List of cached failed resolutions
                 - total_size: Combined cache size
         """
+        positive, negative = self._cache_entries()
         positive_entries = []
-        for key, result in self.positive_cache.items():
+        for key, result in positive:
             positive_entries.append(
                 {
                     'cache_key': key,
@@ -531,13 +452,13 @@ class RealtimeCitationProcessor:
             )
 
         negative_entries = []
-        for key, timestamp in self.negative_cache.items():
+        for key, result in negative:
             negative_entries.append(
                 {
                     'cache_key': key,
-                    'cached_at': timestamp.isoformat()
-                    if isinstance(timestamp, datetime)
-                    else str(timestamp),
+                    'cached_at': result.resolved_at.isoformat()
+                    if result.resolved_at
+                    else None,
                 }
             )
 
@@ -0,0 +1,357 @@
+"""
+Shared citation resolution cache.
+
+The same references (e.g. "Attention Is All You Need") appear in thousands of
+papers. This cache lets every resolution path - realtime, batch and the
+enhancer used by the document pipeline - resolve such a reference once and
+reuse the result, in the same process and across worker processes.
+
+Two tiers:
+- An in-memory LRU per process, checked first
+- The api_enrichment_cache table in PostgreSQL (via CacheRepository), shared
+  by all processes. Used when a database URL is configured; if the database
+  cannot be reached, the cache falls back to memory only for a while.
+
+Results are keyed by the normalized citation key (title, year and first
+author). Resolved and partially resolved citations are kept for the positive
+TTL, unresolved ones for the shorter negative TTL so they are retried later.
+Failed and pending results (errors, timeouts) are not cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from cachetools import LRUCache
+from loguru import logger
+
+from thoth.analyze.citations.resolution_types import (
+    CitationResolutionStatus,
+    ResolutionResult,
+)
+from thoth.utilities.schemas.citations import Citation
+
+if TYPE_CHECKING:
+    from thoth.repositories.cache_repository import CacheRepository
+
+CACHE_KEY_PREFIX = 'citation_resolution:'
+DEFAULT_POSITIVE_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_NEGATIVE_TTL_SECONDS = 3600
+# How long to stay memory-only after PostgreSQL could not be reached
+PERSISTENT_RETRY_SECONDS = 300.0
+
+_POSITIVE_STATUSES = (
+    CitationResolutionStatus.RESOLVED,
+    CitationResolutionStatus.PARTIAL,
+)
+
+_shared_cache: ResolutionCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+def citation_cache_key(citation: Citation) -> str | None:
+    """
+    Generate the normalized cache key of a citation.
+
+    Creates a consistent key from title, year and first author, hashed with
+    MD5 to keep keys manageable.
+
+    Returns:
+        The key, or None for citations without a title (which cannot be told
+        apart reliably)
+    """
+    title = (citation.title or '').lower().strip()
+    if not title:
+        return None
+    year = str(citation.year or '')
+    author = ''
+    if citation.authors:
+        author = citation.authors[0].lower().strip()
+
+    key_components = f'{title}|{year}|{author}'
+    return hashlib.md5(key_components.encode('utf-8')).hexdigest()
+
+
+class ResolutionCache:
+    """In-memory LRU of resolution results in front of a PostgreSQL store."""
+
+    def __init__(
+        self,
+        postgres_factory: Callable[[], Any] | None = None,
+        maxsize: int = 10000,
+        positive_ttl_seconds: float = DEFAULT_POSITIVE_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            postgres_factory: Creates a PostgresService for the persistent
+                tier (None = memory only). Called once per event loop, since
+                connection pools cannot be shared between loops.
+            maxsize: Maximum number of results kept in memory
+            positive_ttl_seconds: Lifetime of resolved results
+            negative_ttl_seconds: Lifetime of unresolved results (0 disables
+                negative caching)
+        """
+        self.positive_ttl_seconds = positive_ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._memory: LRUCache = LRUCache(maxsize=max(maxsize, 1))
+        self._lock = threading.Lock()
+        self._postgres_factory = postgres_factory
+        self._repositories: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._repository_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._persistent_retry_at = 0.0
+
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @classmethod
+    def from_config(cls, config) -> ResolutionCache | None:
+        """
+        Return the process-wide cache configured in ``citation``.
+
+        All resolution chains of a process share one instance, so they share
+        its memory tier. The persistent tier is used when a database URL is
+        configured.
+
+        Returns:
+            The shared cache, or None when the resolution cache is disabled
+        """
+        citation_config = config.citation_config
+        if not getattr(citation_config, 'resolution_cache_enabled', False):
+            return None
+
+        global _shared_cache
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                database_url = getattr(
+                    getattr(config, 'secrets', None), 'database_url', None
+                )
+                postgres_factory = None
+                if database_url:
+
+                    def postgres_factory():
+                        from thoth.services.postgres_service import PostgresService
+
+                        return PostgresService(config=config, database_url=database_url)
+
+                _shared_cache = cls(
+                    postgres_factory=postgres_factory,
+                    maxsize=citation_config.resolution_cache_size,
+                    positive_ttl_seconds=citation_config.resolution_cache_ttl_days
+                    * 24
+                    * 3600,
+                    negative_ttl_seconds=(
+                        citation_config.resolution_cache_negative_ttl_hours * 3600
+                    ),
+                )
+            return _shared_cache
+
+    def ttl_for(self, result: ResolutionResult) -> float | None:
+        """Lifetime of a result in the cache, or None if it is not cached."""
+        if result.status in _POSITIVE_STATUSES:
+            return self.positive_ttl_seconds or None
+        if result.status == CitationResolutionStatus.UNRESOLVED:
+            return self.negative_ttl_seconds or None
+        return None
+
+    def _get_memory(self, key: str) -> ResolutionResult | None:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= time.monotonic():
+                del self._memory[key]
+                return None
+            return result
+
+    def _set_memory(self, key: str, result: ResolutionResult, ttl: float) -> None:
+        with self._lock:
+            self._memory[key] = (time.monotonic() + ttl, result)
+
+    @staticmethod
+    def _hit(result: ResolutionResult, tier: str) -> ResolutionResult:
+        """Copy a cached result so callers can modify it, marking its tier."""
+        hit = result.model_copy(deep=True)
+        hit.metadata.additional_info['cache_hit'] = tier
+        return hit
+
+    async def _repository(self) -> CacheRepository | None:
+        """Return the persistent store of the running event loop, if available."""
+        if (
+            self._postgres_factory is None
+            or time.monotonic() < self._persistent_retry_at
+        ):
+            return None
+
+        loop = asyncio.get_running_loop()
+        repository = self._repositories.get(loop)
+        if repository is not None:
+            return repository
+
+        from thoth.repositories.cache_repository import CacheRepository
+
+        lock = self._repository_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            repository = self._repositories.get(loop)
+            if repository is None:
+                postgres = self._postgres_factory()
+                try:
+                    await postgres.initialize()
+                except Exception as e:
+                    logger.warning(
+                        f'Resolution cache cannot reach PostgreSQL, using memory '
+                        f'only for {PERSISTENT_RETRY_SECONDS:.0f}s: {e}'
+                    )
+                    self._persistent_retry_at = (
+                        time.monotonic() + PERSISTENT_RETRY_SECONDS
+                    )
+                    return None
+                repository = CacheRepository(postgres, use_cache=False)
+                self._repositories[loop] = repository
+        return repository
+
+    def _from_store(self, key: str, data: dict[str, Any]) -> ResolutionResult | None:
+        try:
+            result = ResolutionResult.model_validate(data)
+        except Exception as e:
+            logger.warning(f'Ignoring unreadable resolution cache entry {key}: {e}')
+            return None
+        ttl = self.ttl_for(result)
+        if ttl is not None:
+            self._set_memory(key, result, ttl)
+        return result
+
+    async def get(self, key: str) -> ResolutionResult | None:
+        """
+        Look up the cached resolution of a citation key.
+
+        Returns:
+            A copy of the cached result, with ``metadata.additional_info
+            ['cache_hit']`` set to 'memory' or 'persistent', or None
+        """
+        return (await self.get_many([key])).get(key)
+
+    async def get_many(self, keys: list[str]) -> dict[str, ResolutionResult]:
+        """
+        Look up several citation keys, with one database query for all keys
+        not in memory.
+
+        Returns:
+            Copies of the cached results found, by key
+        """
+        found: dict[str, ResolutionResult] = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            result = self._get_memory(key)
+            if result is not None:
+                self.memory_hits += 1
+                found[key] = self._hit(result, 'memory')
+            else:
+                missing.append(key)
+
+        repository = await self._repository() if missing else None
+        if repository is not None:
+            stored = await repository.get_cached_responses(
+                [CACHE_KEY_PREFIX + key for key in missing]
+            )
+            for key in missing:
+                data = stored.get(CACHE_KEY_PREFIX + key)
+                result = self._from_store(key, data) if data else None
+                if result is not None:
+                    self.persistent_hits += 1
+                    found[key] = self._hit(result, 'persistent')
+
+        self.misses += sum(1 for key in missing if key not in found)
+        return found
+
+    async def put(self, key: str, result: ResolutionResult) -> None:
+        """Cache the resolution of a citation key in both tiers."""
+        ttl = self.ttl_for(result)
+        if ttl is None:
+            return
+        result = result.model_copy(deep=True)
+        result.metadata.additional_info.pop('cache_hit', None)
+        self._set_memory(key, result, ttl)
+        self.stores += 1
+
+        repository = await self._repository()
+        if repository is not None:
+            await repository.set_cached_response(
+                CACHE_KEY_PREFIX + key,
+                result.model_dump(mode='json'),
+                ttl_seconds=ttl,
+                source=result.source.value if result.source else 'unresolved',
+            )
+
+    def clear(self, negative_only: bool = False) -> int:
+        """
+        Clear the memory tier of this process.
+
+        Args:
+            negative_only: Only remove unresolved results
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if not negative_only:
+                count = len(self._memory)
+                self._memory.clear()
+                return count
+            negative = [
+                key
+                for key, (_, result) in self._memory.items()
+                if result.status not in _POSITIVE_STATUSES
+            ]
+            for key in negative:
+                del self._memory[key]
+            return len(negative)
+
+    def entries(self) -> list[tuple[str, ResolutionResult]]:
+        """Unexpired entries of the memory tier."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                (key, result)
+                for key, (expires_at, result) in self._memory.items()
+                if expires_at > now
+            ]
+
+    def stats(self) -> dict[str, Any]:
+        """Size and hit counters of the cache."""
+        with self._lock:
+            size = len(self._memory)
+        lookups = self.memory_hits + self.persistent_hits + self.misses
+        return {
+            'memory_size': size,
+            'memory_maxsize': self._memory.maxsize,
+            'persistent': self._postgres_factory is not None,
+            'memory_hits': self.memory_hits,
+            'persistent_hits': self.persistent_hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'hit_rate': (
+                (self.memory_hits + self.persistent_hits) / lookups if lookups else 0.0
+            ),
+        }
+
+    async def close(self) -> None:
+        """Close the database connections opened for the running event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        repository = self._repositories.pop(loop, None)
+        if repository is not None:
+            await repository.postgres.close()
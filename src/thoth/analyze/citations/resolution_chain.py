@@ -8,11 +8,12 @@ early stopping.
 Resolution Flow:
 ---------------
 1. Check if citation already has DOI → Skip resolution
-2. Check if citation has ArXiv ID → Try Semantic Scholar first (best for arXiv)
-3. Try Crossref → Stop if high confidence match found
-4. Try OpenAlex → Stop if high confidence match found
-5. Try Semantic Scholar → Accept even without DOI (metadata-only match)
-6. Return UNRESOLVED if no good matches found
+2. Match against our own paper corpus (LocalCorpusResolver) → Stop if found
+3. Check if citation has ArXiv ID → Try Semantic Scholar first (best for arXiv)
+4. Try Crossref → Stop if high confidence match found
+5. Try OpenAlex → Stop if high confidence match found
+6. Try Semantic Scholar → Accept even without DOI (metadata-only match)
+7. Return UNRESOLVED if no good matches found
 
 Features:
 ---------
@@ -21,11 +22,28 @@ Features:
 - Confidence-based early stopping to reduce API calls
 - Comprehensive logging of resolution decisions
 - Progress tracking for large batches
+- Bulk identifier pre-pass in batch_resolve: citations that carry a DOI or
+  arXiv ID are looked up with the providers' multi-ID endpoints (OpenAlex
+  ``filter=doi:a|b|c``, Semantic Scholar ``/paper/batch``) before the
+  per-citation chain runs on the leftovers
+- Optional shared ResolutionCache: results are looked up by normalized
+  citation key before any API is called, and a reference that appears
+  several times in a batch is resolved once
+
+Hedged Mode:
+-----------
+With ``mode='hedged'`` the sources are still asked in the order above, but
+the chain does not wait for a slow source to time out: if a source has not
+answered within its latency budget (or answers without a high-confidence
+match), the next source is started alongside it. The first high-confidence
+result wins and the remaining requests are cancelled. Sequential mode stays
+the default because hedging sends more requests per citation to the APIs.
 """
 
 import asyncio  # noqa: I001
+import re
 import time
-from typing import Any, Dict, List  # noqa: UP035
+from typing import TYPE_CHECKING, Any, Dict, List  # noqa: UP035
 
 from loguru import logger
 
@@ -41,6 +59,10 @@ from thoth.analyze.citations.openalex_resolver import (
     OpenAlexResolver,
     MatchCandidate as OpenAlexMatch,
 )
+from thoth.analyze.citations.resolution_cache import (
+    ResolutionCache,
+    citation_cache_key,
+)
 from thoth.analyze.citations.resolution_types import (
     APISource,
     CitationResolutionStatus,
@@ -52,12 +74,62 @@ from thoth.analyze.citations.resolution_types import (
 from thoth.analyze.citations.semanticscholar import SemanticScholarAPI
 from thoth.utilities.schemas.citations import Citation
 
+if TYPE_CHECKING:
+    from thoth.analyze.citations.local_resolver import LocalCorpusResolver
 
 # Confidence thresholds for early stopping (per improved citation resolution spec)
 HIGH_CONFIDENCE_THRESHOLD = 0.85  # Accept automatically (spec requirement)
 MEDIUM_CONFIDENCE_THRESHOLD = 0.70  # Accept if clear winner (spec requirement)
 TITLE_THRESHOLD = 0.80  # Minimum title similarity (spec: validation checklist)
 
+RESOLUTION_MODES = ('sequential', 'hedged')
+
+# Seconds to wait for a source in hedged mode before also starting the next one
+DEFAULT_HEDGE_DELAYS = {
+    APISource.CROSSREF: 1.5,
+    APISource.ARXIV: 1.5,
+    APISource.OPENALEX: 1.5,
+    APISource.SEMANTIC_SCHOLAR: 2.0,
+}
+
+# Fields requested from Semantic Scholar's batch endpoint in the bulk pre-pass
+BULK_S2_FIELDS = [
+    'title',
+    'externalIds',
+    'year',
+    'authors',
+    'venue',
+    'citationCount',
+    'abstract',
+]
+
+_ARXIV_VERSION_RE = re.compile(r'v\d+$')
+
+
+def _normalize_doi(doi: str) -> str:
+    """Lowercase a DOI and strip URL or ``doi:`` prefixes."""
+    doi = doi.strip().lower()
+    for prefix in ('https://doi.org/', 'http://doi.org/', 'doi:'):
+        if doi.startswith(prefix):
+            return doi[len(prefix) :]
+    return doi
+
+
+def _citation_arxiv_id(citation: Citation) -> str | None:
+    """Return the citation's arXiv ID without prefix or version, if any."""
+    arxiv_id = citation.arxiv_id
+    if not arxiv_id and citation.backup_id and citation.backup_id.startswith('arxiv:'):
+        arxiv_id = citation.backup_id.split(':', 1)[1]
+    if not arxiv_id:
+        return None
+    return _normalize_arxiv_id(arxiv_id)
+
+
+def _normalize_arxiv_id(arxiv_id: str) -> str | None:
+    """Lowercase an arXiv ID and strip the ``arXiv:`` prefix and version."""
+    arxiv_id = arxiv_id.strip().lower().removeprefix('arxiv:')
+    return _ARXIV_VERSION_RE.sub('', arxiv_id) or None
+
 
 class CitationResolutionChain:
     """
@@ -78,6 +150,10 @@ class CitationResolutionChain:
         arxiv_resolver: ArxivResolver | None = None,
         openalex_resolver: OpenAlexResolver | None = None,
         semanticscholar_resolver: SemanticScholarAPI | None = None,
+        mode: str = 'sequential',
+        hedge_delays: Dict[APISource | str, float] | None = None,  # noqa: UP006
+        cache: ResolutionCache | None = None,
+        local_resolver: 'LocalCorpusResolver | None' = None,
     ):
         """
         Initialize resolution chain with API resolvers.
@@ -87,7 +163,29 @@ class CitationResolutionChain:
             arxiv_resolver: ArXiv API resolver instance
             openalex_resolver: OpenAlex API resolver instance
             semanticscholar_resolver: Semantic Scholar API instance
+            mode: 'sequential' (one source at a time) or 'hedged' (start the
+                next source when one exceeds its latency budget)
+            hedge_delays: Per-source latency budgets in seconds for hedged
+                mode, overriding DEFAULT_HEDGE_DELAYS
+            cache: Resolution cache shared with other chains and processes
+                (None = no caching)
+            local_resolver: Matches citations against our own paper corpus
+                before any external API is asked (None = APIs only)
+
+        Raises:
+            ValueError: If mode is unknown
         """
+        if mode not in RESOLUTION_MODES:
+            raise ValueError(
+                f'Unknown resolution mode: {mode} (expected one of {RESOLUTION_MODES})'
+            )
+        self.mode = mode
+        self.hedge_delays = dict(DEFAULT_HEDGE_DELAYS)
+        for source, delay in (hedge_delays or {}).items():
+            self.hedge_delays[APISource(source)] = delay
+        self.cache = cache
+        self.local_resolver = local_resolver
+
         # Initialize resolvers with defaults if not provided
         self.crossref_resolver = crossref_resolver or CrossrefResolver()
         self.arxiv_resolver = arxiv_resolver or ArxivResolver()
@@ -98,6 +196,7 @@ class CitationResolutionChain:
         self._stats = {
             'total_processed': 0,
             'already_has_doi': 0,
+            'resolved_local': 0,
             'resolved_crossref': 0,
             'resolved_arxiv': 0,
             'resolved_openalex': 0,
@@ -106,26 +205,78 @@ class CitationResolutionChain:
             'high_confidence': 0,
             'medium_confidence': 0,
             'low_confidence': 0,
+            'bulk_lookup_requests': 0,
+            'bulk_lookup_resolved': 0,
+            'cache_hits': 0,
+            'hedged_resolutions': 0,
+            'hedge_time_saved_ms': 0.0,
+            **{f'hedge_wins_{source.value}': 0 for source in DEFAULT_HEDGE_DELAYS},
         }
 
-        logger.info('Initialized CitationResolutionChain with all API sources')
+        logger.info(
+            f'Initialized CitationResolutionChain with all API sources '
+            f'(mode={self.mode})'
+        )
+
+    def _cache_key(self, citation: Citation) -> str | None:
+        """Cache key of a citation, or None if its result is not cached."""
+        if self.cache is None or citation.doi:
+            # Citations with a DOI resolve without any API call
+            return None
+        return citation_cache_key(citation)
 
     async def resolve(
         self,
         citation: Citation,
         _recursion_depth: int = 0,
         _max_depth: int = 3,
+        *,
+        skip_cache_lookup: bool = False,
+    ) -> ResolutionResult:
+        """
+        Resolve a single citation, using the resolution cache if configured.
+
+        Args:
+            citation: Citation to resolve
+            _recursion_depth: Internal recursion tracking (default: 0)
+            _max_depth: Maximum recursion depth allowed (default: 3)
+            skip_cache_lookup: Skip the cache read because the caller already
+                looked the citation up (results are still written back)
+                (default: False)
+
+        Returns:
+            ResolutionResult with resolution outcome and metadata
+        """
+        key = self._cache_key(citation)
+        if key is not None and not skip_cache_lookup:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                self._stats['cache_hits'] += 1
+                self._stats['total_processed'] += 1
+                return cached
+
+        result = await self._resolve_uncached(citation, _recursion_depth, _max_depth)
+        if key is not None:
+            await self.cache.put(key, result)
+        return result
+
+    async def _resolve_uncached(
+        self,
+        citation: Citation,
+        _recursion_depth: int = 0,
+        _max_depth: int = 3,
     ) -> ResolutionResult:
         """
         Resolve a single citation through the resolution chain.
 
         Resolution flow:
         1. Check if citation already has DOI (skip)
-        2. Check if citation has ArXiv ID (try Semantic Scholar first)
-        3. Try Crossref → stop if high confidence
-        4. Try OpenAlex → stop if high confidence
-        5. Try Semantic Scholar → accept even without DOI
-        6. Return UNRESOLVED if no good matches
+        2. Match against our own paper corpus → stop if found
+        3. Check if citation has ArXiv ID (try Semantic Scholar first)
+        4. Try Crossref → stop if high confidence
+        5. Try OpenAlex → stop if high confidence
+        6. Try Semantic Scholar → accept even without DOI
+        7. Return UNRESOLVED if no good matches
 
         Args:
             citation: Citation to resolve
@@ -183,6 +334,32 @@ class CitationResolutionChain:
                 metadata=metadata,
             )
 
+        # Papers we already hold need no external API call
+        if self.local_resolver is not None:
+            try:
+                result = await self.local_resolver.resolve(citation)
+            except Exception as e:
+                logger.warning(f'Local corpus resolver failed: {e}')
+                result = None
+            if result is not None:
+                logger.info(
+                    f'Found match in local corpus: '
+                    f'score={result.confidence_score:.2f}, '
+                    f'paper_id={result.metadata.additional_info["paper_id"]}'
+                )
+                self._stats['resolved_local'] += 1
+                if result.confidence_score >= HIGH_CONFIDENCE_THRESHOLD:
+                    self._stats['high_confidence'] += 1
+                else:
+                    self._stats['medium_confidence'] += 1
+                self._stats['total_processed'] += 1
+                return result
+
+        if self.mode == 'hedged':
+            return await self._resolve_hedged(
+                citation, citation_text, metadata, candidates, start_time
+            )
+
         # Step 2: Check for ArXiv ID - try Semantic Scholar first for arXiv papers
         if citation.arxiv_id or (
             citation.backup_id and citation.backup_id.startswith('arxiv:')
@@ -299,6 +476,151 @@ class CitationResolutionChain:
             metadata=metadata,
         )
 
+    async def _resolve_hedged(
+        self,
+        citation: Citation,
+        citation_text: str,
+        metadata: ResolutionMetadata,
+        candidates: List[MatchCandidate],  # noqa: UP006
+        start_time: float,
+    ) -> ResolutionResult:
+        """
+        Resolve a citation by racing the sources with hedged requests.
+
+        Sources are started in chain order. The next one starts as soon as
+        the running ones have either answered without a high-confidence
+        match or exceeded the latency budget of the last started source. The
+        first high-confidence result wins and the other requests are
+        cancelled. As in sequential mode, a Semantic Scholar match of medium
+        confidence is accepted if no source reaches high confidence.
+
+        Args:
+            citation: Citation to resolve
+            citation_text: Display text of the citation
+            metadata: Resolution metadata shared by all attempts
+            candidates: List the attempts append match candidates to
+            start_time: Start of the resolution (time.time())
+
+        Returns:
+            ResolutionResult with resolution outcome and metadata
+        """
+        attempts = {
+            APISource.CROSSREF: self._try_crossref,
+            APISource.ARXIV: self._try_arxiv,
+            APISource.OPENALEX: self._try_openalex,
+            APISource.SEMANTIC_SCHOLAR: self._try_semantic_scholar,
+        }
+        order = list(attempts)
+        if citation.arxiv_id or (
+            citation.backup_id and citation.backup_id.startswith('arxiv:')
+        ):
+            # Semantic Scholar is best for arXiv papers, as in sequential mode
+            order.remove(APISource.SEMANTIC_SCHOLAR)
+            order.insert(0, APISource.SEMANTIC_SCHOLAR)
+
+        waiting = list(order)
+        running: Dict[asyncio.Task, APISource] = {}  # noqa: UP006
+        started: Dict[APISource, float] = {}  # noqa: UP006
+        durations: Dict[APISource, float] = {}  # noqa: UP006
+        results: Dict[APISource, ResolutionResult | None] = {}  # noqa: UP006
+        winner: APISource | None = None
+        race_start = time.monotonic()
+
+        def start_next() -> float:
+            source = waiting.pop(0)
+            started[source] = time.monotonic()
+            task = asyncio.create_task(attempts[source](citation, metadata, candidates))
+            running[task] = source
+            return self.hedge_delays[source]
+
+        budget = start_next()
+        try:
+            while running:
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=budget if waiting else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    source = running.pop(task)
+                    durations[source] = time.monotonic() - started[source]
+                    try:
+                        results[source] = task.result()
+                    except Exception as e:
+                        logger.warning(f'{source.value} resolver failed: {e}')
+                        results[source] = None
+                high = [
+                    source
+                    for source in order
+                    if results.get(source)
+                    and results[source].confidence_score >= HIGH_CONFIDENCE_THRESHOLD
+                ]
+                if high:
+                    winner = high[0]
+                    break
+                if waiting:
+                    budget = start_next()
+        finally:
+            for task, source in running.items():
+                task.cancel()
+                durations[source] = time.monotonic() - started[source]
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        if winner is None:
+            s2_result = results.get(APISource.SEMANTIC_SCHOLAR)
+            if s2_result and s2_result.confidence_score >= MEDIUM_CONFIDENCE_THRESHOLD:
+                winner = APISource.SEMANTIC_SCHOLAR
+
+        # Time the sequential chain would have needed to reach the same
+        # outcome (cancelled requests count with the time they had run)
+        sequential_order = order[: order.index(winner) + 1] if winner else order
+        sequential_ms = sum(durations.get(s, 0.0) for s in sequential_order) * 1000
+        saved_ms = max(0.0, sequential_ms - (time.monotonic() - race_start) * 1000)
+        self._stats['hedged_resolutions'] += 1
+        self._stats['hedge_time_saved_ms'] += saved_ms
+        self._stats['total_processed'] += 1
+        metadata.additional_info['hedge_time_saved_ms'] = round(saved_ms, 1)
+
+        if winner is None:
+            logger.warning(
+                f'No suitable matches found for citation: {citation_text[:80]}...'
+            )
+            metadata.processing_time_ms = (time.time() - start_time) * 1000
+            self._stats['unresolved'] += 1
+            self._stats['low_confidence'] += 1
+            return ResolutionResult(
+                citation=citation_text,
+                status=CitationResolutionStatus.UNRESOLVED,
+                confidence_score=0.0,
+                confidence_level=ConfidenceLevel.LOW,
+                source=None,
+                matched_data=None,
+                candidates=candidates,
+                metadata=metadata,
+            )
+
+        result = results[winner]
+        logger.info(
+            f'Hedged resolution won by {winner.value}: '
+            f'score={result.confidence_score:.2f}, saved {saved_ms:.0f}ms'
+        )
+        result.metadata.processing_time_ms = (time.time() - start_time) * 1000
+        result.metadata.additional_info['hedge_winner'] = winner.value
+        self._stats[f'hedge_wins_{winner.value}'] += 1
+        stats_key = {
+            APISource.CROSSREF: 'resolved_crossref',
+            APISource.ARXIV: 'resolved_arxiv',
+            APISource.OPENALEX: 'resolved_openalex',
+            APISource.SEMANTIC_SCHOLAR: 'resolved_semanticscholar',
+        }[winner]
+        self._stats[stats_key] += 1
+        if result.confidence_score >= HIGH_CONFIDENCE_THRESHOLD:
+            self._stats['high_confidence'] += 1
+        else:
+            self._stats['medium_confidence'] += 1
+        return result
+
     async def _try_crossref(
         self,
         citation: Citation,
@@ -594,24 +916,7 @@ class CitationResolutionChain:
                     else CitationResolutionStatus.PARTIAL
                 )
 
-                # Extract DOI if available
-                doi = None
-                if paper_data.get('externalIds'):
-                    doi = paper_data['externalIds'].get('DOI')
-
-                matched_data = {
-                    'title': paper_data.get('title'),
-                    'doi': doi,
-                    'year': paper_data.get('year'),
-                    'authors': [
-                        a.get('name')
-                        for a in paper_data.get('authors', [])
-                        if a.get('name')
-                    ],
-                    'venue': paper_data.get('venue'),
-                    'citation_count': paper_data.get('citationCount'),
-                    'abstract': paper_data.get('abstract'),
-                }
+                matched_data = self._semanticscholar_paper_to_dict(paper_data)
 
                 return ResolutionResult(
                     citation=citation.text or citation.title or 'Unknown',
@@ -840,6 +1145,23 @@ class CitationResolutionChain:
             'citation_count': match.citation_count,
         }
 
+    def _semanticscholar_paper_to_dict(
+        self,
+        paper_data: Dict[str, Any],  # noqa: UP006
+    ) -> Dict[str, Any]:  # noqa: UP006
+        """Convert Semantic Scholar paper data to dict."""
+        return {
+            'title': paper_data.get('title'),
+            'doi': (paper_data.get('externalIds') or {}).get('DOI'),
+            'year': paper_data.get('year'),
+            'authors': [
+                a.get('name') for a in paper_data.get('authors') or [] if a.get('name')
+            ],
+            'venue': paper_data.get('venue'),
+            'citation_count': paper_data.get('citationCount'),
+            'abstract': paper_data.get('abstract'),
+        }
+
     def _calculate_arxiv_confidence(
         self, match: ArxivMatch, citation: Citation
     ) -> float:
@@ -932,17 +1254,200 @@ class CitationResolutionChain:
             'openalex_id': match.openalex_id,
         }
 
+    async def _lookup_semantic_scholar_ids(
+        self,
+        paper_ids: List[str],  # noqa: UP006
+    ) -> Dict[str, Dict[str, Any]]:  # noqa: UP006
+        """
+        Look up papers with Semantic Scholar's batch endpoint.
+
+        Args:
+            paper_ids: Prefixed IDs in normalized form ('DOI:...', 'arXiv:...')
+
+        Returns:
+            Mapping of requested ID to paper data, for the papers found
+        """
+        if not paper_ids:
+            return {}
+        papers = await asyncio.to_thread(
+            self.semanticscholar_resolver.paper_lookup_batch,
+            paper_ids,
+            BULK_S2_FIELDS,
+        )
+        self._stats['bulk_lookup_requests'] += -(
+            -len(paper_ids) // self.semanticscholar_resolver.batch_size
+        )
+
+        # The batch endpoint drops unknown IDs, so map papers back by their
+        # external IDs rather than by position
+        wanted = set(paper_ids)
+        found = {}
+        for paper in papers:
+            external_ids = paper.get('externalIds') or {}
+            keys = []
+            if external_ids.get('DOI'):
+                keys.append(f'DOI:{_normalize_doi(external_ids["DOI"])}')
+            if external_ids.get('ArXiv'):
+                arxiv_id = _ARXIV_VERSION_RE.sub('', external_ids['ArXiv'].lower())
+                keys.append(f'arXiv:{arxiv_id}')
+            for key in keys:
+                if key in wanted:
+                    found[key] = paper
+        return found
+
+    async def _resolve_identifiers_in_bulk(
+        self,
+        citations: list[Citation],
+    ) -> Dict[int, ResolutionResult]:  # noqa: UP006
+        """
+        Resolve citations that carry a DOI or arXiv ID with bulk lookups.
+
+        DOIs are looked up with OpenAlex's OR filter, arXiv IDs and the DOIs
+        OpenAlex does not know with Semantic Scholar's batch endpoint, so a
+        reference list costs a handful of requests instead of one per
+        citation. An identifier match is definitive, so matches are accepted
+        with full confidence.
+
+        Args:
+            citations: Citations of the batch
+
+        Returns:
+            Mapping of citation index to result for the citations resolved;
+            the others are left to the per-citation chain
+        """
+        start_time = time.time()
+        doi_indices: Dict[str, List[int]] = {}  # noqa: UP006
+        arxiv_indices: Dict[str, List[int]] = {}  # noqa: UP006
+        for i, citation in enumerate(citations):
+            if citation.doi:
+                doi = _normalize_doi(citation.doi)
+                if doi:
+                    doi_indices.setdefault(doi, []).append(i)
+            elif arxiv_id := _citation_arxiv_id(citation):
+                arxiv_indices.setdefault(arxiv_id, []).append(i)
+
+        if not doi_indices and not arxiv_indices:
+            return {}
+
+        async def lookup_openalex():
+            if not doi_indices:
+                return {}
+            works = await self.openalex_resolver.lookup_dois(list(doi_indices))
+            self._stats['bulk_lookup_requests'] += -(
+                -len(doi_indices) // self.openalex_resolver.MAX_FILTER_VALUES
+            )
+            return works
+
+        openalex_works, s2_papers = await asyncio.gather(
+            lookup_openalex(),
+            self._lookup_semantic_scholar_ids(
+                [f'arXiv:{arxiv_id}' for arxiv_id in arxiv_indices]
+            ),
+            return_exceptions=True,
+        )
+        if isinstance(openalex_works, BaseException):
+            logger.warning(f'OpenAlex bulk DOI lookup failed: {openalex_works}')
+            openalex_works = {}
+        if isinstance(s2_papers, BaseException):
+            logger.warning(f'Semantic Scholar bulk lookup failed: {s2_papers}')
+            s2_papers = {}
+
+        missing_dois = [doi for doi in doi_indices if doi not in openalex_works]
+        try:
+            s2_papers.update(
+                await self._lookup_semantic_scholar_ids(
+                    [f'DOI:{doi}' for doi in missing_dois]
+                )
+            )
+        except Exception as e:
+            logger.warning(f'Semantic Scholar bulk DOI lookup failed: {e}')
+
+        matches: Dict[int, tuple] = {}  # noqa: UP006
+        for doi, indices in doi_indices.items():
+            if doi in openalex_works:
+                match = (
+                    APISource.OPENALEX,
+                    self._openalex_match_to_dict(openalex_works[doi]),
+                )
+            elif f'DOI:{doi}' in s2_papers:
+                match = (
+                    APISource.SEMANTIC_SCHOLAR,
+                    self._semanticscholar_paper_to_dict(s2_papers[f'DOI:{doi}']),
+                )
+            else:
+                continue
+            for i in indices:
+                matches[i] = match
+        for arxiv_id, indices in arxiv_indices.items():
+            if f'arXiv:{arxiv_id}' in s2_papers:
+                data = self._semanticscholar_paper_to_dict(
+                    s2_papers[f'arXiv:{arxiv_id}']
+                )
+                data['arxiv_id'] = arxiv_id
+                for i in indices:
+                    matches[i] = (APISource.SEMANTIC_SCHOLAR, data)
+
+        if not matches:
+            return {}
+
+        # The lookup time is shared by every citation it resolved
+        per_citation_ms = (time.time() - start_time) * 1000 / len(matches)
+        results = {}
+        for i, (source, data) in matches.items():
+            citation = citations[i]
+            matched_data = dict(data)
+            if citation.doi:
+                # Keep the DOI as cited; OpenAlex returns it as a doi.org URL
+                matched_data['doi'] = citation.doi
+                self._stats['already_has_doi'] += 1
+            elif source == APISource.SEMANTIC_SCHOLAR:
+                self._stats['resolved_semanticscholar'] += 1
+            results[i] = ResolutionResult(
+                citation=citation.text or citation.title or 'Unknown citation',
+                status=CitationResolutionStatus.RESOLVED,
+                confidence_score=1.0,
+                confidence_level=ConfidenceLevel.HIGH,
+                source=source,
+                matched_data=matched_data,
+                metadata=ResolutionMetadata(
+                    api_sources_tried=[source],
+                    processing_time_ms=per_citation_ms,
+                    additional_info={
+                        'identifier_lookup': 'doi' if citation.doi else 'arxiv'
+                    },
+                ),
+            )
+            self._stats['high_confidence'] += 1
+            self._stats['total_processed'] += 1
+        self._stats['bulk_lookup_resolved'] += len(results)
+
+        with_ids = sum(map(len, doi_indices.values())) + sum(
+            map(len, arxiv_indices.values())
+        )
+        logger.info(
+            f'Bulk identifier lookup resolved {len(results)}/{with_ids} '
+            f'citations with DOI or arXiv ID'
+        )
+        return results
+
     async def batch_resolve(
         self,
         citations: list[Citation],
         parallel: bool = True,
+        bulk_lookup: bool = True,
     ) -> List[ResolutionResult]:  # noqa: UP006
         """
         Resolve multiple citations in batch.
 
+        Citations are looked up in the resolution cache and the local corpus
+        index first; only the rest cost API requests.
+
         Args:
             citations: List of citations to resolve
             parallel: If True, process citations concurrently
+            bulk_lookup: If True, resolve citations that carry a DOI or arXiv
+                ID with bulk identifier lookups first and send only the
+                leftovers through the per-citation chain
 
         Returns:
             List of ResolutionResult objects
@@ -957,6 +1462,52 @@ class CitationResolutionChain:
 
         start_time = time.time()
 
+        final_results: List[ResolutionResult | None] = [  # noqa: UP006
+            None
+        ] * len(citations)
+        keys = [self._cache_key(citation) for citation in citations]
+        if self.cache is not None:
+            cached = await self.cache.get_many([key for key in keys if key])
+            for i, key in enumerate(keys):
+                if key in cached:
+                    final_results[i] = cached[key].model_copy(deep=True)
+                    self._stats['cache_hits'] += 1
+                    self._stats['total_processed'] += 1
+        if self.local_resolver is not None:
+            # Index only: the per-citation chain also searches the database
+            remaining = [i for i, result in enumerate(final_results) if result is None]
+            try:
+                matched = await self.local_resolver.resolve_many(
+                    [citations[i] for i in remaining], use_database=False
+                )
+            except Exception as e:
+                logger.warning(f'Local corpus resolver failed: {e}')
+                matched = {}
+            for n, result in matched.items():
+                final_results[remaining[n]] = result
+                self._stats['resolved_local'] += 1
+                if result.confidence_score >= HIGH_CONFIDENCE_THRESHOLD:
+                    self._stats['high_confidence'] += 1
+                else:
+                    self._stats['medium_confidence'] += 1
+                self._stats['total_processed'] += 1
+        if bulk_lookup:
+            remaining = [i for i, result in enumerate(final_results) if result is None]
+            resolved = await self._resolve_identifiers_in_bulk(
+                [citations[i] for i in remaining]
+            )
+            for n, result in resolved.items():
+                final_results[remaining[n]] = result
+
+        # Citations with the same cache key are one reference: resolve it once
+        groups: Dict[Any, List[int]] = {}  # noqa: UP006
+        for i, result in enumerate(final_results):
+            if result is None:
+                groups.setdefault(keys[i] or i, []).append(i)
+        pending = [members[0] for members in groups.values()]
+        # The cache was already consulted for the whole batch above
+        resolve_kwargs = {'skip_cache_lookup': True} if self.cache is not None else {}
+
         if parallel:
             # Process citations concurrently with bounded parallelism
             # Limit to 50 concurrent tasks to prevent resource exhaustion
@@ -964,14 +1515,13 @@ class CitationResolutionChain:
 
             async def resolve_with_limit(citation):
                 async with semaphore:
-                    return await self.resolve(citation)
+                    return await self.resolve(citation, **resolve_kwargs)
 
-            tasks = [resolve_with_limit(citation) for citation in citations]
+            tasks = [resolve_with_limit(citations[i]) for i in pending]
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
             # Handle any exceptions
-            final_results = []
-            for i, result in enumerate(results):
+            for i, result in zip(pending, results):  # noqa: B905
                 if isinstance(result, Exception):
                     logger.error(
                         f'Error resolving citation {i}: {result}',
@@ -980,26 +1530,29 @@ class CitationResolutionChain:
                     # Create error result
                     citation = citations[i]
                     citation_text = citation.text or citation.title or 'Unknown'
-                    final_results.append(
-                        ResolutionResult(
-                            citation=citation_text,
-                            status=CitationResolutionStatus.FAILED,
-                            confidence_score=0.0,
-                            confidence_level=ConfidenceLevel.LOW,
-                            source=None,
-                            matched_data=None,
-                            metadata=ResolutionMetadata(error_message=str(result)),
-                        )
+                    final_results[i] = ResolutionResult(
+                        citation=citation_text,
+                        status=CitationResolutionStatus.FAILED,
+                        confidence_score=0.0,
+                        confidence_level=ConfidenceLevel.LOW,
+                        source=None,
+                        matched_data=None,
+                        metadata=ResolutionMetadata(error_message=str(result)),
                     )
                 else:
-                    final_results.append(result)
+                    final_results[i] = result
         else:
             # Process citations sequentially
-            final_results = []
-            for i, citation in enumerate(citations):
-                logger.debug(f'Processing citation {i + 1}/{len(citations)}')
-                result = await self.resolve(citation)
-                final_results.append(result)
+            for n, i in enumerate(pending):
+                logger.debug(f'Processing citation {n + 1}/{len(pending)}')
+                final_results[i] = await self.resolve(citations[i], **resolve_kwargs)
+
+        for members in groups.values():
+            for i in members[1:]:
+                final_results[i] = final_results[members[0]].model_copy(deep=True)
+                final_results[i].citation = (
+                    citations[i].text or citations[i].title or 'Unknown citation'
+                )
 
         elapsed = time.time() - start_time
 
@@ -1041,6 +1594,7 @@ class CitationResolutionChain:
         low_conf = sum(1 for r in results if r.confidence_level == ConfidenceLevel.LOW)
 
         # Count by source
+        local = sum(1 for r in results if r.source == APISource.LOCAL)
         crossref = sum(1 for r in results if r.source == APISource.CROSSREF)
         openalex = sum(1 for r in results if r.source == APISource.OPENALEX)
         semantic = sum(1 for r in results if r.source == APISource.SEMANTIC_SCHOLAR)
@@ -1052,7 +1606,7 @@ class CitationResolutionChain:
             f'  Unresolved: {unresolved} ({unresolved / total * 100:.1f}%)\n'
             f'  Failed: {failed} ({failed / total * 100:.1f}%)\n'
             f'  Confidence: HIGH={high_conf}, MEDIUM={med_conf}, LOW={low_conf}\n'
-            f'  Sources: Crossref={crossref}, OpenAlex={openalex}, '
+            f'  Sources: Local={local}, Crossref={crossref}, OpenAlex={openalex}, '
             f'SemanticScholar={semantic}\n'
             f'  Avg time: {elapsed / total * 1000:.1f}ms per citation'
         )
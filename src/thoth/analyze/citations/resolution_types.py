@@ -66,12 +66,14 @@ class APISource(str, Enum):
         OPENALEX: OpenAlex API for open citation data
         SEMANTIC_SCHOLAR: Semantic Scholar API for ML-enhanced matching
         ARXIV: arXiv API for preprints and technical papers
+        LOCAL: Our own paper_metadata table (no API call)
     """
 
     CROSSREF = 'crossref'
     OPENALEX = 'openalex'
     SEMANTIC_SCHOLAR = 'semantic_scholar'
     ARXIV = 'arxiv'
+    LOCAL = 'local'
 
 
 class MatchCandidate(BaseModel):
@@ -4,6 +4,7 @@ LLM Processor for Thoth.
 This module handles the analysis of content using LLM.
 """
 
+import time
 from pathlib import Path
 from typing import Any, Literal
 
@@ -48,6 +49,8 @@ class LLMProcessor:
         map_reduce_threshold_multiplier: float = 2.5,  # Threshold multiplier for choosing map_reduce over refine
         analysis_model: type[BaseModel] | None = None,  # Custom analysis schema model
         custom_instructions: str | None = None,  # Additional extraction instructions
+        map_concurrency: int = 4,  # Chunk analyses in flight during the map phase
+        map_max_retries: int = 2,  # Retries for chunks whose map call failed
     ):
         """
         Initializes the LLMProcessor.
@@ -62,13 +65,18 @@ class LLMProcessor:
             chunk_size: Target size of chunks for document splitting in tokens.
             chunk_overlap: Overlap between chunks in tokens.
             model_kwargs: Additional keyword arguments for the model.
-            refine_threshold_multiplier: Multiplier for max_context_length to choose
-                'refine'.
+            refine_threshold_multiplier: Multiplier for max_context_length giving
+                the refine threshold (logged only; 'refine' runs when forced).
             map_reduce_threshold_multiplier: Multiplier for max_context_length to
-                choose 'map_reduce'.
+                choose 'map_reduce' over 'direct'.
             analysis_model: Custom Pydantic model for analysis response
                 (defaults to AnalysisResponse).
             custom_instructions: Additional instructions to guide extraction.
+            map_concurrency: Maximum number of chunk analyses run concurrently in
+                the map phase (requests still go through the client's rate
+                limiter).
+            map_max_retries: How many times chunks whose analysis failed are
+                retried before the map phase continues without them.
         """
         self.llm_service = llm_service
         self.model = model
@@ -89,6 +97,8 @@ class LLMProcessor:
             / model.split('/')[0]
         )
         self.model_kwargs = model_kwargs if model_kwargs else {}
+        self.map_concurrency = max(1, map_concurrency)
+        self.map_max_retries = max(0, map_max_retries)
         self.refine_threshold = int(max_context_length * refine_threshold_multiplier)
         self.map_reduce_threshold = int(
             max_context_length * map_reduce_threshold_multiplier
@@ -108,6 +118,8 @@ class LLMProcessor:
         client_kwargs.pop(
             'map_reduce_threshold_multiplier', None
         )  # Not used by get_client
+        client_kwargs.pop('map_concurrency', None)  # Not used by get_client
+        client_kwargs.pop('map_max_retries', None)  # Not used by get_client
 
         # Pass provider if available in config
         provider = getattr(self.llm_service.config.llm_config, 'provider', None)
@@ -121,6 +133,7 @@ class LLMProcessor:
         logger.debug(f'Refine threshold: {self.refine_threshold}')
         logger.debug(f'Map-reduce threshold: {self.map_reduce_threshold}')
         logger.debug(f'Max context length: {self.max_context_length}')
+        logger.debug(f'Map concurrency: {self.map_concurrency}')
         logger.debug(f'Max output tokens: {self.max_output_tokens}')
         logger.debug(f'Chunk size: {self.chunk_size}')
         logger.debug(f'Chunk overlap: {self.chunk_overlap}')
@@ -219,8 +232,20 @@ class LLMProcessor:
         return state
 
     def _determine_strategy(self, state: AnalysisState) -> AnalysisState:
-        """Determines the processing strategy based on token count."""
+        """
+        Determines the processing strategy based on token count.
+
+        Content up to the map-reduce threshold is analyzed in one direct
+        call. Beyond it the chunks are analyzed in parallel and reduced, so
+        latency follows the slowest chunk rather than the chunk count. Refine
+        needs one sequential call per chunk and is only used when forced. A
+        strategy already set in the state (forced by the caller) is kept.
+        """
         logger.debug('Determining processing strategy...')
+        if state.get('strategy'):
+            logger.debug(f'Using forced strategy: {state["strategy"]}')
+            return state
+
         content = state.get('original_content')  # Get content loaded by previous node
         if not content:
             raise ValueError(
@@ -231,10 +256,8 @@ class LLMProcessor:
         logger.debug(f'Token count: {token_count}')
         if token_count <= self.map_reduce_threshold:
             strategy = 'direct'
-        elif token_count <= self.refine_threshold:
-            strategy = 'map_reduce'
         else:
-            strategy = 'refine'
+            strategy = 'map_reduce'
 
         logger.debug(f'Selected strategy: {strategy}')
         state['strategy'] = strategy
@@ -279,20 +302,11 @@ class LLMProcessor:
             raise LLMError('No content chunks to process in map-reduce strategy')
 
         # Map phase
-        chunk_results = []
-        logger.debug(f'Map phase: Processing {len(chunks)} chunks...')
-        for i, chunk in enumerate(chunks):
-            logger.debug(f'Processing chunk {i + 1}/{len(chunks)}')
-            # Pass only the required input 'content' to map_chain
-            result = self.map_chain.invoke(
-                {
-                    'content': chunk.page_content,
-                    'analysis_schema': self.analysis_model.model_json_schema(),
-                    'custom_instructions': self.custom_instructions,
-                }
-            )
-            chunk_results.append(result)
-            logger.debug(f'Chunk {i + 1} analysis: {result}')
+        logger.debug(
+            f'Map phase: Processing {len(chunks)} chunks '
+            f'({self.map_concurrency} at a time)...'
+        )
+        chunk_results = self._map_chunks(chunks)
 
         if not chunk_results:
             logger.error('Map-Reduce: Failed to process any chunks in map phase')
@@ -317,6 +331,58 @@ class LLMProcessor:
 
         return state
 
+    def _map_chunks(self, chunks: list[Document]) -> list[AnalysisResponse]:
+        """
+        Analyzes chunks concurrently, retrying the ones that fail.
+
+        Returns:
+            The analyses of the chunks that succeeded, in chunk order. Chunks
+            that still fail after ``map_max_retries`` retries are left out.
+        """
+        schema = self.analysis_model.model_json_schema()
+        inputs = [
+            {
+                'content': chunk.page_content,
+                'analysis_schema': schema,
+                'custom_instructions': self.custom_instructions,
+            }
+            for chunk in chunks
+        ]
+        results: list[AnalysisResponse | None] = [None] * len(chunks)
+        errors: dict[int, Exception] = {}
+        pending = list(range(len(chunks)))
+
+        for attempt in range(self.map_max_retries + 1):
+            if attempt:
+                logger.warning(
+                    f'Retrying {len(pending)} failed chunk(s) '
+                    f'(attempt {attempt + 1}/{self.map_max_retries + 1})'
+                )
+                time.sleep(min(2**attempt, 30))
+            outputs = self.map_chain.batch(
+                [inputs[i] for i in pending],
+                config={'max_concurrency': self.map_concurrency},
+                return_exceptions=True,
+            )
+            failed = []
+            for i, output in zip(pending, outputs, strict=True):
+                if isinstance(output, Exception):
+                    errors[i] = output
+                    failed.append(i)
+                else:
+                    results[i] = output
+                    logger.debug(f'Chunk {i + 1} analysis: {output}')
+            pending = failed
+            if not pending:
+                break
+
+        for i in pending:
+            logger.error(
+                f'Map-Reduce: Chunk {i + 1}/{len(chunks)} failed after '
+                f'{self.map_max_retries + 1} attempts: {errors[i]}'
+            )
+        return [result for result in results if result is not None]
+
     def _analyze_refine(self, state: AnalysisState) -> AnalysisState:
         """Analyzes content using the refine strategy."""
         logger.debug('Analyzing content using refine...')
@@ -488,7 +554,7 @@ class LLMProcessor:
             'markdown_path': markdown_path,
             'original_content': None,
             'content_chunks': None,
-            'strategy': None,
+            'strategy': force_processing_strategy,
             'chunk_analyses': None,
             'current_analysis': None,
             'final_analysis': None,
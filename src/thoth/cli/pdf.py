@@ -1,9 +1,14 @@
 """
 CLI commands for PDF management.
 
-This module provides commands for locating and managing PDFs.
+This module provides commands for locating and managing PDFs, and for the
+durable ingestion queue (queueing PDFs and running queue workers).
 """
 
+import asyncio
+import signal
+from pathlib import Path
+
 from loguru import logger
 
 from thoth.pipeline import ThothPipeline
@@ -102,6 +107,77 @@ def run_test_source(args, pipeline: ThothPipeline):  # noqa: ARG001
     return 0
 
 
+def _ingestion_queue(pipeline: ThothPipeline, worker_id: str | None = None):
+    from thoth.pipelines.ingestion_queue import IngestionQueue
+
+    return IngestionQueue.from_config(
+        pipeline.services.postgres, pipeline.config, worker_id=worker_id
+    )
+
+
+async def run_pdf_enqueue(args, pipeline: ThothPipeline):
+    """
+    Queue PDFs (files or directories) for ingestion workers.
+    """
+    pdf_paths: list[Path] = []
+    for path in map(Path, args.paths):
+        if path.is_dir():
+            pdf_paths.extend(sorted(p for p in path.rglob('*.pdf') if p.is_file()))
+        elif path.suffix.lower() == '.pdf' and path.is_file():
+            pdf_paths.append(path)
+        else:
+            logger.warning(f'Skipping {path}: not a PDF file or directory')
+
+    if not pdf_paths:
+        logger.error('No PDFs found to queue')
+        return 1
+
+    queue = _ingestion_queue(pipeline)
+    for pdf_path in pdf_paths:
+        await queue.enqueue_async(
+            pdf_path, user_id=args.user_id, priority=args.priority
+        )
+    logger.info(f'Queued {len(pdf_paths)} PDFs for ingestion')
+    return 0
+
+
+async def run_pdf_worker(args, pipeline: ThothPipeline):
+    """
+    Process queued PDFs until interrupted (or until the queue is empty with
+    --drain). Run several workers, in separate processes or containers, to
+    drain a large backlog in parallel.
+    """
+    from thoth.pipelines.ingestion_worker import IngestionWorker
+
+    queue_config = pipeline.config.performance_config.ingestion_queue
+    worker = IngestionWorker(
+        pipeline.document_pipeline,
+        _ingestion_queue(pipeline, worker_id=args.worker_id),
+        concurrency=args.concurrency or queue_config.concurrency,
+        poll_interval=queue_config.poll_interval_seconds,
+    )
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    await worker.run_async(stop_event, drain=args.drain)
+    return 0 if worker.failed == 0 else 1
+
+
+async def run_pdf_queue_status(args, pipeline: ThothPipeline):  # noqa: ARG001
+    """
+    Show the number of queued ingestion jobs per status.
+    """
+    stats = await _ingestion_queue(pipeline).stats_async()
+    if not stats:
+        logger.info('Ingestion queue is empty')
+    for status, count in sorted(stats.items()):
+        logger.info(f'{status}: {count}')
+    return 0
+
+
 def _process_all_articles(
     pdf_locator,  # noqa: ARG001
     update_existing: bool,  # noqa: ARG001
@@ -156,3 +232,42 @@ def configure_subparser(subparsers):
     )
     test_parser.add_argument('--doi', help='Test with specific DOI')
     test_parser.set_defaults(func=run_test_source)
+
+    # Ingestion queue commands
+    enqueue_parser = subparsers.add_parser(
+        'pdf-enqueue', help='Queue PDFs for processing by ingestion workers'
+    )
+    enqueue_parser.add_argument(
+        'paths', nargs='+', help='PDF files or directories (searched recursively)'
+    )
+    enqueue_parser.add_argument(
+        '--priority',
+        type=int,
+        default=0,
+        help='Higher priorities are processed first (default: 0)',
+    )
+    enqueue_parser.add_argument('--user-id', help='Owning user in multi-user mode')
+    enqueue_parser.set_defaults(func=run_pdf_enqueue)
+
+    worker_parser = subparsers.add_parser(
+        'pdf-worker', help='Process PDFs from the ingestion queue'
+    )
+    worker_parser.add_argument(
+        '--concurrency',
+        type=int,
+        help='Jobs processed at once (default: ingestionQueue.concurrency)',
+    )
+    worker_parser.add_argument(
+        '--drain',
+        action='store_true',
+        help='Exit once no queued jobs are due instead of polling',
+    )
+    worker_parser.add_argument(
+        '--worker-id', help='Lease owner name (default: host, PID and random suffix)'
+    )
+    worker_parser.set_defaults(func=run_pdf_worker)
+
+    queue_status_parser = subparsers.add_parser(
+        'pdf-queue', help='Show ingestion queue status'
+    )
+    queue_status_parser.set_defaults(func=run_pdf_queue_status)
@@ -8,7 +8,8 @@ This module provides commands for:
 - System resource optimization
 """
 
-import asyncio  # noqa: I001
+import argparse  # noqa: I001
+import asyncio
 import json
 import time
 from pathlib import Path
@@ -16,7 +17,10 @@ from pathlib import Path
 from loguru import logger
 
 from thoth.pipeline import ThothPipeline
-from thoth.pipelines.optimized_document_pipeline import OptimizedDocumentPipeline
+from thoth.pipelines.optimized_document_pipeline import (
+    DOCUMENT_STAGES,
+    OptimizedDocumentPipeline,
+)
 from thoth.services.cache_service import CacheService
 from thoth.services.service_manager import ServiceManager
 from thoth.config import config
@@ -28,6 +32,10 @@ def run_optimized_batch(args, pipeline: ThothPipeline):
     """
     # config imported globally from thoth.config
 
+    if args.stage_workers and not args.async_mode:
+        logger.error('--stage-workers only applies to --async processing')
+        return 1
+
     # Load PDF list
     try:
         if args.input_file:
@@ -75,7 +83,9 @@ def run_optimized_batch(args, pipeline: ThothPipeline):
         # Use async processing
         try:
             results = asyncio.run(
-                optimized_pipeline.batch_process_pdfs_async(pdf_paths)
+                optimized_pipeline.batch_process_pdfs_async(
+                    pdf_paths, stage_workers=args.stage_workers
+                )
             )
             successful = len([r for r in results if r is not None])
             failed = len(pdf_paths) - successful
@@ -122,9 +132,41 @@ def run_optimized_batch(args, pipeline: ThothPipeline):
     print(f'   Max Workers: {perf_stats.get("max_workers", {})}')
     print(f'   Async Enabled: {perf_stats.get("async_processing_enabled", False)}')
 
+    if perf_stats.get('stages'):
+        print('\nPipeline Stages:')
+        print(
+            f'   {"Stage":<10} {"Workers":>7} {"Done":>6} {"Failed":>6} '
+            f'{"Avg s":>7} {"Per min":>8} {"Busy":>6}'
+        )
+        for name, stage in perf_stats['stages'].items():
+            print(
+                f'   {name:<10} {stage["workers"]:>7} {stage["completed"]:>6} '
+                f'{stage["failed"]:>6} {stage["average_seconds"]:>7.1f} '
+                f'{stage["throughput_per_minute"]:>8.1f} '
+                f'{stage["utilization"]:>6.0%}'
+            )
+
     return 0 if failed == 0 else 1
 
 
+def _parse_stage_workers(value: str) -> dict[str, int]:
+    """Parse 'ocr=4,analysis=2' into per-stage worker counts (argparse type)."""
+    workers = {}
+    for part in value.split(','):
+        name, _, count = part.partition('=')
+        name = name.strip()
+        if name not in DOCUMENT_STAGES:
+            raise argparse.ArgumentTypeError(
+                f'unknown stage {name!r}; expected one of {", ".join(DOCUMENT_STAGES)}'
+            )
+        if not count.strip().isdigit() or int(count) < 1:
+            raise argparse.ArgumentTypeError(
+                f'worker count for {name!r} must be an integer >= 1, got {count!r}'
+            )
+        workers[name] = int(count)
+    return workers
+
+
 def run_benchmark(args, pipeline: ThothPipeline):
     """
     Run performance benchmark comparing standard vs optimized processing.
@@ -228,6 +270,105 @@ def run_benchmark(args, pipeline: ThothPipeline):
     return 0
 
 
+def run_ingest_benchmark(args, pipeline: ThothPipeline):  # noqa: ARG001
+    """
+    Benchmark per-row vs. COPY-based bulk chunk ingestion into pgvector.
+    """
+    from thoth.performance.ingest_benchmark import run_ingest_benchmark
+
+    logger.info(
+        f'Running ingest benchmark: {args.chunks} chunks x {args.iterations} iterations'
+    )
+    try:
+        result = asyncio.run(
+            run_ingest_benchmark(
+                chunk_count=args.chunks,
+                dimensions=args.dimensions,
+                iterations=args.iterations,
+            )
+        )
+    except Exception as e:
+        logger.error(f'Ingest benchmark failed: {e}')
+        return 1
+
+    print('\n' + '=' * 60)
+    print('CHUNK INGESTION BENCHMARK RESULTS')
+    print('=' * 60)
+    print(f'Chunks per ingest: {result.chunk_count} ({result.dimensions} dims)')
+
+    print('\nPer-row INSERT path:')
+    print(f'   Median: {result.per_row_median:.2f} seconds')
+    print(f'   Chunks/sec: {result.chunk_count / result.per_row_median:.0f}')
+
+    print('\nBulk COPY path:')
+    print(f'   Median: {result.bulk_median:.2f} seconds')
+    print(f'   Chunks/sec: {result.chunk_count / result.bulk_median:.0f}')
+
+    print('\nComparison:')
+    print(f'   Speedup Factor: {result.speedup:.1f}x')
+    print(f'   Chunk IDs identical: {"yes" if result.ids_match else "NO"}')
+
+    return 0 if result.ids_match else 1
+
+
+def run_chunk_benchmark(args, pipeline: ThothPipeline):  # noqa: ARG001
+    """
+    Benchmark markdown chunking over real papers from the knowledge base.
+    """
+    from thoth.performance.chunking_benchmark import (
+        load_database_papers,
+        load_markdown_files,
+        run_chunking_benchmark,
+    )
+
+    rag_config = config.rag_config
+    try:
+        if args.path:
+            papers = load_markdown_files(Path(args.path), args.papers)
+        else:
+            papers = asyncio.run(
+                load_database_papers(config.secrets.database_url, args.papers)
+            )
+        if not papers:
+            logger.error('No papers with markdown content found')
+            return 1
+
+        logger.info(
+            f'Running chunking benchmark: {len(papers)} papers x '
+            f'{args.iterations} iterations'
+        )
+        result = run_chunking_benchmark(
+            papers,
+            chunk_size=rag_config.chunk_size,
+            chunk_overlap=rag_config.chunk_overlap,
+            encoding_name=rag_config.chunk_encoding,
+            iterations=args.iterations,
+        )
+    except Exception as e:
+        logger.error(f'Chunking benchmark failed: {e}')
+        return 1
+
+    print('\n' + '=' * 60)
+    print('CHUNKING BENCHMARK RESULTS')
+    print('=' * 60)
+    print(f'Papers: {result.paper_count} ({result.total_chars / 1e6:.1f}M chars)')
+
+    print('\nLegacy two-stage splitter:')
+    print(f'   Median: {result.legacy_median:.2f} seconds')
+    print(f'   Papers/sec: {result.paper_count / result.legacy_median:.1f}')
+    print(f'   Chunks: {result.legacy_chunks}')
+
+    print('\nToken-offset chunker:')
+    print(f'   Median: {result.chunker_median:.2f} seconds')
+    print(f'   Papers/sec: {result.paper_count / result.chunker_median:.1f}')
+    print(f'   Chunks: {result.chunker_chunks}')
+
+    print('\nComparison:')
+    print(f'   Speedup Factor: {result.speedup:.1f}x')
+
+    return 0
+
+
 def run_cache_stats(args, pipeline: ThothPipeline):  # noqa: ARG001
     """
     Show cache statistics and management.
@@ -342,6 +483,14 @@ def configure_subparser(subparsers):
         action='store_true',
         help='Use async processing (recommended)',
     )
+    batch_parser.add_argument(
+        '--stage-workers',
+        type=_parse_stage_workers,
+        help=(
+            'Worker pool sizes per stage with --async, e.g. '
+            'ocr=4,analysis=2,citations=6,note=2,rag=2'
+        ),
+    )
     batch_parser.set_defaults(func=run_optimized_batch)
 
     # Benchmark
@@ -356,6 +505,42 @@ def configure_subparser(subparsers):
     )
     benchmark_parser.set_defaults(func=run_benchmark)
 
+    # Chunk ingestion benchmark
+    ingest_parser = perf_subparsers.add_parser(
+        'ingest-benchmark',
+        help='Compare per-row and bulk COPY chunk ingestion into pgvector',
+    )
+    ingest_parser.add_argument(
+        '--chunks', type=int, default=500, help='Chunks per ingest (default: 500)'
+    )
+    ingest_parser.add_argument(
+        '--iterations', type=int, default=3, help='Timed runs per path (default: 3)'
+    )
+    ingest_parser.add_argument(
+        '--dimensions',
+        type=int,
+        default=1536,
+        help='Embedding dimensions, must match document_chunks (default: 1536)',
+    )
+    ingest_parser.set_defaults(func=run_ingest_benchmark)
+
+    # Chunking benchmark
+    chunk_parser = perf_subparsers.add_parser(
+        'chunk-benchmark',
+        help='Compare the markdown chunker with the legacy splitter on real papers',
+    )
+    chunk_parser.add_argument(
+        '--papers', type=int, default=300, help='Papers to split (default: 300)'
+    )
+    chunk_parser.add_argument(
+        '--path',
+        help='Directory of markdown files to use instead of the database',
+    )
+    chunk_parser.add_argument(
+        '--iterations', type=int, default=3, help='Timed runs per chunker (default: 3)'
+    )
+    chunk_parser.set_defaults(func=run_chunk_benchmark)
+
     # Cache management
     cache_parser = perf_subparsers.add_parser(
         'cache', help='Cache statistics and management'
@@ -9,6 +9,8 @@ def run_rag_index(args, pipeline: ThothPipeline):
     """
     if args.force:
         logger.warning('Force flag enabled - will reindex all documents')
+    if getattr(args, 'from_database', False):
+        return run_rag_index_from_database(args, pipeline)
     try:
         logger.info('Starting knowledge base indexing for RAG system...')
         stats = pipeline.knowledge_pipeline.index_knowledge_base()
@@ -31,6 +33,31 @@ def run_rag_index(args, pipeline: ThothPipeline):
         return 1
 
 
+def run_rag_index_from_database(args, pipeline: ThothPipeline):
+    """
+    Index processed papers stored in PostgreSQL.
+    """
+    try:
+        logger.info('Starting database indexing for RAG system...')
+        stats = pipeline.services.rag.index_from_database(
+            limit=args.limit, force=args.force
+        )
+        logger.info('Database indexing completed:')
+        logger.info(f'  Papers found: {stats["total_papers"]}')
+        logger.info(f'  Papers indexed: {stats["papers_indexed"]}')
+        if stats.get('papers_skipped'):
+            logger.info(f'  Papers skipped (no content): {stats["papers_skipped"]}')
+        logger.info(f'  Total chunks created: {stats["total_chunks"]}')
+        if stats['errors']:
+            logger.warning(f'  Errors encountered: {len(stats["errors"])}')
+            for error in stats['errors']:
+                logger.warning(f'    - {error}')
+        return 0
+    except Exception as e:
+        logger.error(f'Error indexing papers from database: {e}')
+        return 1
+
+
 def run_rag_search(args, pipeline: ThothPipeline):
     """
     Search the knowledge base.
@@ -135,6 +162,62 @@ def run_rag_clear(args, pipeline: ThothPipeline):
         return 1
 
 
+def _log_index_health(health) -> None:
+    if health.method is None:
+        logger.info(f'  Index: none ({health.rows} embedded chunks)')
+    else:
+        options = ', '.join(f'{k}={v}' for k, v in health.options.items())
+        logger.info(
+            f'  Index: {health.name} ({health.method}{", " + options if options else ""})'
+        )
+        logger.info(f'  Valid: {health.valid}')
+        logger.info(f'  Size: {health.size_bytes / (1024 * 1024):.1f} MB')
+        logger.info(f'  Embedded chunks: {health.rows}')
+        if health.rows_at_build is not None:
+            logger.info(f'  Chunks at build time: {health.rows_at_build}')
+        logger.info(f'  Dead rows: {health.dead_rows}')
+
+
+def run_rag_index_health(args, pipeline: ThothPipeline):  # noqa: ARG001
+    """
+    Report vector index health and whether a rebuild is recommended.
+    """
+    try:
+        health = pipeline.services.rag.get_vector_index_health()
+        logger.info('Vector index health:')
+        _log_index_health(health)
+        if health.needs_rebuild:
+            logger.warning('Rebuild recommended:')
+            for reason in health.recommendations:
+                logger.warning(f'  - {reason}')
+            logger.warning('Run "thoth rag rebuild-index" (writes are not blocked).')
+        else:
+            logger.info('Index is healthy.')
+        return 0
+    except Exception as e:
+        logger.error(f'Error checking vector index: {e}')
+        return 1
+
+
+def run_rag_rebuild_index(args, pipeline: ThothPipeline):
+    """
+    Rebuild the vector index concurrently.
+    """
+    try:
+        logger.info('Rebuilding vector index concurrently...')
+        health = pipeline.services.rag.rebuild_vector_index(
+            method=args.method,
+            lists=args.lists,
+            maintenance_work_mem=args.maintenance_work_mem,
+        )
+        logger.info('Vector index rebuilt:')
+        _log_index_health(health)
+        return 0
+    except Exception as e:
+        logger.error(f'Error rebuilding vector index: {e}')
+        return 1
+
+
 def run_rag_command(args, pipeline: ThothPipeline):
     """Handle RAG commands."""
     if not hasattr(args, 'rag_command') or not args.rag_command:
@@ -151,6 +234,10 @@ def run_rag_command(args, pipeline: ThothPipeline):
         return run_rag_stats(args, pipeline)
     elif args.rag_command == 'clear':
         return run_rag_clear(args, pipeline)
+    elif args.rag_command == 'index-health':
+        return run_rag_index_health(args, pipeline)
+    elif args.rag_command == 'rebuild-index':
+        return run_rag_rebuild_index(args, pipeline)
     else:
         logger.error(f'Unknown RAG command: {args.rag_command}')
         return 1
@@ -173,6 +260,17 @@ def configure_subparser(subparsers):
         action='store_true',
         help='Force re-indexing of all documents.',
     )
+    index_parser.add_argument(
+        '--from-database',
+        action='store_true',
+        help='Index processed papers from PostgreSQL instead of vault files.',
+    )
+    index_parser.add_argument(
+        '--limit',
+        type=int,
+        default=None,
+        help='Maximum number of papers to index (with --from-database).',
+    )
     index_parser.set_defaults(func=run_rag_index)
 
     search_parser = rag_subparsers.add_parser(
@@ -215,4 +313,33 @@ def configure_subparser(subparsers):
     )
     clear_parser.set_defaults(func=run_rag_clear)
 
+    health_parser = rag_subparsers.add_parser(
+        'index-health', help='Report vector index health and rebuild recommendations'
+    )
+    health_parser.set_defaults(func=run_rag_index_health)
+
+    rebuild_parser = rag_subparsers.add_parser(
+        'rebuild-index',
+        help='Rebuild the vector index concurrently (without blocking writes)',
+    )
+    rebuild_parser.add_argument(
+        '--method',
+        choices=['hnsw', 'ivfflat'],
+        default=None,
+        help='Index method (default: vectorIndexType from settings)',
+    )
+    rebuild_parser.add_argument(
+        '--lists',
+        type=int,
+        default=None,
+        help='IVFFlat lists (default: sized to the number of chunks)',
+    )
+    rebuild_parser.add_argument(
+        '--maintenance-work-mem',
+        type=str,
+        default=None,
+        help="Memory for the index build, e.g. '1GB'",
+    )
+    rebuild_parser.set_defaults(func=run_rag_rebuild_index)
+
     parser.set_defaults(func=run_rag_command)
@@ -323,8 +323,8 @@ def run_watcher_backfill_db(args, pipeline: ThothPipeline):
                             'source': f'database:paper:{paper_id}',
                         }
 
-                        # Split into chunks using RAG manager's splitter
-                        chunks = rag_manager.text_splitter.split_text(content)
+                        # Split into chunks using RAG manager's chunker
+                        chunks = rag_manager.chunker.split_text(content)
 
                         # Generate embeddings for all chunks at once
                         embeddings = rag_manager.embedding_manager.get_embedding_model().embed_documents(
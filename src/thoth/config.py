@@ -183,6 +183,9 @@ class LLMDefaultConfig(BaseModel):
     map_reduce_threshold_multiplier: float = Field(
         default=3.0, alias='mapReduceThresholdMultiplier'
     )
+    # Map-reduce analysis: chunk analyses in flight and retries per chunk
+    map_concurrency: int = Field(default=4, alias='mapConcurrency')
+    map_max_retries: int = Field(default=2, alias='mapMaxRetries')
 
     class Config:
         populate_by_name = True
@@ -375,6 +378,14 @@ class LLMConfig(BaseModel):
     def map_reduce_threshold_multiplier(self) -> float:
         return self.default.map_reduce_threshold_multiplier
 
+    @property
+    def map_concurrency(self) -> int:
+        return self.default.map_concurrency
+
+    @property
+    def map_max_retries(self) -> int:
+        return self.default.map_max_retries
+
     @property
     def provider(self) -> str:
         """Extract provider prefix from model string, default to openrouter."""
@@ -470,6 +481,76 @@ class RAGConfig(BaseModel):
         default='openai/text-embedding-3-small', alias='embeddingModel'
     )
     embedding_batch_size: int = Field(default=100, alias='embeddingBatchSize')
+    bulk_ingest_enabled: bool = Field(
+        default=False,
+        alias='bulkIngestEnabled',
+        description='Write chunks via binary COPY + set-based upsert instead of per-row INSERTs',
+    )
+    bulk_ingest_batch_size: int = Field(
+        default=500,
+        alias='bulkIngestBatchSize',
+        description='Chunks staged per COPY/merge batch when bulk ingestion is enabled',
+    )
+    local_embedding_token_budget: int = Field(
+        default=8192,
+        alias='localEmbeddingTokenBudget',
+        description='Initial estimated tokens per local embedding batch (tuned at runtime)',
+    )
+    local_embedding_max_batch_size: int = Field(
+        default=64,
+        alias='localEmbeddingMaxBatchSize',
+        description='Maximum texts per local embedding batch',
+    )
+    local_embedding_max_rss_mb: float | None = Field(
+        default=None,
+        alias='localEmbeddingMaxRssMb',
+        description='Shrink local embedding batches when process RSS exceeds this',
+    )
+    embedding_workers: int = Field(
+        default=0,
+        alias='embeddingWorkers',
+        description='Worker processes for local embedding models (0 or 1 = in-process)',
+    )
+    embedding_cache_enabled: bool = Field(
+        default=True,
+        alias='embeddingCacheEnabled',
+        description='Reuse stored embeddings for chunks whose text has not changed',
+    )
+    embedding_version: str = Field(
+        default='v1',
+        alias='embeddingVersion',
+        description='Embedding strategy version; bump to invalidate cached embeddings',
+    )
+    query_embedding_cache_size: int = Field(
+        default=1024,
+        alias='queryEmbeddingCacheSize',
+        description='Query embeddings kept in memory (LRU); 0 disables the cache',
+    )
+    query_embedding_cache_ttl_seconds: float = Field(
+        default=3600.0,
+        alias='queryEmbeddingCacheTtlSeconds',
+        description='Seconds a cached query embedding stays valid',
+    )
+    streaming_index_enabled: bool = Field(
+        default=True,
+        alias='streamingIndexEnabled',
+        description='Overlap chunk embedding and DB writes when indexing papers',
+    )
+    streaming_index_batch_size: int = Field(
+        default=32,
+        alias='streamingIndexBatchSize',
+        description='Chunks per embed/write micro-batch in the streaming indexer',
+    )
+    streaming_index_queue_depth: int = Field(
+        default=2,
+        alias='streamingIndexQueueDepth',
+        description='Micro-batches buffered between streaming indexer stages',
+    )
+    incremental_reindex_enabled: bool = Field(
+        default=True,
+        alias='incrementalReindexEnabled',
+        description='Re-index a paper by diffing chunk content hashes, rewriting only changed chunks',
+    )
     skip_files_with_images: bool = Field(default=True, alias='skipFilesWithImages')
     vector_db_path: str = Field(default='knowledge/vector_db', alias='vectorDbPath')
     collection_name: str = Field(default='thoth_knowledge', alias='collectionName')
@@ -498,7 +579,39 @@ class RAGConfig(BaseModel):
     full_text_backend: str = Field(
         default='tsvector',
         alias='fullTextBackend',
-        description='Full-text search backend: tsvector (default) or paradedb',
+        description='Full-text search backend: tsvector (default), bm25 or paradedb',
+    )
+    hybrid_search_mode: str = Field(
+        default='fused',
+        alias='hybridSearchMode',
+        description='fused (one SQL statement with server-side RRF) or concurrent',
+    )
+
+    # Vector index configuration (see `thoth rag index-health`)
+    vector_index_type: str = Field(
+        default='hnsw',
+        alias='vectorIndexType',
+        description='Index method used when rebuilding the embedding index: hnsw or ivfflat',
+    )
+    hnsw_m: int = Field(
+        default=16,
+        alias='hnswM',
+        description='HNSW max connections per layer (index build)',
+    )
+    hnsw_ef_construction: int = Field(
+        default=64,
+        alias='hnswEfConstruction',
+        description='HNSW candidate list size during index build',
+    )
+    hnsw_ef_search: int | None = Field(
+        default=None,
+        alias='hnswEfSearch',
+        description='HNSW candidate list size per query (higher = better recall, slower); None uses the server default',
+    )
+    ivfflat_probes: int | None = Field(
+        default=None,
+        alias='ivfflatProbes',
+        description='IVFFlat lists probed per query (higher = better recall, slower); None uses the server default',
     )
 
     # Reranking configuration
@@ -506,13 +619,23 @@ class RAGConfig(BaseModel):
     reranker_provider: str = Field(
         default='auto',
         alias='rerankerProvider',
-        description='Reranker provider: auto, cohere, llm, or none',
+        description='Reranker provider: auto, cohere, llm, cross-encoder, or none',
     )
     reranker_model: str = Field(
         default='rerank-v3.5',
         alias='rerankerModel',
         description='Reranker model name (for Cohere)',
     )
+    cross_encoder_model: str = Field(
+        default='cross-encoder/ms-marco-MiniLM-L-6-v2',
+        alias='crossEncoderModel',
+        description='Local cross-encoder model name or path (rerankerProvider=cross-encoder)',
+    )
+    cross_encoder_batch_size: int = Field(
+        default=32,
+        alias='crossEncoderBatchSize',
+        description='(query, document) pairs scored per cross-encoder forward pass',
+    )
     reranker_top_n: int = Field(
         default=5,
         alias='rerankerTopN',
@@ -524,6 +647,45 @@ class RAGConfig(BaseModel):
         description='Number of candidates to retrieve before reranking',
     )
 
+    # LLM grading/reranking configuration (DocumentGrader and LLMReranker)
+    llm_grading_mode: str = Field(
+        default='listwise',
+        alias='llmGradingMode',
+        description='listwise (several documents per LLM call) or pointwise (one call per document)',
+    )
+    llm_grading_batch_size: int = Field(
+        default=10,
+        alias='llmGradingBatchSize',
+        description='Maximum documents per listwise grading/reranking call',
+    )
+    llm_grading_token_budget: int = Field(
+        default=2000,
+        alias='llmGradingTokenBudget',
+        description='Approximate document tokens packed into one listwise call',
+    )
+    llm_grading_max_concurrency: int = Field(
+        default=8,
+        alias='llmGradingMaxConcurrency',
+        description='Maximum concurrent grading/reranking LLM calls',
+    )
+
+    # Semantic answer cache configuration
+    answer_cache_enabled: bool = Field(
+        default=True,
+        alias='answerCacheEnabled',
+        description='Serve near-identical questions from previously generated answers',
+    )
+    answer_cache_similarity_threshold: float = Field(
+        default=0.97,
+        alias='answerCacheSimilarityThreshold',
+        description='Minimum cosine similarity between questions for an answer cache hit (0-1)',
+    )
+    answer_cache_ttl_hours: float = Field(
+        default=168.0,
+        alias='answerCacheTtlHours',
+        description='Maximum age of a cached answer in hours',
+    )
+
     # Contextual enrichment configuration
     contextual_enrichment_enabled: bool = Field(
         default=False,
@@ -535,6 +697,11 @@ class RAGConfig(BaseModel):
         alias='contextualEnrichmentModel',
         description='Model for generating chunk context (use cheap model)',
     )
+    contextual_enrichment_cache_enabled: bool = Field(
+        default=True,
+        alias='contextualEnrichmentCacheEnabled',
+        description='Reuse generated chunk contexts when re-indexing unchanged papers',
+    )
 
     # Adaptive routing configuration
     adaptive_routing_enabled: bool = Field(
@@ -922,6 +1089,25 @@ class CitationConfig(BaseModel):
         alias='useResolutionChain',
         description='Enable improved citation resolution chain with Crossref, ArXiv, OpenAlex, and Semantic Scholar',
     )
+    # 'sequential' asks one source at a time; 'hedged' also starts the next
+    # source when one exceeds its latency budget (more requests per citation)
+    resolution_mode: str = Field(default='sequential', alias='resolutionMode')
+    hedge_delays_seconds: Dict[str, float] = Field(  # noqa: UP006
+        default_factory=dict, alias='hedgeDelaysSeconds'
+    )
+    # Resolution results shared by all resolution paths and worker processes:
+    # an in-memory LRU in front of the api_enrichment_cache table
+    resolution_cache_enabled: bool = Field(default=True, alias='resolutionCacheEnabled')
+    resolution_cache_size: int = Field(default=10000, alias='resolutionCacheSize')
+    resolution_cache_ttl_days: float = Field(
+        default=30.0, alias='resolutionCacheTtlDays'
+    )
+    resolution_cache_negative_ttl_hours: float = Field(
+        default=1.0, alias='resolutionCacheNegativeTtlHours'
+    )
+    # Match citations against our own paper_metadata table before the APIs
+    local_resolution_enabled: bool = Field(default=True, alias='localResolutionEnabled')
+    local_match_threshold: float = Field(default=0.8, alias='localMatchThreshold')
 
     class Config:
         populate_by_name = True
@@ -947,6 +1133,10 @@ class OCRConfig(BaseModel):
     max_concurrent: int = Field(default=3, alias='maxConcurrent')
     enable_caching: bool = Field(default=True, alias='enableCaching')
     cache_ttl_hours: int = Field(default=24, alias='cacheTtlHours')
+    # Content-addressed OCR result store shared by all processing paths
+    # (defaults to <cache_root>/ocr)
+    cache_dir: str | None = Field(default=None, alias='cacheDir')
+    cache_max_size_mb: int = Field(default=2048, alias='cacheMaxSizeMb')
 
     class Config:
         populate_by_name = True
@@ -984,6 +1174,21 @@ class SemanticScholarConfig(BaseModel):
         populate_by_name = True
 
 
+class IngestionQueueConfig(BaseModel):
+    """Durable PDF ingestion queue configuration."""
+
+    enabled: bool = False
+    concurrency: int = 2
+    poll_interval_seconds: float = Field(default=5.0, alias='pollIntervalSeconds')
+    max_attempts: int = Field(default=5, alias='maxAttempts')
+    backoff_base_seconds: float = Field(default=30.0, alias='backoffBaseSeconds')
+    backoff_max_seconds: float = Field(default=3600.0, alias='backoffMaxSeconds')
+    lock_timeout_seconds: float = Field(default=1800.0, alias='lockTimeoutSeconds')
+
+    class Config:
+        populate_by_name = True
+
+
 class PerformanceConfig(BaseModel):
     """Performance configuration."""
 
@@ -995,6 +1200,9 @@ class PerformanceConfig(BaseModel):
     semantic_scholar: SemanticScholarConfig = Field(
         default_factory=SemanticScholarConfig, alias='semanticScholar'
     )
+    ingestion_queue: IngestionQueueConfig = Field(
+        default_factory=IngestionQueueConfig, alias='ingestionQueue'
+    )
 
     class Config:
         populate_by_name = True
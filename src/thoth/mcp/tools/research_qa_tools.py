@@ -1259,6 +1259,12 @@ class AgenticResearchQuestionMCPTool(MCPTool):
             response_parts.append(
                 f'**Grounded**: {"Yes" if result["is_grounded"] else "No (potential hallucination detected)"}'
             )
+            cache = result.get('cache') or {}
+            if cache.get('hit'):
+                response_parts.append(
+                    f'**Cached Answer**: reused from "{cache["cached_question"]}" '
+                    f'(similarity {cache["similarity"]:.2f}, cached {cache["cached_at"]})'
+                )
 
             # Add CRAG retrieval assessment with action guidance
             assessment = result.get('retrieval_assessment', '')
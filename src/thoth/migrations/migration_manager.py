@@ -50,6 +50,13 @@ class MigrationManager:
             (7, 'add_multi_user_support', MIGRATION_007_ADD_MULTI_USER_SUPPORT),
             (8, 'add_thoth_docs_tables', MIGRATION_008_ADD_THOTH_DOCS_TABLES),
             (9, 'add_skill_message_count', MIGRATION_009_ADD_SKILL_MESSAGE_COUNT),
+            (10, 'add_embedding_cache', MIGRATION_010_ADD_EMBEDDING_CACHE),
+            (11, 'add_bm25_statistics', MIGRATION_011_ADD_BM25_STATISTICS),
+            (12, 'add_chunk_context_cache', MIGRATION_012_ADD_CHUNK_CONTEXT_CACHE),
+            (13, 'add_answer_cache', MIGRATION_013_ADD_ANSWER_CACHE),
+            (14, 'add_chunk_content_hash', MIGRATION_014_ADD_CHUNK_CONTENT_HASH),
+            (15, 'add_ingestion_queue', MIGRATION_015_ADD_INGESTION_QUEUE),
+            (16, 'add_paper_doi_lower_index', MIGRATION_016_ADD_PAPER_DOI_LOWER_INDEX),
         ]
         return sorted(migrations, key=lambda x: x[0])
 
@@ -1326,3 +1333,378 @@ CREATE INDEX IF NOT EXISTS idx_thoth_doc_chunks_doc ON thoth_doc_chunks(doc_id);
 CREATE INDEX IF NOT EXISTS idx_thoth_doc_chunks_embedding
     ON thoth_doc_chunks USING ivfflat (embedding vector_cosine_ops);
 """
+
+MIGRATION_010_ADD_EMBEDDING_CACHE = """
+-- Migration 010: Content-addressed embedding cache
+--
+-- Re-indexing a paper re-embeds every chunk even when the text is unchanged.
+-- Embeddings are cached by (model, embedding_version, sha256 of the normalized
+-- chunk text) so only new or edited chunks reach the embedding model. Stored as
+-- REAL[] rather than vector(n) so models with different dimensions can share
+-- the table.
+
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    model TEXT NOT NULL,
+    embedding_version VARCHAR(32) NOT NULL,
+    content_hash CHAR(64) NOT NULL,
+    embedding REAL[] NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    last_used_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (model, embedding_version, content_hash)
+);
+
+-- Supports pruning entries that have not been used recently
+CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used
+    ON embedding_cache(last_used_at);
+"""
+
+MIGRATION_011_ADD_BM25_STATISTICS = """
+-- Migration 011: Corpus statistics for extension-free BM25 scoring
+--
+-- ts_rank_cd ignores inverse document frequency. The BM25 backend scores with
+-- per-lexeme document frequencies and the corpus average chunk length, kept in
+-- these tables and maintained incrementally by statement-level triggers on
+-- document_chunks (transition tables, so bulk COPY merges update once per
+-- statement rather than once per row). Term frequencies come straight from the
+-- positions stored in document_chunks.search_vector.
+--
+-- The triggers are not installed here: deployments on the default tsvector
+-- backend should not pay for BM25 bookkeeping on every chunk write.
+-- bm25_rebuild_stats() installs them and backfills the statistics; the BM25
+-- backend calls it when it first finds them missing. bm25_drop_stats()
+-- removes them again.
+
+CREATE TABLE IF NOT EXISTS bm25_term_stats (
+    lexeme TEXT PRIMARY KEY,
+    doc_freq INTEGER NOT NULL
+);
+
+-- Corpus totals are split over slots (summed when read) so concurrent
+-- indexing transactions do not all queue on one row
+CREATE TABLE IF NOT EXISTS bm25_corpus_stats (
+    slot SMALLINT PRIMARY KEY CHECK (slot >= 0 AND slot < 16),
+    doc_count BIGINT NOT NULL DEFAULT 0,
+    total_length BIGINT NOT NULL DEFAULT 0
+);
+
+-- Number of tokens in a tsvector (lexemes without positions count once)
+CREATE OR REPLACE FUNCTION bm25_doc_length(vec tsvector) RETURNS INTEGER AS $$
+    SELECT COALESCE(SUM(COALESCE(array_length(u.positions, 1), 1)), 0)::INTEGER
+    FROM unnest(vec) AS u
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Apply the statistics delta of removed and added chunk vectors in one pass.
+-- Term rows are upserted in lexeme order so concurrent indexers sharing
+-- lexemes lock them in the same order and cannot deadlock.
+CREATE OR REPLACE FUNCTION bm25_apply_delta(removed tsvector[], added tsvector[])
+RETURNS VOID AS $$
+DECLARE
+    emptied TEXT[];
+BEGIN
+    WITH changes AS (
+        SELECT v.vec, -1 AS sign FROM unnest(removed) AS v(vec)
+        WHERE v.vec IS NOT NULL
+        UNION ALL
+        SELECT v.vec, 1 FROM unnest(added) AS v(vec)
+        WHERE v.vec IS NOT NULL
+    ),
+    delta AS (
+        SELECT u.lexeme, SUM(c.sign)::INTEGER AS doc_freq
+        FROM changes c, unnest(c.vec) AS u
+        GROUP BY u.lexeme
+        HAVING SUM(c.sign) <> 0
+    ),
+    upserted AS (
+        INSERT INTO bm25_term_stats AS s (lexeme, doc_freq)
+        SELECT lexeme, doc_freq FROM delta
+        ORDER BY lexeme
+        ON CONFLICT (lexeme) DO UPDATE SET doc_freq = s.doc_freq + EXCLUDED.doc_freq
+        RETURNING s.lexeme, s.doc_freq
+    )
+    SELECT array_agg(lexeme ORDER BY lexeme) INTO emptied
+    FROM upserted
+    WHERE doc_freq <= 0;
+
+    -- Only lexemes of this delta can have dropped to zero
+    IF emptied IS NOT NULL THEN
+        DELETE FROM bm25_term_stats
+        WHERE lexeme = ANY(emptied) AND doc_freq <= 0;
+    END IF;
+
+    INSERT INTO bm25_corpus_stats AS c (slot, doc_count, total_length)
+    SELECT pg_backend_pid() % 16,
+           COALESCE(SUM(d.sign), 0),
+           COALESCE(SUM(d.sign * bm25_doc_length(d.vec)), 0)
+    FROM (
+        SELECT v.vec, -1 AS sign FROM unnest(removed) AS v(vec)
+        WHERE v.vec IS NOT NULL
+        UNION ALL
+        SELECT v.vec, 1 FROM unnest(added) AS v(vec)
+        WHERE v.vec IS NOT NULL
+    ) AS d
+    HAVING COUNT(*) > 0
+    ON CONFLICT (slot) DO UPDATE SET
+        doc_count = c.doc_count + EXCLUDED.doc_count,
+        total_length = c.total_length + EXCLUDED.total_length;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION bm25_on_chunks_insert() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM bm25_apply_delta(
+        ARRAY[]::tsvector[], ARRAY(SELECT search_vector FROM new_rows)
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION bm25_on_chunks_delete() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM bm25_apply_delta(
+        ARRAY(SELECT search_vector FROM old_rows), ARRAY[]::tsvector[]
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION bm25_on_chunks_update() RETURNS TRIGGER AS $$
+BEGIN
+    -- Only rows whose text actually changed move the statistics
+    PERFORM bm25_apply_delta(
+        ARRAY(
+            SELECT o.search_vector FROM old_rows o JOIN new_rows n ON n.id = o.id
+            WHERE o.search_vector IS DISTINCT FROM n.search_vector
+        ),
+        ARRAY(
+            SELECT n.search_vector FROM old_rows o JOIN new_rows n ON n.id = o.id
+            WHERE o.search_vector IS DISTINCT FROM n.search_vector
+        )
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Whether the statistics triggers are installed
+CREATE OR REPLACE FUNCTION bm25_stats_enabled() RETURNS BOOLEAN AS $$
+    SELECT EXISTS (
+        SELECT 1 FROM pg_trigger
+        WHERE tgrelid = 'document_chunks'::regclass
+          AND tgname = 'bm25_chunks_insert'
+    )
+$$ LANGUAGE sql STABLE;
+
+-- Install the triggers and rebuild the statistics from scratch (turning BM25
+-- on, or repair after manual edits)
+CREATE OR REPLACE FUNCTION bm25_rebuild_stats() RETURNS VOID AS $$
+BEGIN
+    -- Block chunk writes so no change is missed between rebuild and triggers
+    LOCK TABLE document_chunks IN SHARE MODE;
+
+    DROP TRIGGER IF EXISTS bm25_chunks_insert ON document_chunks;
+    CREATE TRIGGER bm25_chunks_insert
+        AFTER INSERT ON document_chunks
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION bm25_on_chunks_insert();
+
+    DROP TRIGGER IF EXISTS bm25_chunks_delete ON document_chunks;
+    CREATE TRIGGER bm25_chunks_delete
+        AFTER DELETE ON document_chunks
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION bm25_on_chunks_delete();
+
+    DROP TRIGGER IF EXISTS bm25_chunks_update ON document_chunks;
+    CREATE TRIGGER bm25_chunks_update
+        AFTER UPDATE ON document_chunks
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION bm25_on_chunks_update();
+
+    TRUNCATE bm25_term_stats;
+    DELETE FROM bm25_corpus_stats;
+    PERFORM bm25_apply_delta(
+        ARRAY[]::tsvector[], ARRAY(SELECT search_vector FROM document_chunks)
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+-- Remove the triggers and statistics (after switching back to tsvector)
+CREATE OR REPLACE FUNCTION bm25_drop_stats() RETURNS VOID AS $$
+BEGIN
+    DROP TRIGGER IF EXISTS bm25_chunks_insert ON document_chunks;
+    DROP TRIGGER IF EXISTS bm25_chunks_delete ON document_chunks;
+    DROP TRIGGER IF EXISTS bm25_chunks_update ON document_chunks;
+    TRUNCATE bm25_term_stats;
+    DELETE FROM bm25_corpus_stats;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+MIGRATION_012_ADD_CHUNK_CONTEXT_CACHE = """
+-- Migration 012: Persistent cache for contextual enrichment
+--
+-- Contextual enrichment asks the LLM for a short context per chunk. The
+-- generated context is cached by (model, document hash, chunk hash) so
+-- re-indexing an unchanged paper makes no LLM calls at all.
+
+CREATE TABLE IF NOT EXISTS chunk_context_cache (
+    model TEXT NOT NULL,
+    document_hash CHAR(64) NOT NULL,
+    chunk_hash CHAR(64) NOT NULL,
+    context TEXT NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    last_used_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (model, document_hash, chunk_hash)
+);
+
+-- Supports pruning entries that have not been used recently
+CREATE INDEX IF NOT EXISTS idx_chunk_context_cache_last_used
+    ON chunk_context_cache(last_used_at);
+"""
+
+MIGRATION_013_ADD_ANSWER_CACHE = """
+-- Migration 013: Semantic answer cache
+--
+-- Near-identical questions otherwise rerun the whole retrieve-grade-generate
+-- pipeline. Answers are cached with the question embedding and looked up by
+-- cosine similarity within the same user, answer mode and filter scope. The
+-- embedding column is dimensionless so any embedding model can be used;
+-- lookups always filter by embedding_model first.
+--
+-- Entries record the document_chunks they were answered from and are deleted
+-- by the triggers below as soon as one of those chunks is re-indexed with
+-- different content or deleted (including via paper deletion cascades), and
+-- the whole cache is dropped when document_chunks is truncated.
+
+CREATE TABLE IF NOT EXISTS answer_cache (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id TEXT NOT NULL,
+    scope_key CHAR(64) NOT NULL,
+    embedding_model TEXT NOT NULL,
+    question TEXT NOT NULL,
+    query_embedding vector NOT NULL,
+    response JSONB NOT NULL,
+    source_chunk_ids UUID[] NOT NULL DEFAULT '{}',
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    last_hit_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_answer_cache_scope
+    ON answer_cache(user_id, scope_key, embedding_model);
+CREATE INDEX IF NOT EXISTS idx_answer_cache_sources
+    ON answer_cache USING GIN (source_chunk_ids);
+CREATE INDEX IF NOT EXISTS idx_answer_cache_created
+    ON answer_cache(created_at);
+
+CREATE OR REPLACE FUNCTION answer_cache_on_chunks_delete() RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM answer_cache
+    WHERE source_chunk_ids && ARRAY(SELECT id FROM old_rows);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION answer_cache_on_chunks_update() RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM answer_cache
+    WHERE source_chunk_ids && ARRAY(
+        SELECT o.id FROM old_rows o JOIN new_rows n ON n.id = o.id
+        WHERE o.content IS DISTINCT FROM n.content
+           OR o.embedding IS DISTINCT FROM n.embedding
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION answer_cache_on_chunks_truncate() RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM answer_cache;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS answer_cache_chunks_delete ON document_chunks;
+CREATE TRIGGER answer_cache_chunks_delete
+    AFTER DELETE ON document_chunks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION answer_cache_on_chunks_delete();
+
+DROP TRIGGER IF EXISTS answer_cache_chunks_update ON document_chunks;
+CREATE TRIGGER answer_cache_chunks_update
+    AFTER UPDATE ON document_chunks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION answer_cache_on_chunks_update();
+
+DROP TRIGGER IF EXISTS answer_cache_chunks_truncate ON document_chunks;
+CREATE TRIGGER answer_cache_chunks_truncate
+    AFTER TRUNCATE ON document_chunks
+    FOR EACH STATEMENT EXECUTE FUNCTION answer_cache_on_chunks_truncate();
+"""
+
+MIGRATION_014_ADD_CHUNK_CONTENT_HASH = """
+-- Migration 014: Content hash per chunk for incremental re-indexing
+--
+-- Re-indexing aligns a paper's stored chunks with the new split by content
+-- hash (SHA-256 of the whitespace-normalized chunk text, before contextual
+-- enrichment), so only changed chunks are re-embedded and unchanged chunks
+-- keep their IDs. Rows written before this migration have no hash; the first
+-- re-index of each paper rewrites them in place and records it.
+
+ALTER TABLE document_chunks
+ADD COLUMN IF NOT EXISTS content_hash CHAR(64);
+
+COMMENT ON COLUMN document_chunks.content_hash IS
+'SHA-256 of the normalized chunk text before enrichment. Used to diff chunks on re-index.';
+"""
+
+MIGRATION_015_ADD_INGESTION_QUEUE = """
+-- Migration 015: Durable PDF ingestion queue
+--
+-- processing_queue holds one row per queued PDF. Workers claim the
+-- highest-priority due row with SELECT ... FOR UPDATE SKIP LOCKED and lease it
+-- (locked_by/locked_at); a lease that is not renewed within the lock timeout
+-- is taken over by another worker, so a crashed worker's job is resumed.
+-- Failed attempts are retried after next_attempt_at until max_attempts.
+--
+-- processing_jobs holds one checkpoint row per completed stage (job_type =
+-- 'ocr', 'analysis', 'citations', 'note' or 'rag') with the stage output, so
+-- a resumed job skips every stage that already finished.
+
+ALTER TABLE processing_queue
+    ADD COLUMN IF NOT EXISTS max_attempts INTEGER NOT NULL DEFAULT 5,
+    ADD COLUMN IF NOT EXISTS next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    ADD COLUMN IF NOT EXISTS locked_by TEXT,
+    ADD COLUMN IF NOT EXISTS locked_at TIMESTAMPTZ,
+    ADD COLUMN IF NOT EXISTS completed_at TIMESTAMPTZ;
+
+-- Claim order for due pending jobs
+CREATE INDEX IF NOT EXISTS idx_processing_queue_claim
+    ON processing_queue(priority DESC, next_attempt_at, created_at)
+    WHERE status = 'pending';
+
+-- Expired leases of crashed workers
+CREATE INDEX IF NOT EXISTS idx_processing_queue_leases
+    ON processing_queue(locked_at)
+    WHERE status = 'processing';
+
+-- A PDF is queued at most once per user while it is pending or in progress
+CREATE UNIQUE INDEX IF NOT EXISTS idx_processing_queue_active_pdf
+    ON processing_queue(user_id, pdf_path)
+    WHERE status IN ('pending', 'processing');
+
+ALTER TABLE processing_jobs
+    ADD COLUMN IF NOT EXISTS queue_id UUID
+    REFERENCES processing_queue(id) ON DELETE CASCADE;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_processing_jobs_queue_stage
+    ON processing_jobs(queue_id, job_type);
+"""
+
+MIGRATION_016_ADD_PAPER_DOI_LOWER_INDEX = """
+-- Migration 016: Case-insensitive DOI lookup on paper_metadata
+--
+-- DOIs are case-insensitive but stored as received. The local citation
+-- resolver looks them up with lower(doi), which this index serves.
+
+CREATE INDEX IF NOT EXISTS idx_paper_metadata_doi_lower
+    ON paper_metadata(lower(doi));
+"""
@@ -0,0 +1,169 @@
+"""
+Chunking micro-benchmark over real papers.
+
+Compares ``MarkdownChunker`` with the two-stage LangChain splitter it replaced
+(header splitter, then a recursive character splitter measuring every
+candidate piece with tiktoken) on markdown from the knowledge base: either
+``processed_papers.markdown_content`` or the markdown files under a vault
+directory. Only CPU time for splitting is measured; nothing is embedded or
+written.
+"""
+
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from loguru import logger
+
+from thoth.rag.chunker import MarkdownChunker, get_encoding
+
+
+@dataclass
+class ChunkingBenchmarkResult:
+    """Timings for both chunkers over the same papers."""
+
+    paper_count: int
+    total_chars: int
+    iterations: int
+    legacy_seconds: list[float] = field(default_factory=list)
+    chunker_seconds: list[float] = field(default_factory=list)
+    legacy_chunks: int = 0
+    chunker_chunks: int = 0
+
+    @property
+    def legacy_median(self) -> float:
+        return statistics.median(self.legacy_seconds) if self.legacy_seconds else 0.0
+
+    @property
+    def chunker_median(self) -> float:
+        return statistics.median(self.chunker_seconds) if self.chunker_seconds else 0.0
+
+    @property
+    def speedup(self) -> float:
+        return (
+            self.legacy_median / self.chunker_median if self.chunker_median > 0 else 0.0
+        )
+
+
+def build_legacy_splitter(
+    chunk_size: int, chunk_overlap: int, encoding_name: str
+) -> Callable[[str], int]:
+    """
+    The two-stage splitter previously used by ``RAGManager``.
+
+    Returns:
+        Function splitting a document and returning its chunk count
+    """
+    from langchain_text_splitters import (
+        MarkdownHeaderTextSplitter,
+        RecursiveCharacterTextSplitter,
+    )
+
+    header_splitter = MarkdownHeaderTextSplitter(
+        headers_to_split_on=[('#', 'h1'), ('##', 'h2'), ('###', 'h3'), ('####', 'h4')],
+        strip_headers=False,
+    )
+    text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        encoding_name=encoding_name,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=['\n\n', '\n', ' ', ''],
+        disallowed_special=(),
+    )
+
+    def split(content: str) -> int:
+        import tiktoken
+
+        count = 0
+        for section in header_splitter.split_text(content):
+            enc = tiktoken.get_encoding(encoding_name)
+            tokens = len(enc.encode(section.page_content, disallowed_special=()))
+            if tokens > chunk_size:
+                count += len(text_splitter.split_text(section.page_content))
+            else:
+                count += 1
+        return count
+
+    return split
+
+
+def load_markdown_files(path: Path, limit: int) -> list[str]:
+    """Read up to ``limit`` non-empty markdown files under ``path``."""
+    papers = []
+    for file_path in sorted(path.rglob('*.md')):
+        text = file_path.read_text(encoding='utf-8', errors='replace')
+        if text.strip():
+            papers.append(text)
+        if len(papers) >= limit:
+            break
+    return papers
+
+
+async def load_database_papers(database_url: str, limit: int) -> list[str]:
+    """Fetch up to ``limit`` processed papers' markdown from PostgreSQL."""
+    import asyncpg
+
+    conn = await asyncpg.connect(database_url)
+    try:
+        rows = await conn.fetch(
+            """
+            SELECT markdown_content FROM processed_papers
+            WHERE markdown_content IS NOT NULL AND markdown_content <> ''
+            ORDER BY paper_id
+            LIMIT $1
+            """,
+            limit,
+        )
+    finally:
+        await conn.close()
+    return [row['markdown_content'] for row in rows]
+
+
+def run_chunking_benchmark(
+    papers: list[str],
+    chunk_size: int = 1000,
+    chunk_overlap: int = 200,
+    encoding_name: str = 'cl100k_base',
+    iterations: int = 3,
+) -> ChunkingBenchmarkResult:
+    """
+    Time the legacy splitter and ``MarkdownChunker`` over the same papers.
+
+    The encoder is loaded before timing so both sides measure splitting only.
+
+    Args:
+        papers: Markdown documents to split
+        chunk_size: Maximum tokens per chunk
+        chunk_overlap: Token overlap between sub-chunks
+        encoding_name: tiktoken encoding
+        iterations: Timed passes over all papers per chunker
+
+    Returns:
+        ChunkingBenchmarkResult with raw timings and chunk counts
+    """
+    get_encoding(encoding_name)
+    legacy_split = build_legacy_splitter(chunk_size, chunk_overlap, encoding_name)
+    chunker = MarkdownChunker(chunk_size, chunk_overlap, encoding_name)
+    result = ChunkingBenchmarkResult(
+        paper_count=len(papers),
+        total_chars=sum(len(paper) for paper in papers),
+        iterations=iterations,
+    )
+
+    for i in range(iterations):
+        start = time.perf_counter()
+        result.legacy_chunks = sum(legacy_split(paper) for paper in papers)
+        result.legacy_seconds.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        result.chunker_chunks = sum(len(chunker.split(paper, {})) for paper in papers)
+        result.chunker_seconds.append(time.perf_counter() - start)
+        logger.debug(
+            f'Chunking benchmark iteration {i + 1}/{iterations}: '
+            f'legacy {result.legacy_seconds[-1]:.2f}s, '
+            f'chunker {result.chunker_seconds[-1]:.2f}s'
+        )
+
+    return result
@@ -0,0 +1,160 @@
+"""
+Chunk ingestion benchmark for the pgvector document store.
+
+Compares the per-row INSERT path of VectorStoreManager with the COPY-based
+bulk path on synthetic chunks. Embeddings are generated locally from a seeded
+RNG so the measurement isolates database write time. All rows are written
+against a scratch paper that is deleted (with its chunks) afterwards.
+"""
+
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from langchain_core.documents import Document
+from loguru import logger
+
+from thoth.rag.vector_store import VectorStoreManager
+
+BENCHMARK_PAPER_TITLE = '__thoth_ingest_benchmark__'
+
+
+class SyntheticEmbeddings:
+    """Deterministic random embeddings (no model, no network)."""
+
+    def __init__(self, dimensions: int = 1536, seed: int = 0):
+        self.dimensions = dimensions
+        self._rng = random.Random(seed)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:  # noqa: ARG002
+        return [self._rng.uniform(-1.0, 1.0) for _ in range(self.dimensions)]
+
+
+@dataclass
+class IngestBenchmarkResult:
+    """Timings for both ingestion paths."""
+
+    chunk_count: int
+    dimensions: int
+    iterations: int
+    per_row_seconds: list[float] = field(default_factory=list)
+    bulk_seconds: list[float] = field(default_factory=list)
+    ids_match: bool = False
+
+    @property
+    def per_row_median(self) -> float:
+        return statistics.median(self.per_row_seconds) if self.per_row_seconds else 0.0
+
+    @property
+    def bulk_median(self) -> float:
+        return statistics.median(self.bulk_seconds) if self.bulk_seconds else 0.0
+
+    @property
+    def speedup(self) -> float:
+        return self.per_row_median / self.bulk_median if self.bulk_median > 0 else 0.0
+
+
+def build_synthetic_chunks(
+    chunk_count: int, words_per_chunk: int = 180, seed: int = 0
+) -> list[Document]:
+    """Build chunks shaped like ``RAGManager._split_markdown_content`` output."""
+    rng = random.Random(seed)
+    vocabulary = (
+        'attention transformer gradient embedding retrieval corpus token layer '
+        'encoder decoder loss benchmark dataset baseline ablation inference '
+        'latency throughput citation model training evaluation'
+    ).split()
+    return [
+        Document(
+            page_content=' '.join(rng.choices(vocabulary, k=words_per_chunk)),
+            metadata={
+                'chunk_index': i,
+                'section_path': ['Benchmark', f'Section {i // 10}'],
+                'heading_level': 2,
+                'is_subsection': False,
+                'total_chunks': chunk_count,
+            },
+        )
+        for i in range(chunk_count)
+    ]
+
+
+async def run_ingest_benchmark(
+    chunk_count: int = 500,
+    dimensions: int = 1536,
+    iterations: int = 3,
+) -> IngestBenchmarkResult:
+    """
+    Time per-row vs. bulk chunk ingestion against the configured database.
+
+    Each iteration starts from an empty chunk set for the scratch paper so both
+    paths measure a cold insert. After timing, the per-row path is re-run as an
+    upsert over the bulk-written rows, and the IDs returned by both paths are
+    compared with the rows read back from ``document_chunks``.
+
+    Args:
+        chunk_count: Number of chunks per ingest
+        dimensions: Embedding dimensions (must match ``document_chunks.embedding``)
+        iterations: Timed runs per path
+
+    Returns:
+        IngestBenchmarkResult with raw timings and the ID equivalence check
+    """
+    store = VectorStoreManager(embedding_function=SyntheticEmbeddings(dimensions))
+    # Measure writes only: synthetic vectors must neither hit nor fill the cache
+    store._embedding_cache = None
+    documents = build_synthetic_chunks(chunk_count)
+    result = IngestBenchmarkResult(
+        chunk_count=chunk_count, dimensions=dimensions, iterations=iterations
+    )
+
+    pool = await store._get_pool()
+    async with pool.acquire() as conn:
+        paper_id: UUID = await conn.fetchval(
+            'INSERT INTO paper_metadata (title, source_of_truth) '
+            "VALUES ($1, 'processed') RETURNING id",
+            BENCHMARK_PAPER_TITLE,
+        )
+
+    try:
+        bulk_ids: list[str] = []
+        for i in range(iterations):
+            await store.delete_documents_async(paper_id)
+            start = time.perf_counter()
+            await store.add_documents_async(documents, paper_id=paper_id, bulk=False)
+            result.per_row_seconds.append(time.perf_counter() - start)
+
+            await store.delete_documents_async(paper_id)
+            start = time.perf_counter()
+            bulk_ids = await store.add_documents_async(
+                documents, paper_id=paper_id, bulk=True
+            )
+            result.bulk_seconds.append(time.perf_counter() - start)
+            logger.debug(
+                f'Ingest benchmark iteration {i + 1}/{iterations}: '
+                f'per-row {result.per_row_seconds[-1]:.2f}s, '
+                f'bulk {result.bulk_seconds[-1]:.2f}s'
+            )
+
+        upsert_ids = await store.add_documents_async(
+            documents, paper_id=paper_id, bulk=False
+        )
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                'SELECT id FROM document_chunks WHERE paper_id = $1 '
+                'ORDER BY chunk_index',
+                paper_id,
+            )
+        stored_ids = [str(row['id']) for row in rows]
+        result.ids_match = bulk_ids == stored_ids and upsert_ids == stored_ids
+    finally:
+        async with pool.acquire() as conn:
+            await conn.execute('DELETE FROM paper_metadata WHERE id = $1', paper_id)
+        await store.close()
+
+    return result
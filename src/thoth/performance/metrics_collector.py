@@ -7,6 +7,7 @@ metrics across all Thoth services and pipelines.
 
 import asyncio  # noqa: I001
 import json
+import sys
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -37,6 +38,7 @@ class PerformanceMetrics:
     llm_response_times: dict[str, list[float]] = field(default_factory=dict)
     rag_query_times: list[float] = field(default_factory=list)
     cache_hit_rates: dict[str, float] = field(default_factory=dict)
+    cache_counters: dict[str, dict[str, Any]] = field(default_factory=dict)
 
     # Pipeline performance
     pdf_processing_times: list[float] = field(default_factory=list)
@@ -82,6 +84,7 @@ class PerformanceMetrics:
                 'llm_response_times': self.llm_response_times,
                 'rag_query_times': self.rag_query_times,
                 'cache_hit_rates': self.cache_hit_rates,
+                'cache_counters': self.cache_counters,
             },
             'pipeline_performance': {
                 'pdf_processing_times': self.pdf_processing_times,
@@ -244,7 +247,8 @@ class MetricsCollector:
             # RAG service metrics
             if hasattr(self.service_manager, 'rag'):
                 # Could collect pgvector query performance here
-                pass
+                self._collect_query_embedding_cache(metrics)
+                self._collect_answer_cache(metrics)
 
             # LLM service metrics
             if hasattr(self.service_manager, 'llm'):
@@ -254,6 +258,28 @@ class MetricsCollector:
         except Exception as e:
             logger.warning(f'Failed to collect service metrics: {e}')
 
+    def _collect_query_embedding_cache(self, metrics: PerformanceMetrics) -> None:
+        """Record hit/miss counters of the in-process query embedding cache."""
+        # Only read it if a search already loaded it; importing thoth.rag here
+        # would pull in the embedding stack just to report zeros
+        module = sys.modules.get('thoth.rag.query_embedding_cache')
+        if module is None:
+            return
+        stats = module.query_embedding_cache_stats()
+        if stats is not None:
+            metrics.cache_counters['query_embeddings'] = stats
+            metrics.cache_hit_rates['query_embeddings'] = stats['hit_rate']
+
+    def _collect_answer_cache(self, metrics: PerformanceMetrics) -> None:
+        """Record hit/miss counters of the semantic answer cache."""
+        # Don't construct a RAGManager just to report zeros
+        rag_manager = getattr(self.service_manager.rag, '_rag_manager', None)
+        answer_cache = getattr(rag_manager, 'answer_cache', None)
+        if answer_cache is not None:
+            stats = answer_cache.stats()
+            metrics.cache_counters['answers'] = stats
+            metrics.cache_hit_rates['answers'] = stats['hit_rate']
+
     def _calculate_cache_hit_rates(
         self, cache_stats: dict[str, Any]
     ) -> dict[str, float]:
@@ -0,0 +1,346 @@
+"""
+Durable PDF ingestion queue backed by PostgreSQL.
+
+PDFs detected by the monitor are otherwise processed in-process, so queued
+work is lost when the process dies and a large backlog can only be drained by
+one process. ``IngestionQueue`` stores queued PDFs in ``processing_queue``:
+
+- Workers claim the highest-priority due job with
+  ``SELECT ... FOR UPDATE SKIP LOCKED``, so any number of worker processes or
+  containers can drain the queue without handing out a job twice.
+- A claimed job is leased to its worker (``locked_by``/``locked_at``). Leases
+  are renewed while the job runs; a lease older than ``lock_timeout_seconds``
+  belongs to a crashed worker and the job is claimed again.
+- Failed attempts are retried with exponential backoff until
+  ``max_attempts``, after which the job is marked ``failed``.
+- Each finished pipeline stage is checkpointed in ``processing_jobs`` with its
+  output, so a retried or resumed job skips the stages that already finished.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+# Pipeline stages checkpointed per job, in execution order
+STAGES = ('ocr', 'analysis', 'citations', 'note', 'rag')
+
+DEFAULT_USER_ID = 'default_user'
+
+
+class LeaseLostError(RuntimeError):
+    """The job's lease expired and it was claimed by another worker."""
+
+
+@dataclass
+class QueuedJob:
+    """A claimed ``processing_queue`` row and its completed stage outputs."""
+
+    id: str
+    pdf_path: Path
+    user_id: str
+    priority: int
+    attempts: int
+    max_attempts: int
+    checkpoints: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+_ENQUEUE_SQL = """
+    INSERT INTO processing_queue (pdf_path, user_id, priority, max_attempts)
+    VALUES ($1, $2, $3, $4)
+    ON CONFLICT (user_id, pdf_path) WHERE status IN ('pending', 'processing')
+    DO UPDATE SET
+        priority = GREATEST(processing_queue.priority, EXCLUDED.priority),
+        updated_at = NOW()
+    RETURNING id
+"""
+
+
+class IngestionQueue:
+    """
+    Job queue for PDF ingestion on ``processing_queue``/``processing_jobs``.
+
+    Higher ``priority`` values are claimed first; jobs of equal priority are
+    claimed in the order they became due.
+    """
+
+    def __init__(
+        self,
+        postgres,
+        worker_id: str | None = None,
+        max_attempts: int = 5,
+        backoff_base_seconds: float = 30.0,
+        backoff_max_seconds: float = 3600.0,
+        lock_timeout_seconds: float = 1800.0,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            postgres: PostgresService used for all queue operations
+            worker_id: Lease owner recorded on claimed jobs (defaults to
+                host, PID and a random suffix)
+            max_attempts: Attempts per job before it is marked failed
+            backoff_base_seconds: Delay before the first retry, doubled on
+                each further attempt
+            backoff_max_seconds: Upper bound for the retry delay
+            lock_timeout_seconds: Age after which an unrenewed lease is
+                considered abandoned
+        """
+        self.postgres = postgres
+        self.worker_id = (
+            worker_id or f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+        )
+        self.max_attempts = max_attempts
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.lock_timeout_seconds = lock_timeout_seconds
+
+    @classmethod
+    def from_config(cls, postgres, config, worker_id: str | None = None):
+        """Create a queue from ``performance_config.ingestion_queue``."""
+        queue_config = config.performance_config.ingestion_queue
+        return cls(
+            postgres,
+            worker_id=worker_id,
+            max_attempts=queue_config.max_attempts,
+            backoff_base_seconds=queue_config.backoff_base_seconds,
+            backoff_max_seconds=queue_config.backoff_max_seconds,
+            lock_timeout_seconds=queue_config.lock_timeout_seconds,
+        )
+
+    def retry_delay(self, attempts: int) -> float:
+        """Backoff before the next attempt after ``attempts`` failed ones."""
+        delay = self.backoff_base_seconds * 2 ** max(0, attempts - 1)
+        return min(delay, self.backoff_max_seconds)
+
+    def _enqueue_params(
+        self, pdf_path: str | Path, user_id: str | None, priority: int
+    ) -> tuple:
+        return (
+            str(Path(pdf_path).resolve()),
+            user_id or DEFAULT_USER_ID,
+            priority,
+            self.max_attempts,
+        )
+
+    async def enqueue_async(
+        self, pdf_path: str | Path, user_id: str | None = None, priority: int = 0
+    ) -> str:
+        """
+        Queue a PDF for ingestion.
+
+        A PDF that is already pending or in progress for the same user is not
+        queued twice; its priority is raised to ``priority`` if higher.
+
+        Args:
+            pdf_path: PDF to process
+            user_id: Owning user (defaults to the single-user ID)
+            priority: Higher values are processed first
+
+        Returns:
+            ID of the queued job
+        """
+        params = self._enqueue_params(pdf_path, user_id, priority)
+        return str(await self.postgres.fetchval(_ENQUEUE_SQL, *params))
+
+    def enqueue(
+        self, pdf_path: str | Path, user_id: str | None = None, priority: int = 0
+    ) -> str:
+        """
+        Blocking ``enqueue_async`` for threads without an event loop.
+
+        Uses a short-lived connection, since the service's pool is bound to
+        the event loop it was created on (watchdog callbacks run in their own
+        threads).
+        """
+        import asyncpg
+
+        params = self._enqueue_params(pdf_path, user_id, priority)
+
+        async def _enqueue() -> str:
+            conn = await asyncpg.connect(self.postgres.database_url)
+            try:
+                return str(await conn.fetchval(_ENQUEUE_SQL, *params))
+            finally:
+                await conn.close()
+
+        return asyncio.run(_enqueue())
+
+    async def claim_async(self) -> QueuedJob | None:
+        """
+        Claim the next due job, or a job whose lease has expired.
+
+        Returns:
+            The claimed job with its checkpoints, or None if nothing is due
+        """
+        row = await self.postgres.fetchrow(
+            """
+            UPDATE processing_queue q
+            SET status = 'processing',
+                attempts = q.attempts + 1,
+                locked_by = $1,
+                locked_at = NOW(),
+                updated_at = NOW()
+            FROM (
+                SELECT id FROM processing_queue
+                WHERE (status = 'pending' AND next_attempt_at <= NOW())
+                   OR (status = 'processing'
+                       AND locked_at < NOW() - make_interval(secs => $2))
+                ORDER BY priority DESC, next_attempt_at, created_at
+                LIMIT 1
+                FOR UPDATE SKIP LOCKED
+            ) due
+            WHERE q.id = due.id
+            RETURNING q.id, q.pdf_path, q.user_id, q.priority, q.attempts,
+                      q.max_attempts
+            """,
+            self.worker_id,
+            float(self.lock_timeout_seconds),
+        )
+        if row is None:
+            return None
+
+        stages = await self.postgres.fetch(
+            """
+            SELECT job_type, output_data FROM processing_jobs
+            WHERE queue_id = $1 AND status = 'completed'
+            """,
+            row['id'],
+        )
+        checkpoints = {}
+        for stage in stages:
+            output = stage['output_data']
+            checkpoints[stage['job_type']] = (
+                json.loads(output) if isinstance(output, str) else output or {}
+            )
+
+        return QueuedJob(
+            id=str(row['id']),
+            pdf_path=Path(row['pdf_path']),
+            user_id=row['user_id'],
+            priority=row['priority'],
+            attempts=row['attempts'],
+            max_attempts=row['max_attempts'],
+            checkpoints=checkpoints,
+        )
+
+    async def renew_async(self, job: QueuedJob) -> None:
+        """
+        Extend the lease on a running job.
+
+        Raises:
+            LeaseLostError: If the job is no longer leased to this worker
+        """
+        renewed = await self.postgres.fetchval(
+            """
+            UPDATE processing_queue SET locked_at = NOW(), updated_at = NOW()
+            WHERE id = $1 AND locked_by = $2 AND status = 'processing'
+            RETURNING id
+            """,
+            uuid.UUID(job.id),
+            self.worker_id,
+        )
+        if renewed is None:
+            raise LeaseLostError(f'Lease on job {job.id} was lost')
+
+    async def checkpoint_async(
+        self, job: QueuedJob, stage: str, output: dict[str, Any]
+    ) -> None:
+        """
+        Record a finished stage and its output, renewing the lease.
+
+        Raises:
+            LeaseLostError: If the job is no longer leased to this worker
+        """
+        recorded = await self.postgres.fetchval(
+            """
+            WITH lease AS (
+                UPDATE processing_queue SET locked_at = NOW(), updated_at = NOW()
+                WHERE id = $1 AND locked_by = $2 AND status = 'processing'
+                RETURNING id, user_id
+            )
+            INSERT INTO processing_jobs (
+                queue_id, job_type, status, output_data, user_id,
+                started_at, completed_at
+            )
+            SELECT id, $3, 'completed', $4::jsonb, user_id, NOW(), NOW()
+            FROM lease
+            ON CONFLICT (queue_id, job_type) DO UPDATE SET
+                status = 'completed',
+                output_data = EXCLUDED.output_data,
+                error_message = NULL,
+                completed_at = NOW()
+            RETURNING id
+            """,
+            uuid.UUID(job.id),
+            self.worker_id,
+            stage,
+            json.dumps(output, default=str),
+        )
+        if recorded is None:
+            raise LeaseLostError(f'Lease on job {job.id} was lost during {stage}')
+        job.checkpoints[stage] = output
+
+    async def complete_async(self, job: QueuedJob) -> None:
+        """Mark a job completed and release its lease."""
+        await self.postgres.execute(
+            """
+            UPDATE processing_queue
+            SET status = 'completed', completed_at = NOW(), updated_at = NOW(),
+                error_message = NULL, locked_by = NULL, locked_at = NULL
+            WHERE id = $1 AND locked_by = $2
+            """,
+            uuid.UUID(job.id),
+            self.worker_id,
+        )
+
+    async def fail_async(self, job: QueuedJob, error: str) -> bool:
+        """
+        Record a failed attempt and release the lease.
+
+        The job is scheduled for another attempt after ``retry_delay`` unless
+        it has used up its attempts, in which case it is marked failed.
+
+        Returns:
+            True if the job will be retried
+        """
+        retry = job.attempts < job.max_attempts
+        delay = self.retry_delay(job.attempts) if retry else 0.0
+        await self.postgres.execute(
+            """
+            UPDATE processing_queue
+            SET status = $3, error_message = $4,
+                next_attempt_at = NOW() + make_interval(secs => $5),
+                locked_by = NULL, locked_at = NULL, updated_at = NOW()
+            WHERE id = $1 AND locked_by = $2
+            """,
+            uuid.UUID(job.id),
+            self.worker_id,
+            'pending' if retry else 'failed',
+            error[:4000],
+            float(delay),
+        )
+        if retry:
+            logger.warning(
+                f'Ingestion job {job.id} attempt {job.attempts}/{job.max_attempts} '
+                f'failed, retrying in {delay:.0f}s: {error}'
+            )
+        else:
+            logger.error(
+                f'Ingestion job {job.id} failed after {job.attempts} attempts: {error}'
+            )
+        return retry
+
+    async def stats_async(self) -> dict[str, int]:
+        """Number of queued jobs per status."""
+        rows = await self.postgres.fetch(
+            'SELECT status, COUNT(*) AS count FROM processing_queue GROUP BY status'
+        )
+        return {row['status']: row['count'] for row in rows}
@@ -0,0 +1,323 @@
+"""
+Worker draining the durable PDF ingestion queue.
+
+Runs each claimed job through the same stages as
+``OptimizedDocumentPipeline.process_pdf`` (OCR, content analysis and citation
+extraction in parallel, note generation, RAG indexing), checkpointing every
+stage in ``processing_jobs``. A job resumed after a crash or retried after a
+failure starts at the first stage without a checkpoint. Several workers, in
+one process or many, can drain the same queue.
+"""
+
+import asyncio
+import contextlib
+from pathlib import Path
+from typing import Any
+
+from thoth.pipelines.ingestion_queue import (
+    DEFAULT_USER_ID,
+    IngestionQueue,
+    LeaseLostError,
+    QueuedJob,
+)
+from thoth.pipelines.optimized_document_pipeline import OptimizedDocumentPipeline
+from thoth.utilities.schemas import AnalysisResponse, Citation
+
+
+class IngestionWorker:
+    """Claims queued PDFs and processes them stage by stage."""
+
+    def __init__(
+        self,
+        pipeline: OptimizedDocumentPipeline,
+        queue: IngestionQueue,
+        concurrency: int = 2,
+        poll_interval: float = 5.0,
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            pipeline: Pipeline whose stage implementations are used
+            queue: Queue to claim jobs from
+            concurrency: Jobs processed at once by this worker
+            poll_interval: Seconds to wait before polling an empty queue again
+        """
+        self.pipeline = pipeline
+        self.queue = queue
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.logger = pipeline.logger.bind(worker=queue.worker_id)
+        self.completed = 0
+        self.failed = 0
+
+    async def run_async(
+        self, stop_event: asyncio.Event | None = None, drain: bool = False
+    ) -> None:
+        """
+        Process jobs until stopped.
+
+        Args:
+            stop_event: Set to stop claiming new jobs; running jobs finish
+            drain: Return once the queue has no due jobs instead of polling
+        """
+        stop_event = stop_event or asyncio.Event()
+        self.logger.info(
+            f'Ingestion worker {self.queue.worker_id} started '
+            f'(concurrency {self.concurrency})'
+        )
+        await asyncio.gather(
+            *(self._loop(stop_event, drain) for _ in range(self.concurrency))
+        )
+        self.logger.info(
+            f'Ingestion worker {self.queue.worker_id} stopped: '
+            f'{self.completed} completed, {self.failed} failed'
+        )
+
+    async def _loop(self, stop_event: asyncio.Event, drain: bool) -> None:
+        while not stop_event.is_set():
+            try:
+                job = await self.queue.claim_async()
+            except Exception as e:
+                self.logger.error(f'Failed to claim ingestion job: {e}')
+                job = None
+
+            if job is None:
+                if drain:
+                    return
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(stop_event.wait(), self.poll_interval)
+                continue
+
+            await self.process_job_async(job)
+
+    async def process_job_async(self, job: QueuedJob) -> bool:
+        """
+        Run a claimed job and record the outcome in the queue.
+
+        Returns:
+            True if the job completed
+        """
+        if job.attempts > job.max_attempts:
+            # Claimed again after its last attempt's worker died
+            await self.queue.fail_async(job, 'Worker lost during final attempt')
+            self.failed += 1
+            return False
+
+        done = list(job.checkpoints)
+        self.logger.info(
+            f'Processing {job.pdf_path.name} (job {job.id}, attempt '
+            f'{job.attempts}/{job.max_attempts}'
+            + (f', resuming after {", ".join(done)}' if done else '')
+            + ')'
+        )
+
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            await self._run_stages(job)
+        except LeaseLostError as e:
+            # Another worker owns the job now; leave its row alone
+            self.logger.warning(str(e))
+            return False
+        except Exception as e:
+            self.logger.exception(f'Ingestion of {job.pdf_path.name} failed')
+            await self.queue.fail_async(job, f'{type(e).__name__}: {e}')
+            self.failed += 1
+            return False
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+        await self.queue.complete_async(job)
+        self.completed += 1
+        self.logger.info(f'Completed ingestion of {job.pdf_path.name}')
+        return True
+
+    async def _heartbeat(self, job: QueuedJob) -> None:
+        """Renew the job's lease well before it times out."""
+        interval = max(1.0, self.queue.lock_timeout_seconds / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.queue.renew_async(job)
+            except LeaseLostError as e:
+                # The next checkpoint stops the job
+                self.logger.warning(str(e))
+                return
+            except Exception as e:
+                self.logger.warning(f'Failed to renew lease on job {job.id}: {e}')
+
+    async def _run_stages(self, job: QueuedJob) -> None:
+        from thoth.mcp.auth import reset_current_user_context, set_current_user_context
+
+        user_id = None if job.user_id == DEFAULT_USER_ID else job.user_id
+        username, vault_path = self._user_vault(job.pdf_path)
+        tokens = set_current_user_context(user_id, username, vault_path)
+        try:
+            await self._run_pipeline(job, user_id)
+        finally:
+            reset_current_user_context(tokens)
+
+    async def _run_pipeline(self, job: QueuedJob, user_id: str | None) -> None:
+        pdf_path = job.pdf_path
+        if not job.checkpoints and self._already_processed(pdf_path):
+            self.logger.info(f'Skipping already processed and unchanged {pdf_path}')
+            return
+
+        project_name = self.pipeline._get_project_name(pdf_path)
+
+        # Later stages only read the no-images markdown, and the note stage
+        # renames the PDF and full markdown, so once it has run the OCR
+        # output is never redone
+        ocr = job.checkpoints.get('ocr')
+        if ocr is None or (
+            'note' not in job.checkpoints
+            and not Path(ocr['no_images_markdown_path']).exists()
+        ):
+            ocr = await self._run_stage(job, 'ocr', self._ocr, pdf_path, project_name)
+        markdown_path = Path(ocr['markdown_path'])
+        no_images_path = Path(ocr['no_images_markdown_path'])
+
+        # Let both stages finish (and checkpoint) even if the other one fails
+        analysis, citations = await asyncio.gather(
+            self._stage(job, 'analysis', self._analyze, no_images_path),
+            self._stage(job, 'citations', self._extract_citations, no_images_path),
+            return_exceptions=True,
+        )
+        for result in (analysis, citations):
+            if isinstance(result, BaseException):
+                raise result
+
+        note = await self._stage(
+            job,
+            'note',
+            self._note,
+            pdf_path,
+            markdown_path,
+            no_images_path,
+            analysis,
+            citations,
+            project_name,
+        )
+
+        await self._stage(
+            job,
+            'rag',
+            self._index,
+            no_images_path,
+            Path(note['note_path']),
+            user_id,
+            note.get('article_id'),
+        )
+
+    async def _stage(self, job: QueuedJob, stage: str, fn, *args) -> dict[str, Any]:
+        """Output of ``stage``, running it only if it has no checkpoint."""
+        if stage in job.checkpoints:
+            self.logger.debug(f'Job {job.id}: {stage} already done')
+            return job.checkpoints[stage]
+        return await self._run_stage(job, stage, fn, *args)
+
+    async def _run_stage(self, job: QueuedJob, stage: str, fn, *args) -> dict[str, Any]:
+        # to_thread copies the context, so stages see the job's user paths
+        output = await asyncio.to_thread(fn, *args)
+        await self.queue.checkpoint_async(job, stage, output)
+        return output
+
+    def _ocr(self, pdf_path: Path, project_name: str | None) -> dict[str, Any]:
+        markdown_path, no_images_path = self.pipeline._ocr_convert_optimized(
+            pdf_path, output_dir=self.pipeline._markdown_output_dir(project_name)
+        )
+        return {
+            'markdown_path': str(markdown_path),
+            'no_images_markdown_path': str(no_images_path),
+        }
+
+    def _analyze(self, no_images_path: Path) -> dict[str, Any]:
+        analysis = self.pipeline._analyze_content(no_images_path)
+        return analysis.model_dump(mode='json')
+
+    def _extract_citations(self, no_images_path: Path) -> dict[str, Any]:
+        citations = self.pipeline._extract_citations_batch(no_images_path)
+        return {'citations': [c.model_dump(mode='json') for c in citations]}
+
+    def _note(
+        self,
+        pdf_path: Path,
+        markdown_path: Path,
+        no_images_path: Path,
+        analysis: dict[str, Any],
+        citations: dict[str, Any],
+        project_name: str | None,
+    ) -> dict[str, Any]:
+        note_path, new_pdf_path, new_markdown_path, article_id = (
+            self.pipeline._generate_note(
+                pdf_path=pdf_path,
+                markdown_path=markdown_path,
+                analysis=self._load_analysis(analysis),
+                citations=[Citation.model_validate(c) for c in citations['citations']],
+                no_images_markdown=no_images_path.read_text(encoding='utf-8'),
+                project_name=project_name,
+            )
+        )
+        self.pipeline.pdf_tracker.mark_processed(
+            pdf_path,
+            {
+                'note_path': str(note_path),
+                'new_pdf_path': str(new_pdf_path),
+                'new_markdown_path': str(new_markdown_path),
+            },
+        )
+        return {
+            'note_path': str(note_path),
+            'new_pdf_path': str(new_pdf_path),
+            'new_markdown_path': str(new_markdown_path),
+            'article_id': article_id,
+        }
+
+    def _index(
+        self,
+        no_images_path: Path,
+        note_path: Path,
+        user_id: str | None,
+        paper_id: str | None,
+    ) -> dict[str, Any]:
+        # Unlike the in-process path, indexing errors fail the attempt so the
+        # stage is retried instead of leaving the paper unsearchable
+        indexed = []
+        for path in (no_images_path, note_path):
+            if path.exists() and path.suffix == '.md':
+                self.pipeline.services.rag.index_file(
+                    path, user_id=user_id, paper_id=paper_id
+                )
+                indexed.append(str(path))
+        return {'indexed': indexed}
+
+    def _load_analysis(self, data: dict[str, Any]) -> Any:
+        """Rebuild the analysis model from its checkpointed form."""
+        processing = self.pipeline.services.processing
+        schema_service = getattr(processing, 'analysis_schema_service', None)
+        if schema_service is not None:
+            try:
+                return schema_service.get_active_model().model_validate(data)
+            except Exception as e:
+                self.logger.debug(f'Active analysis schema rejected checkpoint: {e}')
+        return AnalysisResponse.model_validate(data)
+
+    def _already_processed(self, pdf_path: Path) -> bool:
+        tracker = self.pipeline.pdf_tracker
+        return tracker.is_processed(pdf_path) and tracker.verify_file_unchanged(
+            pdf_path
+        )
+
+    def _user_vault(self, pdf_path: Path) -> tuple[str | None, Path | None]:
+        from thoth.config import config
+        from thoth.server.pdf_monitor import _resolve_username_from_path
+
+        username = _resolve_username_from_path(pdf_path, config)
+        vault_path = (
+            Path(config.vaults_root) / username
+            if username and getattr(config, 'vaults_root', None)
+            else None
+        )
+        return username, vault_path
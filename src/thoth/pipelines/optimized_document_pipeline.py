@@ -19,9 +19,13 @@ from typing import Any
 from loguru import logger
 
 from thoth.pipelines.base import BasePipeline
+from thoth.pipelines.stage_executor import Stage, StageExecutor, StageStats
 from thoth.services.async_processing_service import AsyncProcessingService
 from thoth.utilities.schemas import Citation
 
+# Stages of the per-PDF processing graph, in dependency order
+DOCUMENT_STAGES = ('ocr', 'analysis', 'citations', 'note', 'rag')
+
 
 class OptimizedDocumentPipeline(BasePipeline):
     """
@@ -38,6 +42,7 @@ class OptimizedDocumentPipeline(BasePipeline):
         super().__init__(*args, **kwargs)
         self._async_processing_service = None
         self._max_workers = self._calculate_optimal_workers()
+        self._last_stage_stats: dict[str, StageStats] = {}
 
         # PRIORITY 3: Persistent ThreadPoolExecutors
         self._content_analysis_executor = ThreadPoolExecutor(
@@ -75,6 +80,7 @@ class OptimizedDocumentPipeline(BasePipeline):
                 available_cores, 6
             ),  # I/O-bound, can handle more
             'ocr_processing': min(3, available_cores),  # API rate-limited
+            'note_generation': 2,  # Disk-bound
             'background_tasks': 2,  # For RAG indexing and cleanup
         }
 
@@ -161,73 +167,15 @@ class OptimizedDocumentPipeline(BasePipeline):
         self.logger.debug(f'Processing PDF (optimized): {pdf_path}')
 
         # Check if already processed
-        if self.pdf_tracker.is_processed(
-            pdf_path
-        ) and self.pdf_tracker.verify_file_unchanged(pdf_path):
-            self.logger.info(
-                f'Skipping already processed and unchanged file: {pdf_path}'
-            )
-            note_path = self.pdf_tracker.get_note_path(pdf_path)
-            if note_path:
-                # Get the processed metadata to return all paths
-                vault_relative = None
-                if self.pdf_tracker.vault_resolver:
-                    try:
-                        resolved = pdf_path.resolve()
-                        if self.pdf_tracker.vault_resolver.is_vault_relative(resolved):
-                            vault_relative = (
-                                self.pdf_tracker.vault_resolver.make_relative(resolved)
-                            )
-                    except ValueError:
-                        pass
-
-                # Look up the processed metadata
-                metadata = None
-                if (
-                    vault_relative
-                    and vault_relative in self.pdf_tracker.processed_files
-                ):
-                    metadata = self.pdf_tracker.processed_files[vault_relative]
-                else:
-                    abs_path = str(pdf_path.resolve())
-                    if abs_path in self.pdf_tracker.processed_files:
-                        metadata = self.pdf_tracker.processed_files[abs_path]
-
-                if metadata:
-                    # Return the tuple of (note_path, new_pdf_path, new_markdown_path)
-                    new_pdf_path = Path(metadata.get('new_pdf_path', str(pdf_path)))
-                    new_markdown_path = Path(
-                        metadata.get(
-                            'new_markdown_path', str(pdf_path).replace('.pdf', '.md')
-                        )
-                    )
-                    return (note_path, new_pdf_path, new_markdown_path)
-                else:
-                    # If metadata not found, return best guess tuple
-                    return (
-                        note_path,
-                        pdf_path,
-                        Path(str(pdf_path).replace('.pdf', '.md')),
-                    )
-
-            self.logger.warning(
-                f'File {pdf_path} was processed, but note path not found in tracker. Reprocessing.'
-            )
+        processed = self._processed_result(pdf_path)
+        if processed is not None:
+            return processed
 
         # OCR conversion (potentially cached)
         # Detect project folder from PDF path for organized output
         project_name = self._get_project_name(pdf_path)
-        from thoth.mcp.auth import get_current_user_paths
-
-        up = get_current_user_paths()
-        effective_markdown_dir = up.markdown_dir if up else self.markdown_dir
-        output_dir = (
-            effective_markdown_dir / project_name
-            if project_name
-            else effective_markdown_dir
-        )
         markdown_path, no_images_markdown_path = self._ocr_convert_optimized(
-            pdf_path, output_dir=output_dir
+            pdf_path, output_dir=self._markdown_output_dir(project_name)
         )
         self.logger.info(f'OCR conversion completed: {markdown_path}')
 
@@ -278,6 +226,78 @@ class OptimizedDocumentPipeline(BasePipeline):
 
         return Path(note_path), Path(new_pdf_path), Path(new_markdown_path)
 
+    def _processed_result(self, pdf_path: Path) -> tuple[Path, Path, Path] | None:
+        """
+        Output paths of an already processed and unchanged PDF.
+
+        Returns:
+            (note_path, new_pdf_path, new_markdown_path), or None if the PDF
+            needs processing
+        """
+        if not (
+            self.pdf_tracker.is_processed(pdf_path)
+            and self.pdf_tracker.verify_file_unchanged(pdf_path)
+        ):
+            return None
+
+        self.logger.info(f'Skipping already processed and unchanged file: {pdf_path}')
+        note_path = self.pdf_tracker.get_note_path(pdf_path)
+        if note_path:
+            # Get the processed metadata to return all paths
+            vault_relative = None
+            if self.pdf_tracker.vault_resolver:
+                try:
+                    resolved = pdf_path.resolve()
+                    if self.pdf_tracker.vault_resolver.is_vault_relative(resolved):
+                        vault_relative = self.pdf_tracker.vault_resolver.make_relative(
+                            resolved
+                        )
+                except ValueError:
+                    pass
+
+            # Look up the processed metadata
+            metadata = None
+            if vault_relative and vault_relative in self.pdf_tracker.processed_files:
+                metadata = self.pdf_tracker.processed_files[vault_relative]
+            else:
+                abs_path = str(pdf_path.resolve())
+                if abs_path in self.pdf_tracker.processed_files:
+                    metadata = self.pdf_tracker.processed_files[abs_path]
+
+            if metadata:
+                # Return the tuple of (note_path, new_pdf_path, new_markdown_path)
+                new_pdf_path = Path(metadata.get('new_pdf_path', str(pdf_path)))
+                new_markdown_path = Path(
+                    metadata.get(
+                        'new_markdown_path', str(pdf_path).replace('.pdf', '.md')
+                    )
+                )
+                return (note_path, new_pdf_path, new_markdown_path)
+            else:
+                # If metadata not found, return best guess tuple
+                return (
+                    note_path,
+                    pdf_path,
+                    Path(str(pdf_path).replace('.pdf', '.md')),
+                )
+
+        self.logger.warning(
+            f'File {pdf_path} was processed, but note path not found in tracker. Reprocessing.'
+        )
+        return None
+
+    def _markdown_output_dir(self, project_name: str | None) -> Path:
+        """OCR output directory for the current user and project folder."""
+        from thoth.mcp.auth import get_current_user_paths
+
+        up = get_current_user_paths()
+        effective_markdown_dir = up.markdown_dir if up else self.markdown_dir
+        return (
+            effective_markdown_dir / project_name
+            if project_name
+            else effective_markdown_dir
+        )
+
     def _ocr_convert_optimized(
         self, pdf_path: Path, output_dir: Path | None = None
     ) -> tuple[Path, Path]:
@@ -430,42 +450,135 @@ class OptimizedDocumentPipeline(BasePipeline):
         self._background_tasks_executor.submit(_background_rag_indexing)
 
     async def batch_process_pdfs_async(
-        self, pdf_paths: list[Path]
+        self,
+        pdf_paths: list[Path],
+        user_id: str | None = None,
+        stage_workers: dict[str, int] | None = None,
     ) -> list[tuple[Path, Path, Path]]:
         """
-        Process multiple PDFs concurrently with optimal resource utilization.
+        Process multiple PDFs through a stage-level pipeline.
 
-        This method provides significant speedup for batch processing by utilizing
-        async I/O and intelligent batching.
-        """
-        self.logger.info(
-            f'Starting optimized batch processing of {len(pdf_paths)} PDFs'
-        )
-
-        # Process in optimal batch sizes to avoid overwhelming the system
-        max_concurrent = min(len(pdf_paths), self._max_workers['ocr_processing'])
+        Each stage (OCR, content analysis, citation extraction, note
+        generation, RAG indexing) has its own bounded worker pool and queue,
+        and a PDF enters a stage as soon as its inputs are ready. Stages of
+        different PDFs therefore overlap: one PDF's note is written while
+        another is being OCR'd and a third analyzed. Per-stage statistics of
+        the run are available from ``get_performance_stats()['stages']``.
 
-        results = []
-        for i in range(0, len(pdf_paths), max_concurrent):
-            batch = pdf_paths[i : i + max_concurrent]
-            batch_tasks = [self.process_pdf_async(pdf_path) for pdf_path in batch]
-
-            batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-
-            for j, result in enumerate(batch_results):
-                if isinstance(result, Exception):
-                    self.logger.error(f'Failed to process {batch[j]}: {result}')
-                    continue
-                results.append(result)
+        Args:
+            pdf_paths: PDFs to process
+            user_id: Owner of the indexed documents
+            stage_workers: Worker count overrides per stage name
 
-            self.logger.info(
-                f'Completed batch {i // max_concurrent + 1}: {len([r for r in batch_results if not isinstance(r, Exception)])}/{len(batch)} successful'
+        Returns:
+            (note_path, new_pdf_path, new_markdown_path) for every PDF that
+            was processed (or had already been processed), in input order
+        """
+        self.logger.info(f'Starting staged batch processing of {len(pdf_paths)} PDFs')
+
+        results: dict[int, tuple[Path, Path, Path]] = {}
+        pending: list[tuple[int, Path]] = []
+        for i, pdf_path in enumerate(map(Path, pdf_paths)):
+            processed = self._processed_result(pdf_path)
+            if processed is not None:
+                results[i] = processed
+            else:
+                pending.append((i, pdf_path))
+
+        executor = StageExecutor(self._document_stages(user_id, stage_workers))
+        outcomes = await executor.run(pending)
+        self._last_stage_stats = executor.stats()
+        executor.log_stats()
+
+        for outcome in outcomes:
+            index, pdf_path = outcome.item
+            if not outcome.ok:
+                self.logger.error(
+                    f'Failed to process {pdf_path} in stage '
+                    f'{outcome.failed_stage}: {outcome.error}'
+                )
+                continue
+            note_path, new_pdf_path, new_markdown_path, _ = outcome.results['note']
+            results[index] = (
+                Path(note_path),
+                Path(new_pdf_path),
+                Path(new_markdown_path),
             )
 
         self.logger.info(
             f'Batch processing completed: {len(results)}/{len(pdf_paths)} successful'
         )
-        return results
+        return [results[i] for i in sorted(results)]
+
+    def _document_stages(
+        self,
+        user_id: str | None = None,
+        stage_workers: dict[str, int] | None = None,
+    ) -> list[Stage]:
+        """Processing graph for one PDF, with per-stage pool sizes."""
+        unknown = set(stage_workers or {}) - set(DOCUMENT_STAGES)
+        if unknown:
+            raise ValueError(
+                f'Unknown stage(s) {", ".join(sorted(unknown))}; '
+                f'expected {", ".join(DOCUMENT_STAGES)}'
+            )
+        workers = {
+            'ocr': self._max_workers['ocr_processing'],
+            'analysis': self._max_workers['content_analysis'],
+            'citations': self._max_workers['citation_extraction'],
+            'note': self._max_workers['note_generation'],
+            'rag': self._max_workers['background_tasks'],
+            **(stage_workers or {}),
+        }
+
+        def ocr(item, _results):
+            _, pdf_path = item
+            project_name = self._get_project_name(pdf_path)
+            markdown_path, no_images_path = self._ocr_convert_optimized(
+                pdf_path, output_dir=self._markdown_output_dir(project_name)
+            )
+            return project_name, markdown_path, no_images_path
+
+        def analysis(_item, results):
+            return self._analyze_content(results['ocr'][2])
+
+        def citations(_item, results):
+            return self._extract_citations_batch(results['ocr'][2])
+
+        def note(item, results):
+            _, pdf_path = item
+            project_name, markdown_path, no_images_path = results['ocr']
+            note_result = self._generate_note(
+                pdf_path=pdf_path,
+                markdown_path=markdown_path,
+                analysis=results['analysis'],
+                citations=results['citations'],
+                no_images_markdown=no_images_path.read_text(encoding='utf-8'),
+                project_name=project_name,
+            )
+            note_path, new_pdf_path, new_markdown_path, _ = note_result
+            self.pdf_tracker.mark_processed(
+                pdf_path,
+                {
+                    'note_path': str(note_path),
+                    'new_pdf_path': str(new_pdf_path),
+                    'new_markdown_path': str(new_markdown_path),
+                },
+            )
+            return note_result
+
+        def rag(_item, results):
+            note_path, _, _, article_id = results['note']
+            self._index_to_rag(results['ocr'][2], user_id=user_id, paper_id=article_id)
+            self._index_to_rag(Path(note_path), user_id=user_id, paper_id=article_id)
+
+        return [
+            Stage('ocr', ocr, workers['ocr']),
+            Stage('analysis', analysis, workers['analysis'], depends_on=('ocr',)),
+            Stage('citations', citations, workers['citations'], depends_on=('ocr',)),
+            Stage('note', note, workers['note'], depends_on=('analysis', 'citations')),
+            Stage('rag', rag, workers['rag'], depends_on=('note',)),
+        ]
 
     def get_performance_stats(self) -> dict[str, Any]:
         """Get performance statistics for the optimized pipeline."""
@@ -476,6 +589,9 @@ class OptimizedDocumentPipeline(BasePipeline):
             'cache_status': self.async_processing_service.health_check()
             if self._async_processing_service
             else 'not_initialized',
+            'stages': {
+                name: stats.as_dict() for name, stats in self._last_stage_stats.items()
+            },
         }
 
     # Keep the original methods for backward compatibility
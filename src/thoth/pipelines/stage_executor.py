@@ -0,0 +1,276 @@
+"""
+Stage-level executor for batch document processing.
+
+Processing a batch one document at a time (or a few documents at a time, each
+as an opaque unit) leaves most resources idle: OCR waits on the network, LLM
+analysis on a rate-limited API and note generation on the disk, and each
+document holds all of them in sequence. ``StageExecutor`` instead runs every
+stage as its own node with a bounded thread pool and an input queue. A
+document moves to a stage as soon as all the stages it depends on have
+finished for it, so one document's note generation overlaps another's OCR and
+a third's analysis.
+
+Per-stage queue depth, utilization and throughput are tracked so each pool
+can be sized for a bulk import.
+"""
+
+import asyncio
+import contextvars
+import functools
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from loguru import logger
+
+
+@dataclass
+class Stage:
+    """
+    A node of the processing graph.
+
+    ``fn(item, results)`` runs in the stage's thread pool, where ``results``
+    maps the names of finished stages to their return values for that item.
+    """
+
+    name: str
+    fn: Callable[[Any, dict[str, Any]], Any]
+    workers: int = 1
+    depends_on: tuple[str, ...] = ()
+
+
+@dataclass
+class StageStats:
+    """Queue depth and throughput of one stage."""
+
+    name: str
+    workers: int
+    queued: int = 0
+    running: int = 0
+    completed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    first_started: float | None = None
+    last_finished: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds from the stage's first start to its last finish (or now)."""
+        if self.first_started is None:
+            return 0.0
+        if self.running or self.last_finished is None:
+            return time.perf_counter() - self.first_started
+        return self.last_finished - self.first_started
+
+    @property
+    def throughput_per_minute(self) -> float:
+        return self.completed / self.elapsed * 60 if self.elapsed > 0 else 0.0
+
+    @property
+    def average_seconds(self) -> float:
+        done = self.completed + self.failed
+        return self.busy_seconds / done if done else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Share of the pool's worker time spent processing (0-1)."""
+        capacity = self.workers * self.elapsed
+        return min(1.0, self.busy_seconds / capacity) if capacity > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'workers': self.workers,
+            'queued': self.queued,
+            'running': self.running,
+            'completed': self.completed,
+            'failed': self.failed,
+            'average_seconds': round(self.average_seconds, 3),
+            'throughput_per_minute': round(self.throughput_per_minute, 2),
+            'utilization': round(self.utilization, 3),
+        }
+
+
+@dataclass
+class ItemResult:
+    """Outcome of one item: the result of every finished stage."""
+
+    item: Any
+    results: dict[str, Any] = field(default_factory=dict)
+    error: BaseException | None = None
+    failed_stage: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class StageExecutor:
+    """Runs items through a DAG of stages, each with its own bounded pool."""
+
+    def __init__(
+        self,
+        stages: Sequence[Stage],
+        log_interval: float | None = 30.0,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            stages: Stages in topological order (every dependency must be
+                listed before the stages depending on it)
+            log_interval: Seconds between stage statistics log lines while
+                running (None disables them)
+
+        Raises:
+            ValueError: If stage names repeat or a dependency is unknown or
+                listed after its dependent
+        """
+        seen: set[str] = set()
+        for stage in stages:
+            if stage.name in seen:
+                raise ValueError(f'Duplicate stage name: {stage.name}')
+            unknown = [dep for dep in stage.depends_on if dep not in seen]
+            if unknown:
+                raise ValueError(
+                    f'Stage {stage.name} depends on {unknown}, which must be '
+                    'listed before it'
+                )
+            seen.add(stage.name)
+
+        self.stages = list(stages)
+        self.log_interval = log_interval
+        self._dependents: dict[str, list[Stage]] = {s.name: [] for s in stages}
+        for stage in stages:
+            for dep in stage.depends_on:
+                self._dependents[dep].append(stage)
+        self._stats = {s.name: StageStats(s.name, max(1, s.workers)) for s in stages}
+
+    def stats(self) -> dict[str, StageStats]:
+        """Current statistics per stage, in stage order."""
+        return dict(self._stats)
+
+    def log_stats(self) -> None:
+        for stats in self._stats.values():
+            logger.info(
+                f'Stage {stats.name}: {stats.queued} queued, {stats.running}/'
+                f'{stats.workers} running, {stats.completed} done, '
+                f'{stats.failed} failed, {stats.throughput_per_minute:.1f}/min, '
+                f'{stats.utilization:.0%} busy'
+            )
+
+    async def run(self, items: Sequence[Any]) -> list[ItemResult]:
+        """
+        Process ``items`` through all stages.
+
+        A failed stage fails its item: stages depending on it are skipped for
+        that item, while independent stages still run. Other items are not
+        affected.
+
+        Returns:
+            One ItemResult per item, in input order
+        """
+        outcomes = [ItemResult(item) for item in items]
+        if not outcomes:
+            return outcomes
+
+        queues = {stage.name: asyncio.Queue() for stage in self.stages}
+        pools = {
+            stage.name: ThreadPoolExecutor(
+                max_workers=self._stats[stage.name].workers,
+                thread_name_prefix=f'stage_{stage.name}',
+            )
+            for stage in self.stages
+        }
+        # Unfinished dependencies per (item, stage), and stages queued or
+        # running per item
+        waiting = [
+            {stage.name: len(stage.depends_on) for stage in self.stages}
+            for _ in outcomes
+        ]
+        in_flight = [0] * len(outcomes)
+        remaining = len(outcomes)
+        all_done = asyncio.Event()
+
+        def schedule(index: int, stage: Stage) -> None:
+            in_flight[index] += 1
+            self._stats[stage.name].queued += 1
+            queues[stage.name].put_nowait(index)
+
+        def finish(index: int) -> None:
+            nonlocal remaining
+            in_flight[index] -= 1
+            if in_flight[index] == 0:
+                remaining -= 1
+                if remaining == 0:
+                    all_done.set()
+
+        async def work(stage: Stage) -> None:
+            loop = asyncio.get_running_loop()
+            stats = self._stats[stage.name]
+            while True:
+                index = await queues[stage.name].get()
+                outcome = outcomes[index]
+                stats.queued -= 1
+                stats.running += 1
+                started = time.perf_counter()
+                if stats.first_started is None:
+                    stats.first_started = started
+                # A context copy per call: one Context cannot be entered by
+                # several threads at once
+                call = functools.partial(
+                    contextvars.copy_context().run,
+                    stage.fn,
+                    outcome.item,
+                    outcome.results,
+                )
+                try:
+                    result = await loop.run_in_executor(pools[stage.name], call)
+                except Exception as e:
+                    stats.failed += 1
+                    if outcome.error is None:
+                        outcome.error = e
+                        outcome.failed_stage = stage.name
+                    logger.error(f'Stage {stage.name} failed for {outcome.item}: {e}')
+                else:
+                    stats.completed += 1
+                    outcome.results[stage.name] = result
+                    for dependent in self._dependents[stage.name]:
+                        waiting[index][dependent.name] -= 1
+                        if waiting[index][dependent.name] == 0:
+                            schedule(index, dependent)
+                finally:
+                    stats.running -= 1
+                    stats.busy_seconds += time.perf_counter() - started
+                    stats.last_finished = time.perf_counter()
+                finish(index)
+
+        async def report() -> None:
+            while True:
+                await asyncio.sleep(self.log_interval)
+                self.log_stats()
+
+        for index in range(len(outcomes)):
+            for stage in self.stages:
+                if not stage.depends_on:
+                    schedule(index, stage)
+
+        tasks = [
+            asyncio.create_task(work(stage))
+            for stage in self.stages
+            for _ in range(self._stats[stage.name].workers)
+        ]
+        if self.log_interval:
+            tasks.append(asyncio.create_task(report()))
+
+        try:
+            await all_done.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for pool in pools.values():
+                pool.shutdown(wait=False)
+
+        return outcomes
@@ -0,0 +1,184 @@
+"""
+Adaptive, token-budgeted batching for local embedding models.
+
+Sentence-transformer throughput on CPU depends on how much padding each batch
+carries and how large the batches are. Sorting texts by length and packing
+batches up to a token budget removes most padding; the budget is then tuned
+from observed batch latency and process RSS so long chunks cannot blow up
+memory while short chunks get large, efficient batches.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+from loguru import logger
+
+try:
+    import psutil
+except ImportError:  # psutil is optional; memory feedback is disabled without it
+    psutil = None
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (words * 1.3), matching the chunker's fallback."""
+    return max(1, int(len(text.split()) * 1.3))
+
+
+def _estimate_token_counts(texts: list[str]) -> list[int]:
+    return [estimate_tokens(text) for text in texts]
+
+
+def _current_rss_mb() -> float | None:
+    if psutil is None:
+        return None
+    try:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except Exception:
+        return None
+
+
+class AdaptiveBatcher:
+    """
+    Packs texts into length-sorted batches bounded by a token budget.
+
+    After every batch the budget is adjusted: it shrinks when a batch was slow
+    or RSS exceeds ``max_rss_mb``, and grows when batches finish well under
+    ``target_batch_seconds``. A batch that fails with ``MemoryError`` (or a
+    torch out-of-memory ``RuntimeError``) is retried with half the budget.
+    The budget persists across calls so later documents start from the tuned
+    value; it is shared by concurrent calls and guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 8192,
+        max_batch_size: int = 64,
+        max_rss_mb: float | None = None,
+        target_batch_seconds: float = 2.0,
+        token_counter: Callable[[list[str]], list[int]] | None = None,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            token_budget: Initial estimated tokens per batch
+            max_batch_size: Hard cap on texts per batch
+            max_rss_mb: Shrink batches when process RSS exceeds this (None = off)
+            target_batch_seconds: Latency the budget is tuned towards
+            token_counter: Returns the token count of each text, ideally from
+                the model's tokenizer (default: word-count estimate)
+        """
+        self.initial_budget = max(1, token_budget)
+        self.token_budget = self.initial_budget
+        self.min_budget = max(1, self.initial_budget // 16)
+        self.max_budget = self.initial_budget * 4
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_rss_mb = max_rss_mb
+        self.target_batch_seconds = target_batch_seconds
+        self.token_counter = token_counter or _estimate_token_counts
+        self._lock = threading.Lock()
+
+    def embed(
+        self,
+        texts: list[str],
+        embed_fn: Callable[[list[str]], list[list[float]]],
+    ) -> list[list[float]]:
+        """
+        Embed texts in adaptive batches.
+
+        Args:
+            texts: Texts to embed
+            embed_fn: Function embedding one batch of texts
+
+        Returns:
+            Embeddings in the original order of ``texts``
+        """
+        lengths = [max(1, n) for n in self.token_counter(texts)] if texts else []
+        order = sorted(range(len(texts)), key=lengths.__getitem__)
+        results: list[list[float] | None] = [None] * len(texts)
+
+        pos = 0
+        retry_budget = None
+        while pos < len(order):
+            with self._lock:
+                budget = self.token_budget
+            if retry_budget is not None:
+                budget = min(budget, retry_budget)
+            batch = self._next_batch(order, pos, lengths, budget)
+            batch_tokens = sum(lengths[i] for i in batch)
+            started = time.perf_counter()
+            try:
+                vectors = embed_fn([texts[i] for i in batch])
+            except (MemoryError, RuntimeError) as e:
+                if len(batch) == 1 or not _is_oom(e):
+                    raise
+                # Half the failed batch's tokens always yields a smaller batch
+                retry_budget = max(1, batch_tokens // 2)
+                with self._lock:
+                    self.token_budget = min(self.token_budget, retry_budget)
+                logger.warning(
+                    f'Embedding batch of {len(batch)} ran out of memory, '
+                    f'retrying with token budget {retry_budget}'
+                )
+                continue
+
+            retry_budget = None
+            for idx, vector in zip(batch, vectors):  # noqa: B905
+                results[idx] = vector
+            self._adapt(time.perf_counter() - started, batch_tokens)
+            pos += len(batch)
+
+        return results  # type: ignore[return-value]
+
+    def _next_batch(
+        self, order: list[int], pos: int, lengths: list[int], budget: int
+    ) -> list[int]:
+        """Take texts from ``order[pos:]`` until the budget or size cap is hit."""
+        batch = [order[pos]]
+        tokens = lengths[order[pos]]
+        for idx in order[pos + 1 :]:
+            if len(batch) >= self.max_batch_size:
+                break
+            if tokens + lengths[idx] > budget:
+                break
+            batch.append(idx)
+            tokens += lengths[idx]
+        return batch
+
+    def _adapt(self, elapsed: float, batch_tokens: int) -> None:
+        """Grow or shrink the token budget from the last batch's cost."""
+        rss_mb = _current_rss_mb()
+        with self._lock:
+            previous = self.token_budget
+            self._adjust_budget(elapsed, batch_tokens, rss_mb)
+            current = self.token_budget
+
+        if current != previous:
+            logger.debug(
+                f'Embedding token budget {previous} -> {current} '
+                f'(batch {elapsed:.2f}s, rss {rss_mb or 0:.0f}MB)'
+            )
+
+    def _adjust_budget(
+        self, elapsed: float, batch_tokens: int, rss_mb: float | None
+    ) -> None:
+        """Apply the budget rules; called with the lock held."""
+        if (
+            self.max_rss_mb is not None
+            and rss_mb is not None
+            and rss_mb > self.max_rss_mb
+        ):
+            self.token_budget = max(self.min_budget, self.token_budget // 2)
+        elif elapsed > self.target_batch_seconds * 1.5:
+            self.token_budget = max(self.min_budget, int(self.token_budget * 0.75))
+        elif (
+            elapsed < self.target_batch_seconds * 0.5
+            and batch_tokens >= self.token_budget * 0.5
+        ):
+            # Only grow when the budget (not the input size) limited the batch
+            self.token_budget = min(self.max_budget, int(self.token_budget * 1.5))
+
+
+def _is_oom(error: BaseException) -> bool:
+    return isinstance(error, MemoryError) or 'out of memory' in str(error).lower()
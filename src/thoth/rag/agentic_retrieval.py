@@ -8,11 +8,18 @@ Implements an adaptive, self-correcting retrieval pipeline that:
 - Grades document relevance
 - Rewrites queries on low confidence
 - Verifies answer groundedness
+
+Independent query-analysis nodes (expansion or decomposition, and filter
+extraction) run as parallel graph branches, sub-query searches run
+concurrently, and every node's start offset and duration is recorded so the
+critical path of a question is visible.
 """
 
 import asyncio
+import operator
+import time
 from collections.abc import Callable
-from typing import Any, Literal, TypedDict
+from typing import Annotated, Any, Literal, TypedDict
 
 from langchain_core.documents import Document
 from langchain_core.output_parsers import StrOutputParser
@@ -77,6 +84,34 @@ class AgenticRAGState(TypedDict):
     config: dict[str, Any]  # RAG configuration
     progress_callback: Callable[[str, str], Any] | None  # Progress update callback
 
+    # Instrumentation (parallel nodes append concurrently, hence the reducer)
+    run_started_at: float  # perf_counter() at the start of the run
+    node_timings: Annotated[list[dict[str, Any]], operator.add]
+
+
+def summarize_node_timings(timings: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Summarize per-node timings of one run.
+
+    Returns:
+        Dict with wall-clock ``total_ms``, ``serial_ms`` (sum of node
+        durations; the gap to total_ms is time saved by parallel branches)
+        and ``per_node_ms`` (total time per node, slowest first)
+    """
+    per_node: dict[str, float] = {}
+    for entry in timings:
+        per_node[entry['node']] = (
+            per_node.get(entry['node'], 0.0) + entry['duration_ms']
+        )
+    total = max((t['start_ms'] + t['duration_ms'] for t in timings), default=0.0)
+    return {
+        'total_ms': round(total, 1),
+        'serial_ms': round(sum(t['duration_ms'] for t in timings), 1),
+        'per_node_ms': dict(
+            sorted(per_node.items(), key=lambda item: item[1], reverse=True)
+        ),
+    }
+
 
 class AgenticRAGOrchestrator:
     """
@@ -133,39 +168,42 @@ class AgenticRAGOrchestrator:
         """
         workflow = StateGraph(AgenticRAGState)
 
-        # Add nodes
-        workflow.add_node('classify_query', self._classify_query)
-        workflow.add_node('expand_query', self._expand_query)
-        workflow.add_node('decompose_query', self._decompose_query)
-        workflow.add_node('extract_filters', self._extract_filters)
-        workflow.add_node('retrieve_documents', self._retrieve_documents)
-        workflow.add_node('grade_documents', self._grade_documents)
-        workflow.add_node('refine_knowledge', self._refine_knowledge)
-        workflow.add_node('rewrite_query', self._rewrite_query)
-        workflow.add_node('rerank_documents', self._rerank_documents)
-        workflow.add_node('generate_answer', self._generate_answer)
-        workflow.add_node('check_hallucination', self._check_hallucination)
+        # Add nodes (each wrapped to record its timing)
+        nodes = {
+            'classify_query': self._classify_query,
+            'expand_query': self._expand_query,
+            'decompose_query': self._decompose_query,
+            'extract_filters': self._extract_filters,
+            'retrieve_documents': self._retrieve_documents,
+            'grade_documents': self._grade_documents,
+            'refine_knowledge': self._refine_knowledge,
+            'rewrite_query': self._rewrite_query,
+            'rerank_documents': self._rerank_documents,
+            'generate_answer': self._generate_answer,
+            'check_hallucination': self._check_hallucination,
+        }
+        for name, node in nodes.items():
+            workflow.add_node(name, self._timed(name, node))
 
         # Set entry point
         workflow.set_entry_point('classify_query')
 
-        # Add conditional edges from classify_query
+        # Add conditional edges from classify_query; retrieval paths fan out
+        # to expansion/decomposition and filter extraction in parallel
         workflow.add_conditional_edges(
             'classify_query',
             self._route_after_classification,
             {
                 'expand': 'expand_query',
                 'decompose': 'decompose_query',
+                'extract_filters': 'extract_filters',
                 'direct_answer': 'generate_answer',
             },
         )
 
-        # Query expansion -> filter extraction -> retrieval
-        workflow.add_edge('expand_query', 'extract_filters')
-        workflow.add_edge('extract_filters', 'retrieve_documents')
-
-        # Query decomposition -> retrieval
-        workflow.add_edge('decompose_query', 'retrieve_documents')
+        # Join: retrieval starts once both parallel branches have finished
+        workflow.add_edge(['expand_query', 'extract_filters'], 'retrieve_documents')
+        workflow.add_edge(['decompose_query', 'extract_filters'], 'retrieve_documents')
 
         # Retrieval -> grading
         workflow.add_edge('retrieve_documents', 'grade_documents')
@@ -255,6 +293,8 @@ class AgenticRAGOrchestrator:
             'grounding_explanation': '',
             'config': self.config,
             'progress_callback': progress_callback,
+            'run_started_at': time.perf_counter(),
+            'node_timings': [],
         }
 
         # Run the graph
@@ -271,11 +311,15 @@ class AgenticRAGOrchestrator:
                 'retry_count': final_state['retry_count'],
                 'num_documents': len(final_state['graded_documents']),
                 'retrieval_assessment': final_state.get('retrieval_assessment', ''),
+                'node_timings': final_state['node_timings'],
+                'timing_summary': summarize_node_timings(final_state['node_timings']),
             }
 
+            summary = result['timing_summary']
             logger.info(
                 f'Agentic RAG completed: {result["retry_count"]} retries, '
-                f'{result["num_documents"]} documents'
+                f'{result["num_documents"]} documents, '
+                f'{summary["total_ms"]:.0f}ms (serial {summary["serial_ms"]:.0f}ms)'
             )
 
             return result
@@ -286,6 +330,27 @@ class AgenticRAGOrchestrator:
 
     # --- Graph Nodes ---
 
+    @staticmethod
+    def _timed(
+        name: str, node: Callable[[AgenticRAGState], dict[str, Any]]
+    ) -> Callable[[AgenticRAGState], dict[str, Any]]:
+        """Wrap a node to append its start offset and duration to the state."""
+
+        def run(state: AgenticRAGState) -> dict[str, Any]:
+            started = time.perf_counter()
+            update = node(state)
+            duration = time.perf_counter() - started
+            origin = state.get('run_started_at') or started
+            timing = {
+                'node': name,
+                'start_ms': round((started - origin) * 1000, 1),
+                'duration_ms': round(duration * 1000, 1),
+            }
+            logger.debug(f'Agentic node {name} took {timing["duration_ms"]:.0f}ms')
+            return {**update, 'node_timings': [timing]}
+
+        return run
+
     def _classify_query(self, state: AgenticRAGState) -> dict[str, Any]:
         """Classify query type and route to appropriate strategy."""
         if callback := state.get('progress_callback'):
@@ -399,23 +464,15 @@ class AgenticRAGOrchestrator:
                 STEP_PROGRESS['retrieve'],
             )
 
-        queries = state['expanded_queries'] or [state['query']]
+        # Identical variations (e.g. the original query repeated) search once
+        queries = list(dict.fromkeys(state['expanded_queries'] or [state['query']]))
         filters = state['extracted_filters']
         k = state['retrieval_k']
 
-        # Retrieve for each query variation
-        all_docs: list[Document] = []
-        for query in queries:
-            try:
-                # Use asyncio.run since we're in sync context
-                docs = asyncio.run(
-                    self.vector_store.similarity_search_async(
-                        query=query, k=k, filter=filters or None
-                    )
-                )
-                all_docs.extend(docs)
-            except Exception as e:
-                logger.error(f'Retrieval failed for query "{query}": {e}')
+        # Search every query variation concurrently on one event loop, so the
+        # searches share the vector store's connection pool
+        results = asyncio.run(self._search_queries_async(queries, k, filters or None))
+        all_docs: list[Document] = [doc for docs in results for doc in docs]
 
         # Deduplicate by document ID or content hash
         seen = set()
@@ -429,6 +486,22 @@ class AgenticRAGOrchestrator:
         logger.info(f'Retrieved {len(unique_docs)} unique documents')
         return {'documents': unique_docs}
 
+    async def _search_queries_async(
+        self, queries: list[str], k: int, filters: dict[str, Any] | None
+    ) -> list[list[Document]]:
+        """Run one similarity search per query concurrently."""
+
+        async def search(query: str) -> list[Document]:
+            try:
+                return await self.vector_store.similarity_search_async(
+                    query=query, k=k, filter=filters
+                )
+            except Exception as e:
+                logger.error(f'Retrieval failed for query "{query}": {e}')
+                return []
+
+        return await asyncio.gather(*(search(query) for query in queries))
+
     def _grade_documents(self, state: AgenticRAGState) -> dict[str, Any]:
         """Grade documents for relevance."""
         if callback := state.get('progress_callback'):
@@ -598,6 +671,7 @@ Rewritten Query:"""
                 {
                     'title': title,
                     'paper_id': doc.metadata.get('paper_id'),
+                    'chunk_id': doc.metadata.get('chunk_id'),
                     'authors': doc.metadata.get('authors'),
                     'relevance_score': doc.metadata.get('rerank_score', 0.0),
                 }
@@ -669,18 +743,21 @@ Answer:"""
 
     # --- Routing Functions ---
 
-    def _route_after_classification(
-        self, state: AgenticRAGState
-    ) -> Literal['expand', 'decompose', 'direct_answer']:
-        """Route after query classification."""
+    def _route_after_classification(self, state: AgenticRAGState) -> list[str]:
+        """
+        Route after query classification.
+
+        Retrieval routes return two branches that LangGraph runs in parallel:
+        expansion (or decomposition for multi-hop) and filter extraction.
+        """
         query_type = state['query_type']
 
         if query_type == QueryType.DIRECT_ANSWER.value:
-            return 'direct_answer'
+            return ['direct_answer']
         elif query_type == QueryType.MULTI_HOP_RAG.value:
-            return 'decompose'
+            return ['decompose', 'extract_filters']
         else:
-            return 'expand'
+            return ['expand', 'extract_filters']
 
     def _route_after_grading(
         self, state: AgenticRAGState
@@ -0,0 +1,208 @@
+"""
+Semantic answer cache for RAG question answering.
+
+Agents and users often ask the same question in slightly different words, and
+every one of them runs the full retrieve-grade-generate-check pipeline. Answers
+are stored in the ``answer_cache`` table together with the question embedding;
+a new question whose embedding is within ``similarity_threshold`` (cosine) of a
+cached one, for the same user and scope, is answered from the cache.
+
+Entries remember the chunks they were answered from. Database triggers delete
+an entry as soon as one of those chunks is re-indexed with new content or
+deleted, so a cached answer never outlives its sources.
+"""
+
+import hashlib
+import json
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import asyncpg
+from loguru import logger
+
+
+def scope_key(mode: str, k: int, filter: dict[str, Any] | None) -> str:
+    """
+    Hash of everything besides the question that shapes an answer.
+
+    Args:
+        mode: Answering pipeline ('standard' or 'agentic')
+        k: Number of documents retrieved for context
+        filter: Metadata filter applied to retrieval
+
+    Returns:
+        Hex SHA-256 of the canonical scope
+    """
+    canonical = json.dumps(
+        {'mode': mode, 'k': k, 'filter': filter or {}}, sort_keys=True, default=str
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def source_chunk_ids(sources: list[dict[str, Any]]) -> list[str]:
+    """Chunk IDs cited by a response's sources (in either source format)."""
+    chunk_ids = []
+    for source in sources:
+        chunk_id = source.get('chunk_id') or source.get('metadata', {}).get('chunk_id')
+        if chunk_id:
+            chunk_ids.append(str(chunk_id))
+    return list(dict.fromkeys(chunk_ids))
+
+
+class SemanticAnswerCache:
+    """
+    Answer cache keyed by question embedding similarity, backed by PostgreSQL.
+
+    Cache errors never fail question answering: lookups degrade to misses and
+    failed writes are logged and dropped.
+    """
+
+    def __init__(
+        self,
+        get_pool: Callable[[], Awaitable[asyncpg.Pool]],
+        embedding_model: str,
+        similarity_threshold: float = 0.97,
+        ttl_seconds: float = 7 * 24 * 3600,
+    ):
+        """
+        Initialize the answer cache.
+
+        Args:
+            get_pool: Coroutine function returning the asyncpg pool to use
+            embedding_model: Model the question embeddings come from
+            similarity_threshold: Minimum cosine similarity for a hit (0-1)
+            ttl_seconds: Maximum age of a cached answer
+        """
+        self._get_pool = get_pool
+        self.embedding_model = embedding_model
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    async def lookup(
+        self, query_embedding: list[float], user_id: str, scope: str
+    ) -> dict[str, Any] | None:
+        """
+        Return the closest cached answer above the similarity threshold.
+
+        Args:
+            query_embedding: Embedding of the new question
+            user_id: Owner of the cached answers
+            scope: Scope key from ``scope_key``
+
+        Returns:
+            Cached response with a ``cache`` provenance entry, or None
+        """
+        started = time.perf_counter()
+        embedding_str = '[' + ','.join(str(x) for x in query_embedding) + ']'
+        try:
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                row = await conn.fetchrow(
+                    """
+                    SELECT id, question, response::text AS response, created_at,
+                           1 - (query_embedding <=> $1::vector) AS similarity
+                    FROM answer_cache
+                    WHERE embedding_model = $2
+                      AND user_id = $3
+                      AND scope_key = $4
+                      AND created_at > NOW() - make_interval(secs => $5)
+                    ORDER BY query_embedding <=> $1::vector
+                    LIMIT 1
+                    """,
+                    embedding_str,
+                    self.embedding_model,
+                    user_id,
+                    scope,
+                    float(self.ttl_seconds),
+                )
+                if row is None or row['similarity'] < self.similarity_threshold:
+                    self.misses += 1
+                    return None
+
+                await conn.execute(
+                    """
+                    UPDATE answer_cache
+                    SET hit_count = hit_count + 1, last_hit_at = NOW()
+                    WHERE id = $1
+                    """,
+                    row['id'],
+                )
+        except Exception as e:
+            logger.warning(f'Answer cache lookup failed: {e}')
+            return None
+
+        self.hits += 1
+        response = json.loads(row['response'])
+        response['cache'] = {
+            'hit': True,
+            'entry_id': str(row['id']),
+            'cached_question': row['question'],
+            'similarity': float(row['similarity']),
+            'cached_at': row['created_at'].isoformat(),
+            'lookup_ms': (time.perf_counter() - started) * 1000,
+        }
+        logger.info(
+            f'Answer cache hit (similarity={row["similarity"]:.3f}) '
+            f'for: {row["question"][:80]}'
+        )
+        return response
+
+    async def store(
+        self,
+        question: str,
+        query_embedding: list[float],
+        user_id: str,
+        scope: str,
+        response: dict[str, Any],
+    ) -> None:
+        """
+        Cache an answer.
+
+        Answers without cited chunks are not cached: nothing would ever
+        invalidate them when the knowledge base changes.
+
+        Args:
+            question: Question that was answered
+            query_embedding: Embedding of the question
+            user_id: Owner of the answer
+            scope: Scope key from ``scope_key``
+            response: Response dict returned to the caller
+        """
+        chunk_ids = source_chunk_ids(response.get('sources') or [])
+        if not chunk_ids:
+            return
+
+        embedding_str = '[' + ','.join(str(x) for x in query_embedding) + ']'
+        payload = {k: v for k, v in response.items() if k != 'cache'}
+        try:
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    INSERT INTO answer_cache
+                        (user_id, scope_key, embedding_model, question,
+                         query_embedding, response, source_chunk_ids)
+                    VALUES ($1, $2, $3, $4, $5::vector, $6::text::jsonb, $7::uuid[])
+                    """,
+                    user_id,
+                    scope,
+                    self.embedding_model,
+                    question,
+                    embedding_str,
+                    json.dumps(payload, default=str),
+                    chunk_ids,
+                )
+        except Exception as e:
+            logger.warning(f'Failed to cache answer: {e}')
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for metrics collection."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,78 @@
+"""
+Content-hash alignment of stored and re-split chunk sequences.
+
+Chunks are stored by ``(paper_id, chunk_index)``, so inserting one paragraph
+near the top of a note shifts every later index. Re-indexing by position
+would then rewrite (and re-embed) the whole paper. Aligning the old and new
+chunk sequences by content hash instead finds the chunks that merely moved;
+only the chunks that actually changed need enrichment, embedding and a
+content write, and unchanged chunks keep their IDs.
+"""
+
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+
+
+@dataclass
+class ChunkDiff:
+    """
+    Plan for turning a paper's stored chunks into a new split.
+
+    ``keep`` and ``update`` pair an existing chunk ID with its new chunk index:
+    kept chunks have identical content (only their index and positional
+    metadata may change), updated chunks are rewritten in place so their ID
+    survives. ``insert`` lists new indexes without a stored row and ``delete``
+    the stored chunks that no longer exist.
+    """
+
+    keep: list[tuple[str, int]] = field(default_factory=list)
+    update: list[tuple[str, int]] = field(default_factory=list)
+    insert: list[int] = field(default_factory=list)
+    delete: list[str] = field(default_factory=list)
+
+    @property
+    def changed_indexes(self) -> list[int]:
+        """New chunk indexes whose content must be (re-)embedded, in order."""
+        return sorted([index for _, index in self.update] + self.insert)
+
+
+def diff_chunks(
+    stored: list[tuple[str, str | None]], new_hashes: list[str]
+) -> ChunkDiff:
+    """
+    Align stored chunks with a new split by content hash.
+
+    Uses the longest-matching-block alignment from ``difflib``, so an edit only
+    affects the chunks around it. Within a replaced region, stored chunks are
+    reused pairwise for the new content (keeping their IDs) and any surplus is
+    inserted or deleted.
+
+    Args:
+        stored: ``(chunk_id, content_hash)`` of the stored chunks in
+            chunk_index order. Rows without a hash (written before hashes
+            were recorded) never match.
+        new_hashes: Content hashes of the new split, in order
+
+    Returns:
+        ChunkDiff describing the minimal set of writes
+    """
+    # Unhashed rows get a sentinel unique to the row so they cannot match
+    old_hashes = [
+        digest if digest is not None else f'\0{chunk_id}' for chunk_id, digest in stored
+    ]
+    matcher = SequenceMatcher(a=old_hashes, b=new_hashes, autojunk=False)
+    diff = ChunkDiff()
+
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            diff.keep.extend(
+                (stored[i][0], j)
+                for i, j in zip(range(i1, i2), range(j1, j2))  # noqa: B905
+            )
+            continue
+        reused = min(i2 - i1, j2 - j1)
+        diff.update.extend((stored[i1 + k][0], j1 + k) for k in range(reused))
+        diff.insert.extend(range(j1 + reused, j2))
+        diff.delete.extend(chunk_id for chunk_id, _ in stored[i1 + reused : i2])
+
+    return diff
@@ -0,0 +1,262 @@
+"""
+Token-offset markdown chunker for the RAG system.
+
+The previous two-stage splitter (LangChain's header splitter followed by a
+recursive character splitter with a tiktoken length function) encoded every
+section once to decide whether it needed splitting and then re-encoded each
+candidate piece many more times while merging. Chunking dominated CPU time in
+bulk reindexes.
+
+``MarkdownChunker`` encodes each document exactly once, with an encoder
+loaded once per process. Header sections come from a single line scan, and
+token counts and sub-chunk boundaries are read off the token offsets with
+binary search. Sub-chunks hold at most ``chunk_size`` tokens and break at the
+last paragraph, line or word boundary that fits, consecutive sub-chunks
+overlapping by about ``chunk_overlap`` tokens.
+"""
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from langchain_core.documents import Document
+
+# ATX headings tracked in chunk metadata (h1-h4); deeper headings stay in text
+_HEADER_RE = re.compile(r'^ {0,3}(#{1,4})[ \t]+(.*?)[ \t]*$')
+_FENCE_RE = re.compile(r'^ {0,3}(```|~~~)')
+_WHITESPACE_RE = re.compile(r'\s')
+
+
+@cache
+def get_encoding(name: str) -> Any:
+    """Process-wide tiktoken encoder (loading one parses a large BPE file)."""
+    import tiktoken
+
+    return tiktoken.get_encoding(name)
+
+
+@dataclass
+class Section:
+    """A header-delimited span of a markdown document."""
+
+    start: int
+    end: int
+    headers: dict[str, str]
+
+    @property
+    def section_path(self) -> list[str]:
+        return [self.headers[f'h{i}'] for i in range(1, 5) if f'h{i}' in self.headers]
+
+    @property
+    def heading_level(self) -> int:
+        return max((int(key[1:]) for key in self.headers), default=0)
+
+
+class MarkdownChunker:
+    """
+    Splits markdown into header sections and token-bounded sub-chunks.
+
+    Produces the same chunk metadata as the two-stage splitter it replaces:
+    ``chunk_index``, ``section_path``, ``heading_level``, ``is_subsection``
+    (plus ``subsection_index``/``total_subsections`` for split sections) and
+    ``total_chunks``. Header lines are kept in the chunk text and headings
+    inside fenced code blocks are ignored.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        encoding_name: str = 'cl100k_base',
+        encoding: Any | None = None,
+    ):
+        """
+        Initialize the chunker.
+
+        Args:
+            chunk_size: Maximum tokens per chunk
+            chunk_overlap: Tokens shared by consecutive sub-chunks of a section
+            encoding_name: tiktoken encoding used for token counts
+            encoding: Optional pre-built encoder (defaults to the shared
+                process-wide encoder for ``encoding_name``)
+
+        Raises:
+            ValueError: If the overlap is not smaller than the chunk size
+        """
+        if chunk_overlap >= chunk_size:
+            raise ValueError(
+                f'chunk_overlap ({chunk_overlap}) must be smaller than '
+                f'chunk_size ({chunk_size})'
+            )
+        self.chunk_size = chunk_size
+        self.chunk_overlap = max(0, chunk_overlap)
+        self.encoding_name = encoding_name
+        self._encoding = encoding
+
+    @property
+    def encoding(self) -> Any:
+        if self._encoding is None:
+            self._encoding = get_encoding(self.encoding_name)
+        return self._encoding
+
+    def token_offsets(self, text: str) -> list[int]:
+        """Character offset at which each token of ``text`` starts."""
+        # disallowed_special=() lets text like <|endoftext|> pass through
+        # without raising -- common in ML textbooks and technical docs
+        tokens = self.encoding.encode(text, disallowed_special=())
+        _, offsets = self.encoding.decode_with_offsets(tokens)
+        return offsets
+
+    def split(self, content: str, base_metadata: dict[str, Any]) -> list[Document]:
+        """
+        Split a markdown document into chunk Documents.
+
+        Args:
+            content: Markdown content to split
+            base_metadata: Metadata copied onto every chunk
+
+        Returns:
+            Chunks in document order
+        """
+        offsets = self.token_offsets(content)
+        documents: list[Document] = []
+
+        for section in self.sections(content):
+            section_metadata = {
+                **base_metadata,
+                'section_path': section.section_path,
+                'heading_level': section.heading_level,
+            }
+            tokens = bisect_left(offsets, section.end) - bisect_left(
+                offsets, section.start
+            )
+            if tokens <= self.chunk_size:
+                documents.append(
+                    Document(
+                        page_content=content[section.start : section.end],
+                        metadata={
+                            **section_metadata,
+                            'chunk_index': len(documents),
+                            'is_subsection': False,
+                        },
+                    )
+                )
+                continue
+
+            pieces = self._window(content, offsets, section.start, section.end)
+            for i, piece in enumerate(pieces):
+                documents.append(
+                    Document(
+                        page_content=piece,
+                        metadata={
+                            **section_metadata,
+                            'chunk_index': len(documents),
+                            'is_subsection': True,
+                            'subsection_index': i,
+                            'total_subsections': len(pieces),
+                        },
+                    )
+                )
+
+        for doc in documents:
+            doc.metadata['total_chunks'] = len(documents)
+        return documents
+
+    def split_text(self, text: str) -> list[str]:
+        """Split plain text into token-bounded chunks, ignoring headings."""
+        offsets = self.token_offsets(text)
+        if len(offsets) <= self.chunk_size:
+            return [text.strip()] if text.strip() else []
+        return self._window(text, offsets, 0, len(text))
+
+    @staticmethod
+    def sections(content: str) -> list[Section]:
+        """
+        Header-delimited sections with surrounding whitespace trimmed.
+
+        A heading closes the current section and replaces any open heading of
+        the same or a deeper level.
+        """
+        spans: list[Section] = []
+        headers: dict[str, str] = {}
+        start = pos = 0
+        in_fence = False
+
+        for line in content.splitlines(keepends=True):
+            if _FENCE_RE.match(line):
+                in_fence = not in_fence
+            elif not in_fence and (match := _HEADER_RE.match(line.rstrip('\r\n'))):
+                spans.append(Section(start, pos, headers))
+                level = len(match.group(1))
+                headers = {
+                    key: value for key, value in headers.items() if int(key[1:]) < level
+                }
+                headers[f'h{level}'] = match.group(2)
+                start = pos
+            pos += len(line)
+        spans.append(Section(start, len(content), headers))
+
+        sections = []
+        for span in spans:
+            start, end = span.start, span.end
+            while start < end and content[start].isspace():
+                start += 1
+            while end > start and content[end - 1].isspace():
+                end -= 1
+            if start < end:
+                sections.append(Section(start, end, span.headers))
+        return sections
+
+    def _window(self, text: str, offsets: list[int], start: int, end: int) -> list[str]:
+        """Slide a ``chunk_size`` token window over ``text[start:end]``."""
+        pieces: list[str] = []
+        chunk_start = start
+
+        while chunk_start < end:
+            first_token = bisect_left(offsets, chunk_start)
+            limit_token = first_token + self.chunk_size
+            if limit_token >= len(offsets) or offsets[limit_token] >= end:
+                pieces.append(text[chunk_start:end].strip())
+                break
+
+            chunk_end = self._break_before(text, chunk_start, offsets[limit_token])
+            if piece := text[chunk_start:chunk_end].strip():
+                pieces.append(piece)
+
+            # Step back chunk_overlap tokens, then forward to a word start
+            next_token = max(
+                bisect_left(offsets, chunk_end) - self.chunk_overlap, first_token + 1
+            )
+            next_start = self._word_start(text, offsets[next_token], chunk_end)
+            chunk_start = next_start if next_start > chunk_start else chunk_end
+            while chunk_start < end and text[chunk_start].isspace():
+                chunk_start += 1
+
+        return [piece for piece in pieces if piece]
+
+    @staticmethod
+    def _break_before(text: str, start: int, limit: int) -> int:
+        """
+        Best break position in ``text[start:limit]``.
+
+        Prefers the last paragraph break, then line break, in the second half
+        of the window (so chunks are not cut needlessly short), then the last
+        space, and finally cuts at ``limit``.
+        """
+        midpoint = start + (limit - start) // 2
+        for separator in ('\n\n', '\n'):
+            position = text.rfind(separator, midpoint, limit)
+            if position > start:
+                return position
+        position = text.rfind(' ', start, limit)
+        return position if position > start else limit
+
+    @staticmethod
+    def _word_start(text: str, position: int, limit: int) -> int:
+        """First word start at or after ``position`` (and before ``limit``)."""
+        if position == 0 or text[position - 1].isspace():
+            return position
+        match = _WHITESPACE_RE.search(text, position, limit)
+        return match.end() if match else position
@@ -4,15 +4,130 @@ Contextual retrieval enrichment for RAG systems.
 Implements Anthropic's contextual retrieval technique: prepending LLM-generated
 context to chunks before embedding to improve retrieval accuracy.
 
+Generated contexts are cached in PostgreSQL per (model, document hash, chunk
+hash), so re-indexing an unchanged paper makes no LLM calls. Every prompt for a
+document starts with the same byte-identical prefix (instructions, title and
+document excerpt) and only the chunk text differs, so provider-side prompt
+caching can reuse the prefix across a paper's chunks.
+
 Reference: https://www.anthropic.com/news/contextual-retrieval
 """
 
 import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
+import asyncpg
 from langchain_core.documents import Document
 from loguru import logger
 
+from thoth.rag.embedding_cache import content_hash
+
+
+@dataclass
+class EnrichmentStats:
+    """Per-paper enrichment counts."""
+
+    cached: int = 0
+    fresh: int = 0
+    failed: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.cached + self.fresh + self.failed
+
+
+class ChunkContextCache:
+    """
+    Persistent cache of generated chunk contexts backed by PostgreSQL.
+
+    Like the embedding cache, errors never fail indexing: lookups degrade to
+    "all misses" and failed writes are logged and dropped.
+    """
+
+    def __init__(self, get_pool: Callable[[], Awaitable[asyncpg.Pool]]):
+        """
+        Initialize the context cache.
+
+        Args:
+            get_pool: Coroutine function returning the asyncpg pool to use
+        """
+        self._get_pool = get_pool
+
+    async def get_many(
+        self, model: str, document_hash: str, chunk_hashes: list[str]
+    ) -> dict[str, str]:
+        """
+        Look up cached contexts for one document.
+
+        Args:
+            model: Model that generated the contexts
+            document_hash: Hash of the document the chunks belong to
+            chunk_hashes: Chunk content hashes to look up
+
+        Returns:
+            Mapping of chunk hash to context for every hit
+        """
+        unique = list(dict.fromkeys(chunk_hashes))
+        if not unique:
+            return {}
+
+        try:
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    UPDATE chunk_context_cache
+                    SET last_used_at = NOW()
+                    WHERE model = $1
+                      AND document_hash = $2
+                      AND chunk_hash = ANY($3::text[])
+                    RETURNING chunk_hash, context
+                    """,
+                    model,
+                    document_hash,
+                    unique,
+                )
+        except Exception as e:
+            logger.warning(f'Chunk context cache lookup failed: {e}')
+            return {}
+
+        return {row['chunk_hash']: row['context'] for row in rows}
+
+    async def put_many(
+        self, model: str, document_hash: str, contexts: dict[str, str]
+    ) -> None:
+        """
+        Store generated contexts for one document.
+
+        Args:
+            model: Model that generated the contexts
+            document_hash: Hash of the document the chunks belong to
+            contexts: Mapping of chunk hash to generated context
+        """
+        if not contexts:
+            return
+
+        try:
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                await conn.executemany(
+                    """
+                    INSERT INTO chunk_context_cache
+                        (model, document_hash, chunk_hash, context)
+                    VALUES ($1, $2, $3, $4)
+                    ON CONFLICT (model, document_hash, chunk_hash)
+                    DO UPDATE SET context = EXCLUDED.context, last_used_at = NOW()
+                    """,
+                    [
+                        (model, document_hash, chunk_hash, context)
+                        for chunk_hash, context in contexts.items()
+                    ],
+                )
+        except Exception as e:
+            logger.warning(f'Failed to store {len(contexts)} chunk contexts: {e}')
+
 
 class ContextualEnricher:
     """
@@ -30,6 +145,7 @@ class ContextualEnricher:
         max_doc_tokens: int = 1000,
         batch_size: int = 10,
         enabled: bool = True,
+        cache: ChunkContextCache | None = None,
     ):
         """
         Initialize contextual enricher.
@@ -40,6 +156,7 @@ class ContextualEnricher:
             max_doc_tokens: Maximum document tokens to include in prompt
             batch_size: Number of chunks to process in parallel
             enabled: Whether enrichment is enabled
+            cache: Optional persistent cache of generated contexts
         """
         self.llm_client = llm_client
         # OpenRouterClient stores model as model_name (inherits from ChatOpenAI)
@@ -49,6 +166,7 @@ class ContextualEnricher:
         self.max_doc_tokens = max_doc_tokens
         self.batch_size = batch_size
         self.enabled = enabled
+        self.cache = cache
 
         logger.info(
             f'Initialized ContextualEnricher '
@@ -75,48 +193,101 @@ class ContextualEnricher:
         Returns:
             Enriched chunks with context prepended
         """
+        enriched, _ = await self.enrich_chunks_with_stats_async(
+            chunks, document_text, document_title
+        )
+        return enriched
+
+    async def enrich_chunks_with_stats_async(
+        self,
+        chunks: list[Document],
+        document_text: str,
+        document_title: str | None = None,
+    ) -> tuple[list[Document], EnrichmentStats]:
+        """
+        Enrich chunks and report how many contexts were cached vs generated.
+
+        Cached contexts are reused without an LLM call. The first uncached
+        chunk is sent on its own so the provider can cache the shared
+        document prefix, and the remaining chunks follow in parallel batches
+        that hit that cached prefix.
+
+        Args:
+            chunks: List of document chunks
+            document_text: Full document text (will be truncated if too long)
+            document_title: Optional document title for better context
+
+        Returns:
+            Tuple of (enriched chunks in input order, enrichment stats)
+        """
+        stats = EnrichmentStats()
         if not self.enabled or not chunks:
-            return chunks
+            return chunks, stats
 
         logger.debug(f'Enriching {len(chunks)} chunks with contextual information')
 
-        # Truncate document for prompt
-        doc_excerpt = self._truncate_document(document_text)
+        # One prefix per document, shared byte-for-byte by every prompt
+        prefix = self._build_document_prefix(
+            self._truncate_document(document_text), document_title
+        )
+        document_hash = content_hash(f'{document_title or ""}\n{document_text}')
+        chunk_hashes = [content_hash(chunk.page_content) for chunk in chunks]
+
+        cached: dict[str, str] = {}
+        if self.cache is not None:
+            cached = await self.cache.get_many(self.model, document_hash, chunk_hashes)
+
+        # Chunks with identical text share one generated context
+        pending: dict[str, int] = {}
+        for i, digest in enumerate(chunk_hashes):
+            if digest not in cached:
+                pending.setdefault(digest, i)
+        first_indices = list(pending.values())
+
+        # Prime the provider's prompt cache with one request, then fan out
+        batches = [first_indices[:1]] + [
+            first_indices[i : i + self.batch_size]
+            for i in range(1, len(first_indices), self.batch_size)
+        ]
+        fresh: dict[str, str] = {}
+        for batch in batches:
+            if not batch:
+                continue
+            results = await asyncio.gather(
+                *(
+                    self._generate_context(chunks[i].page_content, prefix)
+                    for i in batch
+                ),
+                return_exceptions=True,
+            )
+            for i, context in zip(batch, results):  # noqa: B905
+                if isinstance(context, Exception):
+                    logger.warning(f'Enrichment failed for chunk: {context}')
+                else:
+                    fresh[chunk_hashes[i]] = context
 
-        # Process chunks in batches
         enriched_chunks = []
-        for i in range(0, len(chunks), self.batch_size):
-            batch = chunks[i : i + self.batch_size]
-
-            # Enrich batch in parallel
-            enrichment_tasks = [
-                self._enrich_single_chunk(chunk, doc_excerpt, document_title)
-                for chunk in batch
-            ]
-
-            try:
-                enriched_batch = await asyncio.gather(
-                    *enrichment_tasks, return_exceptions=True
-                )
-
-                # Handle any errors
-                for orig_chunk, enriched in zip(batch, enriched_batch):  # noqa: B905
-                    if isinstance(enriched, Exception):
-                        logger.warning(f'Enrichment failed for chunk: {enriched}')
-                        # Use original chunk if enrichment fails
-                        enriched_chunks.append(orig_chunk)
-                    else:
-                        enriched_chunks.append(enriched)
+        for chunk, digest in zip(chunks, chunk_hashes):  # noqa: B905
+            if digest in cached:
+                enriched_chunks.append(self._apply_context(chunk, cached[digest]))
+                stats.cached += 1
+            elif digest in fresh:
+                enriched_chunks.append(self._apply_context(chunk, fresh[digest]))
+                stats.fresh += 1
+            else:
+                # Use original chunk if enrichment fails
+                enriched_chunks.append(chunk)
+                stats.failed += 1
 
-            except Exception as e:
-                logger.error(f'Batch enrichment failed: {e}')
-                # Fall back to original chunks for this batch
-                enriched_chunks.extend(batch)
+        if self.cache is not None:
+            await self.cache.put_many(self.model, document_hash, fresh)
 
+        source = f' for {document_title!r}' if document_title else ''
         logger.info(
-            f'Successfully enriched {len(enriched_chunks)}/{len(chunks)} chunks'
+            f'Enriched {len(chunks)} chunks{source}: {stats.cached} cached, '
+            f'{stats.fresh} generated, {stats.failed} failed'
         )
-        return enriched_chunks
+        return enriched_chunks, stats
 
     def enrich_chunks(
         self,
@@ -149,75 +320,61 @@ class ContextualEnricher:
             else:
                 raise
 
-    async def _enrich_single_chunk(
-        self,
-        chunk: Document,
-        document_excerpt: str,
-        document_title: str | None,
-    ) -> Document:
+    async def _generate_context(self, chunk_text: str, prefix: str) -> str:
         """
-        Enrich a single chunk with contextual information.
+        Generate the context for a single chunk.
 
         Args:
-            chunk: Document chunk to enrich
-            document_excerpt: Excerpt of full document for context
-            document_title: Optional document title
+            chunk_text: Chunk text to contextualize
+            prefix: Shared document prefix from _build_document_prefix
 
         Returns:
-            Enriched document chunk
+            Generated context (1-2 sentences)
         """
-        # Build prompt for contextual enrichment
-        prompt = self._build_enrichment_prompt(
-            chunk.page_content, document_excerpt, document_title
-        )
-
-        try:
-            # Generate context using LLM
-            response = await asyncio.to_thread(self.llm_client.invoke, prompt)
+        prompt = prefix + self._build_chunk_suffix(chunk_text)
+        response = await asyncio.to_thread(self.llm_client.invoke, prompt)
 
-            context = response.content.strip()
+        context = response.content.strip()
 
-            # Validate context (should be 1-3 sentences)
-            if len(context) > 500:  # Sanity check
-                logger.warning('Generated context too long, truncating')
-                context = context[:500] + '...'
+        # Validate context (should be 1-3 sentences)
+        if len(context) > 500:  # Sanity check
+            logger.warning('Generated context too long, truncating')
+            context = context[:500] + '...'
 
-            # Create enriched chunk
-            enriched_content = f'{context}\n\n{chunk.page_content}'
+        return context
 
-            # Copy metadata and add enrichment info
-            enriched_metadata = dict(chunk.metadata)
-            enriched_metadata['enriched'] = True
-            enriched_metadata['context'] = context
-            enriched_metadata['original_content'] = chunk.page_content
+    @staticmethod
+    def _apply_context(chunk: Document, context: str) -> Document:
+        """Prepend the context to a chunk, keeping the original in metadata."""
+        enriched_metadata = dict(chunk.metadata)
+        enriched_metadata['enriched'] = True
+        enriched_metadata['context'] = context
+        enriched_metadata['original_content'] = chunk.page_content
 
-            return Document(page_content=enriched_content, metadata=enriched_metadata)
-
-        except Exception as e:
-            logger.error(f'Context generation failed: {e}')
-            # Return original chunk on error
-            return chunk
+        return Document(
+            page_content=f'{context}\n\n{chunk.page_content}',
+            metadata=enriched_metadata,
+        )
 
-    def _build_enrichment_prompt(
-        self,
-        chunk_text: str,
-        document_excerpt: str,
-        document_title: str | None,
+    def _build_document_prefix(
+        self, document_excerpt: str, document_title: str | None
     ) -> str:
         """
-        Build prompt for contextual enrichment.
+        Build the part of the enrichment prompt shared by all chunks.
+
+        Nothing chunk-specific may appear here, otherwise the provider's
+        prompt cache misses on every chunk.
 
         Args:
-            chunk_text: Chunk text to enrich
             document_excerpt: Document excerpt for context
             document_title: Optional document title
 
         Returns:
-            Prompt string
+            Prompt prefix
         """
         title_part = f'\nDocument Title: {document_title}\n' if document_title else ''
 
-        prompt = f"""You are an expert at providing context for document chunks to improve search retrieval.
+        return f"""You are an expert at providing context for document chunks to improve search retrieval.
 
 Given a chunk from a document, provide a brief context (1-2 sentences) that situates this chunk within the overall document. The context should help someone searching for this information find it more easily.
 
@@ -226,13 +383,16 @@ Be concise and specific. Focus on what makes this chunk unique or where it fits
 Document Excerpt:
 {document_excerpt}
 
-Chunk to Contextualize:
+"""
+
+    @staticmethod
+    def _build_chunk_suffix(chunk_text: str) -> str:
+        """Build the chunk-specific end of the enrichment prompt."""
+        return f"""Chunk to Contextualize:
 {chunk_text}
 
 Brief Context (1-2 sentences):"""
 
-        return prompt
-
     def _truncate_document(self, document_text: str) -> str:
         """
         Truncate document to fit within token limit.
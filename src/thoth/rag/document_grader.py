@@ -3,6 +3,8 @@ Document relevance grading for agentic RAG.
 
 Provides LLM-based binary relevance grading to filter retrieved documents
 before generation, improving answer quality and reducing hallucination risk.
+Documents are graded listwise (several per LLM call) by default, with a
+per-document fallback when a listwise response cannot be parsed.
 """
 
 import asyncio
@@ -12,6 +14,16 @@ from typing import Any
 from langchain_core.documents import Document
 from loguru import logger
 
+from thoth.rag.listwise import (
+    format_documents,
+    llm_semaphore,
+    pack_documents,
+    parse_listwise_response,
+)
+
+# Per-document character cap (same in listwise and pointwise prompts)
+MAX_DOCUMENT_CHARS = 800
+
 
 class RetrievalConfidence(Enum):
     """
@@ -33,6 +45,11 @@ class DocumentGrader:
     Scores each retrieved document's relevance to the query using binary
     yes/no grading. Faster and more cost-effective than scoring-based
     approaches while maintaining high accuracy.
+
+    In ``listwise`` mode up to ``batch_size`` documents share one prompt and
+    the LLM returns a JSON object of yes/no grades; ``pointwise`` mode sends
+    one prompt per document. Either way, calls are capped by the shared
+    grading semaphore (see ``thoth.rag.listwise``).
     """
 
     def __init__(
@@ -40,6 +57,8 @@ class DocumentGrader:
         llm_client: Any,
         threshold: float = 0.5,
         batch_size: int = 10,
+        mode: str = 'listwise',
+        token_budget: int = 2000,
     ):
         """
         Initialize document grader.
@@ -47,12 +66,16 @@ class DocumentGrader:
         Args:
             llm_client: LLM client for grading
             threshold: Minimum confidence threshold (0-1) for relevance
-            batch_size: Number of documents to grade in parallel
+            batch_size: Maximum documents per listwise grading call
+            mode: 'listwise' or 'pointwise'
+            token_budget: Approximate document tokens per listwise call
         """
         self.llm_client = llm_client
         self.threshold = threshold
         self.batch_size = batch_size
-        logger.info(f'Initialized DocumentGrader (threshold={threshold})')
+        self.mode = mode
+        self.token_budget = token_budget
+        logger.info(f'Initialized DocumentGrader (threshold={threshold}, mode={mode})')
 
     async def grade_documents_async(
         self, query: str, documents: list[Document]
@@ -61,7 +84,8 @@ class DocumentGrader:
         Grade documents for relevance to query (async).
 
         Uses LLM to perform binary yes/no relevance grading. Documents
-        are graded in parallel batches for efficiency.
+        are graded in listwise batches (or one per call in pointwise mode),
+        with concurrency capped by the shared grading semaphore.
 
         Args:
             query: Search query
@@ -81,11 +105,28 @@ class DocumentGrader:
 
         logger.debug(f'Grading {len(documents)} documents for query: {query[:100]}')
 
-        # Grade documents in parallel batches
-        grading_tasks = [self._grade_single_document(query, doc) for doc in documents]
-
         try:
-            grades = await asyncio.gather(*grading_tasks, return_exceptions=True)
+            if self.mode == 'listwise':
+                batches = pack_documents(
+                    documents, self.batch_size, self.token_budget, MAX_DOCUMENT_CHARS
+                )
+                batch_grades = await asyncio.gather(
+                    *(self._grade_batch(query, documents, batch) for batch in batches),
+                    return_exceptions=True,
+                )
+                grades: list[Any] = [None] * len(documents)
+                for batch, result in zip(batches, batch_grades):  # noqa: B905
+                    for position, (index, _) in enumerate(batch):
+                        grades[index] = (
+                            result
+                            if isinstance(result, Exception)
+                            else result[position]
+                        )
+            else:
+                grades = await asyncio.gather(
+                    *(self._grade_single_document(query, doc) for doc in documents),
+                    return_exceptions=True,
+                )
 
             # Separate relevant and irrelevant documents
             relevant = []
@@ -143,6 +184,57 @@ class DocumentGrader:
             else:
                 raise
 
+    async def _grade_batch(
+        self,
+        query: str,
+        documents: list[Document],
+        batch: list[tuple[int, str]],
+    ) -> list[str]:
+        """
+        Grade a batch of documents with one listwise LLM call.
+
+        Falls back to per-document grading if the response cannot be parsed.
+
+        Args:
+            query: Search query
+            documents: All documents being graded
+            batch: (index, truncated content) pairs from pack_documents
+
+        Returns:
+            'yes'/'no' grades in batch order
+        """
+        if len(batch) == 1:
+            return [await self._grade_single_document(query, documents[batch[0][0]])]
+
+        prompt = f"""Decide whether each numbered document is relevant to answering the query.
+Output ONLY a JSON object mapping every document number to "yes" or "no", e.g. {{"1": "yes", "2": "no"}}.
+
+Query: {query}
+
+Documents:
+{format_documents(batch, documents)}
+
+Grades (JSON):"""
+
+        try:
+            async with llm_semaphore():
+                response = await asyncio.to_thread(self.llm_client.invoke, prompt)
+            grades = parse_listwise_response(response.content, len(batch), _parse_grade)
+            logger.debug(f'Listwise graded {len(batch)} documents in one call')
+            return grades
+        except Exception as e:
+            logger.warning(
+                f'Listwise grading failed ({e}), grading {len(batch)} documents individually'
+            )
+            return list(
+                await asyncio.gather(
+                    *(
+                        self._grade_single_document(query, documents[index])
+                        for index, _ in batch
+                    )
+                )
+            )
+
     async def _grade_single_document(self, query: str, document: Document) -> str:
         """
         Grade a single document's relevance to query using LLM.
@@ -159,7 +251,7 @@ class DocumentGrader:
             'yes' if relevant, 'no' if irrelevant
         """
         # Truncate document to avoid context overflow (keep first 800 chars)
-        content = document.page_content[:800]
+        content = document.page_content[:MAX_DOCUMENT_CHARS]
 
         # Get document title/source if available for context
         doc_info = ''
@@ -178,7 +270,8 @@ Query: {query}
 Relevant (yes/no):"""
 
         try:
-            response = await asyncio.to_thread(self.llm_client.invoke, prompt)
+            async with llm_semaphore():
+                response = await asyncio.to_thread(self.llm_client.invoke, prompt)
 
             # Parse yes/no response
             result = response.content.strip().lower()
@@ -268,3 +361,15 @@ Relevant (yes/no):"""
             return RetrievalConfidence.AMBIGUOUS
         else:
             return RetrievalConfidence.INCORRECT
+
+
+def _parse_grade(value: Any) -> str:
+    """Normalize one listwise grade to 'yes' or 'no'."""
+    if isinstance(value, bool):
+        return 'yes' if value else 'no'
+    text = str(value).strip().lower()
+    if text.startswith('yes'):
+        return 'yes'
+    if text.startswith('no'):
+        return 'no'
+    raise ValueError(f'Unrecognized grade: {value!r}')
@@ -0,0 +1,181 @@
+"""
+Persistent embedding cache for the Thoth RAG system.
+
+Chunk embeddings are stored in the ``embedding_cache`` table keyed by
+(model, embedding_version, sha256 of the normalized chunk text). Re-indexing a
+paper whose text did not change - e.g. a note that was only touched or
+re-saved by the watcher - then costs a single lookup instead of a full round
+of embedding calls.
+"""
+
+import hashlib
+import re
+import unicodedata
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import asyncpg
+from loguru import logger
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    """Normalize chunk text so cosmetic whitespace changes share a cache key."""
+    return _WHITESPACE_RE.sub(' ', unicodedata.normalize('NFC', text)).strip()
+
+
+def content_hash(text: str) -> str:
+    """Return the hex SHA-256 of the normalized text."""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+def resolve_model_name(embedding_function: Any) -> str:
+    """
+    Best-effort model identifier for a LangChain embeddings object.
+
+    ``OpenAIEmbeddings`` exposes ``model`` and ``HuggingFaceEmbeddings``
+    exposes ``model_name``; anything else falls back to its class name.
+    """
+    for attr in ('model', 'model_name'):
+        value = getattr(embedding_function, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    return type(embedding_function).__name__
+
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding cache backed by PostgreSQL.
+
+    Cache errors never fail indexing: lookups degrade to "all misses" and
+    failed writes are logged and dropped.
+    """
+
+    def __init__(
+        self,
+        get_pool: Callable[[], Awaitable[asyncpg.Pool]],
+        model: str,
+        embedding_version: str = 'v1',
+    ):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            get_pool: Coroutine function returning the asyncpg pool to use
+            model: Embedding model identifier (part of the cache key)
+            embedding_version: Embedding strategy version (part of the cache key)
+        """
+        self._get_pool = get_pool
+        self.model = model
+        self.embedding_version = embedding_version
+        self.hits = 0
+        self.misses = 0
+
+    async def get_many(self, hashes: list[str]) -> dict[str, list[float]]:
+        """
+        Look up cached embeddings.
+
+        Args:
+            hashes: Content hashes to look up
+
+        Returns:
+            Mapping of content hash to embedding for every hit
+        """
+        unique = list(dict.fromkeys(hashes))
+        if not unique:
+            return {}
+
+        try:
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    UPDATE embedding_cache
+                    SET last_used_at = NOW()
+                    WHERE model = $1
+                      AND embedding_version = $2
+                      AND content_hash = ANY($3::text[])
+                    RETURNING content_hash, embedding
+                    """,
+                    self.model,
+                    self.embedding_version,
+                    unique,
+                )
+        except Exception as e:
+            logger.warning(f'Embedding cache lookup failed, embedding all chunks: {e}')
+            return {}
+
+        found = {row['content_hash']: list(row['embedding']) for row in rows}
+        self.hits += len(found)
+        self.misses += len(unique) - len(found)
+        return found
+
+    async def put_many(self, entries: dict[str, list[float]]) -> None:
+        """
+        Store embeddings in the cache.
+
+        Args:
+            entries: Mapping of content hash to embedding
+        """
+        if not entries:
+            return
+
+        try:
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                await conn.executemany(
+                    """
+                    INSERT INTO embedding_cache
+                        (model, embedding_version, content_hash, embedding)
+                    VALUES ($1, $2, $3, $4)
+                    ON CONFLICT (model, embedding_version, content_hash)
+                    DO UPDATE SET last_used_at = NOW()
+                    """,
+                    [
+                        (
+                            self.model,
+                            self.embedding_version,
+                            digest,
+                            [float(x) for x in embedding],
+                        )
+                        for digest, embedding in entries.items()
+                    ],
+                )
+        except Exception as e:
+            logger.warning(f'Failed to store {len(entries)} cached embeddings: {e}')
+
+    async def embed_documents(
+        self,
+        texts: list[str],
+        embed_fn: Callable[[list[str]], Awaitable[list[list[float]]]],
+    ) -> list[list[float]]:
+        """
+        Embed texts, sending only cache misses to ``embed_fn``.
+
+        Args:
+            texts: Texts to embed
+            embed_fn: Coroutine function embedding a list of texts
+
+        Returns:
+            Embeddings aligned with ``texts``
+        """
+        hashes = [content_hash(text) for text in texts]
+        cached = await self.get_many(hashes)
+
+        missing: dict[str, str] = {}
+        for digest, text in zip(hashes, texts):  # noqa: B905
+            if digest not in cached:
+                missing.setdefault(digest, text)
+
+        if missing:
+            fresh = await embed_fn(list(missing.values()))
+            new_entries = dict(zip(missing.keys(), fresh))  # noqa: B905
+            await self.put_many(new_entries)
+            cached.update(new_entries)
+
+        logger.debug(
+            f'Embedding cache: {len(texts) - len(missing)} cached, '
+            f'{len(missing)} embedded ({self.model}, {self.embedding_version})'
+        )
+        return [cached[digest] for digest in hashes]
@@ -0,0 +1,182 @@
+"""
+Multi-process embedding worker pool for CPU-only deployments.
+
+The CLI pins OMP/MKL/torch to a single thread to avoid segfaults, which limits
+a local sentence-transformers model to one core. This pool runs one model per
+worker process instead: every worker keeps the single-thread safety settings,
+loads the model once, and encodes its shard of each request straight into a
+shared-memory result buffer, so vectors never get pickled back to the parent.
+
+Workers are started with ``spawn`` (forking after torch/OpenMP initialization
+is unsafe), so each worker pays a one-time import and model-load cost when the
+pool starts; the pool is therefore created lazily and reused for the process
+lifetime.
+"""
+
+import atexit
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+# Same single-thread settings as cli/main.py and EmbeddingManager
+SINGLE_THREAD_ENV = {
+    'TOKENIZERS_PARALLELISM': 'false',
+    'OMP_NUM_THREADS': '1',
+    'MKL_NUM_THREADS': '1',
+    'NUMEXPR_NUM_THREADS': '1',
+    'TORCH_NUM_THREADS': '1',
+    'KMP_DUPLICATE_LIB_OK': 'TRUE',
+    'KMP_INIT_AT_FORK': 'FALSE',
+}
+
+# Per-process model, set by _init_worker
+_worker_model: Any = None
+_worker_encode_kwargs: dict[str, Any] = {}
+
+
+def load_sentence_transformer(model_name: str) -> Any:
+    """Load a CPU sentence-transformers model limited to one thread."""
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    torch.set_num_threads(1)
+    return SentenceTransformer(model_name, device='cpu', trust_remote_code=False)
+
+
+def _init_worker(
+    model_name: str,
+    encode_kwargs: dict[str, Any],
+    model_factory: Callable[[str], Any],
+) -> None:
+    """Process initializer: apply thread safety settings and load the model."""
+    global _worker_model, _worker_encode_kwargs
+    os.environ.update(SINGLE_THREAD_ENV)
+    _worker_model = model_factory(model_name)
+    _worker_encode_kwargs = encode_kwargs
+
+
+def _worker_dimension() -> int:
+    return int(_worker_model.get_sentence_embedding_dimension())
+
+
+def _encode_into(
+    shm_name: str, shape: tuple[int, int], rows: list[int], texts: list[str]
+) -> int:
+    """Encode ``texts`` and write them to ``rows`` of the shared result buffer."""
+    vectors = _worker_model.encode(
+        texts, convert_to_numpy=True, show_progress_bar=False, **_worker_encode_kwargs
+    )
+    shm = shared_memory.SharedMemory(name=shm_name)
+    # The parent owns (and unlinks) the segment; don't let this process's
+    # resource tracker claim it too (Python < 3.13 has no track=False)
+    resource_tracker.unregister(shm._name, 'shared_memory')
+    try:
+        out = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+        out[rows] = vectors
+        del out
+    finally:
+        shm.close()
+    return len(rows)
+
+
+class EmbeddingWorkerPool:
+    """
+    Shards embedding requests across worker processes.
+
+    Texts are sorted by length and dealt round-robin to workers, so every
+    shard has a similar amount of work and each worker encodes
+    similar-length texts together (little padding).
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        num_workers: int,
+        batch_size: int = 64,
+        normalize_embeddings: bool = True,
+        model_factory: Callable[[str], Any] = load_sentence_transformer,
+    ):
+        """
+        Start the worker pool.
+
+        Args:
+            model_name: sentence-transformers model to load in each worker
+            num_workers: Number of worker processes
+            batch_size: Encode batch size inside each worker
+            normalize_embeddings: L2-normalize embeddings (matches EmbeddingManager)
+            model_factory: Picklable top-level function loading the model by name
+        """
+        self.model_name = model_name
+        self.num_workers = max(1, num_workers)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(
+                model_name,
+                {
+                    'batch_size': batch_size,
+                    'normalize_embeddings': normalize_embeddings,
+                },
+                model_factory,
+            ),
+        )
+        self.dimension = self._executor.submit(_worker_dimension).result()
+        atexit.register(self.close)
+        logger.info(
+            f'Embedding worker pool started: {self.num_workers} workers, '
+            f'model={model_name}, dim={self.dimension}'
+        )
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed texts across all workers.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embeddings in the order of ``texts``
+        """
+        if not texts:
+            return []
+
+        shape = (len(texts), self.dimension)
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        shards = [order[w :: self.num_workers] for w in range(self.num_workers)]
+
+        shm = shared_memory.SharedMemory(
+            create=True, size=int(np.prod(shape)) * np.dtype(np.float32).itemsize
+        )
+        try:
+            futures = [
+                self._executor.submit(
+                    _encode_into, shm.name, shape, rows, [texts[i] for i in rows]
+                )
+                for rows in shards
+                if rows
+            ]
+            for future in futures:
+                future.result()
+            view = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+            result = view.tolist()
+            del view  # release the buffer export before closing the segment
+        finally:
+            shm.close()
+            shm.unlink()
+        return result
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -12,6 +12,11 @@ from langchain_openai import OpenAIEmbeddings
 from loguru import logger
 
 from thoth.config import config
+from thoth.rag.adaptive_batching import AdaptiveBatcher
+
+# sentence-transformers encode batch size. Kept small for CPU memory safety;
+# AdaptiveBatcher decides how many texts are handed to each encode call.
+LOCAL_ENCODE_BATCH_SIZE = 4
 
 # HuggingFaceEmbeddings is imported lazily to avoid requiring the heavy
 # sentence-transformers / PyTorch dependencies when using API-based embeddings
@@ -67,6 +72,18 @@ class EmbeddingManager:
             else:
                 logger.warning(f'Some environment issues remain: {remaining_issues}')
 
+        # Token-budgeted batching for local models (OpenAI batches server-side)
+        rag_config = self.config.rag_config
+        self.batcher = AdaptiveBatcher(
+            token_budget=rag_config.local_embedding_token_budget,
+            max_batch_size=rag_config.local_embedding_max_batch_size,
+            max_rss_mb=rag_config.local_embedding_max_rss_mb,
+        )
+
+        # Optional multi-process pool for local models (started on first use)
+        self.num_workers = rag_config.embedding_workers
+        self._worker_pool = None
+
         # Initialize embeddings
         self._init_embeddings()
 
@@ -165,7 +182,7 @@ class EmbeddingManager:
                 },
                 encode_kwargs={
                     'normalize_embeddings': True,
-                    'batch_size': 4,  # Even smaller batch size to prevent memory issues
+                    'batch_size': LOCAL_ENCODE_BATCH_SIZE,
                     'convert_to_numpy': True,  # Convert to numpy to free torch memory
                 },
                 show_progress=False,  # Disable progress display
@@ -186,7 +203,7 @@ class EmbeddingManager:
                     },
                     encode_kwargs={
                         'normalize_embeddings': True,
-                        'batch_size': 4,
+                        'batch_size': LOCAL_ENCODE_BATCH_SIZE,
                         'convert_to_numpy': True,
                     },
                     show_progress=False,
@@ -197,6 +214,35 @@ class EmbeddingManager:
                 logger.error(f'Failed to initialize fallback embeddings: {fallback_e}')
                 raise
 
+        self.batcher.token_counter = self._tokenizer_counter() or (
+            self.batcher.token_counter
+        )
+
+    def _tokenizer_counter(self) -> Any | None:
+        """
+        Return a function counting tokens with the local model's tokenizer.
+
+        Lengths are capped at the model's max sequence length, since longer
+        texts are truncated before encoding. Returns None (keeping the
+        word-count estimate) if the tokenizer is not reachable.
+        """
+        model = getattr(self.embeddings, '_client', None)
+        tokenizer = getattr(model, 'tokenizer', None)
+        if tokenizer is None:
+            return None
+        max_length = getattr(model, 'max_seq_length', None)
+
+        def count_tokens(texts: list[str]) -> list[int]:
+            encoded = tokenizer(
+                texts,
+                add_special_tokens=True,
+                truncation=max_length is not None,
+                max_length=max_length,
+            )
+            return [len(ids) for ids in encoded['input_ids']]
+
+        return count_tokens
+
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """
         Create embeddings for a list of documents.
@@ -214,15 +260,12 @@ class EmbeddingManager:
             if self.is_openai_model:
                 # OpenAI embeddings handle batching automatically
                 embeddings = self.embeddings.embed_documents(texts)
+            elif (pool := self._get_worker_pool()) is not None:
+                # Shard across worker processes, one model per core
+                embeddings = pool.embed_documents(texts)
             else:
-                # Process in smaller batches to prevent memory issues for local models
-                batch_size = 8
-                embeddings = []
-
-                for i in range(0, len(texts), batch_size):
-                    batch = texts[i : i + batch_size]
-                    batch_embeddings = self.embeddings.embed_documents(batch)
-                    embeddings.extend(batch_embeddings)
+                # Length-sorted, token-budgeted batches tuned by latency and RSS
+                embeddings = self.batcher.embed(texts, self.embeddings.embed_documents)
 
             logger.debug(f'Successfully embedded {len(embeddings)} documents')
             return embeddings
@@ -230,6 +273,33 @@ class EmbeddingManager:
             logger.error(f'Error embedding documents: {e}')
             raise
 
+    def _get_worker_pool(self) -> Any | None:
+        """
+        Return the embedding worker pool, starting it on first use.
+
+        Only used for local models when ``embeddingWorkers`` > 1. If the pool
+        cannot start, embedding falls back to the in-process batcher.
+        """
+        if self.is_openai_model or self.num_workers <= 1:
+            return None
+        if self._worker_pool is None:
+            try:
+                from thoth.rag.embedding_workers import EmbeddingWorkerPool
+
+                self._worker_pool = EmbeddingWorkerPool(
+                    model_name=self.model,
+                    num_workers=self.num_workers,
+                    batch_size=LOCAL_ENCODE_BATCH_SIZE,
+                )
+            except Exception as e:
+                logger.warning(
+                    f'Could not start embedding worker pool, '
+                    f'using in-process embedding: {e}'
+                )
+                self.num_workers = 0
+                return None
+        return self._worker_pool
+
     def embed_query(self, text: str) -> list[float]:
         """
         Create embedding for a single query text.
@@ -28,6 +28,8 @@ async def run_rag_evaluation(
     output_dir: Path = Path('./rag_evaluation_results'),
     use_existing_ground_truth: Path | None = None,
     k_values: list = [1, 3, 5, 10],  # noqa: B006
+    full_text_backend: str | None = None,
+    reranker_provider: str | None = None,
 ) -> RAGMetrics:
     """
     Run comprehensive RAG pipeline evaluation.
@@ -46,6 +48,10 @@ async def run_rag_evaluation(
         output_dir: Directory for evaluation results
         use_existing_ground_truth: Path to existing ground truth file
         k_values: Values of K for Precision@K, Recall@K, NDCG@K metrics
+        full_text_backend: Override the configured full-text backend (e.g. run
+            once with 'tsvector' and once with 'bm25' to compare them)
+        reranker_provider: Override the configured reranker (e.g. compare
+            'cross-encoder' against 'llm' on the same ground truth)
 
     Returns:
         RAGMetrics object with comprehensive evaluation results
@@ -55,6 +61,12 @@ async def run_rag_evaluation(
 
     # Initialize services
     config = Config()
+    if full_text_backend:
+        config.rag_config.full_text_backend = full_text_backend
+        logger.info(f'Using full-text backend: {full_text_backend}')
+    if reranker_provider:
+        config.rag_config.reranker_provider = reranker_provider
+        logger.info(f'Using reranker provider: {reranker_provider}')
     postgres = PostgresService(config)
     await postgres.initialize()
 
@@ -255,6 +267,18 @@ def main():
         default=None,
         help='Path to existing ground truth file',
     )
+    parser.add_argument(
+        '--backend',
+        choices=['tsvector', 'bm25', 'paradedb'],
+        default=None,
+        help='Full-text search backend to evaluate (defaults to config)',
+    )
+    parser.add_argument(
+        '--reranker',
+        choices=['auto', 'cohere', 'llm', 'cross-encoder', 'none'],
+        default=None,
+        help='Reranker provider to evaluate (defaults to config)',
+    )
 
     args = parser.parse_args()
 
@@ -263,6 +287,8 @@ def main():
             num_samples=args.samples,
             output_dir=args.output,
             use_existing_ground_truth=args.ground_truth,
+            full_text_backend=args.backend,
+            reranker_provider=args.reranker,
         )
     )
 
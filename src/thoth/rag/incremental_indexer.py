@@ -0,0 +1,122 @@
+"""
+Incremental re-indexing of a single paper.
+
+Watcher-triggered re-indexes usually follow a small edit to one note. Rather
+than rewriting every chunk by position, the new split is aligned with the
+stored chunks by content hash (see ``chunk_diff``): only inserted or changed
+chunks are enriched, embedded and written, removed chunks are deleted, and
+unchanged chunks keep their IDs, with just their index and positional metadata
+refreshed. Work is proportional to the size of the edit, not of the paper.
+"""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from langchain_core.documents import Document
+from loguru import logger
+
+from thoth.rag.chunk_diff import diff_chunks
+from thoth.rag.streaming_indexer import IndexJob
+from thoth.rag.vector_store import StaleChunksError, VectorStoreManager
+
+
+class IncrementalIndexer:
+    """
+    Re-indexes papers by applying a content-hash diff of their chunks.
+
+    Papers without stored chunks are simply inserted. If the stored chunks
+    change while a diff is being prepared (a concurrent re-index of the same
+    paper), the diff is recomputed once against the new state.
+    """
+
+    def __init__(
+        self,
+        vector_store: VectorStoreManager,
+        split_fn: Callable[[str, dict[str, Any]], list[Document]],
+        enricher: Any | None = None,
+        max_attempts: int = 2,
+    ):
+        """
+        Initialize the incremental indexer.
+
+        Args:
+            vector_store: Vector store used for embeddings and chunk writes
+            split_fn: Function splitting ``(content, metadata)`` into chunks
+            enricher: Optional ContextualEnricher applied to changed chunks
+            max_attempts: Diff/apply attempts before a concurrent change is
+                reported as an error
+        """
+        self.vector_store = vector_store
+        self.split_fn = split_fn
+        self.enricher = enricher
+        self.max_attempts = max(1, max_attempts)
+
+    async def index_async(self, job: IndexJob) -> list[str]:
+        """
+        Re-index a single paper.
+
+        Args:
+            job: Paper to index
+
+        Returns:
+            List of document chunk IDs in chunk order
+
+        Raises:
+            StaleChunksError: If the paper kept changing concurrently
+        """
+        documents = await asyncio.to_thread(self.split_fn, job.content, job.metadata)
+        hashes = [self.vector_store.chunk_hash(doc) for doc in documents]
+
+        attempt = 1
+        while True:
+            try:
+                return await self._apply_diff(job, documents, hashes)
+            except StaleChunksError:
+                if attempt >= self.max_attempts:
+                    raise
+                attempt += 1
+                logger.warning(
+                    f'Chunks of paper {job.paper_id} changed during re-index, '
+                    'recomputing diff'
+                )
+
+    async def _apply_diff(
+        self, job: IndexJob, documents: list[Document], hashes: list[str]
+    ) -> list[str]:
+        """Diff against the stored chunks, then embed and write the changes."""
+        stored = await self.vector_store.get_chunk_hashes_async(job.paper_id)
+        diff = diff_chunks(stored, hashes)
+        changed_indexes = diff.changed_indexes
+
+        prepared = list(documents)
+        changed = [documents[idx] for idx in changed_indexes]
+        if changed and self.enricher and self.enricher.enabled:
+            # Context is generated from the whole new document, but only for
+            # the chunks that actually need to be written
+            changed = await self.enricher.enrich_chunks_async(
+                chunks=changed,
+                document_text=job.content,
+                document_title=job.title,
+            )
+        for idx, doc in zip(changed_indexes, changed):  # noqa: B905
+            prepared[idx] = doc
+
+        vectors = await self.vector_store.embed_documents_async(
+            [doc.page_content for doc in changed]
+        )
+        ids = await self.vector_store.apply_chunk_diff_async(
+            job.paper_id,
+            prepared,
+            diff,
+            dict(zip(changed_indexes, vectors)),  # noqa: B905
+            expected_ids=[chunk_id for chunk_id, _ in stored],
+            user_id=job.user_id,
+        )
+
+        logger.info(
+            f'Incremental re-index of {job.paper_id}: '
+            f'{len(diff.keep)} unchanged, {len(diff.update)} rewritten, '
+            f'{len(diff.insert)} inserted, {len(diff.delete)} deleted'
+        )
+        return ids
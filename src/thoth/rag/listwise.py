@@ -0,0 +1,140 @@
+"""
+Listwise LLM scoring helpers shared by DocumentGrader and LLMReranker.
+
+Pointwise grading sends one LLM request per document, repeating the query and
+instructions in every prompt. Listwise grading packs several documents,
+truncated to a token budget, into one prompt that asks for a JSON object with
+one grade or score per document. All grading calls go through a shared
+semaphore so a large candidate set cannot trip provider rate limits.
+"""
+
+import asyncio
+import json
+import re
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+from langchain_core.documents import Document
+
+# Rough chars-per-token ratio for budgeting without loading a tokenizer
+CHARS_PER_TOKEN = 4
+
+_max_concurrency = 8
+# asyncio.Semaphore is bound to the loop it is first used on, and grading
+# runs under asyncio.run() from sync graph nodes, so keep one per loop
+_semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = weakref.WeakKeyDictionary()
+
+
+def configure_llm_concurrency(limit: int) -> None:
+    """Set the maximum number of concurrent grading/reranking LLM calls."""
+    global _max_concurrency
+    _max_concurrency = max(1, limit)
+    _semaphores.clear()
+
+
+def llm_semaphore() -> asyncio.Semaphore:
+    """Shared semaphore capping grading/reranking LLM calls on this loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_max_concurrency)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+def pack_documents(
+    documents: list[Document],
+    batch_size: int,
+    token_budget: int,
+    max_chars_per_document: int,
+) -> list[list[tuple[int, str]]]:
+    """
+    Split documents into listwise batches.
+
+    Each document is truncated to ``max_chars_per_document`` and a batch is
+    closed once it holds ``batch_size`` documents or the next document would
+    exceed ``token_budget``. A single document larger than the budget is
+    truncated to fit on its own.
+
+    Args:
+        documents: Documents to pack
+        batch_size: Maximum documents per batch
+        token_budget: Approximate document tokens allowed per batch
+        max_chars_per_document: Per-document character cap
+
+    Returns:
+        Batches of (index into documents, truncated content)
+    """
+    budget_chars = max(1, token_budget) * CHARS_PER_TOKEN
+    batches: list[list[tuple[int, str]]] = []
+    current: list[tuple[int, str]] = []
+    used = 0
+
+    for index, doc in enumerate(documents):
+        content = doc.page_content[:max_chars_per_document][:budget_chars]
+        if current and (
+            len(current) >= max(1, batch_size) or used + len(content) > budget_chars
+        ):
+            batches.append(current)
+            current, used = [], 0
+        current.append((index, content))
+        used += len(content)
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def format_documents(batch: list[tuple[int, str]], documents: list[Document]) -> str:
+    """Render a batch as numbered documents (numbering starts at 1)."""
+    sections = []
+    for number, (index, content) in enumerate(batch, start=1):
+        metadata = documents[index].metadata
+        header = f'[{number}]'
+        if title := metadata.get('title') or metadata.get('paper_title'):
+            header += f' Title: {title}'
+        sections.append(f'{header}\n{content}')
+    return '\n\n'.join(sections)
+
+
+def parse_listwise_response(
+    content: str, count: int, convert: Callable[[Any], Any]
+) -> list[Any]:
+    """
+    Parse a JSON object mapping document numbers (1..count) to values.
+
+    Args:
+        content: Raw LLM response text
+        count: Number of documents in the batch
+        convert: Converts one raw value, raising ValueError if it is invalid
+
+    Returns:
+        Converted values in document order
+
+    Raises:
+        ValueError: If the response is not valid JSON or misses a document
+    """
+    text = content.strip()
+    # Extract JSON if wrapped in markdown code blocks or surrounded by prose
+    match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', text, re.DOTALL)
+    if match:
+        text = match.group(1)
+    elif not text.startswith('{'):
+        match = re.search(r'\{.*\}', text, re.DOTALL)
+        if match:
+            text = match.group(0)
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f'Invalid listwise JSON: {e}') from e
+    if not isinstance(data, dict):
+        raise ValueError('Listwise response is not a JSON object')
+
+    values = []
+    for number in range(1, count + 1):
+        if str(number) not in data:
+            raise ValueError(f'Listwise response is missing document {number}')
+        values.append(convert(data[str(number)]))
+    return values
@@ -0,0 +1,167 @@
+"""
+In-process LRU/TTL cache for query embeddings.
+
+Every search embeds its query text, and the agentic pipeline re-runs searches
+for the same expanded or rewritten queries several times per question. With a
+remote embedding provider each of those is a network round trip. This cache
+keeps recent query vectors keyed by (model, text) and coalesces concurrent
+identical requests, so only one embedding call is ever in flight per key.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Any
+
+Embedding = list[float]
+
+
+class QueryEmbeddingCache:
+    """
+    Bounded, thread-safe LRU cache with per-entry expiry.
+
+    ``get_or_embed_async`` runs the embedding call in a worker thread as a
+    task shared by all concurrent callers asking for the same key, so a
+    caller that is cancelled does not cancel the others. Vectors are stored
+    as tuples and every caller gets its own list. Failed calls are not cached.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached query vectors
+            ttl_seconds: Seconds an entry stays valid
+        """
+        self.maxsize = max(1, maxsize)
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], tuple[float, tuple[float, ...]]] = (
+            OrderedDict()
+        )
+        self._inflight: dict[tuple[str, str], asyncio.Task[Embedding]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get(self, model: str, text: str) -> Embedding | None:
+        """Return a cached vector (counted as a hit) or None."""
+        key = (model, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, vector = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(vector)
+
+    def put(self, model: str, text: str, vector: Sequence[float]) -> None:
+        """Store a vector, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[(model, text)] = (
+                time.monotonic() + self.ttl_seconds,
+                tuple(vector),
+            )
+            self._entries.move_to_end((model, text))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    async def get_or_embed_async(
+        self, model: str, text: str, embed_fn: Callable[[str], Embedding]
+    ) -> Embedding:
+        """
+        Return the cached vector, or embed it once for all concurrent callers.
+
+        Args:
+            model: Embedding model identifier (part of the key)
+            text: Query text
+            embed_fn: Blocking function embedding one query
+
+        Returns:
+            The query embedding
+        """
+        vector = self.get(model, text)
+        if vector is not None:
+            return vector
+
+        key = (model, text)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._inflight.get(key)
+            if task is not None and task.get_loop() is loop:
+                self.coalesced += 1
+            else:
+                self.misses += 1
+                task = loop.create_task(self._embed(key, embed_fn))
+                task.add_done_callback(_retrieve_exception)
+                self._inflight[key] = task
+
+        # shield: cancelling this caller must not cancel the shared call
+        return list(await asyncio.shield(task))
+
+    async def _embed(
+        self, key: tuple[str, str], embed_fn: Callable[[str], Embedding]
+    ) -> Embedding:
+        """Embed ``key``'s text in a worker thread and cache the result."""
+        try:
+            vector = await asyncio.to_thread(embed_fn, key[1])
+            self.put(*key, vector)
+            return vector
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is asyncio.current_task():
+                    del self._inflight[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for metrics collection."""
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hit_rate': (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            }
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    """Mark a failure retrieved so one every caller abandoned is not logged."""
+    if not task.cancelled():
+        task.exception()
+
+
+_shared_cache: QueryEmbeddingCache | None = None
+_shared_lock = threading.Lock()
+
+
+def get_query_embedding_cache(
+    maxsize: int = 1024, ttl_seconds: float = 3600.0
+) -> QueryEmbeddingCache:
+    """
+    Process-wide cache shared by all vector stores.
+
+    The first call fixes the size and TTL; later calls return the same cache.
+    """
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = QueryEmbeddingCache(maxsize, ttl_seconds)
+        return _shared_cache
+
+
+def query_embedding_cache_stats() -> dict[str, Any] | None:
+    """Stats of the shared cache, or None if no search has created it yet."""
+    return _shared_cache.stats() if _shared_cache is not None else None
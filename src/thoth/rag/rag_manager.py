@@ -7,27 +7,31 @@ system, coordinating embeddings, vector storage, and question answering.
 
 from pathlib import Path  # noqa: I001
 from typing import Any
+from uuid import UUID
 
-from langchain_text_splitters import (
-    RecursiveCharacterTextSplitter,
-    MarkdownHeaderTextSplitter,
-)
 from langchain_core.documents import Document
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from loguru import logger
 
+from thoth.rag.answer_cache import SemanticAnswerCache, scope_key
+from thoth.rag.embedding_cache import resolve_model_name
+from thoth.rag.chunker import MarkdownChunker
 from thoth.rag.embeddings import EmbeddingManager
 from thoth.rag.vector_store import VectorStoreManager
+from thoth.rag.streaming_indexer import IndexJob, IndexResult, StreamingIndexer
+from thoth.rag.incremental_indexer import IncrementalIndexer
 from thoth.rag.reranker import create_reranker, BaseReranker
-from thoth.rag.contextual_enrichment import ContextualEnricher
+from thoth.rag.contextual_enrichment import ChunkContextCache, ContextualEnricher
 from thoth.rag.query_router import QueryRouter
 from thoth.rag.agentic_retrieval import AgenticRAGOrchestrator
 from thoth.rag.document_grader import DocumentGrader
+from thoth.rag.listwise import configure_llm_concurrency
 from thoth.rag.hallucination_checker import HallucinationChecker
 from thoth.rag.knowledge_refiner import KnowledgeRefiner
 from thoth.mcp.auth import get_mcp_user_id
 from thoth.utilities import OpenRouterClient
+from thoth.utilities.async_utils import run_async_safely
 from thoth.config import config
 
 
@@ -101,30 +105,14 @@ class RAGManager:
         self.vector_store_manager = VectorStoreManager(
             collection_name=self.collection_name,
             persist_directory=self.vector_db_path,
-            embedding_function=self.embedding_manager.get_embedding_model(),
+            embedding_function=self.embedding_manager,
         )
 
-        # Initialize text splitters (two-stage for markdown)
-        # Stage 1: Split by markdown headers to preserve document structure
-        self.header_splitter = MarkdownHeaderTextSplitter(
-            headers_to_split_on=[
-                ('#', 'h1'),
-                ('##', 'h2'),
-                ('###', 'h3'),
-                ('####', 'h4'),
-            ],
-            strip_headers=False,  # Keep headers in content for context
-        )
-
-        # Stage 2: Split large sections into smaller chunks (token-based)
-        # disallowed_special=() lets text like <|endoftext|> pass through
-        # without raising -- common in ML textbooks and technical docs
-        self.text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
-            encoding_name=self.chunk_encoding,
+        # Header sections and token-bounded sub-chunks from one encode pass
+        self.chunker = MarkdownChunker(
             chunk_size=self.chunk_size,
             chunk_overlap=self.chunk_overlap,
-            separators=['\n\n', '\n', ' ', ''],
-            disallowed_special=(),
+            encoding_name=self.chunk_encoding,
         )
 
         # Initialize LLM for QA
@@ -135,6 +123,9 @@ class RAGManager:
             max_tokens=self.config.rag_config.qa.max_tokens,
         )
 
+        # Cap concurrent grading/reranking LLM calls across all components
+        configure_llm_concurrency(self.config.rag_config.llm_grading_max_concurrency)
+
         # Initialize reranker
         if self.config.rag_config.reranking_enabled:
             api_keys = {
@@ -145,6 +136,11 @@ class RAGManager:
                 api_keys=api_keys,
                 llm_client=self.llm,
                 reranker_model=self.config.rag_config.reranker_model,
+                cross_encoder_model=self.config.rag_config.cross_encoder_model,
+                cross_encoder_batch_size=self.config.rag_config.cross_encoder_batch_size,
+                llm_mode=self.config.rag_config.llm_grading_mode,
+                llm_batch_size=self.config.rag_config.llm_grading_batch_size,
+                llm_token_budget=self.config.rag_config.llm_grading_token_budget,
             )
             logger.debug(f'Initialized reranker: {self.reranker.get_name()}')
         else:
@@ -153,16 +149,46 @@ class RAGManager:
             self.reranker = NoOpReranker()
             logger.debug('Reranking disabled')
 
+        # Semantic answer cache (near-identical questions skip the QA pipeline)
+        self.answer_cache: SemanticAnswerCache | None = None
+        if self.config.rag_config.answer_cache_enabled:
+            self.answer_cache = SemanticAnswerCache(
+                self.vector_store_manager.get_pool,
+                embedding_model=resolve_model_name(self.embedding_manager),
+                similarity_threshold=self.config.rag_config.answer_cache_similarity_threshold,
+                ttl_seconds=self.config.rag_config.answer_cache_ttl_hours * 3600,
+            )
+
         # Initialize contextual enricher
         contextual_enabled = getattr(
             self.config.rag_config, 'contextual_enrichment_enabled', False
         )
+        context_cache = None
+        if self.config.rag_config.contextual_enrichment_cache_enabled:
+            context_cache = ChunkContextCache(self.vector_store_manager.get_pool)
         self.contextual_enricher = ContextualEnricher(
             llm_client=self.llm,
             enabled=contextual_enabled,
+            cache=context_cache,
         )
         logger.debug(f'Contextual enrichment: {contextual_enabled}')
 
+        # Initialize streaming indexer (overlaps embedding with DB writes)
+        self.streaming_indexer = StreamingIndexer(
+            vector_store=self.vector_store_manager,
+            split_fn=self._split_markdown_content,
+            enricher=self.contextual_enricher,
+            batch_size=self.config.rag_config.streaming_index_batch_size,
+            queue_depth=self.config.rag_config.streaming_index_queue_depth,
+        )
+
+        # Single-paper re-indexes only rewrite the chunks that changed
+        self.incremental_indexer = IncrementalIndexer(
+            vector_store=self.vector_store_manager,
+            split_fn=self._split_markdown_content,
+            enricher=self.contextual_enricher,
+        )
+
         # Initialize query router
         routing_enabled = getattr(
             self.config.rag_config, 'adaptive_routing_enabled', False
@@ -185,6 +211,9 @@ class RAGManager:
             self.document_grader = DocumentGrader(
                 llm_client=self.llm,
                 threshold=agentic_config.confidence_threshold,
+                batch_size=self.config.rag_config.llm_grading_batch_size,
+                mode=self.config.rag_config.llm_grading_mode,
+                token_budget=self.config.rag_config.llm_grading_token_budget,
             )
 
             # Initialize hallucination checker
@@ -403,127 +432,22 @@ class RAGManager:
             List of document IDs that were indexed.
         """
         import asyncio
-        from uuid import UUID
-
-        import asyncpg
 
         try:
-            logger.info(f'Indexing paper by ID: {paper_id}')
-            paper_uuid = UUID(paper_id)
-
-            db_url = getattr(self.config.secrets, 'database_url', None)
-            if not db_url:
-                raise ValueError('DATABASE_URL not configured - PostgreSQL is required')
-
-            async def fetch_and_index():
-                resolved_user_id = user_id or get_mcp_user_id()
-                conn = await asyncpg.connect(db_url)
-                try:
-                    # Fetch paper details and markdown content including collection info
-                    row = await conn.fetchrow(
-                        """
-                        SELECT
-                            pm.id,
-                            pm.title,
-                            pm.doi,
-                            pm.authors,
-                            pm.collection_id,
-                            pm.document_category,
-                            kc.name as collection_name,
-                            pp.markdown_content
-                        FROM paper_metadata pm
-                        LEFT JOIN processed_papers pp ON pp.paper_id = pm.id
-                        LEFT JOIN knowledge_collections kc ON kc.id = pm.collection_id
-                        WHERE pm.id = $1 AND pm.user_id = $2
-                        """,
-                        paper_uuid,
-                        resolved_user_id,
-                    )
-
-                    if not row:
-                        raise ValueError(f'Paper not found: {paper_id}')
-
-                    content = markdown_content or row['markdown_content']
-                    if not content:
-                        logger.warning(f'No markdown content for paper {paper_id}')
-                        return []
-
-                    # Strip image references from content if configured
-                    if (
-                        self.config.rag_config.skip_files_with_images
-                        and self._has_images(content)
-                    ):
-                        logger.debug(
-                            f'Stripping image references from paper {paper_id}'
-                        )
-                        content = self._strip_images(content)
-
-                        # Check if there's still meaningful content after
-                        # stripping images
-                        if len(content.strip()) < 100:
-                            logger.warning(
-                                f'Paper {paper_id} has insufficient content after image removal'
-                            )
-                            return []
-
-                    # Prepare metadata including collection info
-                    metadata = {
-                        'paper_id': str(row['id']),
-                        'title': row['title'] or 'Unknown',
-                        'doi': row['doi'],
-                        'authors': row['authors'],
-                        'document_type': 'article',
-                        'source': f'database:paper:{paper_id}',
-                        'document_category': row['document_category']
-                        or 'research_paper',
-                    }
-
-                    # Add collection metadata if present
-                    if row['collection_id']:
-                        metadata['collection_id'] = str(row['collection_id'])
-                        metadata['collection_name'] = row['collection_name']
-
-                    # Split into chunks using two-stage strategy
-                    documents = self._split_markdown_content(content, metadata)
-                    logger.debug(
-                        f'Split paper into {len(documents)} chunks using two-stage strategy'
-                    )
-
-                    # Apply contextual enrichment if enabled
-                    if self.contextual_enricher.enabled:
-                        documents = await self.contextual_enricher.enrich_chunks_async(
-                            chunks=documents,
-                            document_text=content,
-                            document_title=row['title'],
-                        )
-                        logger.debug('Applied contextual enrichment to chunks')
-
-                    # Index documents using async method
-                    doc_ids = await self.vector_store_manager.add_documents_async(
-                        documents, paper_id=paper_uuid, user_id=user_id
-                    )
-                    logger.info(
-                        f'Successfully indexed {len(doc_ids)} chunks for paper {paper_id}'
+            asyncio.get_running_loop()
+            raise RuntimeError(
+                'index_paper_by_id() called from async context. '
+                "Use 'await index_paper_by_id_async()' instead."
+            )
+        except RuntimeError as e:
+            if 'no running event loop' in str(e).lower():
+                return asyncio.run(
+                    self.index_paper_by_id_async(
+                        paper_id, markdown_content=markdown_content, user_id=user_id
                     )
-                    return doc_ids
-                finally:
-                    await conn.close()
-
-            try:
-                asyncio.get_running_loop()
-                raise RuntimeError(
-                    'index_paper_by_id() called from async context. '
-                    "Use 'await index_paper_by_id_async()' instead."
                 )
-            except RuntimeError as e:
-                if 'no running event loop' in str(e).lower():
-                    return asyncio.run(fetch_and_index())
-                else:
-                    raise
-
-        except Exception as e:
-            logger.error(f'Error indexing paper {paper_id}: {e}')
-            raise
+            else:
+                raise
 
     async def index_paper_by_id_async(
         self,
@@ -543,96 +467,198 @@ class RAGManager:
         Returns:
             List of document IDs that were indexed.
         """
-        from uuid import UUID
-
         import asyncpg
 
         try:
             logger.info(f'Indexing paper by ID (async): {paper_id}')
             paper_uuid = UUID(paper_id)
 
-            db_url = getattr(self.config.secrets, 'database_url', None)
-            if not db_url:
-                raise ValueError('DATABASE_URL not configured - PostgreSQL is required')
-
-            conn = await asyncpg.connect(db_url)
+            conn = await asyncpg.connect(self._get_database_url())
             try:
-                resolved_user_id = user_id or get_mcp_user_id()
-                row = await conn.fetchrow(
-                    """
-                    SELECT
-                        pm.id,
-                        pm.title,
-                        pm.doi,
-                        pm.authors,
-                        pm.collection_id,
-                        pm.document_category,
-                        kc.name as collection_name,
-                        pp.markdown_content
-                    FROM paper_metadata pm
-                    LEFT JOIN processed_papers pp ON pp.paper_id = pm.id
-                    LEFT JOIN knowledge_collections kc ON kc.id = pm.collection_id
-                    WHERE pm.id = $1 AND pm.user_id = $2
-                    """,
-                    paper_uuid,
-                    resolved_user_id,
+                job = await self._build_index_job(
+                    conn, paper_uuid, user_id, markdown_content
                 )
+            finally:
+                await conn.close()
+
+            if job is None:
+                return []
 
-                if not row:
-                    raise ValueError(f'Paper not found: {paper_id}')
-
-                content = markdown_content or row['markdown_content']
-                if not content:
-                    logger.warning(f'No markdown content for paper {paper_id}')
-                    return []
-
-                if self.config.rag_config.skip_files_with_images and self._has_images(
-                    content
-                ):
-                    content = self._strip_images(content)
-                    if len(content.strip()) < 100:
-                        logger.warning(
-                            f'Paper {paper_id} has insufficient content after image removal'
-                        )
-                        return []
-
-                metadata = {
-                    'paper_id': str(row['id']),
-                    'title': row['title'] or 'Unknown',
-                    'doi': row['doi'],
-                    'authors': row['authors'],
-                    'document_type': 'article',
-                    'source': f'database:paper:{paper_id}',
-                    'document_category': row['document_category'] or 'research_paper',
-                }
-
-                if row['collection_id']:
-                    metadata['collection_id'] = str(row['collection_id'])
-                    metadata['collection_name'] = row['collection_name']
-
-                documents = self._split_markdown_content(content, metadata)
+            if self.config.rag_config.incremental_reindex_enabled:
+                doc_ids = await self.incremental_indexer.index_async(job)
+            elif self.config.rag_config.streaming_index_enabled:
+                doc_ids = await self.streaming_indexer.index_async(job)
+            else:
+                documents = self._split_markdown_content(job.content, job.metadata)
 
                 if self.contextual_enricher.enabled:
                     documents = await self.contextual_enricher.enrich_chunks_async(
                         chunks=documents,
-                        document_text=content,
-                        document_title=row['title'],
+                        document_text=job.content,
+                        document_title=job.title,
                     )
 
                 doc_ids = await self.vector_store_manager.add_documents_async(
                     documents, paper_id=paper_uuid, user_id=user_id
                 )
-                logger.info(
-                    f'Successfully indexed {len(doc_ids)} chunks for paper {paper_id}'
-                )
-                return doc_ids
-            finally:
-                await conn.close()
+            logger.info(
+                f'Successfully indexed {len(doc_ids)} chunks for paper {paper_id}'
+            )
+            return doc_ids
 
         except Exception as e:
             logger.error(f'Error indexing paper {paper_id} (async): {e}')
             raise
 
+    async def index_papers_streaming_async(
+        self,
+        paper_ids: list[str],
+        user_id: str | None = None,
+    ) -> list[IndexResult]:
+        """
+        Index many papers through one streaming pipeline.
+
+        Papers are fetched one at a time as the chunking stage asks for them, so
+        the reindex keeps embedding and database writes busy concurrently
+        without loading every paper up front. Per-paper failures are reported
+        in the results rather than aborting the run.
+
+        Args:
+            paper_ids: UUIDs of the papers to index.
+            user_id: Optional user ID for multi-tenant isolation.
+
+        Returns:
+            One IndexResult per paper, in input order. Papers without
+            content have ``skip_reason`` set.
+        """
+        import asyncpg
+
+        fetch_failures: dict[UUID, IndexResult] = {}
+
+        async def jobs(conn: asyncpg.Connection):
+            for paper_id in paper_ids:
+                paper_uuid = UUID(paper_id)
+                try:
+                    job = await self._build_index_job(conn, paper_uuid, user_id)
+                except Exception as e:
+                    logger.error(f'Error loading paper {paper_id} for indexing: {e}')
+                    fetch_failures[paper_uuid] = IndexResult(paper_uuid, error=e)
+                    continue
+                if job is None:
+                    fetch_failures[paper_uuid] = IndexResult(
+                        paper_uuid, skip_reason='no content'
+                    )
+                    continue
+                yield job
+
+        conn = await asyncpg.connect(self._get_database_url())
+        try:
+            indexed = await self.streaming_indexer.index_many_async(jobs(conn))
+        finally:
+            await conn.close()
+
+        by_id = {result.paper_id: result for result in indexed}
+        by_id.update(fetch_failures)
+        return [
+            by_id.get(paper_uuid, IndexResult(paper_uuid))
+            for paper_uuid in map(UUID, paper_ids)
+        ]
+
+    def _get_database_url(self) -> str:
+        """Return the configured PostgreSQL URL or raise if it is missing."""
+        db_url = getattr(self.config.secrets, 'database_url', None)
+        if not db_url:
+            raise ValueError('DATABASE_URL not configured - PostgreSQL is required')
+        return db_url
+
+    async def _build_index_job(
+        self,
+        conn: Any,
+        paper_uuid: UUID,
+        user_id: str | None = None,
+        markdown_content: str | None = None,
+    ) -> IndexJob | None:
+        """
+        Load a paper row and turn it into an IndexJob.
+
+        Args:
+            conn: Open asyncpg connection.
+            paper_uuid: Paper UUID.
+            user_id: Optional user ID for multi-tenant isolation.
+            markdown_content: Optional content overriding the stored markdown.
+
+        Returns:
+            IndexJob, or None if the paper has nothing worth indexing.
+
+        Raises:
+            ValueError: If the paper does not exist for this user.
+        """
+        resolved_user_id = user_id or get_mcp_user_id()
+        # Fetch paper details and markdown content including collection info
+        row = await conn.fetchrow(
+            """
+            SELECT
+                pm.id,
+                pm.title,
+                pm.doi,
+                pm.authors,
+                pm.collection_id,
+                pm.document_category,
+                kc.name as collection_name,
+                pp.markdown_content
+            FROM paper_metadata pm
+            LEFT JOIN processed_papers pp ON pp.paper_id = pm.id
+            LEFT JOIN knowledge_collections kc ON kc.id = pm.collection_id
+            WHERE pm.id = $1 AND pm.user_id = $2
+            """,
+            paper_uuid,
+            resolved_user_id,
+        )
+
+        if not row:
+            raise ValueError(f'Paper not found: {paper_uuid}')
+
+        content = markdown_content or row['markdown_content']
+        if not content:
+            logger.warning(f'No markdown content for paper {paper_uuid}')
+            return None
+
+        # Strip image references from content if configured
+        if self.config.rag_config.skip_files_with_images and self._has_images(content):
+            logger.debug(f'Stripping image references from paper {paper_uuid}')
+            content = self._strip_images(content)
+
+            # Check if there's still meaningful content after stripping images
+            if len(content.strip()) < 100:
+                logger.warning(
+                    f'Paper {paper_uuid} has insufficient content after image removal'
+                )
+                return None
+
+        # Prepare metadata including collection info
+        metadata = {
+            'paper_id': str(row['id']),
+            'title': row['title'] or 'Unknown',
+            'doi': row['doi'],
+            'authors': row['authors'],
+            'document_type': 'article',
+            'source': f'database:paper:{paper_uuid}',
+            'document_category': row['document_category'] or 'research_paper',
+        }
+
+        # Add collection metadata if present
+        if row['collection_id']:
+            metadata['collection_id'] = str(row['collection_id'])
+            metadata['collection_name'] = row['collection_name']
+
+        return IndexJob(
+            paper_id=paper_uuid,
+            content=content,
+            metadata=metadata,
+            title=row['title'],
+            user_id=user_id,
+        )
+
     def index_markdown_file(
         self,
         file_path: Path,
@@ -876,23 +902,71 @@ class RAGManager:
             logger.error(f'Error searching documents: {e}')
             raise
 
+    async def _lookup_cached_answer(
+        self,
+        question: str,
+        mode: str,
+        k: int,
+        filter: dict[str, Any] | None,
+    ) -> tuple[dict[str, Any] | None, tuple[list[float], str, str] | None]:
+        """
+        Look up a semantically equivalent, previously answered question.
+
+        Args:
+            question: The question to answer
+            mode: Answering pipeline ('standard' or 'agentic')
+            k: Number of documents retrieved for context
+            filter: Metadata filter applied to retrieval
+
+        Returns:
+            Tuple of (cached response or None, cache key for storing the
+            fresh answer or None if the cache is unavailable)
+        """
+        if self.answer_cache is None:
+            return None, None
+        try:
+            embedding = await self.vector_store_manager.embed_query_async(question)
+        except Exception as e:
+            logger.warning(f'Answer cache skipped, could not embed question: {e}')
+            return None, None
+
+        cache_key = (embedding, get_mcp_user_id(), scope_key(mode, k, filter))
+        return await self.answer_cache.lookup(*cache_key), cache_key
+
+    async def _store_cached_answer(
+        self,
+        question: str,
+        cache_key: tuple[list[float], str, str] | None,
+        response: dict[str, Any],
+    ) -> None:
+        """Cache a freshly generated answer under the key from the lookup."""
+        if self.answer_cache is None or cache_key is None:
+            return
+        embedding, user_id, scope = cache_key
+        await self.answer_cache.store(question, embedding, user_id, scope, response)
+
     def answer_question(
         self,
         question: str,
         k: int = 4,
         filter: dict[str, Any] | None = None,
         return_sources: bool = True,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """
         Answer a question using the RAG system.
 
-        Uses hybrid search and reranking if enabled in configuration.
+        Uses hybrid search and reranking if enabled in configuration. A
+        near-identical question answered before (same user, k and filter) is
+        served from the semantic answer cache; the response's ``cache`` entry
+        says whether it was.
 
         Args:
             question: The question to answer.
             k: Number of documents to retrieve for context (after reranking).
             filter: Optional metadata filter for retrieval.
             return_sources: Whether to return source documents.
+            use_cache: Whether to consult and fill the semantic answer cache.
 
         Returns:
             Dictionary containing the answer and optionally source documents.
@@ -900,6 +974,16 @@ class RAGManager:
         try:
             logger.info(f'Answering question: {question}')
 
+            cache_key = None
+            if use_cache and self.answer_cache is not None:
+                cached, cache_key = run_async_safely(
+                    self._lookup_cached_answer(question, 'standard', k, filter)
+                )
+                if cached is not None:
+                    if not return_sources:
+                        cached.pop('sources', None)
+                    return cached
+
             # Retrieve relevant documents (uses reranking if enabled)
             docs = self.search(
                 query=question,
@@ -937,16 +1021,23 @@ Answer:"""
             response = {
                 'question': question,
                 'answer': answer,
-            }
-
-            if return_sources:
-                response['sources'] = []
-                for doc in docs:
-                    source_info = {
+                'sources': [
+                    {
                         'content': doc.page_content[:200] + '...',  # Preview
                         'metadata': doc.metadata,
                     }
-                    response['sources'].append(source_info)
+                    for doc in docs
+                ],
+            }
+
+            if cache_key is not None:
+                run_async_safely(
+                    self._store_cached_answer(question, cache_key, response)
+                )
+                response['cache'] = {'hit': False}
+
+            if not return_sources:
+                del response['sources']
 
             logger.info('Successfully generated answer')
             return response
@@ -962,13 +1053,16 @@ Answer:"""
         max_retries: int = 2,
         progress_callback: Any = None,
         return_sources: bool = True,
+        filter: dict[str, Any] | None = None,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """
         Answer question using agentic retrieval (async).
 
         Uses the AgenticRAGOrchestrator for adaptive, self-correcting retrieval
         with query classification, expansion, document grading, query rewriting,
-        and hallucination detection.
+        and hallucination detection. Grounded answers are kept in the semantic
+        answer cache, so a near-identical later question skips the graph.
 
         Args:
             question: The question to answer
@@ -976,6 +1070,9 @@ Answer:"""
             max_retries: Maximum number of retrieval retries on low confidence
             progress_callback: Optional callback for progress updates (step, message)
             return_sources: Whether to return source documents
+            filter: Caller scope filter; answers are cached per filter (the
+                graph extracts its own retrieval filters from the question)
+            use_cache: Whether to consult and fill the semantic answer cache
 
         Returns:
             Dictionary containing answer, sources, and metadata
@@ -994,12 +1091,24 @@ Answer:"""
             return self.answer_question(
                 question=question,
                 k=k,
+                filter=filter,
                 return_sources=return_sources,
+                use_cache=use_cache,
             )
 
         try:
             logger.info(f'Answering question with agentic RAG: {question}')
 
+            cache_key = None
+            if use_cache:
+                cached, cache_key = await self._lookup_cached_answer(
+                    question, 'agentic', k, filter
+                )
+                if cached is not None:
+                    if not return_sources:
+                        cached.pop('sources', None)
+                    return cached
+
             # Use agentic orchestrator
             result = await self.agentic_orchestrator.answer_question_async(
                 query=question,
@@ -1016,10 +1125,18 @@ Answer:"""
                 'is_grounded': result['is_grounded'],
                 'query_type': result['query_type'],
                 'retry_count': result['retry_count'],
+                'retrieval_assessment': result.get('retrieval_assessment', ''),
+                'sources': result['sources'],
             }
 
-            if return_sources:
-                response['sources'] = result['sources']
+            if cache_key is not None:
+                # Ungrounded answers are not worth repeating
+                if result['is_grounded']:
+                    await self._store_cached_answer(question, cache_key, response)
+                response['cache'] = {'hit': False}
+
+            if not return_sources:
+                del response['sources']
 
             logger.info(
                 f'Agentic RAG completed: confidence={result["confidence"]:.2f}, '
@@ -1038,6 +1155,8 @@ Answer:"""
         max_retries: int = 2,
         progress_callback: Any = None,
         return_sources: bool = True,
+        filter: dict[str, Any] | None = None,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """
         Answer question using agentic retrieval (sync wrapper).
@@ -1048,6 +1167,8 @@ Answer:"""
             max_retries: Maximum number of retrieval retries
             progress_callback: Optional callback for progress updates
             return_sources: Whether to return source documents
+            filter: Caller scope filter (scopes the answer cache)
+            use_cache: Whether to consult and fill the semantic answer cache
 
         Returns:
             Dictionary containing answer, sources, and metadata
@@ -1071,6 +1192,8 @@ Answer:"""
                         max_retries=max_retries,
                         progress_callback=progress_callback,
                         return_sources=return_sources,
+                        filter=filter,
+                        use_cache=use_cache,
                     )
                 )
             else:
@@ -1145,10 +1268,10 @@ Answer:"""
         self, content: str, base_metadata: dict[str, Any]
     ) -> list[Document]:
         """
-        Split markdown content using two-stage strategy.
+        Split markdown content into header sections and token-bounded chunks.
 
-        Stage 1: Split by markdown headers to preserve document structure
-        Stage 2: Subdivide large sections using token-based chunking
+        Sections larger than ``chunk_size`` tokens are subdivided with
+        ``chunk_overlap`` tokens of overlap; see ``MarkdownChunker``.
 
         Args:
             content: Markdown content to split
@@ -1157,79 +1280,4 @@ Answer:"""
         Returns:
             List of Document objects with hierarchical metadata
         """
-        # Stage 1: Split by headers
-        header_splits = self.header_splitter.split_text(content)
-
-        # Stage 2: Further split large sections
-        all_documents = []
-        chunk_index = 0
-
-        for header_doc in header_splits:
-            # Extract header hierarchy from metadata
-            header_metadata = (
-                header_doc.metadata if hasattr(header_doc, 'metadata') else {}
-            )
-
-            # Build section path from headers
-            section_path = []
-            heading_level = 0
-            for i in range(1, 5):  # h1 through h4
-                header_key = f'h{i}'
-                if header_key in header_metadata:
-                    section_path.append(header_metadata[header_key])
-                    heading_level = i
-
-            # Check if section is large enough to need further splitting
-            section_text = (
-                header_doc.page_content
-                if hasattr(header_doc, 'page_content')
-                else str(header_doc)
-            )
-
-            # Count tokens approximately
-            import tiktoken
-
-            try:
-                enc = tiktoken.get_encoding(self.chunk_encoding)
-                token_count = len(enc.encode(section_text, disallowed_special=()))
-            except Exception:
-                # Fallback: estimate tokens as words * 1.3
-                token_count = len(section_text.split()) * 1.3
-
-            if token_count > self.chunk_size:
-                # Need to split this section further
-                subsections = self.text_splitter.split_text(section_text)
-
-                for i, subsection in enumerate(subsections):
-                    doc_metadata = {
-                        **base_metadata,
-                        'chunk_index': chunk_index,
-                        'section_path': section_path,
-                        'heading_level': heading_level,
-                        'is_subsection': True,
-                        'subsection_index': i,
-                        'total_subsections': len(subsections),
-                    }
-                    all_documents.append(
-                        Document(page_content=subsection, metadata=doc_metadata)
-                    )
-                    chunk_index += 1
-            else:
-                # Section is small enough, use as-is
-                doc_metadata = {
-                    **base_metadata,
-                    'chunk_index': chunk_index,
-                    'section_path': section_path,
-                    'heading_level': heading_level,
-                    'is_subsection': False,
-                }
-                all_documents.append(
-                    Document(page_content=section_text, metadata=doc_metadata)
-                )
-                chunk_index += 1
-
-        # Add total_chunks to all metadata
-        for doc in all_documents:
-            doc.metadata['total_chunks'] = len(all_documents)
-
-        return all_documents
+        return self.chunker.split(content, base_metadata)
@@ -4,16 +4,27 @@ Reranking strategies for RAG retrieval.
 Provides pluggable rerankers to refine initial retrieval results:
 - CohereReranker: Production-grade reranking via Cohere API
 - LLMReranker: Zero-cost reranking using existing OpenRouter LLMs
+- CrossEncoderReranker: Local cross-encoder with batched CPU inference
 - NoOpReranker: Passthrough when reranking is disabled
 """
 
 import asyncio
+import hashlib
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any
 
 from langchain_core.documents import Document
 from loguru import logger
 
+from thoth.rag.listwise import (
+    format_documents,
+    llm_semaphore,
+    pack_documents,
+    parse_listwise_response,
+)
+
 
 class BaseReranker(ABC):
     """
@@ -186,19 +197,27 @@ class CohereReranker(BaseReranker):
 
 class LLMReranker(BaseReranker):
     """
-    LLM-based pointwise reranking.
+    LLM-based reranking.
 
     Uses an existing LLM (via OpenRouterClient) to score each document's
     relevance to the query. Zero-cost approach using models you already pay for.
+    In ``listwise`` mode several documents are scored per call (JSON object of
+    scores); ``pointwise`` sends one call per document. Calls are capped by the
+    shared grading semaphore.
 
     Quality: ~70-80% of dedicated reranker, but with no additional API costs.
     """
 
+    MAX_DOCUMENT_CHARS = 500
+
     def __init__(
         self,
         llm_client: Any,
         model: str | None = None,
         temperature: float = 0.0,
+        mode: str = 'listwise',
+        batch_size: int = 10,
+        token_budget: int = 2000,
     ):
         """
         Initialize LLM reranker.
@@ -207,6 +226,9 @@ class LLMReranker(BaseReranker):
             llm_client: OpenRouterClient or compatible LLM client
             model: Optional model override (uses client's default if None)
             temperature: Temperature for scoring (0.0 for deterministic)
+            mode: 'listwise' or 'pointwise'
+            batch_size: Maximum documents per listwise scoring call
+            token_budget: Approximate document tokens per listwise call
         """
         self.llm_client = llm_client
         # OpenRouterClient stores model as model_name (inherits from ChatOpenAI)
@@ -214,7 +236,10 @@ class LLMReranker(BaseReranker):
             llm_client, 'model_name', getattr(llm_client, 'model', 'unknown')
         )
         self.temperature = temperature
-        logger.info(f'Initialized LLMReranker with model={self.model}')
+        self.mode = mode
+        self.batch_size = batch_size
+        self.token_budget = token_budget
+        logger.info(f'Initialized LLMReranker with model={self.model}, mode={mode}')
 
     async def rerank_async(
         self, query: str, documents: list[Document], top_n: int | None = None
@@ -222,8 +247,8 @@ class LLMReranker(BaseReranker):
         """
         Rerank documents using LLM-based relevance scoring.
 
-        Sends each document through an LLM with a relevance scoring prompt.
-        Scores in parallel using asyncio.gather for speed.
+        Scores documents in listwise batches (or one per call in pointwise
+        mode), in parallel up to the shared concurrency limit.
 
         Args:
             query: Search query
@@ -236,11 +261,31 @@ class LLMReranker(BaseReranker):
         if not documents:
             return []
 
-        # Score all documents in parallel
-        scoring_tasks = [self._score_document(query, doc) for doc in documents]
-
         try:
-            scores = await asyncio.gather(*scoring_tasks, return_exceptions=True)
+            if self.mode == 'listwise':
+                batches = pack_documents(
+                    documents,
+                    self.batch_size,
+                    self.token_budget,
+                    self.MAX_DOCUMENT_CHARS,
+                )
+                batch_scores = await asyncio.gather(
+                    *(self._score_batch(query, documents, batch) for batch in batches),
+                    return_exceptions=True,
+                )
+                scores: list[Any] = [None] * len(documents)
+                for batch, result in zip(batches, batch_scores):  # noqa: B905
+                    for position, (index, _) in enumerate(batch):
+                        scores[index] = (
+                            result
+                            if isinstance(result, Exception)
+                            else result[position]
+                        )
+            else:
+                scores = await asyncio.gather(
+                    *(self._score_document(query, doc) for doc in documents),
+                    return_exceptions=True,
+                )
 
             # Handle any errors in scoring
             doc_scores = []
@@ -273,6 +318,59 @@ class LLMReranker(BaseReranker):
         """Get reranker name."""
         return f'llm-{self.model}'
 
+    async def _score_batch(
+        self,
+        query: str,
+        documents: list[Document],
+        batch: list[tuple[int, str]],
+    ) -> list[float]:
+        """
+        Score a batch of documents with one listwise LLM call.
+
+        Falls back to per-document scoring if the response cannot be parsed.
+
+        Args:
+            query: Search query
+            documents: All documents being reranked
+            batch: (index, truncated content) pairs from pack_documents
+
+        Returns:
+            Relevance scores (0.0-1.0) in batch order
+        """
+        if len(batch) == 1:
+            return [await self._score_document(query, documents[batch[0][0]])]
+
+        prompt = f"""Rate how relevant each numbered document is to the query on a scale from 0 to 1.
+Output ONLY a JSON object mapping every document number to its score, e.g. {{"1": 0.8, "2": 0.1}}.
+
+Query: {query}
+
+Documents:
+{format_documents(batch, documents)}
+
+Scores (JSON):"""
+
+        try:
+            async with llm_semaphore():
+                response = await asyncio.to_thread(self.llm_client.invoke, prompt)
+            return parse_listwise_response(
+                response.content,
+                len(batch),
+                lambda value: max(0.0, min(1.0, float(value))),
+            )
+        except Exception as e:
+            logger.warning(
+                f'Listwise scoring failed ({e}), scoring {len(batch)} documents individually'
+            )
+            return list(
+                await asyncio.gather(
+                    *(
+                        self._score_document(query, documents[index])
+                        for index, _ in batch
+                    )
+                )
+            )
+
     async def _score_document(self, query: str, document: Document) -> float:
         """
         Score a single document's relevance to query using LLM.
@@ -288,7 +386,7 @@ class LLMReranker(BaseReranker):
             Relevance score (0.0-1.0)
         """
         # Truncate document if too long (keep first 500 chars)
-        content = document.page_content[:500]
+        content = document.page_content[: self.MAX_DOCUMENT_CHARS]
 
         prompt = f"""Rate how relevant this document is to the query on a scale from 0 to 1.
 Output ONLY a number between 0 and 1, nothing else.
@@ -300,8 +398,8 @@ Document: {content}
 Relevance score (0-1):"""
 
         try:
-            # Create a temporary client with temperature=0 for deterministic scoring
-            response = await asyncio.to_thread(self.llm_client.invoke, prompt)
+            async with llm_semaphore():
+                response = await asyncio.to_thread(self.llm_client.invoke, prompt)
 
             # Extract score from response
             score_text = response.content.strip()
@@ -330,11 +428,177 @@ Relevance score (0-1):"""
             return 0.5  # Default to neutral on error
 
 
+class CrossEncoderReranker(BaseReranker):
+    """
+    Local cross-encoder reranker.
+
+    Scores (query, document) pairs with a small sentence-transformers
+    cross-encoder in batched CPU inference, so reranking 50 candidates is a
+    few forward passes instead of 50 LLM calls and works without network
+    access. Scores are cached per (query hash, chunk id and content hash), so
+    repeated or refined queries over the same candidates only score the new
+    pairs, and a chunk rewritten in place by a reindex is scored again.
+    """
+
+    DEFAULT_MODEL = 'cross-encoder/ms-marco-MiniLM-L-6-v2'
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        batch_size: int = 32,
+        max_length: int = 512,
+        cache_size: int = 4096,
+        model: Any = None,
+    ):
+        """
+        Initialize cross-encoder reranker.
+
+        The model is loaded on first use; pass ``model`` to supply an already
+        loaded cross-encoder (anything with ``predict(pairs, batch_size=...)``).
+
+        Args:
+            model_name: Hugging Face cross-encoder model name or local path
+            batch_size: Pairs scored per forward pass
+            max_length: Maximum tokens per (query, document) pair
+            cache_size: Maximum cached pair scores (0 disables the cache)
+            model: Optional preloaded cross-encoder
+        """
+        self.model_name = model_name
+        self.batch_size = max(1, batch_size)
+        self.max_length = max_length
+        self.cache_size = max(0, cache_size)
+        self._model = model
+        self._model_lock = threading.Lock()
+        self._cache: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        if model is None:
+            # Fail at construction (like CohereReranker) so the factory can
+            # fall back; the model itself is loaded lazily
+            try:
+                import sentence_transformers  # noqa: F401
+            except ImportError:
+                logger.error(
+                    'sentence-transformers not installed. Install with: '
+                    'pip install sentence-transformers'
+                )
+                raise
+
+        logger.info(f'Initialized CrossEncoderReranker with model={model_name}')
+
+    def _get_model(self) -> Any:
+        """Load the cross-encoder on first use (CPU only)."""
+        with self._model_lock:
+            if self._model is None:
+                from sentence_transformers import CrossEncoder
+
+                self._model = CrossEncoder(
+                    self.model_name, max_length=self.max_length, device='cpu'
+                )
+                logger.info(f'Loaded cross-encoder {self.model_name}')
+            return self._model
+
+    @staticmethod
+    def _query_key(query: str) -> str:
+        return hashlib.sha256(query.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _document_key(document: Document) -> str:
+        """Hash of the scored content, prefixed by the chunk id when known."""
+        digest = hashlib.sha256(document.page_content.encode('utf-8')).hexdigest()
+        chunk_id = document.metadata.get('chunk_id')
+        return digest if chunk_id is None else f'{chunk_id}:{digest}'
+
+    def _score_pairs(self, query: str, documents: list[Document]) -> list[float]:
+        """Score documents against query, running the model only on cache misses."""
+        query_key = self._query_key(query)
+        keys = [(query_key, self._document_key(doc)) for doc in documents]
+        scores: list[float | None] = [None] * len(documents)
+
+        with self._cache_lock:
+            for i, key in enumerate(keys):
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    scores[i] = self._cache[key]
+
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if missing:
+            pairs = [(query, documents[i].page_content) for i in missing]
+            predicted = self._get_model().predict(
+                pairs, batch_size=self.batch_size, show_progress_bar=False
+            )
+            with self._cache_lock:
+                for i, score in zip(missing, predicted):  # noqa: B905
+                    scores[i] = float(score)
+                    if self.cache_size:
+                        self._cache[keys[i]] = scores[i]
+                        self._cache.move_to_end(keys[i])
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        logger.debug(
+            f'Cross-encoder scored {len(missing)} pairs '
+            f'({len(documents) - len(missing)} cached)'
+        )
+        return scores  # type: ignore[return-value]
+
+    async def rerank_async(
+        self, query: str, documents: list[Document], top_n: int | None = None
+    ) -> list[Document]:
+        """
+        Rerank documents using the local cross-encoder.
+
+        Inference runs in a worker thread so it does not block the event loop.
+
+        Args:
+            query: Search query
+            documents: Initial candidates
+            top_n: Number of results to return
+
+        Returns:
+            Documents reordered by cross-encoder score
+        """
+        if not documents:
+            return []
+
+        try:
+            scores = await asyncio.to_thread(self._score_pairs, query, documents)
+        except Exception as e:
+            logger.error(f'Cross-encoder reranking failed: {e}')
+            # Fallback: return original order
+            return documents[:top_n] if top_n else documents
+
+        doc_scores = []
+        for doc, score in zip(documents, scores):  # noqa: B905
+            doc.metadata['rerank_score'] = score
+            doc.metadata['rerank_model'] = self.model_name
+            doc_scores.append((doc, score))
+
+        # Stable sort keeps retrieval order for equal scores
+        doc_scores.sort(key=lambda x: x[1], reverse=True)
+        reranked = [doc for doc, _ in doc_scores]
+        return reranked[:top_n] if top_n else reranked
+
+    def clear_cache(self) -> None:
+        """Drop all cached pair scores."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def get_name(self) -> str:
+        """Get reranker name."""
+        return f'cross-encoder-{self.model_name}'
+
+
 def create_reranker(
     provider: str,
     api_keys: dict[str, str],
     llm_client: Any = None,
     reranker_model: str = 'rerank-v3.5',
+    cross_encoder_model: str = CrossEncoderReranker.DEFAULT_MODEL,
+    cross_encoder_batch_size: int = 32,
+    llm_mode: str = 'listwise',
+    llm_batch_size: int = 10,
+    llm_token_budget: int = 2000,
 ) -> BaseReranker:
     """
     Factory function to create appropriate reranker based on config.
@@ -342,23 +606,38 @@ def create_reranker(
     Auto-detection logic:
     1. If provider='cohere' and cohere_key is set -> CohereReranker
     2. If provider='llm' and llm_client provided -> LLMReranker
-    3. If provider='auto':
+    3. If provider='cross-encoder' -> CrossEncoderReranker (local, offline)
+    4. If provider='auto':
        - Try Cohere if key available
        - Fall back to LLM if llm_client available
        - Fall back to NoOp if neither available
-    4. If provider='none' -> NoOpReranker
+    5. If provider='none' -> NoOpReranker
 
     Args:
-        provider: Reranker provider ('auto', 'cohere', 'llm', 'none')
+        provider: Reranker provider ('auto', 'cohere', 'llm', 'cross-encoder',
+            'none')
         api_keys: Dict with API keys (must include 'cohere_key' if using Cohere)
         llm_client: OpenRouterClient for LLM-based reranking
         reranker_model: Model name for Cohere reranker
+        cross_encoder_model: Model name or path for the cross-encoder reranker
+        cross_encoder_batch_size: Pairs per forward pass for the cross-encoder
+        llm_mode: LLM reranker scoring mode ('listwise' or 'pointwise')
+        llm_batch_size: Documents per listwise LLM reranker call
+        llm_token_budget: Approximate document tokens per listwise call
 
     Returns:
         BaseReranker instance
     """
     provider = provider.lower()
 
+    def _llm_reranker() -> LLMReranker:
+        return LLMReranker(
+            llm_client,
+            mode=llm_mode,
+            batch_size=llm_batch_size,
+            token_budget=llm_token_budget,
+        )
+
     # Explicit provider choices
     if provider == 'none':
         logger.info('Reranking disabled (provider=none)')
@@ -376,7 +655,7 @@ def create_reranker(
         except ImportError:
             logger.warning('Cohere package not installed, falling back to LLM reranker')
             if llm_client:
-                return LLMReranker(llm_client)
+                return _llm_reranker()
             return NoOpReranker()
 
     if provider == 'llm':
@@ -385,7 +664,21 @@ def create_reranker(
                 'LLM provider selected but no LLM client, falling back to NoOp'
             )
             return NoOpReranker()
-        return LLMReranker(llm_client)
+        return _llm_reranker()
+
+    if provider == 'cross-encoder':
+        try:
+            return CrossEncoderReranker(
+                model_name=cross_encoder_model,
+                batch_size=cross_encoder_batch_size,
+            )
+        except ImportError:
+            logger.warning(
+                'sentence-transformers not installed, falling back to LLM reranker'
+            )
+            if llm_client:
+                return _llm_reranker()
+            return NoOpReranker()
 
     # Auto-detection (provider='auto')
     if provider == 'auto':
@@ -401,7 +694,7 @@ def create_reranker(
         # Fall back to LLM reranker
         if llm_client:
             logger.info('Auto-detected LLM reranker (OpenRouter available)')
-            return LLMReranker(llm_client)
+            return _llm_reranker()
 
         # No reranking available
         logger.info('No reranker available, using NoOp (add cohere_key or llm_client)')
@@ -409,4 +702,14 @@ def create_reranker(
 
     # Unknown provider
     logger.warning(f'Unknown reranker provider: {provider}, falling back to auto')
-    return create_reranker('auto', api_keys, llm_client, reranker_model)
+    return create_reranker(
+        'auto',
+        api_keys,
+        llm_client,
+        reranker_model,
+        cross_encoder_model,
+        cross_encoder_batch_size,
+        llm_mode,
+        llm_batch_size,
+        llm_token_budget,
+    )
@@ -36,7 +36,8 @@ class FullTextSearchBackend(ABC):
             conn: Active PostgreSQL connection
             query: Search query text
             k: Number of results to return
-            filter_clause: Optional SQL WHERE clause for filtering
+            filter_clause: Optional SQL WHERE clause for filtering; its
+                placeholders start at ``$3``
             filter_params: Parameters for filter_clause
 
         Returns:
@@ -49,6 +50,41 @@ class FullTextSearchBackend(ABC):
         """Get human-readable backend name."""
         pass
 
+    def candidate_sql(
+        self,
+        query_ref: str,  # noqa: ARG002
+        limit_ref: str,  # noqa: ARG002
+        filter_clause: str = '',  # noqa: ARG002
+    ) -> str | None:
+        """
+        SQL selecting ranked candidate chunks, for embedding in a larger query.
+
+        Lets hybrid search compute text candidates, vector candidates and RRF
+        fusion in a single statement. The returned SELECT must yield ``id`` and
+        ``rank`` (1 = best) for at most ``limit_ref`` rows.
+
+        Args:
+            query_ref: SQL placeholder holding the query text (e.g. ``$2``)
+            limit_ref: SQL placeholder holding the candidate limit
+            filter_clause: Optional SQL condition on ``dc`` (document_chunks)
+
+        Returns:
+            SQL string, or None if the backend cannot be inlined (callers then
+            fall back to ``search``)
+        """
+        return None
+
+    async def prepare(self, conn: asyncpg.Connection) -> None:  # noqa: ARG002
+        """
+        Make sure the database supports this backend.
+
+        Called once per connection pool. The default backend needs nothing.
+
+        Args:
+            conn: Active PostgreSQL connection
+        """
+        return None
+
 
 class TsVectorBackend(FullTextSearchBackend):
     """
@@ -59,7 +95,7 @@ class TsVectorBackend(FullTextSearchBackend):
 
     Note: ts_rank_cd doesn't use global corpus statistics (IDF), making it
     less sophisticated than true BM25. However, it's fast and functional
-    for most use cases. For production BM25, consider ParadeDBBackend.
+    for most use cases. For BM25 without extensions, use BM25Backend.
     """
 
     def __init__(self, language: str = 'english'):
@@ -118,7 +154,7 @@ class TsVectorBackend(FullTextSearchBackend):
             WHERE dc.search_vector @@ query
             {f'AND {filter_clause}' if filter_clause else ''}
             ORDER BY rank DESC
-            LIMIT $3
+            LIMIT ${3 + len(filter_params)}
         """
 
         # Build parameter list
@@ -155,11 +191,221 @@ class TsVectorBackend(FullTextSearchBackend):
             # Return empty results on error (fail gracefully)
             return []
 
+    def candidate_sql(
+        self, query_ref: str, limit_ref: str, filter_clause: str = ''
+    ) -> str | None:
+        """Ranked tsvector candidates (same ranking as ``search``)."""
+        # language comes from code/config, never from user input
+        return f"""
+            SELECT id, ROW_NUMBER() OVER (ORDER BY text_rank DESC) AS rank
+            FROM (
+                SELECT dc.id, ts_rank_cd(dc.search_vector, tsq) AS text_rank
+                FROM document_chunks dc,
+                plainto_tsquery('{self.language}', {query_ref}) AS tsq
+                WHERE dc.search_vector @@ tsq
+                {f'AND {filter_clause}' if filter_clause else ''}
+                ORDER BY text_rank DESC
+                LIMIT {limit_ref}
+            ) ranked_text
+        """  # nosec B608
+
     def get_backend_name(self) -> str:
         """Get backend name."""
         return 'tsvector'
 
 
+class BM25Backend(FullTextSearchBackend):
+    """
+    Okapi BM25 scored in plain SQL, without extensions.
+
+    Term frequencies come from the positions stored in
+    ``document_chunks.search_vector``; document frequencies and the average
+    chunk length come from the ``bm25_term_stats`` and ``bm25_corpus_stats``
+    tables, which triggers keep current as chunks are inserted, updated or
+    deleted (migration 011; ``prepare`` installs the triggers the first time the
+    backend is used). Candidate chunks are found through the existing GIN index
+    with an OR query over the query lexemes, capped at the ``max_candidates``
+    best by ``ts_rank``, then scored as::
+
+        idf(t) = ln(1 + (N - df(t) + 0.5) / (df(t) + 0.5))
+        score  = sum idf(t) * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len / avglen))
+    """
+
+    def __init__(
+        self,
+        language: str = 'english',
+        k1: float = 1.2,
+        b: float = 0.75,
+        max_candidates: int = 1000,
+    ):
+        """
+        Initialize BM25 backend.
+
+        Args:
+            language: PostgreSQL text search configuration (e.g., 'english', 'french')
+            k1: Term-frequency saturation
+            b: Document length normalization (0 = none, 1 = full)
+            max_candidates: Matching chunks scored per query; common query
+                terms can match most of the corpus, so only the best by
+                ``ts_rank`` are scored
+        """
+        self.language = language
+        self.k1 = float(k1)
+        self.b = float(b)
+        self.max_candidates = int(max_candidates)
+        logger.debug(
+            f'Initialized BM25Backend with language={language}, k1={k1}, b={b}, '
+            f'max_candidates={self.max_candidates}'
+        )
+
+    async def prepare(self, conn: asyncpg.Connection) -> None:
+        """Install the statistics triggers and backfill them on first use."""
+        if await conn.fetchval('SELECT bm25_stats_enabled()'):
+            return
+        logger.info('Building BM25 corpus statistics (first use of bm25 backend)')
+        await conn.execute('SELECT bm25_rebuild_stats()')
+
+    def _scored_sql(self, query_ref: str, filter_clause: str = '') -> str:
+        """CTEs ending in ``scored(id, score)`` for the query in ``query_ref``."""
+        # language, k1 and b come from code/config, never from user input
+        return f"""
+            WITH query_terms AS (
+                SELECT DISTINCT u.lexeme
+                FROM unnest(to_tsvector('{self.language}', {query_ref})) AS u
+            ),
+            corpus AS (
+                SELECT
+                    GREATEST(COALESCE(SUM(doc_count), 0), 1)::float8 AS n,
+                    GREATEST(
+                        COALESCE(SUM(total_length)::float8 / NULLIF(SUM(doc_count), 0), 1),
+                        1
+                    ) AS avg_len
+                FROM bm25_corpus_stats
+            ),
+            weighted_terms AS (
+                SELECT
+                    q.lexeme,
+                    ln(1 + (c.n - COALESCE(s.doc_freq, 0) + 0.5)
+                        / (COALESCE(s.doc_freq, 0) + 0.5)) AS idf
+                FROM query_terms q
+                CROSS JOIN corpus c
+                LEFT JOIN bm25_term_stats s ON s.lexeme = q.lexeme
+            ),
+            any_term AS (
+                SELECT replace(
+                    plainto_tsquery('{self.language}', {query_ref})::text, ' & ', ' | '
+                )::tsquery AS tsq
+            ),
+            candidates AS (
+                SELECT dc.id, dc.search_vector
+                FROM document_chunks dc, any_term a
+                WHERE dc.search_vector @@ a.tsq
+                {f'AND {filter_clause}' if filter_clause else ''}
+                ORDER BY ts_rank(dc.search_vector, a.tsq) DESC
+                LIMIT {self.max_candidates}
+            ),
+            matches AS (
+                SELECT id, search_vector, bm25_doc_length(search_vector) AS doc_len
+                FROM candidates
+            ),
+            scored AS (
+                SELECT
+                    m.id,
+                    SUM(
+                        w.idf * (tf.freq * {self.k1 + 1})
+                        / (tf.freq + {self.k1} * (1 - {self.b} + {self.b} * m.doc_len / c.avg_len))
+                    ) AS score
+                FROM matches m
+                CROSS JOIN corpus c
+                CROSS JOIN LATERAL (
+                    SELECT u.lexeme, COALESCE(array_length(u.positions, 1), 1) AS freq
+                    FROM unnest(m.search_vector) AS u
+                ) tf
+                JOIN weighted_terms w ON w.lexeme = tf.lexeme
+                GROUP BY m.id
+            )
+        """  # nosec B608
+
+    async def search(
+        self,
+        conn: asyncpg.Connection,
+        query: str,
+        k: int,
+        filter_clause: str = '',
+        filter_params: list[Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Execute full-text search ranked by BM25."""
+        if filter_params is None:
+            filter_params = []
+
+        query_sql = f"""
+            {self._scored_sql('$1', filter_clause)}
+            SELECT
+                dc.id,
+                dc.paper_id,
+                dc.content,
+                dc.metadata,
+                dc.chunk_type,
+                dc.chunk_index,
+                p.title,
+                p.doi,
+                p.authors,
+                s.score
+            FROM scored s
+            JOIN document_chunks dc ON dc.id = s.id
+            JOIN papers p ON dc.paper_id = p.id
+            ORDER BY s.score DESC
+            LIMIT $2
+        """  # nosec B608
+
+        params = [query, k, *filter_params]
+
+        try:
+            rows = await conn.fetch(query_sql, *params)
+
+            results = [
+                {
+                    'id': row['id'],
+                    'paper_id': row['paper_id'],
+                    'content': row['content'],
+                    'metadata': row['metadata'],
+                    'chunk_type': row['chunk_type'],
+                    'chunk_index': row['chunk_index'],
+                    'title': row['title'],
+                    'doi': row['doi'],
+                    'authors': row['authors'],
+                    'rank': float(row['score']),
+                    'score': float(row['score']),
+                }
+                for row in rows
+            ]
+
+            logger.debug(
+                f'BM25 search found {len(results)} results for query: {query[:50]}'
+            )
+            return results
+
+        except asyncpg.exceptions.PostgresError as e:
+            logger.error(f'BM25 search failed: {e}')
+            return []
+
+    def candidate_sql(
+        self, query_ref: str, limit_ref: str, filter_clause: str = ''
+    ) -> str | None:
+        """Ranked BM25 candidates (same ranking as ``search``)."""
+        return f"""
+            {self._scored_sql(query_ref, filter_clause)}
+            SELECT id, ROW_NUMBER() OVER (ORDER BY score DESC) AS rank
+            FROM scored
+            ORDER BY score DESC
+            LIMIT {limit_ref}
+        """  # nosec B608
+
+    def get_backend_name(self) -> str:
+        """Get backend name."""
+        return 'bm25'
+
+
 class ParadeDBBackend(FullTextSearchBackend):
     """
     ParadeDB pg_search extension backend for true BM25 ranking.
@@ -217,6 +463,12 @@ class ParadeDBBackend(FullTextSearchBackend):
         logger.debug('ParadeDB not implemented, using TsVector fallback')
         return await self._fallback.search(conn, query, k, filter_clause, filter_params)
 
+    def candidate_sql(
+        self, query_ref: str, limit_ref: str, filter_clause: str = ''
+    ) -> str | None:
+        """STUB: Currently uses the TsVectorBackend candidate query."""
+        return self._fallback.candidate_sql(query_ref, limit_ref, filter_clause)
+
     def get_backend_name(self) -> str:
         """Get backend name."""
         return 'paradedb (stub)'
@@ -227,7 +479,7 @@ def create_backend(backend_type: str = 'tsvector') -> FullTextSearchBackend:
     Factory function to create appropriate full-text search backend.
 
     Args:
-        backend_type: Backend type ('tsvector' or 'paradedb')
+        backend_type: Backend type ('tsvector', 'bm25' or 'paradedb')
 
     Returns:
         FullTextSearchBackend instance
@@ -239,6 +491,8 @@ def create_backend(backend_type: str = 'tsvector') -> FullTextSearchBackend:
 
     if backend_type == 'tsvector':
         return TsVectorBackend()
+    elif backend_type == 'bm25':
+        return BM25Backend()
     elif backend_type == 'paradedb':
         return ParadeDBBackend()
     else:
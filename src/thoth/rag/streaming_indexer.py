@@ -0,0 +1,258 @@
+"""
+Pipelined streaming indexer for the RAG system.
+
+Indexes papers through three stages connected by bounded queues:
+
+1. Chunking: split each paper (and optionally enrich its chunks), then emit
+   fixed-size micro-batches.
+2. Embedding: embed one micro-batch at a time in a worker thread (cached
+   chunks are skipped).
+3. Writing: upsert each embedded micro-batch into ``document_chunks``.
+
+Because the stages run concurrently, batch N+1 is being embedded while batch N
+is written to PostgreSQL, and at most ``queue_depth`` batches per stage are held
+in memory instead of every vector of a paper (or of a whole reindex run).
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from langchain_core.documents import Document
+from loguru import logger
+
+from thoth.rag.contextual_enrichment import EnrichmentStats
+from thoth.rag.vector_store import VectorStoreManager
+
+
+@dataclass
+class IndexJob:
+    """A single paper to index."""
+
+    paper_id: UUID
+    content: str
+    metadata: dict[str, Any]
+    title: str | None = None
+    user_id: str | None = None
+
+
+@dataclass
+class IndexResult:
+    """Outcome of indexing one paper."""
+
+    paper_id: UUID
+    ids: list[str] = field(default_factory=list)
+    error: Exception | None = None
+    enrichment: EnrichmentStats | None = None
+    # Why nothing was indexed for a paper that did not fail (e.g. no content)
+    skip_reason: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    @property
+    def skipped(self) -> bool:
+        return self.error is None and self.skip_reason is not None
+
+
+@dataclass
+class _Batch:
+    """A micro-batch of chunks travelling through the pipeline."""
+
+    job: IndexJob
+    result: IndexResult
+    start_index: int
+    documents: list[Document]
+    embeddings: list[list[float]] | None = None
+
+
+class StreamingIndexer:
+    """
+    Overlaps chunk embedding with database writes.
+
+    Each paper is still split as a whole (chunk metadata such as
+    ``total_chunks`` depends on the full split), but embedding and writing
+    happen per micro-batch. A failure while indexing one paper is recorded on
+    that paper's ``IndexResult`` and its remaining batches are skipped; other
+    papers in the same run are unaffected.
+    """
+
+    def __init__(
+        self,
+        vector_store: VectorStoreManager,
+        split_fn: Callable[[str, dict[str, Any]], list[Document]],
+        enricher: Any | None = None,
+        batch_size: int = 32,
+        queue_depth: int = 2,
+    ):
+        """
+        Initialize the streaming indexer.
+
+        Args:
+            vector_store: Vector store used for embeddings and chunk writes
+            split_fn: Function splitting ``(content, metadata)`` into chunks
+            enricher: Optional ContextualEnricher applied before embedding
+            batch_size: Chunks per embed/write micro-batch
+            queue_depth: Micro-batches buffered between stages
+        """
+        self.vector_store = vector_store
+        self.split_fn = split_fn
+        self.enricher = enricher
+        self.batch_size = max(1, batch_size)
+        self.queue_depth = max(1, queue_depth)
+
+    async def index_async(self, job: IndexJob) -> list[str]:
+        """
+        Index a single paper.
+
+        Args:
+            job: Paper to index
+
+        Returns:
+            List of document chunk IDs in chunk order
+
+        Raises:
+            Exception: Whatever error stopped the paper from being indexed
+        """
+        (result,) = await self.index_many_async([job])
+        if result.error is not None:
+            raise result.error
+        return result.ids
+
+    async def index_many_async(
+        self, jobs: Iterable[IndexJob] | AsyncIterable[IndexJob]
+    ) -> list[IndexResult]:
+        """
+        Index a stream of papers through the pipeline.
+
+        Jobs may be produced lazily by an async iterable (e.g. fetched from the
+        database one paper at a time) so a bulk reindex never holds the whole
+        corpus in memory.
+
+        Args:
+            jobs: Papers to index
+
+        Returns:
+            One IndexResult per job, in job order
+        """
+        results: list[IndexResult] = []
+        embed_queue: asyncio.Queue[_Batch | None] = asyncio.Queue(self.queue_depth)
+        write_queue: asyncio.Queue[_Batch | None] = asyncio.Queue(self.queue_depth)
+        chunk_count = 0
+        started = time.perf_counter()
+
+        async def chunk_stage() -> None:
+            nonlocal chunk_count
+            async for job in _aiterate(jobs):
+                result = IndexResult(paper_id=job.paper_id)
+                results.append(result)
+                try:
+                    documents = await asyncio.to_thread(
+                        self.split_fn, job.content, job.metadata
+                    )
+                    if documents and self.enricher and self.enricher.enabled:
+                        (
+                            documents,
+                            result.enrichment,
+                        ) = await self.enricher.enrich_chunks_with_stats_async(
+                            chunks=documents,
+                            document_text=job.content,
+                            document_title=job.title,
+                        )
+                except Exception as e:
+                    self._fail(result, e, 'chunking')
+                    continue
+                if not documents:
+                    result.skip_reason = 'no chunks'
+                    logger.warning(f'No chunks to index for paper {job.paper_id}')
+                    continue
+
+                chunk_count += len(documents)
+                for start in range(0, len(documents), self.batch_size):
+                    await embed_queue.put(
+                        _Batch(
+                            job=job,
+                            result=result,
+                            start_index=start,
+                            documents=documents[start : start + self.batch_size],
+                        )
+                    )
+            await embed_queue.put(None)
+
+        async def embed_stage() -> None:
+            while (batch := await embed_queue.get()) is not None:
+                if batch.result.error is not None:
+                    continue
+                try:
+                    batch.embeddings = await self.vector_store.embed_documents_async(
+                        [doc.page_content for doc in batch.documents]
+                    )
+                except Exception as e:
+                    self._fail(batch.result, e, 'embedding')
+                    continue
+                await write_queue.put(batch)
+            await write_queue.put(None)
+
+        async def write_stage() -> None:
+            while (batch := await write_queue.get()) is not None:
+                if batch.result.error is not None:
+                    continue
+                try:
+                    ids = await self.vector_store.add_embedded_documents_async(
+                        batch.documents,
+                        batch.embeddings,
+                        paper_id=batch.job.paper_id,
+                        user_id=batch.job.user_id,
+                        start_index=batch.start_index,
+                    )
+                except Exception as e:
+                    self._fail(batch.result, e, 'writing')
+                    continue
+                batch.result.ids.extend(ids)
+
+        tasks = [
+            asyncio.create_task(chunk_stage()),
+            asyncio.create_task(embed_stage()),
+            asyncio.create_task(write_stage()),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        failed = sum(1 for result in results if result.error is not None)
+        skipped = sum(1 for result in results if result.skipped)
+        logger.info(
+            f'Streaming indexer processed {len(results)} papers '
+            f'({chunk_count} chunks, {failed} failed, {skipped} skipped) '
+            f'in {time.perf_counter() - started:.2f}s'
+        )
+        return results
+
+    @staticmethod
+    def _fail(result: IndexResult, error: Exception, stage: str) -> None:
+        """Record the first error for a paper; later batches are skipped."""
+        if result.error is None:
+            result.error = error
+            logger.error(
+                f'Streaming index failed for {result.paper_id} ({stage}): {error}'
+            )
+
+
+async def _aiterate(
+    items: Iterable[IndexJob] | AsyncIterable[IndexJob],
+) -> AsyncIterable[IndexJob]:
+    """Iterate a sync or async iterable uniformly."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
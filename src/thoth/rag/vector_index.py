@@ -0,0 +1,240 @@
+"""
+Vector index management for document_chunks.
+
+The original migration creates ``idx_chunks_embedding`` as an IVFFlat index,
+whose centroids are fixed when the index is built: built on an empty or small
+table, recall degrades as the corpus grows. This module reports index health
+and rebuilds the index (HNSW, or IVFFlat with ``lists`` sized to the current
+row count) with ``CREATE INDEX CONCURRENTLY`` so ingestion and search keep
+working during the build. The old index is only swapped out once the new one
+is valid.
+
+The row count at build time is stored in the index comment, so health checks
+can tell how much the table has grown since.
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+
+import asyncpg
+from loguru import logger
+
+INDEX_NAME = 'idx_chunks_embedding'
+INDEX_METHODS = ('hnsw', 'ivfflat')
+
+# Rebuild IVFFlat once the table has grown this much since the build
+IVFFLAT_GROWTH_THRESHOLD = 0.5
+# Reindex HNSW when this fraction of the table is dead tuples
+HNSW_DEAD_TUPLE_THRESHOLD = 0.2
+
+_ROWS_COMMENT = re.compile(r'thoth:rows=(\d+)')
+
+
+def ivfflat_lists_for(rows: int) -> int:
+    """pgvector's guidance: rows / 1000 up to 1M rows, sqrt(rows) beyond."""
+    if rows <= 1_000_000:
+        return max(1, rows // 1000)
+    return int(math.sqrt(rows))
+
+
+@dataclass
+class VectorIndexHealth:
+    """Current state of the chunk embedding index."""
+
+    rows: int
+    dead_rows: int = 0
+    name: str | None = None
+    method: str | None = None
+    valid: bool = True
+    size_bytes: int = 0
+    options: dict[str, int] = field(default_factory=dict)
+    rows_at_build: int | None = None
+    recommendations: list[str] = field(default_factory=list)
+
+    @property
+    def needs_rebuild(self) -> bool:
+        return bool(self.recommendations)
+
+
+def assess_index(health: VectorIndexHealth, preferred_method: str = 'hnsw') -> None:
+    """Fill ``health.recommendations`` from the index state."""
+    recs = health.recommendations
+    if health.method is None:
+        if health.rows:
+            recs.append(f'No vector index on {health.rows} embedded chunks')
+        return
+    if not health.valid:
+        recs.append('Index is invalid (interrupted concurrent build)')
+        return
+    if health.method != preferred_method:
+        recs.append(
+            f'Index method is {health.method}, configured method is {preferred_method}'
+        )
+
+    if health.method == 'ivfflat':
+        lists = health.options.get('lists', 100)
+        wanted = ivfflat_lists_for(health.rows)
+        if health.rows_at_build is None:
+            recs.append('IVFFlat build size unknown; re-cluster to fit current rows')
+        elif health.rows > health.rows_at_build * (1 + IVFFLAT_GROWTH_THRESHOLD):
+            recs.append(
+                f'Table grew from {health.rows_at_build} to {health.rows} rows '
+                'since the IVFFlat centroids were built'
+            )
+        elif not wanted / 2 <= lists <= wanted * 2:
+            recs.append(f'IVFFlat lists={lists}, {wanted} suits {health.rows} rows')
+    elif health.method == 'hnsw':
+        total = health.rows + health.dead_rows
+        if total and health.dead_rows / total > HNSW_DEAD_TUPLE_THRESHOLD:
+            recs.append(
+                f'{health.dead_rows} dead rows ({health.dead_rows / total:.0%}) '
+                'in the HNSW graph'
+            )
+
+
+class VectorIndexManager:
+    """Inspects and rebuilds the document_chunks embedding index."""
+
+    def __init__(
+        self,
+        database_url: str,
+        method: str = 'hnsw',
+        hnsw_m: int = 16,
+        hnsw_ef_construction: int = 64,
+    ):
+        """
+        Initialize the manager.
+
+        Args:
+            database_url: PostgreSQL connection URL
+            method: Preferred index method ('hnsw' or 'ivfflat')
+            hnsw_m: HNSW max connections per layer
+            hnsw_ef_construction: HNSW candidate list size during build
+        """
+        if method not in INDEX_METHODS:
+            raise ValueError(f'Unknown vector index method: {method}')
+        self.database_url = database_url
+        self.method = method
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+
+    async def get_health_async(self) -> VectorIndexHealth:
+        """Inspect the embedding index and recommend a rebuild if needed."""
+        conn = await asyncpg.connect(self.database_url)
+        try:
+            rows = await conn.fetchval(
+                'SELECT COUNT(*) FROM document_chunks WHERE embedding IS NOT NULL'
+            )
+            dead_rows = await conn.fetchval(
+                """
+                SELECT COALESCE(n_dead_tup, 0) FROM pg_stat_user_tables
+                WHERE relid = 'document_chunks'::regclass
+                """
+            )
+            index = await conn.fetchrow(
+                """
+                SELECT
+                    c.relname AS name,
+                    am.amname AS method,
+                    i.indisvalid AS valid,
+                    pg_relation_size(c.oid) AS size_bytes,
+                    c.reloptions AS options,
+                    obj_description(c.oid, 'pg_class') AS comment
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                JOIN pg_am am ON am.oid = c.relam
+                WHERE i.indrelid = 'document_chunks'::regclass
+                  AND am.amname = ANY($1::text[])
+                ORDER BY (c.relname = $2) DESC, i.indisvalid DESC
+                LIMIT 1
+                """,
+                list(INDEX_METHODS),
+                INDEX_NAME,
+            )
+        finally:
+            await conn.close()
+
+        health = VectorIndexHealth(rows=rows or 0, dead_rows=dead_rows or 0)
+        if index is not None:
+            health.name = index['name']
+            health.method = index['method']
+            health.valid = index['valid']
+            health.size_bytes = index['size_bytes']
+            health.options = _parse_options(index['options'])
+            match = _ROWS_COMMENT.search(index['comment'] or '')
+            health.rows_at_build = int(match.group(1)) if match else None
+
+        assess_index(health, self.method)
+        return health
+
+    async def rebuild_async(
+        self,
+        method: str | None = None,
+        lists: int | None = None,
+        maintenance_work_mem: str | None = None,
+    ) -> VectorIndexHealth:
+        """
+        Build a fresh embedding index concurrently and swap it in.
+
+        Args:
+            method: 'hnsw' or 'ivfflat' (defaults to the configured method)
+            lists: IVFFlat lists (defaults to a value sized to the table)
+            maintenance_work_mem: Session memory for the build, e.g. '1GB'
+                (HNSW builds are much faster when the graph fits in memory)
+
+        Returns:
+            Health of the rebuilt index
+        """
+        method = method or self.method
+        if method not in INDEX_METHODS:
+            raise ValueError(f'Unknown vector index method: {method}')
+
+        staging = f'{INDEX_NAME}_rebuild'
+        # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction and
+        # can outlast the pool's command timeout, so use a dedicated connection
+        conn = await asyncpg.connect(self.database_url, command_timeout=None)
+        try:
+            if maintenance_work_mem:
+                await conn.execute(
+                    "SELECT set_config('maintenance_work_mem', $1, false)",
+                    maintenance_work_mem,
+                )
+            rows = await conn.fetchval(
+                'SELECT COUNT(*) FROM document_chunks WHERE embedding IS NOT NULL'
+            )
+            if method == 'hnsw':
+                options = f'm = {int(self.hnsw_m)}, ef_construction = {int(self.hnsw_ef_construction)}'
+            else:
+                options = f'lists = {int(lists or ivfflat_lists_for(rows))}'
+
+            logger.info(f'Building {method} index on {rows} chunks ({options})')
+            # Leftover from an interrupted rebuild
+            await conn.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {staging}')
+            await conn.execute(
+                f"""
+                CREATE INDEX CONCURRENTLY {staging} ON document_chunks
+                USING {method} (embedding vector_cosine_ops)
+                WITH ({options})
+                """
+            )
+            await conn.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}')
+            await conn.execute(f'ALTER INDEX {staging} RENAME TO {INDEX_NAME}')
+            await conn.execute(f"COMMENT ON INDEX {INDEX_NAME} IS 'thoth:rows={rows}'")
+            logger.info(f'Rebuilt {INDEX_NAME} as {method}')
+        finally:
+            await conn.close()
+
+        return await self.get_health_async()
+
+
+def _parse_options(reloptions: list[str] | None) -> dict[str, int]:
+    """Turn ['lists=100'] into {'lists': 100}."""
+    options: dict[str, int] = {}
+    for option in reloptions or []:
+        key, _, value = option.partition('=')
+        try:
+            options[key] = int(value)
+        except ValueError:
+            continue
+    return options
@@ -6,6 +6,8 @@ Supports hybrid search (vector + BM25) with Reciprocal Rank Fusion.
 """
 
 import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 from uuid import UUID
 
@@ -15,9 +17,23 @@ from loguru import logger
 
 from thoth.config import Config
 from thoth.mcp.auth import get_mcp_user_id
+from thoth.rag.chunk_diff import ChunkDiff
+from thoth.rag.embedding_cache import (
+    EmbeddingCache,
+    content_hash,
+    resolve_model_name,
+)
+from thoth.rag.query_embedding_cache import (
+    QueryEmbeddingCache,
+    get_query_embedding_cache,
+)
 from thoth.rag.search_backends import FullTextSearchBackend, create_backend
 
 
+class StaleChunksError(RuntimeError):
+    """A paper's stored chunks changed between diffing and applying a re-index."""
+
+
 class VectorStoreManager:
     """
     Manages vector storage and retrieval using PostgreSQL + pgvector.
@@ -61,6 +77,25 @@ class VectorStoreManager:
         # Connection pool for async operations
         self._pool: asyncpg.Pool | None = None
 
+        self._embedding_model_name = resolve_model_name(embedding_function)
+
+        # Content-addressed cache so unchanged chunks are never re-embedded
+        self._embedding_cache: EmbeddingCache | None = None
+        if self.config.rag_config.embedding_cache_enabled:
+            self._embedding_cache = EmbeddingCache(
+                self._get_pool,
+                model=self._embedding_model_name,
+                embedding_version=self.config.rag_config.embedding_version,
+            )
+
+        # Searches (especially agentic retries) repeat the same query texts
+        self._query_embedding_cache: QueryEmbeddingCache | None = None
+        if self.config.rag_config.query_embedding_cache_size > 0:
+            self._query_embedding_cache = get_query_embedding_cache(
+                self.config.rag_config.query_embedding_cache_size,
+                self.config.rag_config.query_embedding_cache_ttl_seconds,
+            )
+
         # Initialize full-text search backend for hybrid search
         backend_type = self.config.rag_config.full_text_backend
         self._ft_backend: FullTextSearchBackend = create_backend(backend_type)
@@ -69,6 +104,10 @@ class VectorStoreManager:
             f'VectorStoreManager initialized (PostgreSQL + pgvector + {self._ft_backend.get_backend_name()})'
         )
 
+    async def get_pool(self) -> asyncpg.Pool:
+        """Connection pool shared with caches that live outside the vector store."""
+        return await self._get_pool()
+
     async def _get_pool(self) -> asyncpg.Pool:
         """Get or create connection pool.
 
@@ -95,6 +134,14 @@ class VectorStoreManager:
         self._pool = await asyncpg.create_pool(
             self.db_url, min_size=1, max_size=5, command_timeout=60
         )
+        try:
+            async with self._pool.acquire() as conn:
+                await self._ft_backend.prepare(conn)
+        except Exception as e:
+            logger.warning(
+                f'Could not prepare {self._ft_backend.get_backend_name()} '
+                f'full-text backend: {e}'
+            )
         return self._pool
 
     async def _ensure_extension(self) -> None:
@@ -104,6 +151,44 @@ class VectorStoreManager:
             await conn.execute('CREATE EXTENSION IF NOT EXISTS vector')
             logger.debug('Ensured pgvector extension is enabled')
 
+    async def embed_documents_async(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed chunk texts, reusing cached embeddings for unchanged text.
+
+        Only cache misses are sent to the embedding model, which runs in a
+        worker thread so the event loop stays free for database I/O.
+
+        Args:
+            texts: Chunk texts to embed
+
+        Returns:
+            Embeddings aligned with ``texts``
+        """
+
+        async def embed(batch: list[str]) -> list[list[float]]:
+            return await asyncio.to_thread(
+                self.embedding_function.embed_documents, batch
+            )
+
+        if not texts:
+            return []
+        if self._embedding_cache is None:
+            return await embed(texts)
+        return await self._embedding_cache.embed_documents(texts, embed)
+
+    async def embed_query_async(self, query: str) -> list[float]:
+        """
+        Embed a search query, served from the shared query cache when possible.
+
+        Concurrent searches for the same text share one embedding call; the
+        model runs in a worker thread so the event loop is not blocked.
+        """
+        if self._query_embedding_cache is None:
+            return await asyncio.to_thread(self.embedding_function.embed_query, query)
+        return await self._query_embedding_cache.get_or_embed_async(
+            self._embedding_model_name, query, self.embedding_function.embed_query
+        )
+
     async def add_documents_async(
         self, documents: list[Document], paper_id: UUID | None = None, **kwargs: Any
     ) -> list[str]:
@@ -157,6 +242,7 @@ class VectorStoreManager:
         documents: list[Document],
         paper_id: UUID | None = None,
         user_id: str | None = None,
+        bulk: bool | None = None,
         **kwargs: Any,
     ) -> list[str]:
         """Add documents asynchronously.
@@ -165,19 +251,90 @@ class VectorStoreManager:
             documents: List of documents to add
             paper_id: Paper UUID
             user_id: User ID for multi-tenant isolation
+            bulk: Use the COPY-based bulk ingestion path (defaults to
+                ``rag_config.bulk_ingest_enabled``)
             **kwargs: Additional metadata
 
         Returns:
             List of document chunk IDs
         """
-        import json
-
         if not paper_id:
             raise ValueError('paper_id is required for document chunks')
 
-        # Generate embeddings
+        # Generate embeddings (cache misses only)
         texts = [doc.page_content for doc in documents]
-        embeddings = self.embedding_function.embed_documents(texts)
+        embeddings = await self.embed_documents_async(texts)
+
+        return await self._write_chunks_async(
+            documents, embeddings, paper_id, user_id, bulk=bulk, **kwargs
+        )
+
+    async def add_embedded_documents_async(
+        self,
+        documents: list[Document],
+        embeddings: list[list[float]],
+        paper_id: UUID,
+        user_id: str | None = None,
+        start_index: int = 0,
+        bulk: bool | None = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """
+        Store documents whose embeddings were computed by the caller.
+
+        Used by the streaming indexer, which embeds and writes a paper in
+        micro-batches; ``start_index`` is the chunk index of the first document
+        so each batch lands on its absolute ``(paper_id, chunk_index)`` row.
+
+        Args:
+            documents: Documents to store
+            embeddings: Embedding vectors aligned with ``documents``
+            paper_id: Paper UUID
+            user_id: User ID for multi-tenant isolation
+            start_index: Chunk index of ``documents[0]`` within the paper
+            bulk: Use the COPY-based bulk ingestion path
+            **kwargs: Additional metadata
+
+        Returns:
+            List of document chunk IDs
+        """
+        if not paper_id:
+            raise ValueError('paper_id is required for document chunks')
+        if len(documents) != len(embeddings):
+            raise ValueError(
+                f'Got {len(embeddings)} embeddings for {len(documents)} documents'
+            )
+
+        return await self._write_chunks_async(
+            documents,
+            embeddings,
+            paper_id,
+            user_id,
+            start_index=start_index,
+            bulk=bulk,
+            **kwargs,
+        )
+
+    async def _write_chunks_async(
+        self,
+        documents: list[Document],
+        embeddings: list[list[float]],
+        paper_id: UUID,
+        user_id: str | None = None,
+        start_index: int = 0,
+        bulk: bool | None = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Upsert embedded chunks using the per-row or bulk COPY path."""
+        import json
+
+        if bulk is None:
+            bulk = self.config.rag_config.bulk_ingest_enabled
+
+        if bulk:
+            return await self._bulk_add_documents_async(
+                documents, embeddings, paper_id, user_id, start_index, **kwargs
+            )
 
         pool = await self._get_pool()
         ids = []
@@ -188,20 +345,11 @@ class VectorStoreManager:
                 'jsonb', encoder=json.dumps, decoder=json.loads, schema='pg_catalog'
             )
 
-            for idx, (doc, embedding) in enumerate(zip(documents, embeddings)):  # noqa: B905
-                metadata = {**doc.metadata, **kwargs}
-
-                # Ensure metadata values are JSON-serializable
-                clean_metadata = {}
-                for k, v in metadata.items():
-                    if v is None:
-                        clean_metadata[k] = None
-                    elif isinstance(v, (str, int, float, bool)):
-                        clean_metadata[k] = v
-                    elif isinstance(v, (list, dict)):
-                        clean_metadata[k] = v
-                    else:
-                        clean_metadata[k] = str(v)
+            for idx, (doc, embedding) in enumerate(
+                zip(documents, embeddings),  # noqa: B905
+                start=start_index,
+            ):
+                clean_metadata = self._clean_metadata({**doc.metadata, **kwargs})
 
                 # Convert embedding list to PostgreSQL vector format string
                 # pgvector expects format like '[0.1, 0.2, 0.3]'
@@ -212,13 +360,14 @@ class VectorStoreManager:
                     result = await conn.fetchrow(
                         """
                         INSERT INTO document_chunks
-                        (paper_id, content, chunk_index, chunk_type, metadata, embedding, token_count, user_id)
-                        VALUES ($1, $2, $3, $4, $5::jsonb, $6::vector, $7, $8)
+                        (paper_id, content, chunk_index, chunk_type, metadata, embedding, token_count, content_hash, user_id)
+                        VALUES ($1, $2, $3, $4, $5::jsonb, $6::vector, $7, $8, $9)
                         ON CONFLICT (paper_id, chunk_index)
                         DO UPDATE SET
                             content = EXCLUDED.content,
                             embedding = EXCLUDED.embedding,
                             metadata = EXCLUDED.metadata,
+                            content_hash = EXCLUDED.content_hash,
                             user_id = EXCLUDED.user_id,
                             updated_at = CURRENT_TIMESTAMP
                         RETURNING id
@@ -230,19 +379,21 @@ class VectorStoreManager:
                         clean_metadata,
                         embedding_str,
                         len(doc.page_content.split()),  # Rough token count
+                        self.chunk_hash(doc),
                         user_id,
                     )
                 else:
                     result = await conn.fetchrow(
                         """
                         INSERT INTO document_chunks
-                        (paper_id, content, chunk_index, chunk_type, metadata, embedding, token_count)
-                        VALUES ($1, $2, $3, $4, $5::jsonb, $6::vector, $7)
+                        (paper_id, content, chunk_index, chunk_type, metadata, embedding, token_count, content_hash)
+                        VALUES ($1, $2, $3, $4, $5::jsonb, $6::vector, $7, $8)
                         ON CONFLICT (paper_id, chunk_index)
                         DO UPDATE SET
                             content = EXCLUDED.content,
                             embedding = EXCLUDED.embedding,
                             metadata = EXCLUDED.metadata,
+                            content_hash = EXCLUDED.content_hash,
                             updated_at = CURRENT_TIMESTAMP
                         RETURNING id
                     """,
@@ -253,6 +404,7 @@ class VectorStoreManager:
                         clean_metadata,
                         embedding_str,
                         len(doc.page_content.split()),  # Rough token count
+                        self.chunk_hash(doc),
                     )
 
                 ids.append(str(result['id']))
@@ -260,6 +412,326 @@ class VectorStoreManager:
         logger.debug(f'Added {len(ids)} document chunks for paper {paper_id}')
         return ids
 
+    async def _bulk_add_documents_async(
+        self,
+        documents: list[Document],
+        embeddings: list[list[float]],
+        paper_id: UUID,
+        user_id: str | None = None,
+        start_index: int = 0,
+        **kwargs: Any,
+    ) -> list[str]:
+        """
+        Add pre-embedded documents using binary COPY into a staging table.
+
+        Each batch is streamed into a session-local temp table with
+        ``copy_records_to_table`` (binary protocol, embeddings as ``float4[]``)
+        and then merged into ``document_chunks`` with a single
+        ``INSERT ... SELECT ... ON CONFLICT`` statement. The upsert semantics
+        and returned IDs are identical to the per-row path.
+
+        Args:
+            documents: Documents to store
+            embeddings: Embedding vectors aligned with ``documents``
+            paper_id: Paper UUID
+            user_id: User ID for multi-tenant isolation
+            start_index: Chunk index of ``documents[0]`` within the paper
+            **kwargs: Additional metadata
+
+        Returns:
+            List of document chunk IDs in input order
+        """
+        import json
+
+        batch_size = max(1, self.config.rag_config.bulk_ingest_batch_size)
+        records = []
+        for idx, (doc, embedding) in enumerate(
+            zip(documents, embeddings),  # noqa: B905
+            start=start_index,
+        ):
+            clean_metadata = self._clean_metadata({**doc.metadata, **kwargs})
+            records.append(
+                (
+                    idx,
+                    doc.page_content,
+                    clean_metadata.get('chunk_type', 'content'),
+                    json.dumps(clean_metadata),
+                    [float(x) for x in embedding],
+                    len(doc.page_content.split()),  # Rough token count
+                    self.chunk_hash(doc),
+                )
+            )
+
+        # user_id is only written when provided so the column default applies
+        # otherwise, mirroring the per-row path.
+        user_column = ', user_id' if user_id else ''
+        user_value = ', $2' if user_id else ''
+        user_update = 'user_id = EXCLUDED.user_id,' if user_id else ''
+        merge_sql = f"""
+            INSERT INTO document_chunks
+            (paper_id, content, chunk_index, chunk_type, metadata, embedding, token_count, content_hash{user_column})
+            SELECT $1, s.content, s.chunk_index, s.chunk_type, s.metadata::jsonb,
+                   s.embedding::vector, s.token_count, s.content_hash{user_value}
+            FROM _thoth_chunk_staging s
+            ORDER BY s.chunk_index
+            ON CONFLICT (paper_id, chunk_index)
+            DO UPDATE SET
+                content = EXCLUDED.content,
+                embedding = EXCLUDED.embedding,
+                metadata = EXCLUDED.metadata,
+                content_hash = EXCLUDED.content_hash,
+                {user_update}
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING id, chunk_index
+        """  # nosec B608
+        merge_params = [paper_id, user_id] if user_id else [paper_id]
+
+        ids_by_index: dict[int, str] = {}
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            await conn.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS _thoth_chunk_staging (
+                    chunk_index INTEGER NOT NULL,
+                    content TEXT NOT NULL,
+                    chunk_type TEXT,
+                    metadata TEXT,
+                    embedding REAL[],
+                    token_count INTEGER,
+                    content_hash TEXT
+                ) ON COMMIT DELETE ROWS
+            """)
+
+            for start in range(0, len(records), batch_size):
+                batch = records[start : start + batch_size]
+                async with conn.transaction():
+                    await conn.copy_records_to_table(
+                        '_thoth_chunk_staging',
+                        records=batch,
+                        columns=[
+                            'chunk_index',
+                            'content',
+                            'chunk_type',
+                            'metadata',
+                            'embedding',
+                            'token_count',
+                            'content_hash',
+                        ],
+                    )
+                    rows = await conn.fetch(merge_sql, *merge_params)
+                for row in rows:
+                    ids_by_index[row['chunk_index']] = str(row['id'])
+
+        ids = [ids_by_index[record[0]] for record in records]
+        logger.debug(
+            f'Bulk added {len(ids)} document chunks for paper {paper_id} '
+            f'in {-(-len(records) // batch_size)} batch(es)'
+        )
+        return ids
+
+    async def get_chunk_hashes_async(
+        self, paper_id: UUID
+    ) -> list[tuple[str, str | None]]:
+        """
+        Stored chunks of a paper as ``(chunk_id, content_hash)``.
+
+        Args:
+            paper_id: Paper UUID
+
+        Returns:
+            Chunk IDs and content hashes in chunk_index order
+        """
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT id, content_hash FROM document_chunks
+                WHERE paper_id = $1
+                ORDER BY chunk_index
+                """,
+                paper_id,
+            )
+        return [(str(row['id']), row['content_hash']) for row in rows]
+
+    async def apply_chunk_diff_async(
+        self,
+        paper_id: UUID,
+        documents: list[Document],
+        diff: ChunkDiff,
+        embeddings: dict[int, list[float]],
+        expected_ids: list[str],
+        user_id: str | None = None,
+    ) -> list[str]:
+        """
+        Apply a ChunkDiff to a paper's stored chunks in one transaction.
+
+        Kept chunks only get their chunk_index and positional metadata
+        refreshed (existing keys such as the enrichment context are
+        preserved), so the BM25 and answer cache triggers ignore them. Moved
+        rows are parked at negative indexes first so shifting them cannot
+        collide on the ``(paper_id, chunk_index)`` unique index.
+
+        Args:
+            paper_id: Paper UUID
+            documents: The complete new split, in chunk order
+            diff: Diff from ``diff_chunks`` against ``expected_ids``
+            embeddings: Embedding for every index in ``diff.changed_indexes``
+            expected_ids: Stored chunk IDs (in order) the diff was computed from
+            user_id: User ID for multi-tenant isolation
+
+        Returns:
+            Chunk IDs of ``documents``, in order
+
+        Raises:
+            StaleChunksError: If the stored chunks changed since the diff was
+                computed (e.g. a concurrent re-index of the same paper)
+        """
+        import json
+
+        def metadata_json(doc: Document) -> str:
+            return json.dumps(self._clean_metadata(doc.metadata))
+
+        ids = {idx: chunk_id for chunk_id, idx in diff.keep + diff.update}
+
+        def changed_columns(indexes: list[int]) -> list[list[Any]]:
+            docs = [documents[idx] for idx in indexes]
+            return [
+                [doc.page_content for doc in docs],
+                [doc.metadata.get('chunk_type', 'content') for doc in docs],
+                [metadata_json(doc) for doc in docs],
+                [
+                    '[' + ','.join(str(x) for x in embeddings[idx]) + ']'
+                    for idx in indexes
+                ],
+                [len(doc.page_content.split()) for doc in docs],  # Rough token count
+                [self.chunk_hash(doc) for doc in docs],
+            ]
+
+        pool = await self._get_pool()
+        async with pool.acquire() as conn, conn.transaction():
+            current = await conn.fetch(
+                """
+                SELECT id FROM document_chunks
+                WHERE paper_id = $1
+                ORDER BY chunk_index
+                FOR UPDATE
+                """,
+                paper_id,
+            )
+            if [str(row['id']) for row in current] != expected_ids:
+                raise StaleChunksError(
+                    f'Chunks of paper {paper_id} changed during re-index'
+                )
+
+            if diff.delete:
+                await conn.execute(
+                    'DELETE FROM document_chunks WHERE id = ANY($1::uuid[])',
+                    diff.delete,
+                )
+
+            if diff.keep:
+                await conn.execute(
+                    """
+                    UPDATE document_chunks d
+                    SET chunk_index = CASE WHEN d.chunk_index = v.idx
+                                           THEN d.chunk_index ELSE -1 - v.idx END,
+                        metadata = COALESCE(d.metadata, '{}'::jsonb) || v.metadata::jsonb,
+                        updated_at = CURRENT_TIMESTAMP
+                    FROM unnest($1::uuid[], $2::int[], $3::text[]) AS v(id, idx, metadata)
+                    WHERE d.id = v.id
+                      AND (d.chunk_index <> v.idx
+                           OR d.metadata IS DISTINCT FROM
+                              COALESCE(d.metadata, '{}'::jsonb) || v.metadata::jsonb)
+                    """,
+                    [chunk_id for chunk_id, _ in diff.keep],
+                    [idx for _, idx in diff.keep],
+                    [metadata_json(documents[idx]) for _, idx in diff.keep],
+                )
+
+            if diff.update:
+                indexes = [idx for _, idx in diff.update]
+                user_update = ', user_id = $9' if user_id else ''
+                await conn.execute(
+                    f"""
+                    UPDATE document_chunks d
+                    SET chunk_index = -1 - v.idx,
+                        content = v.content,
+                        chunk_type = v.chunk_type,
+                        metadata = v.metadata::jsonb,
+                        embedding = v.embedding::vector,
+                        token_count = v.token_count,
+                        content_hash = v.content_hash,
+                        updated_at = CURRENT_TIMESTAMP{user_update}
+                    FROM unnest($1::uuid[], $2::int[], $3::text[], $4::text[],
+                                $5::text[], $6::text[], $7::int[], $8::text[])
+                        AS v(id, idx, content, chunk_type, metadata, embedding,
+                             token_count, content_hash)
+                    WHERE d.id = v.id
+                    """,  # nosec B608
+                    [chunk_id for chunk_id, _ in diff.update],
+                    indexes,
+                    *changed_columns(indexes),
+                    *([user_id] if user_id else []),
+                )
+
+            if diff.insert:
+                user_column = ', user_id' if user_id else ''
+                user_value = ', $9' if user_id else ''
+                rows = await conn.fetch(
+                    f"""
+                    INSERT INTO document_chunks
+                    (paper_id, chunk_index, content, chunk_type, metadata, embedding,
+                     token_count, content_hash{user_column})
+                    SELECT $1, v.idx, v.content, v.chunk_type, v.metadata::jsonb,
+                           v.embedding::vector, v.token_count, v.content_hash{user_value}
+                    FROM unnest($2::int[], $3::text[], $4::text[], $5::text[],
+                                $6::text[], $7::int[], $8::text[])
+                        AS v(idx, content, chunk_type, metadata, embedding,
+                             token_count, content_hash)
+                    RETURNING id, chunk_index
+                    """,  # nosec B608
+                    paper_id,
+                    diff.insert,
+                    *changed_columns(diff.insert),
+                    *([user_id] if user_id else []),
+                )
+                ids.update({row['chunk_index']: str(row['id']) for row in rows})
+
+            # Move parked rows to their final indexes
+            await conn.execute(
+                """
+                UPDATE document_chunks SET chunk_index = -1 - chunk_index
+                WHERE paper_id = $1 AND chunk_index < 0
+                """,
+                paper_id,
+            )
+
+        logger.debug(
+            f'Re-indexed paper {paper_id}: {len(diff.keep)} unchanged, '
+            f'{len(diff.update)} rewritten, {len(diff.insert)} inserted, '
+            f'{len(diff.delete)} deleted'
+        )
+        return [ids[idx] for idx in range(len(documents))]
+
+    @staticmethod
+    def chunk_hash(doc: Document) -> str:
+        """Content hash of a chunk's own text (before contextual enrichment)."""
+        return content_hash(doc.metadata.get('original_content', doc.page_content))
+
+    @staticmethod
+    def _clean_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
+        """Ensure metadata values are JSON-serializable."""
+        clean_metadata = {}
+        for k, v in metadata.items():
+            if v is None:
+                clean_metadata[k] = None
+            elif isinstance(v, (str, int, float, bool)):
+                clean_metadata[k] = v
+            elif isinstance(v, (list, dict)):
+                clean_metadata[k] = v
+            else:
+                clean_metadata[k] = str(v)
+        return clean_metadata
+
     async def similarity_search_async(
         self,
         query: str,
@@ -275,7 +747,8 @@ class VectorStoreManager:
             query: Search query text
             k: Number of results to return
             filter: Metadata filter (not yet implemented)
-            **kwargs: Additional search parameters
+            **kwargs: Additional search parameters (use_hybrid, ef_search,
+                probes; see _similarity_search_async)
 
         Returns:
             List of similar documents
@@ -297,7 +770,8 @@ class VectorStoreManager:
             query: Search query text
             k: Number of results to return
             filter: Metadata filter (not yet implemented)
-            **kwargs: Additional search parameters
+            **kwargs: Additional search parameters (use_hybrid, ef_search,
+                probes; see _similarity_search_async)
 
         Returns:
             List of similar documents
@@ -335,7 +809,10 @@ class VectorStoreManager:
             query: Search query text
             k: Number of results to return
             filter: Metadata filter (not yet implemented)
-            **kwargs: Additional parameters (use_hybrid=True to force hybrid)
+            **kwargs: Additional parameters:
+                use_hybrid: True/False to force hybrid or vector-only search
+                ef_search: HNSW candidate list size for this query
+                probes: IVFFlat lists to probe for this query
 
         Returns:
             List of Document objects ranked by relevance
@@ -344,27 +821,76 @@ class VectorStoreManager:
         use_hybrid = kwargs.get(
             'use_hybrid', self.config.rag_config.hybrid_search_enabled
         )
+        index_settings = self._index_search_settings(
+            kwargs.get('ef_search'), kwargs.get('probes')
+        )
 
         if use_hybrid:
-            return await self._hybrid_search_async(query, k, filter)
+            return await self._hybrid_search_async(query, k, filter, index_settings)
         else:
-            return await self._vector_only_search_async(query, k, filter)
+            return await self._vector_only_search_async(
+                query, k, filter, index_settings
+            )
+
+    def _index_search_settings(
+        self, ef_search: int | None = None, probes: int | None = None
+    ) -> dict[str, str]:
+        """
+        Per-query pgvector settings (recall/latency trade-off).
+
+        Explicit arguments win over ``hnsw_ef_search``/``ivfflat_probes`` from
+        config; unset values keep the server default.
+        """
+        rag_config = self.config.rag_config
+        if ef_search is None:
+            ef_search = rag_config.hnsw_ef_search
+        if probes is None:
+            probes = rag_config.ivfflat_probes
+
+        settings = {}
+        if ef_search is not None:
+            settings['hnsw.ef_search'] = str(int(ef_search))
+        if probes is not None:
+            settings['ivfflat.probes'] = str(int(probes))
+        return settings
+
+    @asynccontextmanager
+    async def _search_connection(
+        self, index_settings: dict[str, str] | None = None
+    ) -> AsyncIterator[asyncpg.Connection]:
+        """
+        Pooled connection with pgvector settings applied to this query only.
+
+        Settings are applied with ``set_config(..., is_local => true)`` inside a
+        transaction, so they never leak to the next user of the connection.
+        """
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            if not index_settings:
+                yield conn
+            else:
+                async with conn.transaction():
+                    for name, value in index_settings.items():
+                        await conn.execute(
+                            'SELECT set_config($1, $2, true)', name, value
+                        )
+                    yield conn
 
     async def _vector_only_search_async(
         self,
         query: str,
         k: int,
         filter: dict[str, Any] | None = None,
+        index_settings: dict[str, str] | None = None,
     ) -> list[Document]:
         """Pure vector similarity search with optional metadata filtering."""
         # Generate query embedding
-        query_embedding = self.embedding_function.embed_query(query)
+        query_embedding = await self.embed_query_async(query)
 
         # Convert embedding list to pgvector string format for asyncpg
         embedding_str = '[' + ','.join(str(x) for x in query_embedding) + ']'
 
-        pool = await self._get_pool()
-        async with pool.acquire() as conn:
+        async with self._search_connection(index_settings) as conn:
             # Build WHERE clause with filters
             where_clauses = ['dc.embedding IS NOT NULL']
             params = [embedding_str, k]
@@ -410,6 +936,7 @@ class VectorStoreManager:
         query: str,
         k: int,
         filter: dict[str, Any] | None = None,
+        index_settings: dict[str, str] | None = None,
     ) -> list[Document]:
         """
         Hybrid search combining vector similarity and BM25 keyword matching.
@@ -421,61 +948,197 @@ class VectorStoreManager:
             query: Search query text
             k: Final number of results to return
             filter: Metadata filter (not yet implemented)
+            index_settings: Per-query pgvector settings (ef_search/probes)
 
         Returns:
             List of Document objects ranked by RRF score
         """
-        # Get config parameters
-        rrf_k = self.config.rag_config.hybrid_rrf_k
-        vector_weight = self.config.rag_config.hybrid_vector_weight
-        text_weight = self.config.rag_config.hybrid_text_weight
-
         # Over-retrieve from each method (5x to ensure good fusion)
         candidates_per_method = k * 5
 
         # Generate query embedding for vector search
-        query_embedding = self.embedding_function.embed_query(query)
+        query_embedding = await self.embed_query_async(query)
         embedding_str = '[' + ','.join(str(x) for x in query_embedding) + ']'
 
-        pool = await self._get_pool()
-        async with pool.acquire() as conn:
-            # Execute both searches in parallel using asyncio.gather
-            vector_results, text_results = await asyncio.gather(
-                self._get_vector_candidates(
-                    conn, embedding_str, candidates_per_method, filter
-                ),
-                self._get_text_candidates(conn, query, candidates_per_method, filter),
-                return_exceptions=True,
-            )
+        if self.config.rag_config.hybrid_search_mode == 'fused':
+            try:
+                documents = await self._fused_hybrid_search_async(
+                    query,
+                    embedding_str,
+                    k,
+                    candidates_per_method,
+                    filter,
+                    index_settings,
+                )
+            except asyncpg.PostgresError as e:
+                logger.warning(
+                    f'Fused hybrid search failed ({e}), using concurrent queries'
+                )
+            else:
+                if documents is not None:
+                    return documents
+
+        return await self._concurrent_hybrid_search_async(
+            query, embedding_str, k, candidates_per_method, filter, index_settings
+        )
+
+    async def _fused_hybrid_search_async(
+        self,
+        query: str,
+        embedding_str: str,
+        k: int,
+        candidates_per_method: int,
+        filter: dict[str, Any] | None = None,
+        index_settings: dict[str, str] | None = None,
+    ) -> list[Document] | None:
+        """
+        Hybrid search in a single SQL statement.
+
+        Vector candidates, text candidates, weighted RRF fusion and document
+        hydration all run server-side, so a search costs one round trip.
 
-            # Handle errors gracefully
-            if isinstance(vector_results, Exception):
-                logger.error(f'Vector search failed: {vector_results}')
-                vector_results = []
-            if isinstance(text_results, Exception):
-                logger.warning(f'Text search failed: {text_results}, using vector-only')
-                text_results = []
-
-            # If text search returned nothing, fall back to vector-only
-            if not text_results:
-                logger.debug('No text search results, falling back to vector-only')
-                return await self._vector_only_search_async(query, k, filter)
-
-            # Apply RRF fusion
-            fused_results = self._apply_rrf_fusion(
-                vector_results, text_results, rrf_k, vector_weight, text_weight
+        Returns:
+            Documents ranked by RRF score, or None if the full-text backend
+            cannot be inlined (caller falls back to concurrent queries)
+        """
+        rag_config = self.config.rag_config
+        params: list[Any] = [
+            embedding_str,
+            query,
+            candidates_per_method,
+            float(rag_config.hybrid_vector_weight),
+            float(rag_config.hybrid_text_weight),
+            int(rag_config.hybrid_rrf_k),
+            k,
+        ]
+
+        filter_clause = ''
+        if filter:
+            filter_clause, filter_params, _ = self._build_filter_clause(
+                filter, start_param_idx=len(params) + 1
             )
+            params.extend(filter_params)
 
-            # Fetch full document data for top k results
-            documents = await self._fetch_documents_by_ids(
-                conn, [r['id'] for r in fused_results[:k]]
+        text_sql = self._ft_backend.candidate_sql('$2', '$3', filter_clause)
+        if text_sql is None:
+            return None
+
+        async with self._search_connection(index_settings) as conn:
+            rows = await conn.fetch(
+                f"""
+            WITH vector_candidates AS (
+                SELECT id, ROW_NUMBER() OVER (ORDER BY distance) AS rank
+                FROM (
+                    SELECT dc.id, dc.embedding <=> $1::vector AS distance
+                    FROM document_chunks dc
+                    WHERE dc.embedding IS NOT NULL
+                    {f'AND {filter_clause}' if filter_clause else ''}
+                    ORDER BY dc.embedding <=> $1::vector
+                    LIMIT $3
+                ) ranked_vector
+            ),
+            text_candidates AS ({text_sql}),
+            fused AS (
+                SELECT
+                    COALESCE(v.id, t.id) AS id,
+                    COALESCE($4::float8 / ($6::int + v.rank), 0)
+                        + COALESCE($5::float8 / ($6::int + t.rank), 0) AS rrf_score
+                FROM vector_candidates v
+                FULL OUTER JOIN text_candidates t ON v.id = t.id
+            )
+            SELECT
+                dc.id,
+                dc.content,
+                dc.metadata,
+                dc.chunk_type,
+                p.title,
+                p.doi,
+                p.authors,
+                1 - (dc.embedding <=> $1::vector) AS similarity,
+                f.rrf_score
+            FROM fused f
+            JOIN document_chunks dc ON dc.id = f.id
+            JOIN papers p ON dc.paper_id = p.id
+            ORDER BY f.rrf_score DESC
+            LIMIT $7
+        """,  # nosec B608
+                *params,
             )
 
-            logger.debug(
-                f'Hybrid search: {len(vector_results)} vector + {len(text_results)} text '
-                f'-> {len(documents)} fused results'
+        documents = self._rows_to_documents(rows)
+        logger.debug(f'Fused hybrid search returned {len(documents)} documents')
+        return documents
+
+    async def _concurrent_hybrid_search_async(
+        self,
+        query: str,
+        embedding_str: str,
+        k: int,
+        candidates_per_method: int,
+        filter: dict[str, Any] | None = None,
+        index_settings: dict[str, str] | None = None,
+    ) -> list[Document]:
+        """
+        Hybrid search with candidate queries run concurrently, fused in Python.
+
+        Each candidate query gets its own pooled connection (an asyncpg
+        connection cannot run two queries at once).
+        """
+        rrf_k = self.config.rag_config.hybrid_rrf_k
+        vector_weight = self.config.rag_config.hybrid_vector_weight
+        text_weight = self.config.rag_config.hybrid_text_weight
+
+        pool = await self._get_pool()
+
+        async def with_conn(fn, *args):
+            async with pool.acquire() as conn:
+                return await fn(conn, *args)
+
+        async def with_search_conn(fn, *args):
+            async with self._search_connection(index_settings) as conn:
+                return await fn(conn, *args)
+
+        vector_results, text_results = await asyncio.gather(
+            with_search_conn(
+                self._get_vector_candidates,
+                embedding_str,
+                candidates_per_method,
+                filter,
+            ),
+            with_conn(self._get_text_candidates, query, candidates_per_method, filter),
+            return_exceptions=True,
+        )
+
+        # Handle errors gracefully
+        if isinstance(vector_results, Exception):
+            logger.error(f'Vector search failed: {vector_results}')
+            vector_results = []
+        if isinstance(text_results, Exception):
+            logger.warning(f'Text search failed: {text_results}, using vector-only')
+            text_results = []
+
+        # If text search returned nothing, fall back to vector-only
+        if not text_results:
+            logger.debug('No text search results, falling back to vector-only')
+            return await self._vector_only_search_async(
+                query, k, filter, index_settings
             )
-            return documents
+
+        # Apply RRF fusion
+        fused_results = self._apply_rrf_fusion(
+            vector_results, text_results, rrf_k, vector_weight, text_weight
+        )
+
+        # Fetch full document data for top k results
+        documents = await with_conn(
+            self._fetch_documents_by_ids, [r['id'] for r in fused_results[:k]]
+        )
+
+        logger.debug(
+            f'Hybrid search: {len(vector_results)} vector + {len(text_results)} text '
+            f'-> {len(documents)} fused results'
+        )
+        return documents
 
     async def _get_vector_candidates(
         self,
@@ -534,8 +1197,9 @@ class VectorStoreManager:
         filter_params = []
 
         if filter:
+            # Backends bind their own parameters at $1/$2; filters follow
             filter_clause, filter_params, _ = self._build_filter_clause(
-                filter, start_param_idx=1
+                filter, start_param_idx=3
             )
 
         results = await self._ft_backend.search(
@@ -2,11 +2,13 @@
 Cache repository for managing API response caching in PostgreSQL.
 
 This module handles caching of external API responses to reduce
-redundant API calls and improve performance.
+redundant API calls and improve performance. Entries live in the
+api_enrichment_cache table, so they are shared by every process that
+talks to the database.
 """
 
-from datetime import datetime, timedelta  # noqa: I001
-from typing import Any, Dict  # noqa: UP035
+from datetime import UTC, datetime, timedelta  # noqa: I001
+from typing import Any, Dict, List  # noqa: UP035
 from loguru import logger
 import json
 
@@ -18,7 +20,7 @@ class CacheRepository(BaseRepository[Dict[str, Any]]):  # noqa: UP006
 
     def __init__(self, postgres_service, **kwargs):
         """Initialize cache repository."""
-        super().__init__(postgres_service, table_name='api_cache', **kwargs)
+        super().__init__(postgres_service, table_name='api_enrichment_cache', **kwargs)
 
     async def get_cached_response(self, cache_key: str) -> Dict[str, Any] | None:  # noqa: UP006
         """
@@ -32,8 +34,8 @@ class CacheRepository(BaseRepository[Dict[str, Any]]):  # noqa: UP006
         """
         try:
             query = """
-                SELECT response_data, expires_at
-                FROM api_cache
+                SELECT data, expires_at
+                FROM api_enrichment_cache
                 WHERE cache_key = $1
                   AND (expires_at IS NULL OR expires_at > NOW())
             """
@@ -41,7 +43,7 @@ class CacheRepository(BaseRepository[Dict[str, Any]]):  # noqa: UP006
 
             if result:
                 # Parse JSON response
-                response_data = result['response_data']
+                response_data = result['data']
                 if isinstance(response_data, str):
                     response_data = json.loads(response_data)
 
@@ -55,11 +57,51 @@ class CacheRepository(BaseRepository[Dict[str, Any]]):  # noqa: UP006
             logger.error(f"Failed to get cached response for key '{cache_key}': {e}")
             return None
 
+    async def get_cached_responses(
+        self,
+        cache_keys: List[str],  # noqa: UP006
+    ) -> Dict[str, Dict[str, Any]]:  # noqa: UP006
+        """
+        Get several cached API responses in one query.
+
+        Args:
+            cache_keys: Cache identifiers to look up
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Response data of the unexpired entries found,
+            by cache key
+        """
+        if not cache_keys:
+            return {}
+        try:
+            query = """
+                SELECT cache_key, data
+                FROM api_enrichment_cache
+                WHERE cache_key = ANY($1::text[])
+                  AND (expires_at IS NULL OR expires_at > NOW())
+            """
+            rows = await self.postgres.fetch(query, list(cache_keys))
+
+            responses = {}
+            for row in rows:
+                response_data = row['data']
+                if isinstance(response_data, str):
+                    response_data = json.loads(response_data)
+                responses[row['cache_key']] = response_data
+
+            logger.debug(f'Cache hits for {len(responses)}/{len(cache_keys)} keys')
+            return responses
+
+        except Exception as e:
+            logger.error(f'Failed to get cached responses: {e}')
+            return {}
+
     async def set_cached_response(
         self,
         cache_key: str,
         response_data: Dict[str, Any],  # noqa: UP006
-        ttl_seconds: int | None = 3600,
+        ttl_seconds: float | None = 3600,
+        source: str = 'api',
     ) -> bool:
         """
         Store an API response in the cache.
@@ -68,6 +110,7 @@ class CacheRepository(BaseRepository[Dict[str, Any]]):  # noqa: UP006
             cache_key: Unique cache identifier
             response_data: Response data to cache
             ttl_seconds: Time-to-live in seconds (None = no expiration)
+            source: API or component the data came from
 
         Returns:
             bool: True if successful
@@ -75,21 +118,24 @@ class CacheRepository(BaseRepository[Dict[str, Any]]):  # noqa: UP006
         try:
             expires_at = None
             if ttl_seconds is not None:
-                expires_at = datetime.now() + timedelta(seconds=ttl_seconds)
+                expires_at = datetime.now(UTC) + timedelta(seconds=ttl_seconds)
 
             # Convert dict to JSON string
             response_json = json.dumps(response_data)
 
             query = """
-                INSERT INTO api_cache (cache_key, response_data, expires_at)
-                VALUES ($1, $2, $3)
+                INSERT INTO api_enrichment_cache (cache_key, data, source, expires_at)
+                VALUES ($1, $2, $3, $4)
                 ON CONFLICT (cache_key)
                 DO UPDATE SET
-                    response_data = EXCLUDED.response_data,
+                    data = EXCLUDED.data,
+                    source = EXCLUDED.source,
                     expires_at = EXCLUDED.expires_at,
                     created_at = NOW()
             """
-            await self.postgres.execute(query, cache_key, response_json, expires_at)
+            await self.postgres.execute(
+                query, cache_key, response_json, source, expires_at
+            )
 
             # Invalidate cache
             self._invalidate_cache(cache_key)
@@ -112,7 +158,7 @@ class CacheRepository(BaseRepository[Dict[str, Any]]):  # noqa: UP006
             bool: True if successful
         """
         try:
-            query = 'DELETE FROM api_cache WHERE cache_key = $1'
+            query = 'DELETE FROM api_enrichment_cache WHERE cache_key = $1'
             await self.postgres.execute(query, cache_key)
 
             # Invalidate memory cache
@@ -136,7 +182,7 @@ class CacheRepository(BaseRepository[Dict[str, Any]]):  # noqa: UP006
             int: Number of entries invalidated
         """
         try:
-            query = 'DELETE FROM api_cache WHERE cache_key LIKE $1'
+            query = 'DELETE FROM api_enrichment_cache WHERE cache_key LIKE $1'
             result = await self.postgres.execute(query, pattern)
 
             # Extract count from result
@@ -163,7 +209,7 @@ class CacheRepository(BaseRepository[Dict[str, Any]]):  # noqa: UP006
         """
         try:
             query = """
-                DELETE FROM api_cache
+                DELETE FROM api_enrichment_cache
                 WHERE expires_at IS NOT NULL
                   AND expires_at < NOW()
             """
@@ -192,8 +238,8 @@ class CacheRepository(BaseRepository[Dict[str, Any]]):  # noqa: UP006
                     COUNT(*) as total_entries,
                     COUNT(*) FILTER (WHERE expires_at IS NULL OR expires_at > NOW()) as active_entries,
                     COUNT(*) FILTER (WHERE expires_at < NOW()) as expired_entries,
-                    pg_size_pretty(pg_total_relation_size('api_cache')) as table_size
-                FROM api_cache
+                    pg_size_pretty(pg_total_relation_size('api_enrichment_cache')) as table_size
+                FROM api_enrichment_cache
             """
             result = await self.postgres.fetchrow(query)
 
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from thoth.pipeline import ThothPipeline
+    from thoth.pipelines.ingestion_queue import IngestionQueue
     from thoth.pipelines.optimized_document_pipeline import OptimizedDocumentPipeline
 
 from loguru import logger
@@ -624,16 +625,23 @@ class PDFHandler(FileSystemEventHandler):
     the processing pipeline when new PDFs are detected.
     """
 
-    def __init__(self, pipeline: 'ThothPipeline'):
+    def __init__(
+        self,
+        pipeline: 'ThothPipeline',
+        ingestion_queue: Optional['IngestionQueue'] = None,
+    ):
         """
         Initialize the PDF handler.
 
         Args:
             pipeline: Thoth pipeline to process PDFs (ThothPipeline or
                 OptimizedDocumentPipeline).
+            ingestion_queue: If given, new PDFs are queued for ingestion
+                workers instead of being processed in this process.
         """
         # Store the pipeline - could be ThothPipeline or OptimizedDocumentPipeline
         self.pipeline = pipeline
+        self.ingestion_queue = ingestion_queue
         self.config = config
         self._user_id_cache: dict[str, str] = {}
 
@@ -661,6 +669,10 @@ class PDFHandler(FileSystemEventHandler):
             user_id = _resolve_user_id_from_path(
                 file_path, self.config, self._user_id_cache
             )
+            if self.ingestion_queue is not None:
+                job_id = self.ingestion_queue.enqueue(file_path, user_id=user_id)
+                logger.info(f'Queued {file_path.name} for ingestion (job {job_id})')
+                return
             username = _resolve_username_from_path(file_path, self.config)
             vault_path = (
                 Path(self.config.vaults_root) / username
@@ -766,6 +778,9 @@ class PDFMonitor:
 
             _, self.pipeline, _ = initialize_thoth()
 
+        # Queue PDFs for ingestion workers instead of processing them here
+        self.ingestion_queue = self._create_ingestion_queue()
+
         # Set up the observer
         self.observer = PollingObserver(timeout=polling_interval)
         self.polling_interval = polling_interval
@@ -1005,6 +1020,12 @@ class PDFMonitor:
                     set_current_user_context,
                 )
 
+                if self.ingestion_queue is not None:
+                    job_id = self.ingestion_queue.enqueue(pdf_file, user_id=user_id)
+                    logger.info(f'Queued {pdf_file.name} for ingestion (job {job_id})')
+                    self.files_processed += 1
+                    continue
+
                 tokens = set_current_user_context(user_id, username, vault_path)
                 try:
                     self.pipeline.process_pdf(pdf_file, user_id=user_id)
@@ -1029,6 +1050,19 @@ class PDFMonitor:
 
         self.last_check = datetime.now()
 
+    def _create_ingestion_queue(self) -> Optional['IngestionQueue']:
+        """Durable ingestion queue, if enabled in the performance settings."""
+        performance = getattr(self.config, 'performance_config', None)
+        queue_config = getattr(performance, 'ingestion_queue', None)
+        if getattr(queue_config, 'enabled', False) is not True:
+            return None
+
+        from thoth.pipelines.ingestion_queue import IngestionQueue
+
+        queue = IngestionQueue.from_config(self.pipeline.services.postgres, self.config)
+        logger.info('Ingestion queue enabled: new PDFs are queued for workers')
+        return queue
+
     def _start_observer(self):
         """
         Start or restart the observer with current watch directory.
@@ -1037,7 +1071,7 @@ class PDFMonitor:
         logger.info('_start_observer() ENTERED')
 
         print('MONITOR:  Creating PDFHandler...', flush=True)
-        event_handler = PDFHandler(self.pipeline)
+        event_handler = PDFHandler(self.pipeline, ingestion_queue=self.ingestion_queue)
         print('MONITOR:  PDFHandler created', flush=True)
 
         for watch_dir in self.watch_dirs:
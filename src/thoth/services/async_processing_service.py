@@ -6,7 +6,7 @@ OCR, content analysis, and citation extraction for improved I/O performance.
 """
 
 import asyncio
-import hashlib
+import weakref
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +16,7 @@ from pypdf import PdfReader
 
 from thoth.services.base import BaseService, ServiceError
 from thoth.services.llm_service import LLMService
+from thoth.services.ocr_cache import CachedOCR, OCRCache
 
 # Optional import for aiofiles - will fallback to sync I/O if not available
 try:
@@ -55,7 +56,12 @@ class AsyncProcessingService(BaseService):
         super().__init__(config)
         self._llm_service = llm_service
         self._session = session
-        self._ocr_cache = {}  # Simple in-memory cache for OCR results
+        self._ocr_cache: OCRCache | None = None
+        # One lock per PDF digest being converted, so duplicates wait for the
+        # first conversion instead of running OCR again
+        self._ocr_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
         self._semaphore = asyncio.Semaphore(3)  # Limit concurrent API calls
 
     @property
@@ -82,14 +88,12 @@ class AsyncProcessingService(BaseService):
         if self._session:
             await self._session.close()
 
-    def _get_pdf_hash(self, pdf_path: Path) -> str:
-        """Generate hash for PDF file for caching."""
-        hasher = hashlib.md5(usedforsecurity=False)  # nosec B324
-        with pdf_path.open('rb') as f:
-            # Read file in chunks to handle large files
-            for chunk in iter(lambda: f.read(4096), b''):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+    @property
+    def ocr_cache(self) -> OCRCache | None:
+        """Get the shared OCR result cache (None when caching is disabled)."""
+        if self._ocr_cache is None:
+            self._ocr_cache = OCRCache.from_config(self.config)
+        return self._ocr_cache
 
     async def ocr_convert_async(
         self,
@@ -122,27 +126,21 @@ class AsyncProcessingService(BaseService):
                 output_dir = up.markdown_dir if up else self.config.markdown_dir
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Check cache first
-            pdf_hash = self._get_pdf_hash(pdf_path) if use_cache else None
-            if pdf_hash and pdf_hash in self._ocr_cache:
-                self.logger.info(f'Using cached OCR result for {pdf_path.name}')
-                cached_result = self._ocr_cache[pdf_hash]
-                return await self._write_cached_result(
-                    cached_result, pdf_path, output_dir
-                )
-
-            if not self.config.api_keys.mistral_key:
-                self.logger.info('Using local PDF to markdown conversion')
-                result = await self._local_pdf_to_markdown_async(pdf_path, output_dir)
-                if use_cache and pdf_hash:
-                    self._cache_ocr_result(pdf_hash, result)
-                return result
-
-            # Use async Mistral OCR
-            async with self._semaphore:  # Limit concurrent API calls
-                result = await self._mistral_ocr_async(pdf_path, output_dir)
-                if use_cache and pdf_hash:
-                    self._cache_ocr_result(pdf_hash, result)
+            ocr_cache = self.ocr_cache if use_cache else None
+            if ocr_cache is None:
+                return await self._convert_uncached_async(pdf_path, output_dir)
+
+            pdf_hash = await asyncio.to_thread(ocr_cache.digest, pdf_path)
+            lock = self._ocr_locks.setdefault(pdf_hash, asyncio.Lock())
+            async with lock:
+                cached = await asyncio.to_thread(ocr_cache.get, pdf_hash)
+                if cached is not None:
+                    self.logger.info(f'Using cached OCR result for {pdf_path.name}')
+                    return await self._write_cached_result(cached, pdf_path, output_dir)
+
+                result = await self._convert_uncached_async(pdf_path, output_dir)
+                if self.config.api_keys.mistral_key:
+                    await asyncio.to_thread(self._cache_ocr_result, pdf_hash, result)
                 return result
 
         except Exception as e:
@@ -150,6 +148,17 @@ class AsyncProcessingService(BaseService):
                 self.handle_error(e, f"Async OCR conversion of '{pdf_path}'")
             ) from e
 
+    async def _convert_uncached_async(
+        self, pdf_path: Path, output_dir: Path
+    ) -> tuple[Path, Path]:
+        """Run Mistral OCR, or local conversion when no API key is set."""
+        if not self.config.api_keys.mistral_key:
+            self.logger.info('Using local PDF to markdown conversion')
+            return await self._local_pdf_to_markdown_async(pdf_path, output_dir)
+
+        async with self._semaphore:  # Limit concurrent API calls
+            return await self._mistral_ocr_async(pdf_path, output_dir)
+
     async def _mistral_ocr_async(
         self, pdf_path: Path, output_dir: Path
     ) -> tuple[Path, Path]:
@@ -300,25 +309,24 @@ class AsyncProcessingService(BaseService):
             await loop.run_in_executor(None, file_path.write_text, content)
 
     def _cache_ocr_result(self, pdf_hash: str, result: tuple[Path, Path]) -> None:
-        """Cache OCR result for future use."""
-        self._ocr_cache[pdf_hash] = {
-            'full_markdown': result[0].read_text(),
-            'no_images_markdown': result[1].read_text(),
-            'stem': result[0].stem,
-        }
-        self.logger.debug(f'Cached OCR result for hash {pdf_hash[:8]}...')
+        """Store an OCR result in the shared cache."""
+        self.ocr_cache.put(
+            pdf_hash,
+            result[0].read_text(encoding='utf-8'),
+            result[1].read_text(encoding='utf-8'),
+        )
 
     async def _write_cached_result(
-        self, cached_result: dict, pdf_path: Path, output_dir: Path
+        self, cached_result: CachedOCR, pdf_path: Path, output_dir: Path
     ) -> tuple[Path, Path]:
         """Write cached OCR result to files."""
         output_path = output_dir / f'{pdf_path.stem}.md'
         no_images_output_path = output_dir / f'{pdf_path.stem}_no_images.md'
 
         await asyncio.gather(
-            self._write_file_async(output_path, cached_result['full_markdown']),
+            self._write_file_async(output_path, cached_result.full_markdown),
             self._write_file_async(
-                no_images_output_path, cached_result['no_images_markdown']
+                no_images_output_path, cached_result.no_images_markdown
             ),
         )
 
@@ -392,5 +400,7 @@ class AsyncProcessingService(BaseService):
         """Basic health status for the AsyncProcessingService."""
         status = super().health_check()
         status['async_session'] = 'active' if self._session else 'not_created'
-        status['cache_size'] = str(len(self._ocr_cache))
+        status['cache_size'] = (
+            str(self.ocr_cache.stats()['entries']) if self.ocr_cache else 'disabled'
+        )
         return status
@@ -173,6 +173,8 @@ class LLMService(BaseService):
                 'chunk_overlap',
                 'refine_threshold_multiplier',
                 'map_reduce_threshold_multiplier',
+                'map_concurrency',
+                'map_max_retries',
                 'consolidate_model',
                 'suggest_model',
                 'map_model',
@@ -0,0 +1,263 @@
+"""
+Content-addressed, persistent cache for OCR results.
+
+OCR output depends only on the bytes of the PDF, so results are keyed by a
+streaming BLAKE2b digest of the file instead of its path or name. A renamed,
+moved or re-downloaded PDF, or the same paper dropped into several users'
+vaults, is converted once and served from the cache afterwards.
+
+Each entry is a single gzip-compressed JSON file holding the full markdown
+(with the page images embedded as OCR returned them) and the markdown
+without images. Entries are written atomically, so several processes can
+share one cache directory. When the directory grows past its size limit, the
+least recently used entries are evicted.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+_READ_CHUNK_BYTES = 1024 * 1024
+_ENTRY_SUFFIX = '.json.gz'
+
+_shared_caches: dict[Path, OCRCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+@dataclass
+class CachedOCR:
+    """A cached OCR result."""
+
+    full_markdown: str
+    no_images_markdown: str
+    source: str
+    created_at: float
+
+
+class OCRCache:
+    """Disk store of OCR results keyed by PDF content digest."""
+
+    def __init__(self, root: Path, max_size_bytes: int):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Directory holding the cache entries (created on first write)
+            max_size_bytes: Size above which least recently used entries are
+                evicted
+        """
+        self.root = Path(root)
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size_bytes: int | None = None
+        self._lock = threading.Lock()
+        self._inflight: dict[str, list] = {}
+
+    @classmethod
+    def from_config(cls, config) -> OCRCache | None:
+        """
+        Return the process-wide cache configured in ``performance.ocr``.
+
+        Both processing services share one instance per cache directory, so
+        they share size accounting. In-flight deduplication is per service:
+        the synchronous service uses ``claim``, the async service its own
+        per-digest asyncio locks.
+
+        Returns:
+            The shared cache, or None when OCR caching is disabled
+        """
+        ocr_config = config.performance_config.ocr
+        if ocr_config.enable_caching is not True:
+            return None
+        root = (
+            Path(ocr_config.cache_dir).expanduser()
+            if ocr_config.cache_dir
+            else Path(config.cache_root) / 'ocr'
+        )
+        with _shared_caches_lock:
+            cache = _shared_caches.get(root)
+            if cache is None:
+                cache = cls(root, ocr_config.cache_max_size_mb * 1024 * 1024)
+                _shared_caches[root] = cache
+            return cache
+
+    @staticmethod
+    def digest(pdf_path: Path) -> str:
+        """Stream the PDF through BLAKE2b and return its hex digest."""
+        hasher = hashlib.blake2b(digest_size=32)
+        with Path(pdf_path).open('rb') as f:
+            while chunk := f.read(_READ_CHUNK_BYTES):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _entry_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f'{digest}{_ENTRY_SUFFIX}'
+
+    def get(self, digest: str) -> CachedOCR | None:
+        """
+        Look up the OCR result of a PDF.
+
+        A hit refreshes the entry's modification time, which is what eviction
+        orders by. Unreadable entries are removed and count as misses.
+        """
+        path = self._entry_path(digest)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+            os.utime(path)
+            result = CachedOCR(
+                full_markdown=data['full_markdown'],
+                no_images_markdown=data['no_images_markdown'],
+                source=data.get('source', 'unknown'),
+                created_at=data.get('created_at', 0.0),
+            )
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f'Discarding unreadable OCR cache entry {path}: {e}')
+            self._remove(path)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(
+        self,
+        digest: str,
+        full_markdown: str,
+        no_images_markdown: str,
+        source: str = 'mistral',
+    ) -> None:
+        """Store the OCR result of a PDF and evict entries above the size limit."""
+        path = self._entry_path(digest)
+        payload = {
+            'full_markdown': full_markdown,
+            'no_images_markdown': no_images_markdown,
+            'source': source,
+            'created_at': time.time(),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            previous = path.stat().st_size if path.exists() else 0
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with (
+                    os.fdopen(fd, 'wb') as raw,
+                    gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6) as f,
+                ):
+                    f.write(json.dumps(payload).encode('utf-8'))
+                os.replace(tmp_name, path)
+            except BaseException:
+                self._remove(Path(tmp_name))
+                raise
+            size = path.stat().st_size
+        except OSError as e:
+            logger.warning(f'Could not write OCR cache entry for {digest[:12]}: {e}')
+            return
+
+        with self._lock:
+            if self._size_bytes is not None:
+                self._size_bytes += size - previous
+        logger.debug(f'Cached OCR result {digest[:12]} ({size} bytes)')
+        if self.size_bytes() > self.max_size_bytes:
+            self.evict()
+
+    @contextmanager
+    def claim(self, digest: str) -> Iterator[None]:
+        """
+        Serialize work on one digest within this process.
+
+        Callers check the cache and run OCR inside the claim, so concurrent
+        requests for the same PDF wait for the first conversion and then hit
+        the cache instead of converting it again.
+        """
+        with self._lock:
+            entry = self._inflight.setdefault(digest, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._inflight[digest]
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.root.glob(f'*/*{_ENTRY_SUFFIX}'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size_bytes(self) -> int:
+        """Total size of the cache entries on disk."""
+        with self._lock:
+            if self._size_bytes is None:
+                self._size_bytes = sum(size for _, size, _ in self._entries())
+            return self._size_bytes
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits its limit.
+
+        The directory is rescanned, so entries written by other processes are
+        accounted for.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in entries:
+                if total <= self.max_size_bytes:
+                    break
+                if self._remove(path):
+                    total -= size
+                    removed += 1
+            self._size_bytes = total
+        if removed:
+            logger.info(f'Evicted {removed} OCR cache entries')
+        return removed
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f'Could not remove OCR cache file {path}: {e}')
+            return False
+
+    def stats(self) -> dict[str, Any]:
+        """Entry count, size and hit counters of the cache."""
+        return {
+            'directory': str(self.root),
+            'entries': len(self._entries()),
+            'size_bytes': self.size_bytes(),
+            'max_size_bytes': self.max_size_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
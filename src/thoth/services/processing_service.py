@@ -6,6 +6,7 @@ OCR, content analysis, citation extraction, and note generation.
 """
 
 import warnings
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +19,7 @@ from thoth.analyze.llm_processor import LLMProcessor
 from thoth.services.analysis_schema_service import AnalysisSchemaService
 from thoth.services.base import BaseService, ServiceError
 from thoth.services.llm_service import LLMService
+from thoth.services.ocr_cache import OCRCache
 from thoth.utilities.schemas import AnalysisResponse
 
 
@@ -52,6 +54,7 @@ class ProcessingService(BaseService):
         self._ocr_service = None
         self._citation_service = None
         self._analysis_schema_service = None
+        self._ocr_cache: OCRCache | None = None
 
     def _save_markdown_to_postgres(
         self, paper_title: str, markdown_content: str
@@ -161,6 +164,13 @@ class ProcessingService(BaseService):
             )
         return self._mistral_client
 
+    @property
+    def ocr_cache(self) -> OCRCache | None:
+        """Get the shared OCR result cache (None when caching is disabled)."""
+        if self._ocr_cache is None:
+            self._ocr_cache = OCRCache.from_config(self.config)
+        return self._ocr_cache
+
     @property
     def llm_service(self) -> LLMService:
         """Get or create the LLM service."""
@@ -219,25 +229,27 @@ class ProcessingService(BaseService):
                 output_dir = up.markdown_dir if up else self.config.markdown_dir
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            if not self.config.api_keys.mistral_key:
-                self.logger.info('Using local PDF to markdown conversion')
-                return self._local_pdf_to_markdown(pdf_path, output_dir)
-
-            self.logger.debug(f'Uploading PDF for OCR: {pdf_path}')
-            uploaded_file = self._upload_file_to_mistral(pdf_path)
-
-            signed_url_obj = self.mistral_client.files.get_signed_url(
-                file_id=uploaded_file.id, expiry=1
-            )
-            signed_url = signed_url_obj.url
-
-            self.logger.debug('Processing with Mistral OCR')
-            ocr_response = self._call_mistral_ocr(signed_url)
+            ocr_cache = self.ocr_cache
+            digest = ocr_cache.digest(pdf_path) if ocr_cache else None
+            with ocr_cache.claim(digest) if ocr_cache else nullcontext():
+                cached = ocr_cache.get(digest) if ocr_cache else None
+                if cached is not None:
+                    self.logger.info(f'Using cached OCR result for {pdf_path.name}')
+                    no_images_markdown = cached.no_images_markdown
+                elif not self.config.api_keys.mistral_key:
+                    self.logger.info('Using local PDF to markdown conversion')
+                    return self._local_pdf_to_markdown(pdf_path, output_dir)
+                else:
+                    ocr_response = self._mistral_ocr(pdf_path)
+                    no_images_markdown = self._join_markdown_pages(ocr_response)
+                    if ocr_cache:
+                        ocr_cache.put(
+                            digest,
+                            self._get_combined_markdown(ocr_response),
+                            no_images_markdown,
+                        )
 
-            combined_markdown = self._get_combined_markdown(ocr_response)  # noqa: F841
             output_path = output_dir / f'{pdf_path.stem}.md'
-
-            no_images_markdown = self._join_markdown_pages(ocr_response)
             no_images_output_path = output_dir / f'{pdf_path.stem}_no_images.md'
 
             # Save to both disk and PostgreSQL
@@ -259,6 +271,18 @@ class ProcessingService(BaseService):
                 self.handle_error(e, f"OCR conversion of '{pdf_path}'")
             ) from e
 
+    def _mistral_ocr(self, pdf_path: Path) -> OCRResponse:
+        """Upload a PDF to Mistral and run OCR on it."""
+        self.logger.debug(f'Uploading PDF for OCR: {pdf_path}')
+        uploaded_file = self._upload_file_to_mistral(pdf_path)
+
+        signed_url_obj = self.mistral_client.files.get_signed_url(
+            file_id=uploaded_file.id, expiry=1
+        )
+
+        self.logger.debug('Processing with Mistral OCR')
+        return self._call_mistral_ocr(signed_url_obj.url)
+
     def process_pdf_to_markdown(
         self,
         pdf_path: Path,
@@ -349,6 +373,8 @@ class ProcessingService(BaseService):
                 model_kwargs=self.config.llm_config.model_settings.model_dump(),
                 analysis_model=analysis_model,
                 custom_instructions=custom_instructions,
+                map_concurrency=self.config.llm_config.map_concurrency,
+                map_max_retries=self.config.llm_config.map_max_retries,
             )
             analysis = self.llm_processor.analyze_content(
                 content,
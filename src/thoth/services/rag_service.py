@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from thoth.rag.rag_manager import RAGManager
+from thoth.rag.vector_index import VectorIndexHealth, VectorIndexManager
 from thoth.services.base import BaseService, ServiceError
 
 
@@ -484,6 +485,67 @@ class RAGService(BaseService):
         except Exception as e:
             raise ServiceError(self.handle_error(e, 'clearing RAG index')) from e
 
+    def _vector_index_manager(self) -> VectorIndexManager:
+        rag_config = self.config.rag_config
+        return VectorIndexManager(
+            self.config.secrets.database_url,
+            method=rag_config.vector_index_type,
+            hnsw_m=rag_config.hnsw_m,
+            hnsw_ef_construction=rag_config.hnsw_ef_construction,
+        )
+
+    def get_vector_index_health(self) -> VectorIndexHealth:
+        """
+        Inspect the chunk embedding index.
+
+        Returns:
+            VectorIndexHealth: Index state and rebuild recommendations
+
+        Raises:
+            ServiceError: If the inspection fails
+        """
+        from thoth.utilities.async_utils import run_async_safely
+
+        try:
+            return run_async_safely(self._vector_index_manager().get_health_async())
+        except Exception as e:
+            raise ServiceError(self.handle_error(e, 'checking vector index')) from e
+
+    def rebuild_vector_index(
+        self,
+        method: str | None = None,
+        lists: int | None = None,
+        maintenance_work_mem: str | None = None,
+    ) -> VectorIndexHealth:
+        """
+        Rebuild the chunk embedding index concurrently (writes keep working).
+
+        Args:
+            method: 'hnsw' or 'ivfflat' (defaults to config vector_index_type)
+            lists: IVFFlat lists (defaults to a value sized to the table)
+            maintenance_work_mem: Session memory for the build, e.g. '1GB'
+
+        Returns:
+            VectorIndexHealth: State of the rebuilt index
+
+        Raises:
+            ServiceError: If the rebuild fails
+        """
+        from thoth.utilities.async_utils import run_async_safely
+
+        try:
+            health = run_async_safely(
+                self._vector_index_manager().rebuild_async(
+                    method=method,
+                    lists=lists,
+                    maintenance_work_mem=maintenance_work_mem,
+                )
+            )
+            self.log_operation('vector_index_rebuilt', method=health.method)
+            return health
+        except Exception as e:
+            raise ServiceError(self.handle_error(e, 'rebuilding vector index')) from e
+
     def index_knowledge_base(
         self,
         markdown_dir: Path | None = None,
@@ -712,26 +774,67 @@ class RAGService(BaseService):
             stats = {
                 'total_papers': len(papers),
                 'papers_indexed': 0,
+                'papers_skipped': 0,
                 'total_chunks': 0,
                 'errors': [],
             }
 
-            for row in papers:
-                paper_id = str(row['id'])
-                title = row['title'] or 'Unknown'
-                content = row['markdown_content']
-
-                try:
-                    doc_ids = self.rag_manager.index_paper_by_id(
-                        paper_id, markdown_content=content
+            if self.config.rag_config.streaming_index_enabled:
+                # One pipeline for the whole run: embedding of the next batch
+                # overlaps the database write of the current one.
+                titles = {row['id']: row['title'] or 'Unknown' for row in papers}
+                results = run_async_safely(
+                    self.rag_manager.index_papers_streaming_async(
+                        [str(row['id']) for row in papers]
                     )
-                    stats['total_chunks'] += len(doc_ids)
+                )
+                for result in results:
+                    title = titles.get(result.paper_id, 'Unknown')
+                    if result.error is not None:
+                        stats['errors'].append(f'{title}: {result.error}')
+                        continue
+                    if result.skipped:
+                        stats['papers_skipped'] += 1
+                        self.logger.warning(
+                            f'Skipped {title[:50]}: {result.skip_reason}'
+                        )
+                        continue
+                    stats['total_chunks'] += len(result.ids)
                     stats['papers_indexed'] += 1
-                    self.logger.info(f'Indexed {len(doc_ids)} chunks for: {title[:50]}')
-                except Exception as e:
-                    error_msg = f'{title}: {e}'
-                    stats['errors'].append(error_msg)
-                    self.logger.error(f'Failed to index {paper_id}: {e}')
+                    enrichment = ''
+                    if result.enrichment is not None:
+                        stats['contexts_cached'] = (
+                            stats.get('contexts_cached', 0) + result.enrichment.cached
+                        )
+                        stats['contexts_generated'] = (
+                            stats.get('contexts_generated', 0) + result.enrichment.fresh
+                        )
+                        enrichment = (
+                            f' ({result.enrichment.cached} contexts cached, '
+                            f'{result.enrichment.fresh} generated)'
+                        )
+                    self.logger.info(
+                        f'Indexed {len(result.ids)} chunks for: {title[:50]}{enrichment}'
+                    )
+            else:
+                for row in papers:
+                    paper_id = str(row['id'])
+                    title = row['title'] or 'Unknown'
+                    content = row['markdown_content']
+
+                    try:
+                        doc_ids = self.rag_manager.index_paper_by_id(
+                            paper_id, markdown_content=content
+                        )
+                        stats['total_chunks'] += len(doc_ids)
+                        stats['papers_indexed'] += 1
+                        self.logger.info(
+                            f'Indexed {len(doc_ids)} chunks for: {title[:50]}'
+                        )
+                    except Exception as e:
+                        error_msg = f'{title}: {e}'
+                        stats['errors'].append(error_msg)
+                        self.logger.error(f'Failed to index {paper_id}: {e}')
 
             self.log_operation(
                 'database_indexed',
@@ -1,15 +1,17 @@
 """
 Tests for reranking layer (Phase 2).
 
-Tests Cohere, LLM-based, and NoOp rerankers.
+Tests Cohere, LLM-based, cross-encoder, and NoOp rerankers.
 """
 
+import sys
 from unittest.mock import MagicMock
 
 import pytest
 from langchain_core.documents import Document
 
 from thoth.rag.reranker import (
+    CrossEncoderReranker,
     LLMReranker,
     NoOpReranker,
     create_reranker,
@@ -64,7 +66,9 @@ class TestLLMReranker:
             mock_response_3,
         ]
 
-        reranker = LLMReranker(llm_client=mock_llm, model='test-model')
+        reranker = LLMReranker(
+            llm_client=mock_llm, model='test-model', mode='pointwise'
+        )
         assert 'test-model' in reranker.get_name()
 
         docs = [
@@ -84,6 +88,126 @@ class TestLLMReranker:
         assert result[2].metadata['id'] == 2
         assert result[2].metadata['rerank_score'] == 0.3
 
+    @pytest.mark.asyncio
+    async def test_llm_reranker_listwise_single_call(self):
+        """Test listwise mode scores a batch of documents in one LLM call."""
+        mock_llm = MagicMock()
+        response = MagicMock()
+        response.content = '```json\n{"1": 0.2, "2": 0.9, "3": 0.5}\n```'
+        mock_llm.invoke.return_value = response
+
+        reranker = LLMReranker(llm_client=mock_llm, model='test-model')
+        docs = [Document(page_content=f'doc{i}', metadata={'id': i}) for i in (1, 2, 3)]
+
+        result = await reranker.rerank_async('test query', docs, top_n=2)
+
+        assert mock_llm.invoke.call_count == 1
+        assert [d.metadata['id'] for d in result] == [2, 3]
+        assert result[0].metadata['rerank_score'] == 0.9
+
+    @pytest.mark.asyncio
+    async def test_llm_reranker_listwise_falls_back_to_pointwise(self):
+        """Test an unparseable listwise response falls back to per-doc scoring."""
+        mock_llm = MagicMock()
+        responses = [MagicMock(content=text) for text in ('not json', '0.1', '0.8')]
+        mock_llm.invoke.side_effect = responses
+
+        reranker = LLMReranker(llm_client=mock_llm, model='test-model')
+        docs = [Document(page_content=f'doc{i}', metadata={'id': i}) for i in (1, 2)]
+
+        result = await reranker.rerank_async('test query', docs)
+
+        assert mock_llm.invoke.call_count == 3
+        assert [d.metadata['id'] for d in result] == [2, 1]
+
+
+class FakeCrossEncoder:
+    """Scores a pair by the number of query words in the document."""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, pairs, batch_size=32, show_progress_bar=False):  # noqa: ARG002
+        self.calls.append(list(pairs))
+        return [
+            float(sum(word in doc.split() for word in query.split()))
+            for query, doc in pairs
+        ]
+
+
+class TestCrossEncoderReranker:
+    """Test local cross-encoder reranker."""
+
+    @pytest.mark.asyncio
+    async def test_cross_encoder_reorders_by_score(self):
+        """Test documents are sorted by cross-encoder score in one batch."""
+        model = FakeCrossEncoder()
+        reranker = CrossEncoderReranker(model_name='fake', model=model)
+        assert reranker.get_name() == 'cross-encoder-fake'
+
+        docs = [
+            Document(page_content='unrelated text', metadata={'chunk_id': 'a'}),
+            Document(page_content='graph neural networks', metadata={'chunk_id': 'b'}),
+            Document(page_content='neural models', metadata={'chunk_id': 'c'}),
+        ]
+
+        result = await reranker.rerank_async('graph neural networks', docs, top_n=2)
+
+        assert [d.metadata['chunk_id'] for d in result] == ['b', 'c']
+        assert result[0].metadata['rerank_score'] == 3.0
+        assert result[0].metadata['rerank_model'] == 'fake'
+        assert len(model.calls) == 1
+        assert len(model.calls[0]) == 3
+
+    @pytest.mark.asyncio
+    async def test_cross_encoder_caches_scores_per_query_and_chunk(self):
+        """Test only unseen (query, chunk) pairs reach the model."""
+        model = FakeCrossEncoder()
+        reranker = CrossEncoderReranker(model_name='fake', model=model)
+
+        docs = [
+            Document(page_content='attention', metadata={'chunk_id': '1'}),
+            Document(page_content='transformers', metadata={'chunk_id': '2'}),
+        ]
+        await reranker.rerank_async('attention', docs)
+
+        more = [*docs, Document(page_content='attention', metadata={'chunk_id': '3'})]
+        await reranker.rerank_async('attention', more)
+        await reranker.rerank_async('transformers', docs)
+
+        assert [len(call) for call in model.calls] == [2, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_cross_encoder_rescores_chunk_with_changed_content(self):
+        """Test a chunk rewritten under the same id is not served a stale score."""
+        model = FakeCrossEncoder()
+        reranker = CrossEncoderReranker(model_name='fake', model=model)
+
+        await reranker.rerank_async(
+            'attention',
+            [Document(page_content='attention', metadata={'chunk_id': '1'})],
+        )
+        await reranker.rerank_async(
+            'attention', [Document(page_content='revised', metadata={'chunk_id': '1'})]
+        )
+
+        assert [len(call) for call in model.calls] == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_cross_encoder_failure_keeps_original_order(self):
+        """Test model errors fall back to the retrieval order."""
+        model = MagicMock()
+        model.predict.side_effect = RuntimeError('boom')
+        reranker = CrossEncoderReranker(model_name='fake', model=model)
+
+        docs = [
+            Document(page_content='doc1', metadata={'id': 1}),
+            Document(page_content='doc2', metadata={'id': 2}),
+        ]
+        result = await reranker.rerank_async('query', docs, top_n=1)
+
+        assert [d.metadata['id'] for d in result] == [1]
+
 
 class TestRerankerFactory:
     """Test reranker factory."""
@@ -105,6 +229,26 @@ class TestRerankerFactory:
         reranker = create_reranker('auto', api_keys={}, llm_client=mock_llm)
         assert isinstance(reranker, LLMReranker)
 
+    def test_create_reranker_cross_encoder(self, monkeypatch):
+        """Test creating cross-encoder reranker with configured model."""
+        monkeypatch.setitem(sys.modules, 'sentence_transformers', MagicMock())
+        reranker = create_reranker(
+            'cross-encoder',
+            api_keys={},
+            cross_encoder_model='my/cross-encoder',
+            cross_encoder_batch_size=8,
+        )
+        assert isinstance(reranker, CrossEncoderReranker)
+        assert reranker.model_name == 'my/cross-encoder'
+        assert reranker.batch_size == 8
+
+    def test_create_reranker_cross_encoder_missing_package(self, monkeypatch):
+        """Test cross-encoder falls back to LLM when the package is missing."""
+        monkeypatch.setitem(sys.modules, 'sentence_transformers', None)
+        mock_llm = MagicMock()
+        reranker = create_reranker('cross-encoder', api_keys={}, llm_client=mock_llm)
+        assert isinstance(reranker, LLMReranker)
+
     def test_create_reranker_auto_fallback(self):
         """Test auto-detection falls back to NoOp when nothing available."""
         reranker = create_reranker('auto', api_keys={}, llm_client=None)
@@ -0,0 +1 @@
+"""Test module initialization for analyze unit tests."""
@@ -0,0 +1,110 @@
+"""Unit tests for LLMProcessor strategy selection and the map phase."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.runnables import RunnableLambda
+
+from thoth.analyze.llm_processor import LLMProcessor
+
+
+@pytest.fixture
+def processor(tmp_path):
+    llm_service = MagicMock()
+    llm_service.get_client.return_value.with_structured_output.return_value = (
+        RunnableLambda(lambda _: None)
+    )
+    return LLMProcessor(
+        llm_service=llm_service,
+        model='google/test-model',
+        prompts_dir=tmp_path,
+        max_context_length=1000,
+        map_concurrency=3,
+        map_max_retries=1,
+    )
+
+
+def _chunks(count: int) -> list[Document]:
+    return [Document(page_content=f'chunk {i}') for i in range(count)]
+
+
+class TestStrategySelection:
+    @pytest.mark.parametrize(
+        ('tokens', 'strategy'),
+        [(500, 'direct'), (1500, 'direct'), (10_000, 'map_reduce')],
+    )
+    def test_strategy_follows_token_count(self, processor, tokens, strategy):
+        state = {'original_content': 'x' * tokens * 4, 'strategy': None}
+
+        assert processor._determine_strategy(state)['strategy'] == strategy
+
+    def test_forced_strategy_is_kept(self, processor):
+        state = {'original_content': 'x' * 40_000, 'strategy': 'refine'}
+
+        assert processor._determine_strategy(state)['strategy'] == 'refine'
+
+
+class TestMapPhase:
+    def test_chunks_run_concurrently_and_keep_their_order(self, processor):
+        lock = threading.Lock()
+        running, peak = [0], [0]
+
+        def analyze(inputs):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return inputs['content']
+
+        processor.map_chain = RunnableLambda(analyze)
+
+        results = processor._map_chunks(_chunks(6))
+
+        assert results == [f'chunk {i}' for i in range(6)]
+        assert 1 < peak[0] <= 3
+
+    def test_failed_chunks_are_retried(self, processor):
+        attempts = {}
+
+        def analyze(inputs):
+            attempts[inputs['content']] = attempts.get(inputs['content'], 0) + 1
+            if inputs['content'] == 'chunk 1' and attempts['chunk 1'] == 1:
+                raise RuntimeError('rate limited')
+            return inputs['content']
+
+        processor.map_chain = RunnableLambda(analyze)
+
+        with patch('thoth.analyze.llm_processor.time.sleep'):
+            results = processor._map_chunks(_chunks(3))
+
+        assert results == ['chunk 0', 'chunk 1', 'chunk 2']
+        assert attempts == {'chunk 0': 1, 'chunk 1': 2, 'chunk 2': 1}
+
+    def test_chunks_failing_every_attempt_are_left_out(self, processor):
+        def analyze(inputs):
+            if inputs['content'] == 'chunk 1':
+                raise RuntimeError('bad chunk')
+            return inputs['content']
+
+        processor.map_chain = RunnableLambda(analyze)
+
+        with patch('thoth.analyze.llm_processor.time.sleep'):
+            results = processor._map_chunks(_chunks(3))
+
+        assert results == ['chunk 0', 'chunk 2']
+
+    def test_map_reduce_reduces_chunk_analyses_in_order(self, processor):
+        processor.map_chain = RunnableLambda(lambda inputs: inputs['content'])
+        processor.reduce_chain = MagicMock()
+        processor.reduce_chain.invoke.return_value = 'final'
+
+        state = processor._analyze_map_reduce({'content_chunks': _chunks(4)})
+
+        assert state['final_analysis'] == 'final'
+        reduce_inputs = processor.reduce_chain.invoke.call_args.args[0]
+        assert reduce_inputs['section_analyses'] == [f'chunk {i}' for i in range(4)]
@@ -502,6 +502,58 @@ class TestOpenAlexResolverQueryConstruction:
         assert params is None
 
 
+class TestOpenAlexResolverDOILookup:
+    """Test bulk DOI lookups with OpenAlex's OR filter."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_dois_groups_requests(self):
+        """Test that DOIs are looked up in groups joined into one filter."""
+        resolver = OpenAlexResolver()
+        dois = [f'10.1234/paper{i}' for i in range(250)]
+
+        async def fake_request(endpoint, params):  # noqa: ARG001
+            group = params['filter'].removeprefix('doi:').split('|')
+            return {
+                'results': [
+                    {
+                        'id': 'https://openalex.org/W' + doi.rsplit('paper', 1)[1],
+                        'doi': f'https://doi.org/{doi}',
+                    }
+                    for doi in group[:1]
+                ]
+            }
+
+        with patch.object(
+            resolver, '_make_request', side_effect=fake_request
+        ) as mock_request:
+            works = await resolver.lookup_dois(
+                ['https://doi.org/10.1234/Paper0', *dois]
+            )
+
+        assert mock_request.call_count == 3
+        first_filter = mock_request.call_args_list[0].args[1]['filter']
+        assert first_filter.count('|') == resolver.MAX_FILTER_VALUES - 1
+        assert sorted(works) == [
+            '10.1234/paper0',
+            '10.1234/paper100',
+            '10.1234/paper200',
+        ]
+        assert works['10.1234/paper0'].openalex_id == 'W0'
+
+    @pytest.mark.asyncio
+    async def test_lookup_dois_skips_unfilterable_dois(self):
+        """Test that DOIs containing filter separators are not sent."""
+        resolver = OpenAlexResolver()
+
+        with patch.object(
+            resolver, '_make_request', new_callable=AsyncMock
+        ) as mock_request:
+            works = await resolver.lookup_dois(['10.1234/a|b', '10.1234/c,d'])
+
+        assert works == {}
+        mock_request.assert_not_called()
+
+
 class TestSemanticScholarAPIInitialization:
     """Test Semantic Scholar API client initialization."""
 
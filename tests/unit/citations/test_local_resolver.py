@@ -0,0 +1,296 @@
+"""Unit tests for local-first resolution against our own paper corpus."""
+
+import json
+import re
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from rapidfuzz import fuzz
+
+from thoth.analyze.citations import local_resolver
+from thoth.analyze.citations.local_resolver import LocalCorpusResolver
+from thoth.analyze.citations.resolution_chain import CitationResolutionChain
+from thoth.analyze.citations.resolution_types import (
+    APISource,
+    CitationResolutionStatus,
+)
+from thoth.utilities.schemas.citations import Citation
+
+ATTENTION = {
+    'id': '00000000-0000-0000-0000-000000000001',
+    'doi': '10.5555/Attention',
+    'arxiv_id': '1706.03762',
+    'title': 'Attention Is All You Need',
+    'authors': ['Ashish Vaswani', 'Noam Shazeer'],
+    'year': 2017,
+    'journal': 'NeurIPS',
+    'abstract': 'The dominant sequence transduction models...',
+    'source_of_truth': 'citation',
+}
+RESNET = {
+    'id': '00000000-0000-0000-0000-000000000002',
+    'doi': None,
+    'arxiv_id': None,
+    'title': 'Deep Residual Learning for Image Recognition',
+    'authors': ['Kaiming He', 'Xiangyu Zhang'],
+    'year': 2016,
+    'journal': 'CVPR',
+    'abstract': None,
+    'source_of_truth': 'processed',
+}
+BERT = {
+    'id': '00000000-0000-0000-0000-000000000003',
+    'doi': '10.5555/bert',
+    'arxiv_id': None,
+    'title': 'BERT: Pre-training of Deep Bidirectional Transformers',
+    'authors': ['Jacob Devlin'],
+    'year': 2019,
+    'journal': None,
+    'abstract': None,
+    'source_of_truth': 'citation',
+}
+# Title-only rows: a citation placeholder and an external upload
+STUB = {
+    'id': '00000000-0000-0000-0000-000000000004',
+    'doi': None,
+    'arxiv_id': None,
+    'title': 'Graph Attention Networks',
+    'authors': ['Petar Velickovic'],
+    'year': 2018,
+    'journal': None,
+    'abstract': None,
+    'source_of_truth': 'citation',
+}
+UPLOAD = {**STUB, 'id': '00000000-0000-0000-0000-000000000005', 'source_of_truth': None}
+
+
+def _normalize_title(title):
+    return re.sub(r'\s+', ' ', re.sub(r'[^\w\s]', '', title.lower())).strip()
+
+
+class FakePostgres:
+    """In-memory stand-in for the paper_metadata table."""
+
+    def __init__(self, papers):
+        self.papers = papers
+        self.queries = []
+        self.initialize = AsyncMock()
+        self.close = AsyncMock()
+
+    async def fetch(self, query, *args):
+        self.queries.append(query)
+        if 'ANY' in query:
+            rows = [p for p in self.papers if p['id'] in args[0]]
+        elif 'lower(doi) = $1' in query:
+            rows = [
+                p
+                for p in self.papers
+                if (p['doi'] or '').lower() == args[0] or p['arxiv_id'] == args[1]
+            ]
+        elif 'title_normalized %' in query:
+            rows = [
+                p
+                for p in self.papers
+                if fuzz.ratio(_normalize_title(p['title']), args[0]) >= 50
+            ]
+        elif 'ILIKE' in query:
+            surname = args[2].strip('%')
+            rows = [
+                p
+                for p in self.papers
+                if args[0] <= p['year'] <= args[1]
+                and surname in json.dumps(p['authors']).lower()
+            ]
+        else:
+            rows = self.papers
+        # JSONB columns come back as text
+        return [{**p, 'authors': json.dumps(p['authors'])} for p in rows]
+
+
+@pytest.fixture(autouse=True)
+def _no_shared_resolver():
+    local_resolver._shared_resolver = None
+    yield
+    local_resolver._shared_resolver = None
+
+
+def _resolver(papers=None):
+    postgres = FakePostgres(list(papers or [ATTENTION, RESNET, BERT]))
+    return LocalCorpusResolver(postgres_factory=lambda: postgres), postgres
+
+
+class TestLocalCorpusResolver:
+    @pytest.mark.asyncio
+    async def test_identifier_match_returns_stored_record(self):
+        resolver, postgres = _resolver()
+
+        result = await resolver.resolve(
+            Citation(doi='https://doi.org/10.5555/attention', title='Attention')
+        )
+
+        assert result.status == CitationResolutionStatus.RESOLVED
+        assert result.source == APISource.LOCAL
+        assert result.confidence_score == 1.0
+        assert result.matched_data['abstract'] == ATTENTION['abstract']
+        assert result.matched_data['authors'] == ATTENTION['authors']
+        assert 'id' not in result.matched_data
+        assert result.metadata.additional_info == {
+            'local_match': 'identifier',
+            'paper_id': ATTENTION['id'],
+        }
+        # Index load and record fetch only
+        assert len(postgres.queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_title_match_from_token_index(self):
+        resolver, _ = _resolver()
+
+        result = await resolver.resolve(
+            Citation(
+                title='Attention is all you need.',
+                authors=['Vaswani, A.'],
+                year=2017,
+            )
+        )
+
+        assert result.matched_data['doi'] == ATTENTION['doi']
+        assert result.metadata.additional_info['local_match'] == 'index'
+
+    @pytest.mark.asyncio
+    async def test_author_year_block_catches_garbled_title(self):
+        resolver, _ = _resolver()
+        citation = Citation(
+            title='Deep Residul Learnng for Image Recogntion',
+            authors=['He, K.'],
+            year=2016,
+        )
+
+        result = await resolver.resolve(citation)
+
+        assert result.matched_data['title'] == RESNET['title']
+        assert result.metadata.additional_info['local_match'] == 'index'
+
+    @pytest.mark.asyncio
+    async def test_contradicting_year_or_author_is_no_match(self):
+        resolver, _ = _resolver()
+
+        assert (
+            await resolver.resolve(
+                Citation(title='Attention Is All You Need', year=2021)
+            )
+            is None
+        )
+        assert (
+            await resolver.resolve(
+                Citation(title='Attention Is All You Need', authors=['Devlin, J.'])
+            )
+            is None
+        )
+        assert resolver.stats()['misses'] == 2
+
+    @pytest.mark.asyncio
+    async def test_database_finds_papers_added_after_index_load(self):
+        resolver, postgres = _resolver([ATTENTION])
+        await resolver.resolve(Citation(title='Unrelated'))
+        postgres.papers.append(RESNET)
+        citation = Citation(
+            title='Deep residual learning for image recognition',
+            authors=['He, K.'],
+            year=2016,
+        )
+
+        assert await resolver.resolve_many([citation], use_database=False) == {}
+        first = await resolver.resolve(citation)
+        second = await resolver.resolve(citation)
+
+        assert first.metadata.additional_info['local_match'] == 'database'
+        assert second.metadata.additional_info['local_match'] == 'index'
+        assert resolver.stats()['indexed_papers'] == 2
+
+    @pytest.mark.asyncio
+    async def test_database_doi_lookup_is_case_insensitive(self):
+        resolver, postgres = _resolver([RESNET])
+        await resolver.resolve(Citation(title='Unrelated'))
+        postgres.papers.append(ATTENTION)
+
+        result = await resolver.resolve(Citation(doi='10.5555/ATTENTION'))
+
+        assert result.metadata.additional_info['local_match'] == 'database'
+
+    @pytest.mark.asyncio
+    async def test_title_only_stubs_are_not_matched(self):
+        resolver, _ = _resolver([STUB, UPLOAD])
+        citation = Citation(
+            title='Graph Attention Networks', authors=['Velickovic, P.'], year=2018
+        )
+
+        assert await resolver.resolve(citation) is None
+        assert resolver.stats()['indexed_papers'] == 0
+
+    @pytest.mark.asyncio
+    async def test_unreachable_database_resolves_nothing(self):
+        postgres = FakePostgres([ATTENTION])
+        postgres.initialize.side_effect = OSError('connection refused')
+        factory = Mock(return_value=postgres)
+        resolver = LocalCorpusResolver(postgres_factory=factory)
+
+        assert await resolver.resolve(Citation(doi='10.5555/attention')) is None
+        assert await resolver.resolve(Citation(doi='10.5555/attention')) is None
+        factory.assert_called_once()
+
+    def test_from_config_requires_database(self):
+        citation_config = SimpleNamespace(
+            local_resolution_enabled=True, local_match_threshold=0.85
+        )
+        config = SimpleNamespace(
+            citation_config=citation_config,
+            secrets=SimpleNamespace(database_url=None),
+        )
+        assert LocalCorpusResolver.from_config(config) is None
+
+        config.secrets.database_url = 'postgresql://localhost/thoth'
+        resolver = LocalCorpusResolver.from_config(config)
+        assert LocalCorpusResolver.from_config(config) is resolver
+        assert resolver.match_threshold == 0.85
+
+
+class TestResolutionChainLocalStage:
+    @pytest.mark.asyncio
+    async def test_local_match_skips_external_apis(self):
+        resolver, _ = _resolver()
+        chain = CitationResolutionChain(local_resolver=resolver)
+
+        with patch.object(chain, '_try_crossref', new_callable=AsyncMock) as crossref:
+            result = await chain.resolve(
+                Citation(title='Attention Is All You Need', year=2017)
+            )
+
+        crossref.assert_not_called()
+        assert result.source == APISource.LOCAL
+        assert chain.get_statistics()['resolved_local'] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_resolves_held_papers_before_bulk_lookup(self):
+        resolver, _ = _resolver()
+        chain = CitationResolutionChain(local_resolver=resolver)
+        citations = [
+            Citation(doi='10.5555/bert'),
+            Citation(title='Deep Residual Learning for Image Recognition'),
+            Citation(title='A Paper We Do Not Hold'),
+        ]
+
+        with (
+            patch.object(
+                chain, '_resolve_identifiers_in_bulk', new_callable=AsyncMock
+            ) as bulk,
+            patch.object(chain, '_resolve_uncached', new_callable=AsyncMock) as single,
+        ):
+            bulk.return_value = {}
+            single.return_value = Mock(status=CitationResolutionStatus.UNRESOLVED)
+            results = await chain.batch_resolve(citations, parallel=False)
+
+        bulk.assert_awaited_once_with([citations[2]])
+        single.assert_awaited_once()
+        assert [r.source for r in results[:2]] == [APISource.LOCAL, APISource.LOCAL]
+        assert chain.get_statistics()['resolved_local'] == 2
@@ -7,6 +7,7 @@ Tests:
 - Author name normalization and matching
 - Year validation with tolerance
 - Journal matching with abbreviations
+- Batch scoring matching the pairwise functions exactly
 """
 
 import pytest  # noqa: I001, F401
@@ -20,11 +21,17 @@ from thoth.analyze.citations.fuzzy_matcher import (
     match_year,
     match_journal,
     calculate_fuzzy_score,
+    calculate_fuzzy_scores,
+    match_titles,
     WEIGHT_TITLE,
     WEIGHT_AUTHORS,
     WEIGHT_YEAR,
     WEIGHT_JOURNAL,
 )
+from thoth.analyze.citations.match_validator import MatchCandidate, MatchValidator
+from thoth.utilities.schemas.citations import Citation
+
+from tests.fixtures import citation_fixtures
 
 
 class TestTextNormalization:
@@ -414,7 +421,7 @@ class TestCalculateFuzzyScore:
 
     def test_calculate_fuzzy_score_component_breakdown(self):
         """Test that component scores are returned correctly."""
-        score, components = calculate_fuzzy_score(
+        _score, components = calculate_fuzzy_score(
             title1='Test',
             title2='Test',
             authors1=['A'],
@@ -512,3 +519,78 @@ class TestEdgeCases:
         # Should be case-insensitive
         assert score1 == 1.0
         assert score2 == 1.0
+
+
+FIXTURE_CITATIONS = [
+    value for value in vars(citation_fixtures).values() if isinstance(value, Citation)
+]
+
+
+class TestBatchScoring:
+    """Test that batch scoring returns exactly the pairwise scores."""
+
+    def test_calculate_fuzzy_scores_identical_to_pairwise(self):
+        """Every component matches calculate_fuzzy_score bit for bit."""
+        citations = [
+            *FIXTURE_CITATIONS,
+            Citation(title='Deep Learning', journal='Nature', year=2015),
+            Citation(title='Deep Learning: A Survey', journal='Nature Reviews'),
+            Citation(title='00000000', authors=['Doe, A.'], journal='PNAS'),
+            Citation(title='00000000 0000000000', journal='Proc. Natl. Acad. Sci.'),
+            Citation(title='!!!', authors=['', 'Lee, K.'], year=2021),
+        ]
+        titles = [c.title or '' for c in citations]
+        authors = [c.authors or [] for c in citations]
+        years = [c.year for c in citations]
+        journals = [c.journal or '' for c in citations]
+
+        overall, components = calculate_fuzzy_scores(
+            titles, titles, authors, authors, years, years, journals, journals
+        )
+
+        for i, c1 in enumerate(citations):
+            for j, c2 in enumerate(citations):
+                score, expected = calculate_fuzzy_score(
+                    c1.title or '',
+                    c2.title or '',
+                    c1.authors or [],
+                    c2.authors or [],
+                    c1.year,
+                    c2.year,
+                    c1.journal or '',
+                    c2.journal or '',
+                )
+                assert overall[i, j] == score
+                for name, value in expected.items():
+                    assert components[name][i, j] == value
+
+    def test_match_titles_shape_and_empty_inputs(self):
+        """Titles are scored as a rows x columns matrix."""
+        scores = match_titles(['Deep Learning', ''], ['Deep Learning', '...', 'x'])
+
+        assert scores.shape == (2, 3)
+        assert scores[0, 0] == 1.0
+        assert scores[1].tolist() == [0.0, 0.0, 0.0]
+        assert match_titles([], ['Deep Learning']).shape == (0, 1)
+
+    def test_validate_matches_same_as_validate_match(self):
+        """Batch validation sets the same scores as one candidate at a time."""
+        validator = MatchValidator()
+        input_citation = citation_fixtures.CITATION_WITHOUT_IDENTIFIERS
+        candidates = [
+            citation_fixtures.CITATION_WITH_DOI,
+            citation_fixtures.CITATION_VARIANT_SUBTITLE,
+            citation_fixtures.CITATION_VARIANT_AUTHOR_FORMAT,
+            citation_fixtures.CITATION_VARIANT_YEAR_OFF_BY_ONE,
+            input_citation,
+        ]
+        one_by_one = [MatchCandidate(citation=c) for c in candidates]
+        batched = [MatchCandidate(citation=c) for c in candidates]
+
+        expected = [validator.validate_match(input_citation, c) for c in one_by_one]
+        scores = validator.validate_matches(input_citation, batched)
+
+        assert scores == expected
+        for single, batch in zip(one_by_one, batched):  # noqa: B905
+            assert batch.component_scores == single.component_scores
+            assert batch.passed_constraints == single.passed_constraints
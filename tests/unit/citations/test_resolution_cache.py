@@ -0,0 +1,228 @@
+"""Unit tests for the shared citation resolution cache."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from thoth.analyze.citations import resolution_cache
+from thoth.analyze.citations.realtime_processor import (
+    RealtimeCitationProcessor,
+    RealTimeConfig,
+)
+from thoth.analyze.citations.resolution_cache import (
+    ResolutionCache,
+    citation_cache_key,
+)
+from thoth.analyze.citations.resolution_chain import CitationResolutionChain
+from thoth.analyze.citations.resolution_types import (
+    APISource,
+    CitationResolutionStatus,
+    ConfidenceLevel,
+    ResolutionResult,
+)
+from thoth.utilities.schemas.citations import Citation
+
+
+def _citation(title='Attention Is All You Need', **kwargs):
+    kwargs.setdefault('year', 2017)
+    kwargs.setdefault('authors', ['A. Vaswani'])
+    return Citation(title=title, **kwargs)
+
+
+def _result(status=CitationResolutionStatus.RESOLVED):
+    resolved = status == CitationResolutionStatus.RESOLVED
+    return ResolutionResult(
+        citation='Attention Is All You Need',
+        status=status,
+        confidence_score=0.95 if resolved else 0.0,
+        confidence_level=ConfidenceLevel.HIGH if resolved else ConfidenceLevel.LOW,
+        source=APISource.CROSSREF if resolved else None,
+        matched_data={'doi': '10.5555/attention'} if resolved else None,
+    )
+
+
+class FakePostgres:
+    """In-memory stand-in for the api_enrichment_cache table."""
+
+    def __init__(self, rows=None):
+        self.rows = rows if rows is not None else {}
+        self.initialize = AsyncMock()
+        self.close = AsyncMock()
+
+    async def fetch(self, _query, keys):
+        return [
+            {'cache_key': key, 'data': self.rows[key]}
+            for key in keys
+            if key in self.rows
+        ]
+
+    async def execute(self, _query, cache_key, data, _source, _expires_at):
+        self.rows[cache_key] = data
+
+
+@pytest.fixture(autouse=True)
+def _no_shared_cache():
+    resolution_cache._shared_cache = None
+    yield
+    resolution_cache._shared_cache = None
+
+
+class TestCitationCacheKey:
+    def test_normalizes_case_and_whitespace(self):
+        assert citation_cache_key(_citation()) == citation_cache_key(
+            _citation(' attention is all you need ', authors=['a. vaswani'])
+        )
+        assert citation_cache_key(_citation()) != citation_cache_key(
+            _citation(year=2018)
+        )
+
+    def test_no_key_without_title(self):
+        assert citation_cache_key(Citation(text='[1] Vaswani et al.')) is None
+
+
+class TestResolutionCache:
+    @pytest.mark.asyncio
+    async def test_memory_hit_returns_tagged_copy(self):
+        cache = ResolutionCache()
+        await cache.put('k', _result())
+
+        first = await cache.get('k')
+        first.matched_data['doi'] = 'changed'
+        second = await cache.get('k')
+
+        assert second.matched_data == {'doi': '10.5555/attention'}
+        assert second.metadata.additional_info['cache_hit'] == 'memory'
+        assert await cache.get('missing') is None
+        assert cache.stats()['memory_hits'] == 2
+        assert cache.stats()['misses'] == 1
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_their_ttl(self):
+        cache = ResolutionCache(positive_ttl_seconds=100, negative_ttl_seconds=10)
+        with patch.object(resolution_cache.time, 'monotonic', return_value=0.0):
+            await cache.put('resolved', _result())
+            await cache.put('unresolved', _result(CitationResolutionStatus.UNRESOLVED))
+
+        with patch.object(resolution_cache.time, 'monotonic', return_value=50.0):
+            assert await cache.get('resolved') is not None
+            assert await cache.get('unresolved') is None
+
+    @pytest.mark.asyncio
+    async def test_failed_and_disabled_negative_results_not_cached(self):
+        cache = ResolutionCache(negative_ttl_seconds=0)
+        await cache.put('failed', _result(CitationResolutionStatus.FAILED))
+        await cache.put('unresolved', _result(CitationResolutionStatus.UNRESOLVED))
+
+        assert cache.entries() == []
+
+    @pytest.mark.asyncio
+    async def test_persistent_tier_shared_between_processes(self):
+        table = {}
+        writer = ResolutionCache(postgres_factory=lambda: FakePostgres(table))
+        await writer.put('k', _result())
+
+        reader = ResolutionCache(postgres_factory=lambda: FakePostgres(table))
+        found = await reader.get_many(['k', 'other'])
+
+        assert json.loads(table['citation_resolution:k'])['status'] == 'resolved'
+        assert found['k'].matched_data == {'doi': '10.5555/attention'}
+        assert found['k'].metadata.additional_info['cache_hit'] == 'persistent'
+        assert (await reader.get('k')).metadata.additional_info['cache_hit'] == (
+            'memory'
+        )
+
+    @pytest.mark.asyncio
+    async def test_unreachable_database_falls_back_to_memory(self):
+        postgres = FakePostgres()
+        postgres.initialize.side_effect = OSError('connection refused')
+        factory = Mock(return_value=postgres)
+        cache = ResolutionCache(postgres_factory=factory)
+
+        await cache.put('k', _result())
+
+        assert (await cache.get('k')) is not None
+        factory.assert_called_once()
+
+    def test_from_config_shares_one_instance(self):
+        citation_config = SimpleNamespace(
+            resolution_cache_enabled=True,
+            resolution_cache_size=10,
+            resolution_cache_ttl_days=1.0,
+            resolution_cache_negative_ttl_hours=0.5,
+        )
+        config = SimpleNamespace(
+            citation_config=citation_config,
+            secrets=SimpleNamespace(database_url=None),
+        )
+
+        cache = ResolutionCache.from_config(config)
+
+        assert ResolutionCache.from_config(config) is cache
+        assert cache.negative_ttl_seconds == 1800
+        assert cache.stats()['persistent'] is False
+        citation_config.resolution_cache_enabled = False
+        assert ResolutionCache.from_config(config) is None
+
+
+class TestResolutionChainCache:
+    @pytest.mark.asyncio
+    async def test_resolve_uses_cache(self):
+        chain = CitationResolutionChain(cache=ResolutionCache())
+        with patch.object(
+            chain, '_resolve_uncached', new_callable=AsyncMock
+        ) as mock_resolve:
+            mock_resolve.return_value = _result()
+            await chain.resolve(_citation())
+            result = await chain.resolve(_citation())
+
+        mock_resolve.assert_called_once()
+        assert result.metadata.additional_info['cache_hit'] == 'memory'
+        assert chain.get_statistics()['cache_hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_resolves_each_reference_once(self):
+        cache = ResolutionCache()
+        await cache.put(citation_cache_key(_citation('Cached Paper')), _result())
+        chain = CitationResolutionChain(cache=cache)
+        citations = [
+            _citation(),
+            _citation('Cached Paper'),
+            _citation('ATTENTION IS ALL YOU NEED'),
+            _citation('Other Paper'),
+        ]
+
+        with patch.object(
+            chain, '_resolve_uncached', new_callable=AsyncMock
+        ) as mock_resolve:
+            mock_resolve.return_value = _result()
+            results = await chain.batch_resolve(citations, bulk_lookup=False)
+
+        resolved_titles = [call.args[0].title for call in mock_resolve.call_args_list]
+        assert sorted(resolved_titles) == ['Attention Is All You Need', 'Other Paper']
+        assert all(r.status == CitationResolutionStatus.RESOLVED for r in results)
+        assert results[1].metadata.additional_info['cache_hit'] == 'memory'
+        assert results[2] is not results[0]
+        assert len(cache.entries()) == 3
+
+
+class TestRealtimeProcessorCache:
+    @pytest.mark.asyncio
+    async def test_negative_cache_hit_skips_resolution(self):
+        chain = CitationResolutionChain()
+        processor = RealtimeCitationProcessor(RealTimeConfig(), chain)
+        with patch.object(
+            chain, '_resolve_uncached', new_callable=AsyncMock
+        ) as mock_resolve:
+            mock_resolve.return_value = _result(CitationResolutionStatus.UNRESOLVED)
+            await processor.resolve_citation(_citation())
+            result = await processor.resolve_citation(_citation())
+
+        mock_resolve.assert_called_once()
+        assert processor.cache is chain.cache
+        assert result.metadata.additional_info['negative_cache_hit'] is True
+        stats = processor.get_cache_stats()
+        assert stats['negative_cache_hits'] == 1
+        assert stats['negative_cache_size'] == 1
+        assert await processor.clear_negative_cache() == 1
@@ -10,9 +10,9 @@ Tests the core citation resolution chain coordinator, including:
 - Early stopping optimization
 """
 
-import asyncio  # noqa: I001, F401
+import asyncio  # noqa: I001
 from typing import Any, Dict, List  # noqa: F401, UP035
-from unittest.mock import AsyncMock, Mock, patch, MagicMock  # noqa: F401
+from unittest.mock import ANY, AsyncMock, Mock, patch, MagicMock  # noqa: F401
 
 import pytest
 from loguru import logger  # noqa: F401
@@ -31,7 +31,7 @@ from thoth.analyze.citations.resolution_types import (
     ResolutionMetadata,
 )
 from thoth.analyze.citations.crossref_resolver import MatchCandidate as CrossrefMatch
-from thoth.analyze.citations.openalex_resolver import MatchCandidate as OpenAlexMatch  # noqa: F401
+from thoth.analyze.citations.openalex_resolver import MatchCandidate as OpenAlexMatch
 from thoth.analyze.citations.arxiv_resolver import ArxivMatch  # noqa: F401
 from thoth.utilities.schemas.citations import Citation
 
@@ -357,7 +357,9 @@ class TestBatchResolution:
                 for i, cit in enumerate(BATCH_CITATIONS)
             ]
 
-            results = await chain.batch_resolve(BATCH_CITATIONS, parallel=True)
+            results = await chain.batch_resolve(
+                BATCH_CITATIONS, parallel=True, bulk_lookup=False
+            )
 
             assert len(results) == len(BATCH_CITATIONS)
             assert mock_resolve.call_count == len(BATCH_CITATIONS)
@@ -385,7 +387,9 @@ class TestBatchResolution:
                 for i, cit in enumerate(BATCH_CITATIONS)
             ]
 
-            results = await chain.batch_resolve(BATCH_CITATIONS, parallel=False)
+            results = await chain.batch_resolve(
+                BATCH_CITATIONS, parallel=False, bulk_lookup=False
+            )
 
             assert len(results) == len(BATCH_CITATIONS)
             assert mock_resolve.call_count == len(BATCH_CITATIONS)
@@ -410,7 +414,9 @@ class TestBatchResolution:
                 ),
             ]
 
-            results = await chain.batch_resolve(BATCH_CITATIONS[:2], parallel=True)
+            results = await chain.batch_resolve(
+                BATCH_CITATIONS[:2], parallel=True, bulk_lookup=False
+            )
 
             assert len(results) == 2
             # First result should be FAILED
@@ -616,3 +622,193 @@ class TestMetadataTracking:
         # Should have processing time
         assert result.metadata.processing_time_ms is not None
         assert result.metadata.processing_time_ms > 0
+
+
+def _match(source: APISource, score: float) -> ResolutionResult:
+    return ResolutionResult(
+        citation='Test',
+        status=CitationResolutionStatus.RESOLVED,
+        confidence_score=score,
+        confidence_level=ConfidenceLevel.HIGH,
+        source=source,
+        matched_data={'doi': f'10.1234/{source.value}'},
+        metadata=ResolutionMetadata(),
+    )
+
+
+def _attempt(delay: float, result: ResolutionResult | None, calls: list, name: str):
+    async def attempt(_citation, _metadata, _candidates):
+        calls.append(name)
+        await asyncio.sleep(delay)
+        return result
+
+    return attempt
+
+
+class TestHedgedResolution:
+    """Test hedged (fan-out) resolution mode."""
+
+    def test_sequential_is_default(self):
+        """Test that hedging must be enabled explicitly."""
+        assert CitationResolutionChain().mode == 'sequential'
+
+    def test_unknown_mode_rejected(self):
+        """Test that unknown modes raise ValueError."""
+        with pytest.raises(ValueError):
+            CitationResolutionChain(mode='parallel')
+
+    @pytest.mark.asyncio
+    async def test_slow_source_is_hedged_and_cancelled(self):
+        """Test that a slow source does not hold up a faster high-confidence one."""
+        chain = CitationResolutionChain(
+            mode='hedged', hedge_delays={'crossref': 0.05, 'arxiv': 0.05}
+        )
+        calls = []
+        chain._try_crossref = _attempt(5.0, None, calls, 'crossref')
+        chain._try_arxiv = _attempt(0.01, None, calls, 'arxiv')
+        chain._try_openalex = _attempt(
+            0.01, _match(APISource.OPENALEX, 0.9), calls, 'openalex'
+        )
+        chain._try_semantic_scholar = _attempt(5.0, None, calls, 's2')
+
+        start = asyncio.get_running_loop().time()
+        result = await chain.resolve(CITATION_WITHOUT_IDENTIFIERS)
+
+        assert asyncio.get_running_loop().time() - start < 1.0
+        assert result.source == APISource.OPENALEX
+        assert calls == ['crossref', 'arxiv', 'openalex']
+        assert result.metadata.additional_info['hedge_winner'] == 'openalex'
+        assert chain._stats['hedge_wins_openalex'] == 1
+        assert chain._stats['resolved_openalex'] == 1
+        # Lower bound: the cancelled Crossref request counts with its runtime
+        assert chain._stats['hedge_time_saved_ms'] > 0
+
+    @pytest.mark.asyncio
+    async def test_records_time_saved_against_sequential_order(self):
+        """Test that time saved compares with running the sources one by one."""
+        chain = CitationResolutionChain(
+            mode='hedged', hedge_delays={'crossref': 0.01, 'arxiv': 0.01}
+        )
+        calls = []
+        chain._try_crossref = _attempt(0.2, None, calls, 'crossref')
+        chain._try_arxiv = _attempt(0.2, None, calls, 'arxiv')
+        chain._try_openalex = _attempt(0.2, None, calls, 'openalex')
+        chain._try_semantic_scholar = _attempt(0.2, None, calls, 's2')
+
+        result = await chain.resolve(CITATION_WITHOUT_IDENTIFIERS)
+
+        assert result.status == CitationResolutionStatus.UNRESOLVED
+        assert calls == ['crossref', 'arxiv', 'openalex', 's2']
+        # Four 200ms requests ran side by side instead of back to back
+        assert chain._stats['hedge_time_saved_ms'] > 400
+        assert chain._stats['unresolved'] == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_high_confidence_answer_starts_nothing_else(self):
+        """Test that no hedge is sent when the first source answers in time."""
+        chain = CitationResolutionChain(mode='hedged')
+        calls = []
+        chain._try_crossref = _attempt(
+            0.01, _match(APISource.CROSSREF, 0.95), calls, 'crossref'
+        )
+        chain._try_arxiv = _attempt(0.01, None, calls, 'arxiv')
+
+        result = await chain.resolve(CITATION_WITHOUT_IDENTIFIERS)
+
+        assert result.source == APISource.CROSSREF
+        assert calls == ['crossref']
+        assert chain._stats['hedge_wins_crossref'] == 1
+
+
+def _bulk_chain(openalex_works=None, s2_papers=None):
+    openalex = Mock(MAX_FILTER_VALUES=100)
+    openalex.lookup_dois = AsyncMock(return_value=openalex_works or {})
+    s2 = Mock(batch_size=100)
+    s2.paper_lookup_batch = Mock(
+        side_effect=lambda ids, fields: [  # noqa: ARG005
+            paper for key, paper in (s2_papers or {}).items() if key in ids
+        ]
+    )
+    return CitationResolutionChain(
+        crossref_resolver=Mock(),
+        arxiv_resolver=Mock(),
+        openalex_resolver=openalex,
+        semanticscholar_resolver=s2,
+    )
+
+
+class TestBulkIdentifierLookup:
+    """Test the bulk identifier pre-pass of batch_resolve."""
+
+    @pytest.mark.asyncio
+    async def test_identifiers_resolved_in_bulk_and_leftovers_per_citation(self):
+        """Citations with DOI or arXiv ID skip the per-citation chain."""
+        chain = _bulk_chain(
+            openalex_works={
+                '10.1038/nature12345': OpenAlexMatch(
+                    openalex_id='W1',
+                    doi='https://doi.org/10.1038/nature12345',
+                    title='Deep Learning for Image Recognition',
+                    year=2023,
+                )
+            },
+            s2_papers={
+                'arXiv:2401.12345': {
+                    'title': 'Attention Is All You Need',
+                    'externalIds': {'ArXiv': '2401.12345'},
+                    'year': 2024,
+                    'authors': [{'name': 'B. Johnson'}],
+                }
+            },
+        )
+
+        with patch.object(chain, 'resolve', new_callable=AsyncMock) as mock_resolve:
+            mock_resolve.side_effect = lambda _citation: _match(APISource.CROSSREF, 0.9)
+            results = await chain.batch_resolve(BATCH_CITATIONS)
+
+        assert [c.args[0] for c in mock_resolve.call_args_list] == BATCH_CITATIONS[2:]
+        assert results[0].source == APISource.OPENALEX
+        assert results[0].matched_data['doi'] == '10.1038/nature12345'
+        assert results[0].matched_data['openalex_id'] == 'W1'
+        assert results[1].source == APISource.SEMANTIC_SCHOLAR
+        assert results[1].matched_data['authors'] == ['B. Johnson']
+        assert results[1].metadata.additional_info['identifier_lookup'] == 'arxiv'
+        assert all(r.status == CitationResolutionStatus.RESOLVED for r in results)
+        chain.semanticscholar_resolver.paper_lookup_batch.assert_called_once()
+        stats = chain.get_statistics()
+        assert stats['bulk_lookup_requests'] == 2
+        assert stats['bulk_lookup_resolved'] == 2
+
+    @pytest.mark.asyncio
+    async def test_dois_unknown_to_openalex_use_semantic_scholar_batch(self):
+        """DOIs OpenAlex does not know are retried in one S2 batch request."""
+        chain = _bulk_chain(
+            s2_papers={
+                'DOI:10.1038/nature12345': {
+                    'title': 'Deep Learning for Image Recognition',
+                    'externalIds': {'DOI': '10.1038/NATURE12345'},
+                }
+            },
+        )
+
+        results = await chain.batch_resolve([CITATION_WITH_DOI])
+
+        assert results[0].source == APISource.SEMANTIC_SCHOLAR
+        assert results[0].matched_data['doi'] == CITATION_WITH_DOI.doi
+        chain.semanticscholar_resolver.paper_lookup_batch.assert_called_once_with(
+            ['DOI:10.1038/nature12345'], ANY
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_bulk_lookup_falls_back_to_per_citation(self):
+        """A failing bulk request leaves its citations to the chain."""
+        chain = _bulk_chain()
+        chain.openalex_resolver.lookup_dois.side_effect = RuntimeError('timeout')
+
+        with patch.object(chain, 'resolve', new_callable=AsyncMock) as mock_resolve:
+            mock_resolve.return_value = _match(APISource.CROSSREF, 0.9)
+            results = await chain.batch_resolve(BATCH_CITATIONS[:2])
+
+        assert mock_resolve.call_count == 2
+        assert len(results) == 2
+        assert chain.get_statistics()['bulk_lookup_resolved'] == 0
@@ -0,0 +1 @@
+"""Test module initialization for pipeline unit tests."""
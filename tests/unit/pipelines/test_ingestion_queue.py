@@ -0,0 +1,254 @@
+"""Unit tests for the durable ingestion queue and its worker."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from thoth.pipelines.ingestion_queue import IngestionQueue, LeaseLostError, QueuedJob
+from thoth.pipelines.ingestion_worker import IngestionWorker
+
+
+def _postgres() -> MagicMock:
+    postgres = MagicMock()
+    postgres.fetchrow = AsyncMock(return_value=None)
+    postgres.fetch = AsyncMock(return_value=[])
+    postgres.fetchval = AsyncMock(return_value=uuid4())
+    postgres.execute = AsyncMock()
+    return postgres
+
+
+def _job(attempts: int = 1, checkpoints: dict | None = None) -> QueuedJob:
+    return QueuedJob(
+        id=str(uuid4()),
+        pdf_path=Path('/vault/papers/paper.pdf'),
+        user_id='default_user',
+        priority=0,
+        attempts=attempts,
+        max_attempts=3,
+        checkpoints=checkpoints or {},
+    )
+
+
+class TestIngestionQueue:
+    def test_retry_delay_doubles_up_to_cap(self):
+        queue = IngestionQueue(
+            _postgres(), backoff_base_seconds=10, backoff_max_seconds=60
+        )
+
+        assert [queue.retry_delay(n) for n in range(1, 6)] == [10, 20, 40, 60, 60]
+
+    @pytest.mark.asyncio
+    async def test_claim_skips_locked_rows_and_loads_checkpoints(self):
+        postgres = _postgres()
+        job_id = uuid4()
+        postgres.fetchrow.return_value = {
+            'id': job_id,
+            'pdf_path': '/vault/papers/paper.pdf',
+            'user_id': 'u1',
+            'priority': 5,
+            'attempts': 2,
+            'max_attempts': 5,
+        }
+        postgres.fetch.return_value = [
+            {'job_type': 'ocr', 'output_data': json.dumps({'markdown_path': 'a.md'})}
+        ]
+        queue = IngestionQueue(postgres, worker_id='w1')
+
+        job = await queue.claim_async()
+
+        sql, worker_id, _ = postgres.fetchrow.call_args.args
+        assert 'FOR UPDATE SKIP LOCKED' in sql
+        assert 'ORDER BY priority DESC' in sql
+        assert worker_id == 'w1'
+        assert job.id == str(job_id)
+        assert job.attempts == 2
+        assert job.checkpoints == {'ocr': {'markdown_path': 'a.md'}}
+
+    @pytest.mark.asyncio
+    async def test_claim_returns_none_when_nothing_is_due(self):
+        queue = IngestionQueue(_postgres())
+
+        assert await queue.claim_async() is None
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_records_stage_output(self):
+        queue = IngestionQueue(_postgres(), worker_id='w1')
+        job = _job()
+
+        await queue.checkpoint_async(job, 'ocr', {'markdown_path': 'a.md'})
+
+        assert job.checkpoints['ocr'] == {'markdown_path': 'a.md'}
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_after_lease_loss_raises(self):
+        postgres = _postgres()
+        postgres.fetchval.return_value = None
+        queue = IngestionQueue(postgres)
+
+        with pytest.raises(LeaseLostError):
+            await queue.checkpoint_async(_job(), 'ocr', {})
+
+    @pytest.mark.asyncio
+    async def test_failed_attempt_is_rescheduled_with_backoff(self):
+        postgres = _postgres()
+        queue = IngestionQueue(postgres, backoff_base_seconds=10)
+
+        assert await queue.fail_async(_job(attempts=2), 'boom') is True
+
+        status, error, delay = postgres.execute.call_args.args[3:]
+        assert (status, error, delay) == ('pending', 'boom', 20.0)
+
+    @pytest.mark.asyncio
+    async def test_last_attempt_marks_job_failed(self):
+        postgres = _postgres()
+        queue = IngestionQueue(postgres)
+
+        assert await queue.fail_async(_job(attempts=3), 'boom') is False
+        assert postgres.execute.call_args.args[3] == 'failed'
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    markdown = tmp_path / 'paper.md'
+    no_images = tmp_path / 'paper_no_images.md'
+    markdown.write_text('# Paper')
+    no_images.write_text('# Paper')
+
+    pipeline = MagicMock()
+    pipeline._get_project_name.return_value = None
+    pipeline._ocr_convert_optimized.return_value = (markdown, no_images)
+    pipeline._analyze_content.return_value = MagicMock(
+        model_dump=MagicMock(return_value={'title': 'Paper'})
+    )
+    pipeline._extract_citations_batch.return_value = []
+    pipeline._generate_note.return_value = (
+        str(tmp_path / 'note.md'),
+        '/vault/papers/moved.pdf',
+        str(markdown),
+        'article-1',
+    )
+    pipeline.pdf_tracker.is_processed.return_value = False
+    return pipeline
+
+
+def _queue() -> MagicMock:
+    queue = MagicMock(worker_id='w1', lock_timeout_seconds=600)
+
+    async def checkpoint(job, stage, output):
+        job.checkpoints[stage] = output
+
+    queue.checkpoint_async = AsyncMock(side_effect=checkpoint)
+    queue.complete_async = AsyncMock()
+    queue.fail_async = AsyncMock(return_value=True)
+    return queue
+
+
+@pytest.fixture(autouse=True)
+def no_user_vault():
+    with patch.object(IngestionWorker, '_user_vault', return_value=(None, None)):
+        yield
+
+
+class TestIngestionWorker:
+    @pytest.mark.asyncio
+    async def test_runs_and_checkpoints_every_stage(self, pipeline):
+        queue = _queue()
+        worker = IngestionWorker(pipeline, queue)
+        job = _job()
+
+        assert await worker.process_job_async(job) is True
+
+        stages = [call.args[1] for call in queue.checkpoint_async.call_args_list]
+        assert stages[0] == 'ocr' and stages[-2:] == ['note', 'rag']
+        assert set(stages[1:3]) == {'analysis', 'citations'}
+        assert job.checkpoints['note']['article_id'] == 'article-1'
+        pipeline.pdf_tracker.mark_processed.assert_called_once()
+        queue.complete_async.assert_awaited_once_with(job)
+
+    @pytest.mark.asyncio
+    async def test_resumed_job_skips_finished_stages(self, pipeline, tmp_path):
+        queue = _queue()
+        worker = IngestionWorker(pipeline, queue)
+        job = _job(
+            attempts=2,
+            checkpoints={
+                'ocr': {
+                    'markdown_path': str(tmp_path / 'paper.md'),
+                    'no_images_markdown_path': str(tmp_path / 'paper_no_images.md'),
+                },
+                'analysis': {'title': 'Paper'},
+                'citations': {'citations': []},
+            },
+        )
+
+        assert await worker.process_job_async(job) is True
+
+        pipeline._ocr_convert_optimized.assert_not_called()
+        pipeline._analyze_content.assert_not_called()
+        pipeline._extract_citations_batch.assert_not_called()
+        stages = [call.args[1] for call in queue.checkpoint_async.call_args_list]
+        assert stages == ['note', 'rag']
+
+    @pytest.mark.asyncio
+    async def test_retry_after_note_moved_files_does_not_redo_ocr(
+        self, pipeline, tmp_path
+    ):
+        markdown = tmp_path / 'paper.md'
+        renamed = tmp_path / 'Paper_markdown.md'
+
+        def generate_note(**_kwargs):
+            # Like NoteService.create_note: rename the markdown to the title
+            markdown.rename(renamed)
+            return (
+                str(tmp_path / 'note.md'),
+                '/vault/papers/Paper.pdf',
+                str(renamed),
+                'article-1',
+            )
+
+        pipeline._generate_note.side_effect = generate_note
+        pipeline.services.rag.index_file.side_effect = [
+            RuntimeError('database unavailable'),
+            None,
+        ]
+        queue = _queue()
+        worker = IngestionWorker(pipeline, queue)
+        job = _job()
+
+        assert await worker.process_job_async(job) is False
+        assert 'rag' not in job.checkpoints
+        job.attempts += 1
+        assert await worker.process_job_async(job) is True
+
+        pipeline._ocr_convert_optimized.assert_called_once()
+        pipeline._generate_note.assert_called_once()
+        assert 'rag' in job.checkpoints
+
+    @pytest.mark.asyncio
+    async def test_failed_stage_fails_attempt_but_keeps_other_checkpoints(
+        self, pipeline
+    ):
+        pipeline._analyze_content.side_effect = RuntimeError('LLM timeout')
+        queue = _queue()
+        worker = IngestionWorker(pipeline, queue)
+        job = _job()
+
+        assert await worker.process_job_async(job) is False
+
+        assert set(job.checkpoints) == {'ocr', 'citations'}
+        error = queue.fail_async.call_args.args[1]
+        assert 'LLM timeout' in error
+        queue.complete_async.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_job_reclaimed_after_last_attempt_is_failed(self, pipeline):
+        queue = _queue()
+        worker = IngestionWorker(pipeline, queue)
+
+        assert await worker.process_job_async(_job(attempts=4)) is False
+
+        queue.fail_async.assert_awaited_once()
+        pipeline._ocr_convert_optimized.assert_not_called()
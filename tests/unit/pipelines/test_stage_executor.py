@@ -0,0 +1,192 @@
+"""Unit tests for the stage-level batch executor."""
+
+import contextvars
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from thoth.pipelines.optimized_document_pipeline import OptimizedDocumentPipeline
+from thoth.pipelines.stage_executor import Stage, StageExecutor
+
+REQUEST_ID = contextvars.ContextVar('REQUEST_ID', default=None)
+
+
+class Recorder:
+    """Records (stage, item, start, end) of every stage call."""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def stage(self, name, seconds=0.0, fail_on=()):
+        def run(item, results):
+            start = time.perf_counter()
+            time.sleep(seconds)
+            with self._lock:
+                self.calls.append((name, item, start, time.perf_counter()))
+            if item in fail_on:
+                raise RuntimeError(f'{name} failed for {item}')
+            return {'stage': name, 'item': item, 'inputs': sorted(results)}
+
+        return run
+
+    def window(self, name, item):
+        return next((s, e) for n, i, s, e in self.calls if n == name and i == item)
+
+
+def _graph(recorder, fail_on=(), seconds=0.0):
+    return [
+        Stage('ocr', recorder.stage('ocr', seconds), workers=1),
+        Stage(
+            'analysis',
+            recorder.stage('analysis', seconds, fail_on),
+            workers=2,
+            depends_on=('ocr',),
+        ),
+        Stage('citations', recorder.stage('citations'), workers=2, depends_on=('ocr',)),
+        Stage(
+            'note',
+            recorder.stage('note', seconds),
+            workers=1,
+            depends_on=('analysis', 'citations'),
+        ),
+    ]
+
+
+class TestStageExecutor:
+    @pytest.mark.asyncio
+    async def test_stage_receives_results_of_its_dependencies(self):
+        recorder = Recorder()
+        executor = StageExecutor(_graph(recorder), log_interval=None)
+
+        outcomes = await executor.run(['a', 'b'])
+
+        assert [o.item for o in outcomes] == ['a', 'b']
+        assert all(o.ok for o in outcomes)
+        assert outcomes[0].results['note']['inputs'] == ['analysis', 'citations', 'ocr']
+
+    @pytest.mark.asyncio
+    async def test_stages_of_different_items_overlap(self):
+        recorder = Recorder()
+        executor = StageExecutor(_graph(recorder, seconds=0.05), log_interval=None)
+
+        await executor.run(['a', 'b', 'c'])
+
+        # The first item's analysis runs while the single OCR worker is
+        # already busy with the next item
+        analysis_a = recorder.window('analysis', 'a')
+        ocr_b = recorder.window('ocr', 'b')
+        assert analysis_a[0] < ocr_b[1] and ocr_b[0] < analysis_a[1]
+
+    @pytest.mark.asyncio
+    async def test_failure_skips_dependents_of_that_item_only(self):
+        recorder = Recorder()
+        executor = StageExecutor(_graph(recorder, fail_on=('b',)), log_interval=None)
+
+        outcomes = await executor.run(['a', 'b'])
+
+        assert outcomes[0].ok
+        assert not outcomes[1].ok
+        assert outcomes[1].failed_stage == 'analysis'
+        assert 'citations' in outcomes[1].results
+        assert 'note' not in outcomes[1].results
+        stats = executor.stats()
+        assert stats['analysis'].failed == 1
+        assert stats['note'].completed == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_track_each_stage(self):
+        recorder = Recorder()
+        executor = StageExecutor(_graph(recorder), log_interval=None)
+
+        await executor.run(['a', 'b', 'c'])
+
+        stats = executor.stats()
+        assert list(stats) == ['ocr', 'analysis', 'citations', 'note']
+        assert all(s.completed == 3 for s in stats.values())
+        assert all(s.queued == 0 and s.running == 0 for s in stats.values())
+        assert stats['analysis'].workers == 2
+        assert set(stats['ocr'].as_dict()) >= {'throughput_per_minute', 'utilization'}
+
+    @pytest.mark.asyncio
+    async def test_context_variables_reach_stage_threads(self):
+        seen = []
+        executor = StageExecutor(
+            [Stage('only', lambda _item, _results: seen.append(REQUEST_ID.get()))],
+            log_interval=None,
+        )
+        token = REQUEST_ID.set('user-1')
+        try:
+            await executor.run([1, 2])
+        finally:
+            REQUEST_ID.reset(token)
+
+        assert seen == ['user-1', 'user-1']
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        executor = StageExecutor(_graph(Recorder()), log_interval=None)
+
+        assert await executor.run([]) == []
+
+    def test_dependencies_must_precede_dependents(self):
+        with pytest.raises(ValueError):
+            StageExecutor([Stage('note', print, depends_on=('ocr',))])
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    return OptimizedDocumentPipeline(
+        services=MagicMock(),
+        citation_tracker=MagicMock(),
+        pdf_tracker=MagicMock(),
+        output_dir=tmp_path,
+        notes_dir=tmp_path,
+        markdown_dir=tmp_path,
+    )
+
+
+class TestBatchProcessing:
+    @pytest.mark.asyncio
+    async def test_batch_runs_pdfs_through_stages(self, pipeline, tmp_path):
+        no_images = tmp_path / 'paper_no_images.md'
+        no_images.write_text('# Paper')
+
+        def generate_note(pdf_path, **kwargs):  # noqa: ARG001
+            return f'{pdf_path.stem}.note', f'{pdf_path}.moved', 'paper.md', 'id'
+
+        with (
+            patch.object(pipeline, '_processed_result', return_value=None),
+            patch.object(pipeline, '_get_project_name', return_value=None),
+            patch.object(pipeline, '_markdown_output_dir', return_value=tmp_path),
+            patch.object(
+                pipeline,
+                '_ocr_convert_optimized',
+                return_value=(tmp_path / 'paper.md', no_images),
+            ),
+            patch.object(pipeline, '_analyze_content', return_value='analysis'),
+            patch.object(pipeline, '_extract_citations_batch', return_value=[]),
+            patch.object(pipeline, '_generate_note', side_effect=generate_note),
+            patch.object(pipeline, '_index_to_rag') as index_to_rag,
+        ):
+            results = await pipeline.batch_process_pdfs_async(
+                [Path('/pdfs/a.pdf'), Path('/pdfs/b.pdf')],
+                stage_workers={'ocr': 2},
+            )
+
+        assert results == [
+            (Path('a.note'), Path('/pdfs/a.pdf.moved'), Path('paper.md')),
+            (Path('b.note'), Path('/pdfs/b.pdf.moved'), Path('paper.md')),
+        ]
+        assert index_to_rag.call_count == 4
+        assert pipeline.pdf_tracker.mark_processed.call_count == 2
+        stages = pipeline.get_performance_stats()['stages']
+        assert stages['ocr']['workers'] == 2
+        assert stages['note']['completed'] == 2
+
+    def test_unknown_stage_workers_are_rejected(self, pipeline):
+        with pytest.raises(ValueError, match='ocrr'):
+            pipeline._document_stages(stage_workers={'ocrr': 4})
@@ -29,7 +29,9 @@ from hypothesis import example  # noqa: F401
 
 from thoth.analyze.citations.fuzzy_matcher import (
     calculate_fuzzy_score,
+    match_journals,
     match_title,
+    match_titles,
     match_authors,
     match_year,
     match_journal,
@@ -283,6 +285,31 @@ def test_year_score_bounds(year1: int, year2: int):
     assert 0.0 <= score <= 1.0, f'Year score out of bounds: {score}'
 
 
+# ============================================================================
+# Property Tests: Batch Scoring
+# ============================================================================
+
+
+@pytest.mark.property
+@given(
+    titles1=st.lists(st.text(max_size=100), min_size=1, max_size=5),
+    titles2=st.lists(st.text(max_size=100), min_size=1, max_size=5),
+)
+@settings(max_examples=200)
+def test_batch_scores_identical_to_pairwise(
+    titles1: List[str],  # noqa: UP006
+    titles2: List[str],  # noqa: UP006
+):
+    """Property: Batch title/journal scores equal the pairwise scores exactly."""
+    title_scores = match_titles(titles1, titles2)
+    journal_scores = match_journals(titles1, titles2)
+
+    for i, text1 in enumerate(titles1):
+        for j, text2 in enumerate(titles2):
+            assert title_scores[i, j] == match_title(text1, text2)
+            assert journal_scores[i, j] == match_journal(text1, text2)
+
+
 # ============================================================================
 # Property Tests: Monotonicity
 # ============================================================================
@@ -0,0 +1,96 @@
+"""Unit tests for adaptive token-budgeted embedding batches."""
+
+from unittest.mock import patch
+
+import pytest
+
+from thoth.rag import adaptive_batching
+from thoth.rag.adaptive_batching import AdaptiveBatcher, estimate_tokens
+
+
+def _recording_embed(calls: list[list[str]]):
+    def embed(texts):
+        calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    return embed
+
+
+def test_results_keep_input_order():
+    texts = ['word ' * n for n in (9, 1, 5, 3, 7)]
+    calls: list[list[str]] = []
+
+    result = AdaptiveBatcher(token_budget=10).embed(texts, _recording_embed(calls))
+
+    assert result == [[float(len(text))] for text in texts]
+    # Batches are length-sorted
+    flat = [text for batch in calls for text in batch]
+    assert flat == sorted(texts, key=estimate_tokens)
+
+
+def test_batches_respect_token_budget_and_size_cap():
+    texts = ['one two three'] * 10  # 3 tokens each
+    calls: list[list[str]] = []
+    batcher = AdaptiveBatcher(token_budget=9, max_batch_size=2)
+    batcher.target_batch_seconds = float('inf')  # no adaptation
+
+    batcher.embed(texts, _recording_embed(calls))
+
+    assert [len(batch) for batch in calls] == [2, 2, 2, 2, 2]
+
+
+def test_fast_batches_grow_budget_and_slow_batches_shrink_it():
+    batcher = AdaptiveBatcher(token_budget=100, target_batch_seconds=1.0)
+
+    batcher._adapt(elapsed=0.1, batch_tokens=100)
+    assert batcher.token_budget == 150
+
+    batcher._adapt(elapsed=5.0, batch_tokens=150)
+    assert batcher.token_budget == 112
+
+
+def test_high_rss_halves_budget():
+    batcher = AdaptiveBatcher(token_budget=100, max_rss_mb=500)
+
+    with patch.object(adaptive_batching, '_current_rss_mb', return_value=800.0):
+        batcher._adapt(elapsed=0.01, batch_tokens=100)
+
+    assert batcher.token_budget == 50
+
+
+def test_out_of_memory_retries_with_smaller_batches():
+    texts = ['alpha beta'] * 4
+    sizes: list[int] = []
+
+    def embed(batch):
+        sizes.append(len(batch))
+        if len(batch) > 1:
+            raise RuntimeError('CUDA out of memory')
+        return [[1.0]]
+
+    result = AdaptiveBatcher(token_budget=100).embed(texts, embed)
+
+    assert result == [[1.0]] * 4
+    assert sizes[0] == 4
+    assert sizes.count(1) == 4
+
+
+def test_other_errors_propagate():
+    def embed(_batch):
+        raise RuntimeError('model exploded')
+
+    with pytest.raises(RuntimeError, match='model exploded'):
+        AdaptiveBatcher().embed(['a', 'b'], embed)
+
+
+def test_budget_uses_token_counter():
+    texts = ['a', 'b', 'c', 'd']
+    calls: list[list[str]] = []
+    batcher = AdaptiveBatcher(
+        token_budget=10, token_counter=lambda batch: [5] * len(batch)
+    )
+    batcher.target_batch_seconds = float('inf')  # no adaptation
+
+    batcher.embed(texts, _recording_embed(calls))
+
+    assert [len(batch) for batch in calls] == [2, 2]
@@ -0,0 +1,123 @@
+"""Unit tests for parallel node execution in the agentic RAG graph."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.language_models import FakeListChatModel
+
+from thoth.rag.agentic_retrieval import AgenticRAGOrchestrator, summarize_node_timings
+from thoth.rag.document_grader import RetrievalConfidence
+from thoth.rag.query_router import QueryType
+
+DELAY = 0.2
+
+
+def _overlaps(a: dict, b: dict) -> bool:
+    return (
+        a['start_ms'] < b['start_ms'] + b['duration_ms']
+        and b['start_ms'] < a['start_ms'] + a['duration_ms']
+    )
+
+
+def _make_orchestrator(query_type: QueryType, searches: list[str]):
+    router = MagicMock()
+    router.classify_query.return_value = query_type
+
+    async def expand(query, _llm):
+        await asyncio.sleep(DELAY)
+        return [query, 'variation one', 'variation two', query]
+
+    async def decompose(_query, _llm):
+        await asyncio.sleep(DELAY)
+        return ['part one', 'part two']
+
+    async def extract_filters(_query, _llm):
+        await asyncio.sleep(DELAY)
+        return {'year': 2024}
+
+    router.expand_query_async = expand
+    router.decompose_query_async = decompose
+    router.extract_filters_async = extract_filters
+
+    store = MagicMock()
+
+    async def search(query, k, filter):  # noqa: ARG001
+        searches.append(query)
+        await asyncio.sleep(DELAY)
+        return [
+            Document(page_content=f'{query} shared', metadata={'paper_id': 'p1'}),
+            Document(page_content=query, metadata={'paper_id': f'p-{query}'}),
+        ]
+
+    store.similarity_search_async = search
+
+    grader = MagicMock()
+
+    async def grade(_query, docs):
+        return docs, []
+
+    grader.grade_documents_async = grade
+    grader.evaluate_retrieval_confidence.return_value = RetrievalConfidence.CORRECT
+
+    reranker = MagicMock()
+
+    async def rerank(_query, docs, top_n):
+        return docs[:top_n]
+
+    reranker.rerank_async = rerank
+
+    return AgenticRAGOrchestrator(
+        vector_store=store,
+        query_router=router,
+        document_grader=grader,
+        hallucination_checker=MagicMock(),
+        reranker=reranker,
+        llm_client=FakeListChatModel(responses=['answer']),
+        config={'hallucination_check_enabled': False},
+    )
+
+
+@pytest.mark.asyncio
+async def test_analysis_branches_and_searches_run_concurrently():
+    searches: list[str] = []
+    orchestrator = _make_orchestrator(QueryType.STANDARD_RAG, searches)
+
+    result = await orchestrator.answer_question_async('what is attention', k=10)
+
+    timings = {t['node']: t for t in result['node_timings']}
+    assert _overlaps(timings['expand_query'], timings['extract_filters'])
+    # Three distinct queries searched at once, not one after another
+    assert sorted(searches) == ['variation one', 'variation two', 'what is attention']
+    assert timings['retrieve_documents']['duration_ms'] < DELAY * 2 * 1000
+    # Shared paper p1 is deduplicated across sub-query results
+    assert result['num_documents'] == 4
+    assert result['answer'] == 'answer'
+
+
+@pytest.mark.asyncio
+async def test_multi_hop_decomposes_and_extracts_filters_in_parallel():
+    searches: list[str] = []
+    orchestrator = _make_orchestrator(QueryType.MULTI_HOP_RAG, searches)
+
+    result = await orchestrator.answer_question_async('compare a and b')
+
+    timings = {t['node']: t for t in result['node_timings']}
+    assert _overlaps(timings['decompose_query'], timings['extract_filters'])
+    assert 'expand_query' not in timings
+    assert sorted(searches) == ['part one', 'part two']
+
+
+def test_summarize_node_timings():
+    summary = summarize_node_timings(
+        [
+            {'node': 'a', 'start_ms': 0.0, 'duration_ms': 100.0},
+            {'node': 'b', 'start_ms': 0.0, 'duration_ms': 150.0},
+            {'node': 'c', 'start_ms': 150.0, 'duration_ms': 50.0},
+        ]
+    )
+
+    assert summary['total_ms'] == 200.0
+    assert summary['serial_ms'] == 300.0
+    assert list(summary['per_node_ms']) == ['b', 'a', 'c']
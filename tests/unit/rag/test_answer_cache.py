@@ -0,0 +1,116 @@
+"""Unit tests for the semantic answer cache."""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from thoth.rag.answer_cache import SemanticAnswerCache, scope_key, source_chunk_ids
+
+
+def _make_cache(row: dict | None = None, threshold: float = 0.97):
+    conn = MagicMock()
+    conn.fetchrow = AsyncMock(return_value=row)
+    conn.execute = AsyncMock()
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool = MagicMock()
+    pool.acquire = acquire
+    cache = SemanticAnswerCache(
+        AsyncMock(return_value=pool),
+        embedding_model='test-model',
+        similarity_threshold=threshold,
+    )
+    return cache, conn
+
+
+def _row(similarity: float) -> dict:
+    return {
+        'id': uuid4(),
+        'question': 'What is attention?',
+        'response': '{"question": "What is attention?", "answer": "cached"}',
+        'created_at': datetime(2026, 1, 1, tzinfo=UTC),
+        'similarity': similarity,
+    }
+
+
+def test_scope_key_ignores_filter_key_order():
+    assert scope_key('agentic', 5, {'a': 1, 'b': 2}) == scope_key(
+        'agentic', 5, {'b': 2, 'a': 1}
+    )
+    assert scope_key('agentic', 5, None) != scope_key('standard', 5, None)
+    assert scope_key('agentic', 5, None) != scope_key('agentic', 10, None)
+
+
+def test_source_chunk_ids_reads_both_source_formats():
+    sources = [
+        {'chunk_id': 'a', 'title': 'Agentic source'},
+        {'content': '...', 'metadata': {'chunk_id': 'b'}},
+        {'metadata': {'chunk_id': 'a'}},
+        {'title': 'No chunk'},
+    ]
+    assert source_chunk_ids(sources) == ['a', 'b']
+
+
+@pytest.mark.asyncio
+async def test_hit_above_threshold_carries_provenance():
+    cache, conn = _make_cache(_row(0.98))
+
+    response = await cache.lookup([0.1, 0.2], 'user', 'scope')
+
+    assert response['answer'] == 'cached'
+    assert response['cache']['hit'] is True
+    assert response['cache']['similarity'] == 0.98
+    assert response['cache']['cached_question'] == 'What is attention?'
+    conn.execute.assert_awaited_once()  # hit_count bump
+    assert cache.stats()['hits'] == 1
+
+
+@pytest.mark.asyncio
+async def test_closest_entry_below_threshold_is_a_miss():
+    cache, conn = _make_cache(_row(0.9))
+
+    assert await cache.lookup([0.1, 0.2], 'user', 'scope') is None
+    conn.execute.assert_not_awaited()
+    assert cache.stats()['misses'] == 1
+
+
+@pytest.mark.asyncio
+async def test_lookup_errors_degrade_to_miss():
+    cache = SemanticAnswerCache(
+        AsyncMock(side_effect=RuntimeError('db down')), embedding_model='m'
+    )
+    assert await cache.lookup([0.1], 'user', 'scope') is None
+
+
+@pytest.mark.asyncio
+async def test_store_records_cited_chunks():
+    cache, conn = _make_cache()
+    chunk_id = str(uuid4())
+
+    await cache.store(
+        'What is attention?',
+        [0.1, 0.2],
+        'user',
+        'scope',
+        {'answer': 'A', 'sources': [{'chunk_id': chunk_id}], 'cache': {'hit': False}},
+    )
+
+    args = conn.execute.await_args.args
+    assert args[1:4] == ('user', 'scope', 'test-model')
+    assert '"cache"' not in args[6]
+    assert args[7] == [chunk_id]
+
+
+@pytest.mark.asyncio
+async def test_answers_without_cited_chunks_are_not_stored():
+    cache, conn = _make_cache()
+
+    await cache.store('Q', [0.1], 'user', 'scope', {'answer': 'A', 'sources': []})
+
+    conn.execute.assert_not_awaited()
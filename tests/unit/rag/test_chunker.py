@@ -0,0 +1,109 @@
+"""Unit tests for the token-offset markdown chunker."""
+
+import pytest
+import tiktoken
+
+from thoth.rag.chunker import MarkdownChunker
+
+
+class CountingEncoding:
+    """Byte-level encoding (one token per UTF-8 byte) that counts encodes."""
+
+    def __init__(self):
+        self._encoding = tiktoken.Encoding(
+            name='test-bytes',
+            pat_str=r'\s+|\S+',
+            mergeable_ranks={bytes([i]): i for i in range(256)},
+            special_tokens={},
+        )
+        self.encode_calls = 0
+
+    def encode(self, text, **kwargs):
+        self.encode_calls += 1
+        return self._encoding.encode(text, **kwargs)
+
+    def decode_with_offsets(self, tokens):
+        return self._encoding.decode_with_offsets(tokens)
+
+
+DOCUMENT = """Preamble before any heading.
+
+# Paper Title
+
+Short introduction.
+
+## Methods
+
+```python
+# not a heading
+x = 1
+```
+
+### Details
+
+""" + ' '.join(f'word{i}' for i in range(200))
+
+
+@pytest.fixture
+def encoding():
+    return CountingEncoding()
+
+
+def test_sections_follow_heading_hierarchy(encoding):
+    chunker = MarkdownChunker(chunk_size=2000, chunk_overlap=0, encoding=encoding)
+
+    chunks = chunker.split(DOCUMENT, {'paper_id': 'p1'})
+
+    assert [c.metadata['section_path'] for c in chunks] == [
+        [],
+        ['Paper Title'],
+        ['Paper Title', 'Methods'],
+        ['Paper Title', 'Methods', 'Details'],
+    ]
+    assert chunks[2].page_content.startswith('## Methods')
+    assert '# not a heading' in chunks[2].page_content
+    assert [c.metadata['heading_level'] for c in chunks] == [0, 1, 2, 3]
+    assert all(c.metadata['total_chunks'] == 4 for c in chunks)
+    assert all(c.metadata['paper_id'] == 'p1' for c in chunks)
+
+
+def test_large_sections_split_within_token_budget(encoding):
+    chunker = MarkdownChunker(chunk_size=300, chunk_overlap=50, encoding=encoding)
+
+    chunks = chunker.split(DOCUMENT, {})
+    details = [c for c in chunks if c.metadata['is_subsection']]
+
+    assert len(details) > 1
+    assert [c.metadata['subsection_index'] for c in details] == list(
+        range(len(details))
+    )
+    for chunk in details:
+        # One token per byte with this encoding
+        assert len(chunk.page_content.encode('utf-8')) <= 300
+        assert not chunk.page_content.startswith(' ')
+    # Consecutive windows overlap and break on word boundaries
+    first, second = details[0].page_content, details[1].page_content
+    assert second.split()[0] in first.split()
+    assert [c.metadata['chunk_index'] for c in chunks] == list(range(len(chunks)))
+
+
+def test_document_is_encoded_once(encoding):
+    chunker = MarkdownChunker(chunk_size=100, chunk_overlap=20, encoding=encoding)
+
+    chunker.split(DOCUMENT, {})
+
+    assert encoding.encode_calls == 1
+
+
+def test_split_text_ignores_headings(encoding):
+    chunker = MarkdownChunker(chunk_size=100, chunk_overlap=10, encoding=encoding)
+
+    pieces = chunker.split_text('# Heading\n' + 'alpha beta ' * 40)
+
+    assert len(pieces) > 1
+    assert pieces[0].startswith('# Heading')
+
+
+def test_overlap_must_be_smaller_than_chunk_size():
+    with pytest.raises(ValueError):
+        MarkdownChunker(chunk_size=100, chunk_overlap=100)
@@ -0,0 +1,143 @@
+"""Unit tests for cached, prefix-stable contextual enrichment."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.documents import Document
+
+from thoth.rag.contextual_enrichment import ChunkContextCache, ContextualEnricher
+
+
+def _make_cache() -> tuple[ChunkContextCache, dict]:
+    """Return a cache over an in-memory fake of the chunk_context_cache table."""
+    table: dict[tuple, str] = {}
+    conn = MagicMock()
+
+    async def fetch(_sql, model, document_hash, chunk_hashes):
+        return [
+            {'chunk_hash': h, 'context': table[(model, document_hash, h)]}
+            for h in chunk_hashes
+            if (model, document_hash, h) in table
+        ]
+
+    async def executemany(_sql, rows):
+        for model, document_hash, chunk_hash, context in rows:
+            table[(model, document_hash, chunk_hash)] = context
+
+    conn.fetch = AsyncMock(side_effect=fetch)
+    conn.executemany = AsyncMock(side_effect=executemany)
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool = MagicMock()
+    pool.acquire = acquire
+    return ChunkContextCache(AsyncMock(return_value=pool)), table
+
+
+def _make_llm(prompts: list[str], fail_on: str | None = None) -> MagicMock:
+    llm = MagicMock()
+    llm.model_name = 'test-model'
+
+    def invoke(prompt):
+        prompts.append(prompt)
+        if fail_on and fail_on in prompt:
+            raise RuntimeError('llm failed')
+        chunk = prompt.split('Chunk to Contextualize:\n')[1].split('\n')[0]
+        return MagicMock(content=f'context for {chunk}')
+
+    llm.invoke = MagicMock(side_effect=invoke)
+    return llm
+
+
+def _chunks(*texts: str) -> list[Document]:
+    return [
+        Document(page_content=text, metadata={'chunk_index': i})
+        for i, text in enumerate(texts)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reindexing_unchanged_paper_makes_no_llm_calls():
+    cache, table = _make_cache()
+    prompts: list[str] = []
+    enricher = ContextualEnricher(_make_llm(prompts), cache=cache)
+
+    first, first_stats = await enricher.enrich_chunks_with_stats_async(
+        _chunks('alpha', 'beta'), 'full paper text', 'Paper'
+    )
+    second, second_stats = await enricher.enrich_chunks_with_stats_async(
+        _chunks('alpha', 'beta'), 'full paper text', 'Paper'
+    )
+
+    assert len(prompts) == 2
+    assert len(table) == 2
+    assert (first_stats.cached, first_stats.fresh) == (0, 2)
+    assert (second_stats.cached, second_stats.fresh) == (2, 0)
+    assert [d.page_content for d in second] == [d.page_content for d in first]
+    assert second[0].page_content == 'context for alpha\n\nalpha'
+    assert second[0].metadata['original_content'] == 'alpha'
+
+
+@pytest.mark.asyncio
+async def test_only_changed_chunks_are_regenerated():
+    cache, _ = _make_cache()
+    prompts: list[str] = []
+    enricher = ContextualEnricher(_make_llm(prompts), cache=cache)
+
+    await enricher.enrich_chunks_async(_chunks('alpha', 'beta'), 'text', 'Paper')
+    prompts.clear()
+    _, stats = await enricher.enrich_chunks_with_stats_async(
+        _chunks('alpha', 'gamma'), 'text', 'Paper'
+    )
+
+    assert len(prompts) == 1
+    assert 'gamma' in prompts[0]
+    assert (stats.cached, stats.fresh) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_prompts_share_prefix_and_first_request_primes_cache():
+    prompts: list[str] = []
+    active = 0
+    overlaps: list[int] = []
+    llm = _make_llm(prompts)
+
+    async def fake_to_thread(fn, *args):
+        nonlocal active
+        active += 1
+        overlaps.append(active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return fn(*args)
+
+    enricher = ContextualEnricher(llm, batch_size=10)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(asyncio, 'to_thread', fake_to_thread)
+        await enricher.enrich_chunks_async(
+            _chunks('one', 'two', 'three', 'four'), 'paper body', 'Title'
+        )
+
+    prefixes = {p.split('Chunk to Contextualize:')[0] for p in prompts}
+    assert len(prefixes) == 1
+    # The first request runs alone; the rest run concurrently afterwards
+    assert overlaps[0] == 1
+    assert max(overlaps[1:]) > 1
+
+
+@pytest.mark.asyncio
+async def test_failed_chunks_keep_original_text_and_are_not_cached():
+    cache, table = _make_cache()
+    prompts: list[str] = []
+    enricher = ContextualEnricher(_make_llm(prompts, fail_on='beta'), cache=cache)
+
+    enriched, stats = await enricher.enrich_chunks_with_stats_async(
+        _chunks('alpha', 'beta'), 'text'
+    )
+
+    assert enriched[1].page_content == 'beta'
+    assert (stats.fresh, stats.failed) == (1, 1)
+    assert len(table) == 1
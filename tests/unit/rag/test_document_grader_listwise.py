@@ -0,0 +1,127 @@
+"""Unit tests for listwise document grading."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.documents import Document
+
+from thoth.rag import listwise
+from thoth.rag.document_grader import DocumentGrader
+
+
+def _docs(count: int, content: str = 'text') -> list[Document]:
+    return [
+        Document(page_content=f'{content} {i}', metadata={'id': i})
+        for i in range(1, count + 1)
+    ]
+
+
+class TestPackDocuments:
+    """Test splitting documents into listwise batches."""
+
+    def test_batch_size_limit(self):
+        batches = listwise.pack_documents(_docs(5), 2, 10_000, 800)
+        assert [[i for i, _ in batch] for batch in batches] == [[0, 1], [2, 3], [4]]
+
+    def test_token_budget_limit(self):
+        docs = _docs(3, content='x' * 396)  # ~100 tokens each
+        batches = listwise.pack_documents(docs, 10, 250, 800)
+        assert [len(batch) for batch in batches] == [2, 1]
+
+    def test_truncates_to_budget(self):
+        docs = [Document(page_content='x' * 5000)]
+        batches = listwise.pack_documents(docs, 10, 100, 800)
+        assert len(batches[0][0][1]) == 100 * listwise.CHARS_PER_TOKEN
+
+
+class TestParseListwiseResponse:
+    """Test parsing listwise JSON responses."""
+
+    def test_parses_fenced_json(self):
+        content = 'Here you go:\n```json\n{"1": "yes", "2": "no"}\n```'
+        assert listwise.parse_listwise_response(content, 2, str) == ['yes', 'no']
+
+    def test_missing_document_raises(self):
+        with pytest.raises(ValueError):
+            listwise.parse_listwise_response('{"1": "yes"}', 2, str)
+
+    def test_invalid_json_raises(self):
+        with pytest.raises(ValueError):
+            listwise.parse_listwise_response('yes, no', 2, str)
+
+
+class TestListwiseGrading:
+    """Test DocumentGrader listwise mode."""
+
+    @pytest.mark.asyncio
+    async def test_grades_batch_in_one_call(self):
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(
+            content='{"1": "yes", "2": "no", "3": "yes"}'
+        )
+        grader = DocumentGrader(llm_client=llm, batch_size=10)
+
+        relevant, irrelevant = await grader.grade_documents_async('query', _docs(3))
+
+        assert llm.invoke.call_count == 1
+        assert [d.metadata['id'] for d in relevant] == [1, 3]
+        assert [d.metadata['id'] for d in irrelevant] == [2]
+
+    @pytest.mark.asyncio
+    async def test_splits_into_batches(self):
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(content='{"1": "no", "2": "no"}')
+        grader = DocumentGrader(llm_client=llm, batch_size=2)
+
+        relevant, irrelevant = await grader.grade_documents_async('query', _docs(4))
+
+        assert llm.invoke.call_count == 2
+        assert relevant == []
+        assert len(irrelevant) == 4
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_pointwise_on_parse_failure(self):
+        llm = MagicMock()
+        llm.invoke.side_effect = [
+            MagicMock(content='Document 1 is relevant'),
+            MagicMock(content='no'),
+            MagicMock(content='yes'),
+        ]
+        grader = DocumentGrader(llm_client=llm, batch_size=10)
+
+        relevant, irrelevant = await grader.grade_documents_async('query', _docs(2))
+
+        assert llm.invoke.call_count == 3
+        assert {d.metadata['id'] for d in relevant} | {
+            d.metadata['id'] for d in irrelevant
+        } == {1, 2}
+        assert len(relevant) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self):
+        active = 0
+        peak = 0
+
+        async def fake_to_thread(fn, *args):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return fn(*args)
+
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(content='yes')
+        grader = DocumentGrader(llm_client=llm, mode='pointwise')
+
+        listwise.configure_llm_concurrency(2)
+        try:
+            with pytest.MonkeyPatch.context() as mp:
+                mp.setattr(asyncio, 'to_thread', fake_to_thread)
+                await grader.grade_documents_async('query', _docs(6))
+        finally:
+            listwise.configure_llm_concurrency(8)
+
+        assert llm.invoke.call_count == 6
+        assert peak == 2
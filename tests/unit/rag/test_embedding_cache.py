@@ -0,0 +1,102 @@
+"""Unit tests for the content-addressed embedding cache."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from thoth.rag.embedding_cache import EmbeddingCache, content_hash
+
+
+def _make_cache() -> tuple[EmbeddingCache, dict]:
+    """Return a cache over an in-memory fake of the embedding_cache table."""
+    table: dict[tuple, list[float]] = {}
+    conn = MagicMock()
+
+    async def fetch(_sql, model, version, hashes):
+        return [
+            {'content_hash': h, 'embedding': table[(model, version, h)]}
+            for h in hashes
+            if (model, version, h) in table
+        ]
+
+    async def executemany(_sql, rows):
+        for model, version, digest, embedding in rows:
+            table.setdefault((model, version, digest), embedding)
+
+    conn.fetch = AsyncMock(side_effect=fetch)
+    conn.executemany = AsyncMock(side_effect=executemany)
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool = MagicMock()
+    pool.acquire = acquire
+    cache = EmbeddingCache(AsyncMock(return_value=pool), model='test-model')
+    return cache, table
+
+
+def _embedder():
+    calls: list[list[str]] = []
+
+    async def embed(texts):
+        calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    return embed, calls
+
+
+@pytest.mark.asyncio
+async def test_only_misses_are_embedded():
+    cache, _ = _make_cache()
+    embed, calls = _embedder()
+
+    first = await cache.embed_documents(['alpha', 'beta'], embed)
+    second = await cache.embed_documents(['alpha', 'gamma!', 'beta'], embed)
+
+    assert calls == [['alpha', 'beta'], ['gamma!']]
+    assert first == [[5.0], [4.0]]
+    assert second == [[5.0], [6.0], [4.0]]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_texts_are_embedded_once():
+    cache, table = _make_cache()
+    embed, calls = _embedder()
+
+    result = await cache.embed_documents(['same', 'same'], embed)
+
+    assert calls == [['same']]
+    assert result == [[4.0], [4.0]]
+    assert len(table) == 1
+
+
+@pytest.mark.asyncio
+async def test_embedding_version_is_part_of_the_key():
+    cache, _ = _make_cache()
+    embed, calls = _embedder()
+
+    await cache.embed_documents(['alpha'], embed)
+    cache.embedding_version = 'v2'
+    await cache.embed_documents(['alpha'], embed)
+
+    assert calls == [['alpha'], ['alpha']]
+
+
+@pytest.mark.asyncio
+async def test_lookup_failure_falls_back_to_embedding():
+    cache = EmbeddingCache(
+        AsyncMock(side_effect=ConnectionError('db down')), model='test-model'
+    )
+    embed, calls = _embedder()
+
+    result = await cache.embed_documents(['alpha'], embed)
+
+    assert result == [[5.0]]
+    assert calls == [['alpha']]
+
+
+def test_hash_ignores_cosmetic_whitespace():
+    assert content_hash('a  b\n\nc ') == content_hash('a b c')
+    assert content_hash('a b c') != content_hash('a b d')
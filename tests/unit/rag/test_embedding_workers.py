@@ -0,0 +1,55 @@
+"""Unit tests for the multi-process embedding worker pool."""
+
+import os
+
+import numpy as np
+import pytest
+
+from thoth.rag.embedding_workers import EmbeddingWorkerPool
+
+
+class _FakeModel:
+    """Deterministic stand-in for a SentenceTransformer."""
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return 3
+
+    def encode(self, texts, **_kwargs):
+        return np.array(
+            [
+                [len(text), float(os.getpid()), float(os.environ['OMP_NUM_THREADS'])]
+                for text in texts
+            ],
+            dtype=np.float32,
+        )
+
+
+def _fake_factory(_model_name: str) -> _FakeModel:
+    return _FakeModel()
+
+
+@pytest.fixture(scope='module')
+def pool():
+    pool = EmbeddingWorkerPool('fake-model', num_workers=2, model_factory=_fake_factory)
+    yield pool
+    pool.close()
+
+
+def test_results_are_in_input_order(pool):
+    texts = ['a' * n for n in (5, 1, 9, 3, 7, 2)]
+
+    vectors = pool.embed_documents(texts)
+
+    assert [v[0] for v in vectors] == [5.0, 1.0, 9.0, 3.0, 7.0, 2.0]
+
+
+def test_workers_keep_single_thread_settings(pool):
+    vectors = pool.embed_documents(['x'] * 8)
+
+    assert {v[2] for v in vectors} == {1.0}
+    assert os.getpid() not in {int(v[1]) for v in vectors}
+
+
+def test_empty_input(pool):
+    assert pool.embed_documents([]) == []
+    assert pool.dimension == 3
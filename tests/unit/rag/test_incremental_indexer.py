@@ -0,0 +1,196 @@
+"""Unit tests for content-hash chunk diffing and incremental re-indexing."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from langchain_core.documents import Document
+
+from thoth.rag.chunk_diff import ChunkDiff, diff_chunks
+from thoth.rag.embedding_cache import content_hash
+from thoth.rag.incremental_indexer import IncrementalIndexer
+from thoth.rag.streaming_indexer import IndexJob
+from thoth.rag.vector_store import StaleChunksError, VectorStoreManager
+
+
+def _stored(*texts: str) -> list[tuple[str, str]]:
+    return [(f'id-{text}', content_hash(text)) for text in texts]
+
+
+def _hashes(*texts: str) -> list[str]:
+    return [content_hash(text) for text in texts]
+
+
+class TestDiffChunks:
+    def test_insert_at_top_keeps_every_existing_chunk(self):
+        diff = diff_chunks(_stored('a', 'b', 'c'), _hashes('new', 'a', 'b', 'c'))
+
+        assert diff.keep == [('id-a', 1), ('id-b', 2), ('id-c', 3)]
+        assert diff.insert == [0]
+        assert diff.update == [] and diff.delete == []
+
+    def test_edited_chunk_is_rewritten_in_place(self):
+        diff = diff_chunks(_stored('a', 'b', 'c'), _hashes('a', 'b2', 'c'))
+
+        assert diff.update == [('id-b', 1)]
+        assert diff.changed_indexes == [1]
+        assert diff.insert == [] and diff.delete == []
+
+    def test_removed_and_surplus_chunks(self):
+        diff = diff_chunks(_stored('a', 'b', 'c', 'd'), _hashes('a', 'x', 'd'))
+
+        assert diff.update == [('id-b', 1)]
+        assert diff.delete == ['id-c']
+        assert diff.keep == [('id-a', 0), ('id-d', 2)]
+
+    def test_unhashed_rows_never_match(self):
+        diff = diff_chunks([('old', None)], _hashes('a'))
+
+        assert diff.update == [('old', 0)]
+        assert diff.keep == []
+
+
+def _split(content: str, metadata: dict) -> list[Document]:
+    return [
+        Document(page_content=word, metadata={**metadata, 'chunk_index': i})
+        for i, word in enumerate(content.split())
+    ]
+
+
+def _make_store(stored: list[tuple[str, str]]) -> MagicMock:
+    store = MagicMock()
+    store.chunk_hash = VectorStoreManager.chunk_hash
+    store.get_chunk_hashes_async = AsyncMock(return_value=stored)
+    store.embed_documents_async = AsyncMock(
+        side_effect=lambda texts: [[1.0] for _ in texts]
+    )
+    store.apply_chunk_diff_async = AsyncMock(return_value=['ids'])
+    return store
+
+
+class TestIncrementalIndexer:
+    @pytest.mark.asyncio
+    async def test_only_changed_chunks_are_embedded(self):
+        store = _make_store(_stored('a', 'b', 'c'))
+        indexer = IncrementalIndexer(store, _split)
+
+        await indexer.index_async(IndexJob(uuid4(), 'new a b c2', {}))
+
+        store.embed_documents_async.assert_awaited_once_with(['new', 'c2'])
+        _, documents, diff, embeddings = store.apply_chunk_diff_async.call_args.args
+        assert [doc.page_content for doc in documents] == ['new', 'a', 'b', 'c2']
+        assert sorted(embeddings) == [0, 3]
+        assert diff.keep == [('id-a', 1), ('id-b', 2)]
+
+    @pytest.mark.asyncio
+    async def test_enrichment_limited_to_changed_chunks(self):
+        store = _make_store(_stored('a', 'b'))
+        enricher = MagicMock(enabled=True)
+
+        async def enrich(chunks, document_text, document_title):  # noqa: ARG001
+            return [
+                Document(
+                    page_content=f'ctx {c.page_content}',
+                    metadata={**c.metadata, 'original_content': c.page_content},
+                )
+                for c in chunks
+            ]
+
+        enricher.enrich_chunks_async = AsyncMock(side_effect=enrich)
+        indexer = IncrementalIndexer(store, _split, enricher=enricher)
+
+        await indexer.index_async(IndexJob(uuid4(), 'a x', {}))
+
+        chunks = enricher.enrich_chunks_async.call_args.kwargs['chunks']
+        assert [c.page_content for c in chunks] == ['x']
+        store.embed_documents_async.assert_awaited_once_with(['ctx x'])
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_recomputes_diff_once(self):
+        store = _make_store(_stored('a'))
+        store.apply_chunk_diff_async.side_effect = [StaleChunksError('busy'), ['ok']]
+        indexer = IncrementalIndexer(store, _split)
+
+        ids = await indexer.index_async(IndexJob(uuid4(), 'a b', {}))
+
+        assert ids == ['ok']
+        assert store.get_chunk_hashes_async.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        store = _make_store(_stored('a'))
+        store.apply_chunk_diff_async.side_effect = StaleChunksError('busy')
+        indexer = IncrementalIndexer(store, _split, max_attempts=2)
+
+        with pytest.raises(StaleChunksError):
+            await indexer.index_async(IndexJob(uuid4(), 'a b', {}))
+
+
+def _make_vector_store(current_ids: list[str]) -> tuple[VectorStoreManager, MagicMock]:
+    mock_config = MagicMock()
+    mock_config.secrets.database_url = 'postgresql://test'
+    mock_config.rag_config.full_text_backend = 'tsvector'
+    mock_config.rag_config.embedding_cache_enabled = False
+    mock_config.rag_config.query_embedding_cache_size = 0
+    with patch('thoth.rag.vector_store.Config', return_value=mock_config):
+        store = VectorStoreManager(embedding_function=MagicMock())
+
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+
+    async def fetch(sql, *params):
+        if 'FOR UPDATE' in sql:
+            return [{'id': chunk_id} for chunk_id in current_ids]
+        return [{'id': f'new-{idx}', 'chunk_index': idx} for idx in params[1]]
+
+    conn.fetch = AsyncMock(side_effect=fetch)
+
+    @asynccontextmanager
+    async def transaction():
+        yield
+
+    conn.transaction = transaction
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool = MagicMock()
+    pool.acquire = acquire
+    store._get_pool = AsyncMock(return_value=pool)
+    return store, conn
+
+
+class TestApplyChunkDiff:
+    @pytest.mark.asyncio
+    async def test_returns_stable_and_new_ids_in_chunk_order(self):
+        store, conn = _make_vector_store(['id-a', 'id-b', 'id-c'])
+        documents = _split('new a b2', {})
+        diff = ChunkDiff(
+            keep=[('id-a', 1)], update=[('id-b', 2)], insert=[0], delete=['id-c']
+        )
+
+        ids = await store.apply_chunk_diff_async(
+            uuid4(),
+            documents,
+            diff,
+            {0: [0.1], 2: [0.2]},
+            expected_ids=['id-a', 'id-b', 'id-c'],
+        )
+
+        assert ids == ['new-0', 'id-a', 'id-b']
+        statements = [call.args[0] for call in conn.execute.call_args_list]
+        assert 'DELETE FROM document_chunks' in statements[0]
+        # Parked rows are moved back to their final indexes last
+        assert 'chunk_index < 0' in statements[-1]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_change_raises(self):
+        store, conn = _make_vector_store(['id-a', 'id-other'])
+
+        with pytest.raises(StaleChunksError):
+            await store.apply_chunk_diff_async(
+                uuid4(), _split('a', {}), ChunkDiff(keep=[('id-a', 0)]), {}, ['id-a']
+            )
+        conn.execute.assert_not_awaited()
@@ -0,0 +1,121 @@
+"""Unit tests for the in-process query embedding cache."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from thoth.rag.query_embedding_cache import QueryEmbeddingCache
+
+
+class _CountingEmbedder:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.calls: list[str] = []
+        self.delay = delay
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def __call__(self, text: str) -> list[float]:
+        with self._lock:
+            self.calls.append(text)
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError('provider down')
+        return [float(len(text))]
+
+
+@pytest.mark.asyncio
+async def test_hits_and_misses_are_counted():
+    cache = QueryEmbeddingCache()
+    embed = _CountingEmbedder()
+
+    assert await cache.get_or_embed_async('m', 'query', embed) == [5.0]
+    assert await cache.get_or_embed_async('m', 'query', embed) == [5.0]
+    assert await cache.get_or_embed_async('other-model', 'query', embed) == [5.0]
+
+    assert embed.calls == ['query', 'query']
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (1, 2)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = QueryEmbeddingCache(maxsize=2)
+    cache.put('m', 'a', [1.0])
+    cache.put('m', 'b', [2.0])
+    cache.get('m', 'a')
+    cache.put('m', 'c', [3.0])
+
+    assert cache.get('m', 'b') is None
+    assert cache.get('m', 'a') == [1.0]
+    assert cache.get('m', 'c') == [3.0]
+
+
+def test_entries_expire():
+    cache = QueryEmbeddingCache(ttl_seconds=10)
+    with patch('thoth.rag.query_embedding_cache.time.monotonic', return_value=100.0):
+        cache.put('m', 'a', [1.0])
+    with patch('thoth.rag.query_embedding_cache.time.monotonic', return_value=111.0):
+        assert cache.get('m', 'a') is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call():
+    cache = QueryEmbeddingCache()
+    embed = _CountingEmbedder(delay=0.05)
+
+    results = await asyncio.gather(
+        *(cache.get_or_embed_async('m', 'attention', embed) for _ in range(5))
+    )
+
+    assert results == [[9.0]] * 5
+    assert embed.calls == ['attention']
+    stats = cache.stats()
+    assert (stats['misses'], stats['coalesced']) == (1, 4)
+
+
+@pytest.mark.asyncio
+async def test_failures_reach_waiters_and_are_not_cached():
+    cache = QueryEmbeddingCache()
+    embed = _CountingEmbedder(delay=0.05, fail=True)
+
+    results = await asyncio.gather(
+        cache.get_or_embed_async('m', 'q', embed),
+        cache.get_or_embed_async('m', 'q', embed),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert embed.calls == ['q']
+
+    embed.fail = False
+    assert await cache.get_or_embed_async('m', 'q', embed) == [1.0]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_waiters():
+    cache = QueryEmbeddingCache()
+    embed = _CountingEmbedder(delay=0.05)
+
+    first = asyncio.create_task(cache.get_or_embed_async('m', 'query', embed))
+    second = asyncio.create_task(cache.get_or_embed_async('m', 'query', embed))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == [5.0]
+    assert first.cancelled()
+    assert embed.calls == ['query']
+    assert cache.get('m', 'query') == [5.0]
+
+
+@pytest.mark.asyncio
+async def test_callers_get_their_own_copy():
+    cache = QueryEmbeddingCache()
+    embed = _CountingEmbedder()
+
+    vector = await cache.get_or_embed_async('m', 'query', embed)
+    vector.append(0.0)
+
+    assert await cache.get_or_embed_async('m', 'query', embed) == [5.0]
+    assert cache.get('m', 'query') == [5.0]
@@ -0,0 +1,122 @@
+"""Unit tests for the BM25 full-text backend and filter parameter binding."""
+
+import re
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import asyncpg
+import pytest
+
+from thoth.rag.search_backends import BM25Backend, TsVectorBackend, create_backend
+from thoth.rag.vector_store import VectorStoreManager
+
+
+def _placeholders(sql: str) -> set[int]:
+    return {int(n) for n in re.findall(r'\$(\d+)', sql)}
+
+
+def test_create_backend_bm25():
+    backend = create_backend('bm25')
+    assert isinstance(backend, BM25Backend)
+    assert backend.get_backend_name() == 'bm25'
+
+
+@pytest.mark.asyncio
+async def test_bm25_search_uses_corpus_statistics_and_binds_filters():
+    row = {
+        'id': uuid4(),
+        'paper_id': uuid4(),
+        'content': 'attention',
+        'metadata': {},
+        'chunk_type': 'content',
+        'chunk_index': 0,
+        'title': 'Paper',
+        'doi': None,
+        'authors': None,
+        'score': 2.5,
+    }
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=[row])
+
+    results = await BM25Backend(k1=1.5, b=0.5).search(
+        conn, 'attention heads', 5, 'dc.user_id = $3', ['alice']
+    )
+
+    sql, *params = conn.fetch.call_args.args
+    assert params == ['attention heads', 5, 'alice']
+    assert _placeholders(sql) == {1, 2, 3}
+    assert 'bm25_term_stats' in sql
+    assert 'bm25_corpus_stats' in sql
+    assert '2.5' in sql  # k1 + 1
+    assert 'AND dc.user_id = $3' in sql
+    assert results[0]['score'] == pytest.approx(2.5)
+
+
+@pytest.mark.asyncio
+async def test_bm25_search_fails_gracefully():
+    conn = MagicMock()
+    conn.fetch = AsyncMock(side_effect=asyncpg.PostgresError('no stats table'))
+
+    assert await BM25Backend().search(conn, 'q', 5) == []
+
+
+@pytest.mark.asyncio
+async def test_tsvector_limit_follows_filter_params():
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=[])
+
+    await TsVectorBackend().search(conn, 'q', 7, 'dc.user_id = $3', ['alice'])
+
+    sql, *params = conn.fetch.call_args.args
+    assert params == ['english', 'q', 'alice', 7]
+    assert 'LIMIT $4' in sql
+
+
+def test_bm25_candidate_sql_ranks_within_limit():
+    sql = BM25Backend().candidate_sql('$2', '$3', 'dc.user_id = $8')
+
+    assert 'ROW_NUMBER() OVER (ORDER BY score DESC) AS rank' in sql
+    assert 'LIMIT $3' in sql
+    assert _placeholders(sql) == {2, 3, 8}
+
+
+@pytest.mark.asyncio
+async def test_text_candidates_bind_filters_after_backend_params():
+    mock_config = MagicMock()
+    mock_config.secrets.database_url = 'postgresql://test'
+    mock_config.rag_config.full_text_backend = 'bm25'
+    mock_config.rag_config.embedding_cache_enabled = False
+    mock_config.rag_config.query_embedding_cache_size = 0
+    with patch('thoth.rag.vector_store.Config', return_value=mock_config):
+        store = VectorStoreManager(embedding_function=MagicMock())
+
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=[])
+
+    await store._get_text_candidates(conn, 'q', 4, {'user_id': 'alice'})
+
+    sql, *params = conn.fetch.call_args.args
+    assert 'dc.user_id = $3' in sql
+    assert params == ['q', 4, 'alice']
+
+
+def test_bm25_caps_candidates_before_scoring():
+    sql = BM25Backend(max_candidates=250).candidate_sql('$2', '$3')
+
+    assert 'ORDER BY ts_rank(dc.search_vector, a.tsq) DESC' in sql
+    assert 'LIMIT 250' in sql
+    assert 'SUM(doc_count)' in sql
+
+
+@pytest.mark.asyncio
+async def test_bm25_prepare_builds_statistics_only_when_missing():
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.fetchval = AsyncMock(return_value=True)
+
+    await BM25Backend().prepare(conn)
+    conn.execute.assert_not_called()
+
+    conn.fetchval.return_value = False
+    await BM25Backend().prepare(conn)
+    conn.execute.assert_awaited_once_with('SELECT bm25_rebuild_stats()')
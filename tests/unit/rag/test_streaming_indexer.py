@@ -0,0 +1,124 @@
+"""Unit tests for the pipelined streaming indexer."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from langchain_core.documents import Document
+
+from thoth.rag.streaming_indexer import IndexJob, StreamingIndexer
+
+
+def _split(content: str, metadata: dict) -> list[Document]:
+    return [
+        Document(page_content=word, metadata={**metadata, 'chunk_index': i})
+        for i, word in enumerate(content.split())
+    ]
+
+
+def _make_store(events: list[str] | None = None) -> MagicMock:
+    store = MagicMock()
+
+    async def embed(texts):
+        if events is not None:
+            events.append(f'embed {texts[0]}')
+        if 'boom' in texts:
+            raise RuntimeError('embedding failed')
+        return [[1.0] for _ in texts]
+
+    async def write(documents, embeddings, paper_id, user_id, start_index):  # noqa: ARG001
+        if events is not None:
+            events.append(f'write-start {documents[0].page_content}')
+            await asyncio.sleep(0.05)
+            events.append(f'write-end {documents[0].page_content}')
+        return [f'{paper_id}:{start_index + i}' for i in range(len(documents))]
+
+    store.embed_documents_async = AsyncMock(side_effect=embed)
+    store.add_embedded_documents_async = AsyncMock(side_effect=write)
+    return store
+
+
+def _job(content: str) -> IndexJob:
+    return IndexJob(paper_id=uuid4(), content=content, metadata={})
+
+
+@pytest.mark.asyncio
+async def test_micro_batches_keep_absolute_chunk_indexes():
+    store = _make_store()
+    indexer = StreamingIndexer(store, _split, batch_size=2)
+    job = _job('a b c d e')
+
+    ids = await indexer.index_async(job)
+
+    assert ids == [f'{job.paper_id}:{i}' for i in range(5)]
+    starts = [
+        call.kwargs['start_index']
+        for call in store.add_embedded_documents_async.call_args_list
+    ]
+    assert starts == [0, 2, 4]
+
+
+@pytest.mark.asyncio
+async def test_next_batch_is_embedded_while_previous_is_written():
+    events: list[str] = []
+    indexer = StreamingIndexer(_make_store(events), _split, batch_size=1)
+
+    await indexer.index_async(_job('a b c'))
+
+    assert events.index('embed b') < events.index('write-end a')
+
+
+@pytest.mark.asyncio
+async def test_failed_paper_does_not_stop_the_run():
+    store = _make_store()
+    indexer = StreamingIndexer(store, _split, batch_size=1)
+    jobs = [_job('a b'), _job('c boom d'), _job('e')]
+
+    results = await indexer.index_many_async(jobs)
+
+    assert [r.paper_id for r in results] == [j.paper_id for j in jobs]
+    assert results[0].succeeded and len(results[0].ids) == 2
+    assert isinstance(results[1].error, RuntimeError)
+    assert results[2].ids == [f'{jobs[2].paper_id}:0']
+    # Batches after the failure are skipped for that paper only
+    written = [
+        call.args[0][0].page_content
+        for call in store.add_embedded_documents_async.call_args_list
+    ]
+    assert 'd' not in written
+    assert {'a', 'b', 'e'} <= set(written)
+
+
+@pytest.mark.asyncio
+async def test_index_async_reraises_paper_error():
+    indexer = StreamingIndexer(_make_store(), _split)
+
+    with pytest.raises(RuntimeError, match='embedding failed'):
+        await indexer.index_async(_job('boom'))
+
+
+@pytest.mark.asyncio
+async def test_accepts_async_job_stream():
+    indexer = StreamingIndexer(_make_store(), _split, batch_size=4)
+    jobs = [_job('a b'), _job('c')]
+
+    async def stream():
+        for job in jobs:
+            yield job
+
+    results = await indexer.index_many_async(stream())
+
+    assert [len(r.ids) for r in results] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_paper_without_chunks_is_skipped():
+    store = _make_store()
+    indexer = StreamingIndexer(store, _split)
+
+    (result,) = await indexer.index_many_async([_job('   ')])
+
+    assert result.skipped and result.skip_reason == 'no chunks'
+    assert result.ids == []
+    store.embed_documents_async.assert_not_called()
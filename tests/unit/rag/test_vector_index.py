@@ -0,0 +1,62 @@
+"""Unit tests for vector index health assessment."""
+
+from thoth.rag.vector_index import (
+    VectorIndexHealth,
+    _parse_options,
+    assess_index,
+    ivfflat_lists_for,
+)
+
+
+def test_ivfflat_lists_follow_pgvector_guidance():
+    assert ivfflat_lists_for(0) == 1
+    assert ivfflat_lists_for(250_000) == 250
+    assert ivfflat_lists_for(4_000_000) == 2000
+
+
+def test_parse_options():
+    assert _parse_options(['m=16', 'ef_construction=64']) == {
+        'm': 16,
+        'ef_construction': 64,
+    }
+    assert _parse_options(None) == {}
+
+
+def test_missing_index_is_flagged():
+    health = VectorIndexHealth(rows=10)
+    assess_index(health)
+    assert health.needs_rebuild
+
+
+def test_ivfflat_recommended_after_growth():
+    health = VectorIndexHealth(
+        rows=20_000,
+        method='ivfflat',
+        options={'lists': 10},
+        rows_at_build=10_000,
+    )
+    assess_index(health, preferred_method='ivfflat')
+    assert any('grew from 10000' in r for r in health.recommendations)
+
+
+def test_fresh_ivfflat_is_healthy():
+    health = VectorIndexHealth(
+        rows=10_500,
+        method='ivfflat',
+        options={'lists': 10},
+        rows_at_build=10_000,
+    )
+    assess_index(health, preferred_method='ivfflat')
+    assert not health.needs_rebuild
+
+
+def test_hnsw_flags_dead_rows_and_method_mismatch():
+    health = VectorIndexHealth(rows=700, dead_rows=300, method='hnsw')
+    assess_index(health, preferred_method='hnsw')
+    assert len(health.recommendations) == 1
+
+    healthy = VectorIndexHealth(rows=1000, method='hnsw')
+    assess_index(healthy, preferred_method='ivfflat')
+    assert healthy.recommendations == [
+        'Index method is hnsw, configured method is ivfflat'
+    ]
@@ -0,0 +1,136 @@
+"""Unit tests for the COPY-based bulk ingestion path of VectorStoreManager."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from langchain_core.documents import Document
+
+from thoth.rag.embedding_cache import content_hash
+from thoth.rag.vector_store import VectorStoreManager
+
+
+def _make_store(batch_size: int = 500) -> VectorStoreManager:
+    mock_config = MagicMock()
+    mock_config.secrets.database_url = 'postgresql://test'
+    mock_config.rag_config.full_text_backend = 'tsvector'
+    mock_config.rag_config.bulk_ingest_enabled = False
+    mock_config.rag_config.bulk_ingest_batch_size = batch_size
+    mock_config.rag_config.embedding_cache_enabled = False
+    mock_config.rag_config.query_embedding_cache_size = 0
+
+    embeddings = MagicMock()
+    embeddings.embed_documents.side_effect = lambda texts: [
+        [float(i), 0.5] for i in range(len(texts))
+    ]
+    with patch('thoth.rag.vector_store.Config', return_value=mock_config):
+        return VectorStoreManager(embedding_function=embeddings)
+
+
+def _attach_conn(store: VectorStoreManager) -> MagicMock:
+    """Attach a mock pool whose connection echoes staged rows as merge results."""
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    staged: list[tuple] = []
+
+    async def copy_records(_table, records, columns):  # noqa: ARG001
+        staged[:] = records
+
+    async def fetch(_sql, *_params):
+        return [{'id': f'id-{rec[0]}', 'chunk_index': rec[0]} for rec in staged]
+
+    conn.copy_records_to_table = AsyncMock(side_effect=copy_records)
+    conn.fetch = AsyncMock(side_effect=fetch)
+
+    @asynccontextmanager
+    async def transaction():
+        yield
+
+    conn.transaction = transaction
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool = MagicMock()
+    pool.acquire = acquire
+    store._get_pool = AsyncMock(return_value=pool)
+    return conn
+
+
+@pytest.fixture
+def documents():
+    return [
+        Document(page_content=f'chunk {i} text', metadata={'chunk_index': i})
+        for i in range(5)
+    ]
+
+
+class TestBulkIngestion:
+    """Test bulk COPY + merge ingestion."""
+
+    @pytest.mark.asyncio
+    async def test_returns_ids_in_input_order(self, documents):
+        store = _make_store()
+        conn = _attach_conn(store)
+
+        ids = await store.add_documents_async(documents, paper_id=uuid4(), bulk=True)
+
+        assert ids == [f'id-{i}' for i in range(5)]
+        conn.copy_records_to_table.assert_awaited_once()
+        assert conn.fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batches_by_configured_size(self, documents):
+        store = _make_store(batch_size=2)
+        conn = _attach_conn(store)
+
+        ids = await store.add_documents_async(documents, paper_id=uuid4(), bulk=True)
+
+        assert conn.copy_records_to_table.await_count == 3
+        assert conn.fetch.await_count == 3
+        assert ids == [f'id-{i}' for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_staged_records_are_binary_friendly(self, documents):
+        store = _make_store()
+        conn = _attach_conn(store)
+
+        await store.add_documents_async(
+            documents, paper_id=uuid4(), bulk=True, collection_name='ml'
+        )
+
+        records = conn.copy_records_to_table.call_args.kwargs['records']
+        idx, content, chunk_type, metadata, embedding, token_count, digest = records[1]
+        assert idx == 1
+        assert content == 'chunk 1 text'
+        assert chunk_type == 'content'
+        assert '"collection_name": "ml"' in metadata
+        assert embedding == [1.0, 0.5]
+        assert token_count == 3
+        assert digest == content_hash('chunk 1 text')
+
+    @pytest.mark.asyncio
+    async def test_user_id_included_in_merge(self, documents):
+        store = _make_store()
+        conn = _attach_conn(store)
+        paper_id = uuid4()
+
+        await store.add_documents_async(
+            documents, paper_id=paper_id, user_id='alice', bulk=True
+        )
+
+        sql, *params = conn.fetch.call_args.args
+        assert 'user_id = EXCLUDED.user_id' in sql
+        assert params == [paper_id, 'alice']
+
+    @pytest.mark.asyncio
+    async def test_bulk_flag_not_stored_as_metadata(self, documents):
+        store = _make_store()
+        conn = _attach_conn(store)
+
+        await store.add_documents_async(documents, paper_id=uuid4(), bulk=True)
+
+        records = conn.copy_records_to_table.call_args.kwargs['records']
+        assert '"bulk"' not in records[0][3]
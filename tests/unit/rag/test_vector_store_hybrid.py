@@ -0,0 +1,216 @@
+"""Unit tests for single-statement and concurrent hybrid search."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import asyncpg
+import pytest
+
+from thoth.rag.query_embedding_cache import QueryEmbeddingCache
+from thoth.rag.vector_store import VectorStoreManager
+
+
+def _make_store(mode: str = 'fused') -> VectorStoreManager:
+    mock_config = MagicMock()
+    mock_config.secrets.database_url = 'postgresql://test'
+    mock_config.rag_config.full_text_backend = 'tsvector'
+    mock_config.rag_config.embedding_cache_enabled = False
+    mock_config.rag_config.query_embedding_cache_size = 0
+    mock_config.rag_config.hybrid_search_enabled = True
+    mock_config.rag_config.hybrid_search_mode = mode
+    mock_config.rag_config.hybrid_rrf_k = 60
+    mock_config.rag_config.hybrid_vector_weight = 0.7
+    mock_config.rag_config.hybrid_text_weight = 0.3
+    mock_config.rag_config.hnsw_ef_search = None
+    mock_config.rag_config.ivfflat_probes = None
+
+    embeddings = MagicMock()
+    embeddings.embed_query.return_value = [0.1, 0.2]
+    with patch('thoth.rag.vector_store.Config', return_value=mock_config):
+        return VectorStoreManager(embedding_function=embeddings)
+
+
+def _row(content: str, **extra) -> dict:
+    return {
+        'id': uuid4(),
+        'content': content,
+        'metadata': {},
+        'chunk_type': 'content',
+        'title': 'Paper',
+        'doi': None,
+        'authors': None,
+        **extra,
+    }
+
+
+def _attach_pool(store: VectorStoreManager, fetch) -> dict:
+    """Attach a pool handing out fresh mock connections; track concurrency."""
+    stats = {'open': 0, 'max_open': 0, 'acquired': 0, 'settings': []}
+
+    @asynccontextmanager
+    async def transaction():
+        yield
+
+    async def execute(sql, *params):
+        if 'set_config' in sql:
+            stats['settings'].append(params)
+
+    @asynccontextmanager
+    async def acquire():
+        stats['open'] += 1
+        stats['acquired'] += 1
+        stats['max_open'] = max(stats['max_open'], stats['open'])
+        conn = MagicMock()
+        conn.fetch = AsyncMock(side_effect=fetch)
+        conn.execute = AsyncMock(side_effect=execute)
+        conn.transaction = transaction
+        try:
+            yield conn
+        finally:
+            stats['open'] -= 1
+
+    pool = MagicMock()
+    pool.acquire = acquire
+    store._get_pool = AsyncMock(return_value=pool)
+    return stats
+
+
+@pytest.mark.asyncio
+async def test_fused_mode_uses_one_statement():
+    store = _make_store()
+    calls: list[tuple] = []
+
+    async def fetch(sql, *params):
+        calls.append((sql, params))
+        return [_row('best', similarity=0.9), _row('next', similarity=0.8)]
+
+    _attach_pool(store, fetch)
+
+    docs = await store.similarity_search_async('attention heads', k=2)
+
+    assert len(calls) == 1
+    sql, params = calls[0]
+    assert 'FULL OUTER JOIN text_candidates' in sql
+    assert 'plainto_tsquery' in sql
+    assert params[1:] == ('attention heads', 10, 0.7, 0.3, 60, 2)
+    assert [d.page_content for d in docs] == ['best', 'next']
+    assert docs[0].metadata['similarity'] == pytest.approx(0.9)
+
+
+@pytest.mark.asyncio
+async def test_fused_mode_binds_filters_after_fixed_params():
+    store = _make_store()
+    calls: list[tuple] = []
+
+    async def fetch(sql, *params):
+        calls.append((sql, params))
+        return []
+
+    _attach_pool(store, fetch)
+
+    await store.similarity_search_async('q', k=1, filter={'user_id': 'alice'})
+
+    sql, params = calls[0]
+    assert 'dc.user_id = $8' in sql
+    assert params[7] == 'alice'
+
+
+@pytest.mark.asyncio
+async def test_fused_failure_falls_back_to_concurrent_candidates():
+    store = _make_store()
+    text_id = uuid4()
+
+    async def fetch(sql, *params):  # noqa: ARG001
+        if 'WITH vector_candidates' in sql:
+            raise asyncpg.PostgresError('boom')
+        await asyncio.sleep(0.01)
+        if 'ts_rank_cd' in sql:
+            return [
+                {
+                    'id': text_id,
+                    'paper_id': uuid4(),
+                    'content': 'text hit',
+                    'metadata': {},
+                    'chunk_type': 'content',
+                    'chunk_index': 0,
+                    'title': 'Paper',
+                    'doi': None,
+                    'authors': None,
+                    'rank': 1.0,
+                    'score': 1.0,
+                }
+            ]
+        if 'ANY($1::uuid[])' in sql:
+            return [_row('text hit')]
+        return [{'id': uuid4(), 'paper_id': uuid4(), 'score': 0.5}]
+
+    stats = _attach_pool(store, fetch)
+
+    docs = await store.similarity_search_async('q', k=1)
+
+    assert [d.page_content for d in docs] == ['text hit']
+    # Vector and text candidates ran on two connections at once
+    assert stats['max_open'] >= 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_mode_skips_fused_statement():
+    store = _make_store(mode='concurrent')
+    seen: list[str] = []
+
+    async def fetch(sql, *params):  # noqa: ARG001
+        seen.append(sql)
+        return []
+
+    _attach_pool(store, fetch)
+
+    await store.similarity_search_async('q', k=1)
+
+    assert not any('WITH vector_candidates' in sql for sql in seen)
+
+
+@pytest.mark.asyncio
+async def test_index_search_settings_apply_per_query():
+    store = _make_store()
+    store.config.rag_config.ivfflat_probes = 10
+
+    async def fetch(sql, *params):  # noqa: ARG001
+        return []
+
+    stats = _attach_pool(store, fetch)
+
+    await store.similarity_search_async('q', k=1, ef_search=120)
+
+    assert stats['settings'] == [('hnsw.ef_search', '120'), ('ivfflat.probes', '10')]
+
+
+@pytest.mark.asyncio
+async def test_no_index_settings_skip_transaction():
+    store = _make_store()
+
+    async def fetch(sql, *params):  # noqa: ARG001
+        return []
+
+    stats = _attach_pool(store, fetch)
+
+    await store.similarity_search_async('q', k=1, use_hybrid=False)
+
+    assert stats['settings'] == []
+
+
+@pytest.mark.asyncio
+async def test_repeated_queries_reuse_cached_embedding():
+    store = _make_store()
+    store._query_embedding_cache = QueryEmbeddingCache()
+
+    async def fetch(sql, *params):  # noqa: ARG001
+        return []
+
+    _attach_pool(store, fetch)
+
+    await store.similarity_search_async('q', k=1)
+    await store.similarity_search_async('q', k=1, use_hybrid=False)
+
+    assert store.embedding_function.embed_query.call_count == 1
@@ -0,0 +1,143 @@
+"""Unit tests for the content-addressed OCR result cache."""
+
+import os
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from thoth.services.async_processing_service import AsyncProcessingService
+from thoth.services.ocr_cache import OCRCache
+
+
+def _config(tmp_path: Path, enabled: bool = True):
+    ocr = SimpleNamespace(
+        enable_caching=enabled, cache_dir=str(tmp_path / 'ocr'), cache_max_size_mb=1
+    )
+    return SimpleNamespace(
+        performance_config=SimpleNamespace(ocr=ocr),
+        cache_root=tmp_path / 'cache',
+        api_keys=SimpleNamespace(mistral_key='key'),
+        markdown_dir=tmp_path / 'markdown',
+    )
+
+
+@pytest.fixture
+def pdf_bytes() -> bytes:
+    return b'%PDF-1.7 ' + os.urandom(4096)
+
+
+class TestOCRCache:
+    def test_digest_depends_on_content_not_path(self, tmp_path, pdf_bytes):
+        first = tmp_path / 'paper.pdf'
+        renamed = tmp_path / 'elsewhere' / 'downloaded (1).pdf'
+        renamed.parent.mkdir()
+        first.write_bytes(pdf_bytes)
+        renamed.write_bytes(pdf_bytes)
+        other = tmp_path / 'other.pdf'
+        other.write_bytes(pdf_bytes + b'x')
+
+        assert OCRCache.digest(first) == OCRCache.digest(renamed)
+        assert OCRCache.digest(first) != OCRCache.digest(other)
+
+    def test_put_and_get_round_trip(self, tmp_path):
+        cache = OCRCache(tmp_path, max_size_bytes=1 << 20)
+
+        assert cache.get('ab' * 32) is None
+        cache.put('ab' * 32, '# Full ![img](data:image/png;base64,AAA)', '# Full')
+        cached = cache.get('ab' * 32)
+
+        assert cached.full_markdown == '# Full ![img](data:image/png;base64,AAA)'
+        assert cached.no_images_markdown == '# Full'
+        assert cached.source == 'mistral'
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used_entries(self, tmp_path):
+        cache = OCRCache(tmp_path, max_size_bytes=1 << 20)
+        payload = os.urandom(450_000).hex()  # ~450 KB once compressed
+        for i, digest in enumerate(['aa' * 32, 'bb' * 32]):
+            cache.put(digest, payload, '')
+            stamp = time.time() - 100 + i
+            os.utime(cache._entry_path(digest), (stamp, stamp))
+        cache.get('aa' * 32)  # now the most recently used
+
+        cache.put('cc' * 32, payload, '')
+
+        assert cache.get('bb' * 32) is None
+        assert cache.get('aa' * 32) is not None
+        assert cache.get('cc' * 32) is not None
+        assert cache.size_bytes() <= cache.max_size_bytes
+
+    def test_unreadable_entry_is_discarded(self, tmp_path):
+        cache = OCRCache(tmp_path, max_size_bytes=1 << 20)
+        path = cache._entry_path('cd' * 32)
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b'not gzip')
+
+        assert cache.get('cd' * 32) is None
+        assert not path.exists()
+
+    def test_claim_serializes_work_on_one_digest(self, tmp_path):
+        cache = OCRCache(tmp_path, max_size_bytes=1 << 20)
+        active, overlaps = [], []
+
+        def work():
+            with cache.claim('ef' * 32):
+                active.append(1)
+                overlaps.append(len(active))
+                time.sleep(0.01)
+                active.pop()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert overlaps == [1, 1, 1, 1]
+        assert cache._inflight == {}
+
+    def test_from_config_shares_one_instance(self, tmp_path):
+        config = _config(tmp_path)
+
+        assert OCRCache.from_config(config) is OCRCache.from_config(config)
+        assert OCRCache.from_config(config).max_size_bytes == 1024 * 1024
+        assert OCRCache.from_config(_config(tmp_path, enabled=False)) is None
+
+
+class TestAsyncProcessingServiceCache:
+    @pytest.mark.asyncio
+    async def test_duplicate_pdfs_are_converted_once(self, tmp_path, pdf_bytes):
+        vault_a = tmp_path / 'alice' / 'paper.pdf'
+        vault_b = tmp_path / 'bob' / 'renamed.pdf'
+        for path in (vault_a, vault_b):
+            path.parent.mkdir()
+            path.write_bytes(pdf_bytes)
+        service = AsyncProcessingService(config=_config(tmp_path))
+        calls = []
+
+        async def fake_ocr(pdf_path, output_dir):
+            calls.append(pdf_path)
+            full = output_dir / f'{pdf_path.stem}.md'
+            no_images = output_dir / f'{pdf_path.stem}_no_images.md'
+            full.write_text('# Paper ![img-0](data:image/png;base64,AAA)')
+            no_images.write_text('# Paper')
+            return full, no_images
+
+        with (
+            patch.object(service, '_mistral_ocr_async', side_effect=fake_ocr),
+            patch.object(service, '_get_user_paths', return_value=None),
+        ):
+            first = await service.ocr_convert_async(vault_a, tmp_path / 'md_a')
+            second = await service.ocr_convert_async(vault_b, tmp_path / 'md_b')
+
+        assert calls == [vault_a]
+        assert second == (
+            tmp_path / 'md_b' / 'renamed.md',
+            tmp_path / 'md_b' / 'renamed_no_images.md',
+        )
+        assert second[0].read_text() == first[0].read_text()
+        assert second[1].read_text() == '# Paper'